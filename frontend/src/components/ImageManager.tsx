@@ -1,7 +1,7 @@
 import { useState } from "react";
 import { Plus, X } from "lucide-react";
 import { LabelWithTooltip } from "./ui/label-with-tooltip";
-import { getAssetUrl } from "../lib/api";
+import { getAssetThumbnailUrl } from "../lib/api";
 import { MediaPicker } from "./MediaPicker";
 
 interface ImageManagerProps {
@@ -81,7 +81,7 @@ export function ImageManager({
             className="aspect-square border rounded-lg overflow-hidden relative group"
           >
             <img
-              src={getAssetUrl(imagePath)}
+              src={getAssetThumbnailUrl(imagePath)}
               alt={`${label} ${index + 1}`}
               className="w-full h-full object-cover"
             />
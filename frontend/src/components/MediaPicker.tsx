@@ -4,7 +4,7 @@ import { Button } from "./ui/button";
 import {
   listAssets,
   uploadAsset,
-  getAssetUrl,
+  getAssetThumbnailUrl,
   type AssetFileInfo,
 } from "../lib/api";
 import { useCloudStatus } from "../hooks/useCloudStatus";
@@ -189,7 +189,7 @@ export function MediaPicker({
                   title={image.name}
                 >
                   <img
-                    src={getAssetUrl(image.path)}
+                    src={getAssetThumbnailUrl(image.path)}
                     alt={image.name}
                     className="w-full h-full object-cover"
                     loading="lazy"
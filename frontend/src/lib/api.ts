@@ -446,6 +446,15 @@ export const getAssetUrl = (assetPath: string): string => {
   return `/api/v1/assets/${encodeURIComponent(filename)}`;
 };
 
+export const getAssetThumbnailUrl = (
+  assetPath: string,
+  size: number = 256
+): string => {
+  // Downscaled WebP (or poster frame for videos), cached and ETag-validated
+  // by the backend instead of the full-size original
+  return `${getAssetUrl(assetPath)}?thumbnail=${size}`;
+};
+
 // UI metadata from pipeline schema (json_schema_extra on fields)
 export interface SchemaFieldUI {
   category?: string;
@@ -12,10 +12,15 @@ Based on:
 import asyncio
 import json
 import os
+import re
 import shutil
+import struct
 import subprocess as _subprocess
+import tempfile
 import time
 import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import fal
@@ -25,6 +30,27 @@ from fastapi import WebSocket
 # Daydream API configuration
 DAYDREAM_API_BASE = os.getenv("DAYDREAM_API_BASE", "https://api.daydream.live")
 
+# Chunked uploads: binary WebSocket frames of header + data, where the header
+# is the upload ID (UUID bytes) and the byte offset of the data in the file.
+# Must match scope.server.cloud_connection.
+UPLOAD_CHUNK_HEADER = struct.Struct("!16sQ")
+UPLOAD_READ_SIZE = 1024 * 1024
+# How long a partial upload outlives the connection that was sending it, so a
+# client that reconnects can resume it
+UPLOAD_RESUME_TTL_SECONDS = 600
+
+# Local Scope backend that WebSocket messages are proxied to
+SCOPE_BASE_URL = "http://localhost:8000"
+# Keep-alive pool to the backend, shared by every WebSocket on a runner
+SCOPE_CLIENT_MAX_CONNECTIONS = 32
+SCOPE_CLIENT_KEEPALIVE_SECONDS = 60.0
+# Proxied requests from one WebSocket that may be in flight at once
+MAX_INFLIGHT_REQUESTS = 16
+# Latency samples kept per route, and distinct routes tracked
+ROUTE_LATENCY_SAMPLES = 256
+MAX_TRACKED_ROUTES = 100
+API_VERSION = re.compile(r"v\d+")
+
 
 async def validate_user_access(user_id: str) -> tuple[bool, str]:
     """
@@ -173,6 +199,292 @@ class KafkaPublisher:
 kafka_publisher: KafkaPublisher | None = None
 
 
+def route_key(method: str, path: str) -> str:
+    """Group a proxied request for metrics, e.g. "GET /api/v1/recordings/{id}".
+
+    Query strings are dropped and path segments containing digits (session
+    IDs, timestamps) are replaced, apart from API versions like "v1", so IDs
+    do not create new routes.
+    """
+    path = path.split("?", 1)[0]
+    segments = [
+        "{id}"
+        if any(c.isdigit() for c in segment) and not API_VERSION.fullmatch(segment)
+        else segment
+        for segment in path.split("/")
+    ]
+    return f"{method} {'/'.join(segments)}"
+
+
+class RouteLatency:
+    """Rolling latency statistics for one proxied route."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.samples: deque[float] = deque(maxlen=ROUTE_LATENCY_SAMPLES)
+
+    def record(self, seconds: float, ok: bool):
+        self.count += 1
+        if not ok:
+            self.errors += 1
+        self.samples.append(seconds)
+
+    def summary(self) -> dict[str, Any]:
+        ordered = sorted(self.samples)
+
+        def percentile_ms(fraction: float) -> float:
+            if not ordered:
+                return 0.0
+            index = min(len(ordered) - 1, int(fraction * len(ordered)))
+            return round(ordered[index] * 1000, 1)
+
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "p50_ms": percentile_ms(0.5),
+            "p95_ms": percentile_ms(0.95),
+            "max_ms": percentile_ms(1.0),
+        }
+
+
+class ScopeBackendClient:
+    """Pooled HTTP client for the local Scope backend.
+
+    One keep-alive connection pool is shared by all proxied requests instead
+    of connecting per request. The backend (uvicorn) speaks HTTP/1.1 only, so
+    concurrency comes from multiple pooled connections. Latency is recorded
+    per route.
+    """
+
+    def __init__(self, base_url: str = SCOPE_BASE_URL):
+        self.base_url = base_url
+        self.routes: dict[str, RouteLatency] = {}
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                limits=httpx.Limits(
+                    max_connections=SCOPE_CLIENT_MAX_CONNECTIONS,
+                    max_keepalive_connections=SCOPE_CLIENT_MAX_CONNECTIONS,
+                    keepalive_expiry=SCOPE_CLIENT_KEEPALIVE_SECONDS,
+                ),
+                timeout=30.0,
+            )
+        return self._client
+
+    async def request(self, method: str, path: str, route: str | None = None, **kwargs):
+        """Send a request to the backend and record its latency.
+
+        Args:
+            method: HTTP method
+            path: Backend path, e.g. "/api/v1/pipeline/status"
+            route: Metrics key; defaults to route_key(method, path)
+            **kwargs: Passed to httpx.AsyncClient.request (json, content, timeout...)
+        """
+        start = time.perf_counter()
+        ok = False
+        try:
+            response = await self._get_client().request(method, path, **kwargs)
+            ok = response.status_code < 500
+            return response
+        finally:
+            self._route(route or route_key(method, path)).record(
+                time.perf_counter() - start, ok
+            )
+
+    def _route(self, key: str) -> RouteLatency:
+        stats = self.routes.get(key)
+        if stats is None:
+            if len(self.routes) >= MAX_TRACKED_ROUTES:
+                key = "other"
+                stats = self.routes.get(key)
+            if stats is None:
+                stats = self.routes[key] = RouteLatency()
+        return stats
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """Latency summary per route."""
+        return {key: stats.summary() for key, stats in sorted(self.routes.items())}
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def is_mutating(payload: dict) -> bool:
+    """Whether a proxied message may change backend state."""
+    return (
+        payload.get("type") == "api" and payload.get("method", "GET").upper() != "GET"
+    )
+
+
+class OrderedDispatcher:
+    """Runs proxied requests concurrently without reordering mutations.
+
+    Reads run alongside each other, but each waits for the mutation submitted
+    before it, and a mutation waits for every request submitted before it. A
+    parameter update followed by a status read is therefore answered as if
+    the two had run one after the other, while a burst of reads is not
+    serialized behind a slow one.
+    """
+
+    def __init__(self, max_inflight: int = MAX_INFLIGHT_REQUESTS):
+        self._inflight = asyncio.Semaphore(max_inflight)
+        self.tasks: set[asyncio.Task] = set()
+        self._last_mutation: asyncio.Task | None = None
+        self._since_mutation: list[asyncio.Task] = []
+
+    async def submit(
+        self, handler: Callable[..., Awaitable[Any]], *args: Any, mutating: bool
+    ) -> asyncio.Task:
+        """Schedule handler(*args), waiting while max_inflight are running."""
+        await self._inflight.acquire()
+        after = list(self._since_mutation) if mutating else []
+        if self._last_mutation is not None:
+            after.append(self._last_mutation)
+
+        task = asyncio.create_task(self._run(after, handler, *args))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        if mutating:
+            self._last_mutation = task
+            self._since_mutation = []
+        else:
+            self._since_mutation = [t for t in self._since_mutation if not t.done()]
+            self._since_mutation.append(task)
+        return task
+
+    async def _run(
+        self,
+        after: list[asyncio.Task],
+        handler: Callable[..., Awaitable[Any]],
+        *args: Any,
+    ) -> None:
+        try:
+            if after:
+                await asyncio.wait(after)
+            await handler(*args)
+        finally:
+            self._inflight.release()
+
+    async def drain(self) -> None:
+        """Wait for every submitted request to finish."""
+        if self.tasks:
+            await asyncio.wait(list(self.tasks))
+
+    async def cancel(self) -> None:
+        """Cancel outstanding requests and wait for them to finish."""
+        tasks = list(self.tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class PartialUploads:
+    """Chunked uploads in progress on this runner, keyed by upload ID.
+
+    Each upload is a temp file plus the number of bytes received, attached to
+    the connection sending its chunks. When that connection drops the upload
+    is detached rather than deleted, and the same user starting the same
+    upload ID from a new connection picks it up at the received offset.
+    Detached uploads expire after ttl seconds.
+    """
+
+    def __init__(self, ttl: float = UPLOAD_RESUME_TTL_SECONDS):
+        self.ttl = ttl
+        self._uploads: dict[str, dict[str, Any]] = {}
+
+    def start(
+        self,
+        upload_id: str,
+        user_id: str | None,
+        connection_id: str,
+        path: str,
+        content_type: str,
+        size: int,
+    ) -> dict[str, Any] | None:
+        """Begin an upload, or resume a matching one, on a connection.
+
+        Returns:
+            The upload, or None if the ID belongs to another user
+        """
+        self.expire()
+        upload = self._uploads.get(upload_id)
+        if upload is not None:
+            if upload["user_id"] != user_id:
+                return None
+            if upload["path"] != path or upload["size"] != size:
+                # Same ID for a different file; start over
+                self.discard(upload_id)
+                upload = None
+
+        if upload is None:
+            fd, temp_path = tempfile.mkstemp(prefix="scope_upload_")
+            upload = self._uploads[upload_id] = {
+                "user_id": user_id,
+                "temp_path": temp_path,
+                "file": os.fdopen(fd, "wb"),
+                "path": path,
+                "content_type": content_type,
+                "size": size,
+                "received": 0,
+            }
+        elif upload["file"] is None:
+            upload["file"] = open(upload["temp_path"], "ab")
+
+        upload["connection_id"] = connection_id
+        upload["detached_at"] = None
+        return upload
+
+    def get(self, upload_id: str, connection_id: str) -> dict[str, Any] | None:
+        """Get an upload if it is attached to the connection."""
+        upload = self._uploads.get(upload_id)
+        if upload is None or upload["connection_id"] != connection_id:
+            return None
+        return upload
+
+    def discard(self, upload_id: str) -> None:
+        upload = self._uploads.pop(upload_id, None)
+        if upload is None:
+            return
+        if upload["file"] is not None:
+            upload["file"].close()
+        try:
+            os.remove(upload["temp_path"])
+        except OSError:
+            pass
+
+    def detach(self, connection_id: str) -> None:
+        """Keep a dropped connection's uploads for resuming."""
+        now = time.monotonic()
+        for upload in self._uploads.values():
+            if upload["connection_id"] != connection_id:
+                continue
+            upload["file"].close()
+            upload["file"] = None
+            upload["connection_id"] = None
+            upload["detached_at"] = now
+        self.expire()
+
+    def expire(self) -> None:
+        """Discard detached uploads older than the TTL."""
+        cutoff = time.monotonic() - self.ttl
+        for upload_id, upload in list(self._uploads.items()):
+            detached_at = upload["detached_at"]
+            if detached_at is not None and detached_at < cutoff:
+                self.discard(upload_id)
+
+    def __len__(self) -> int:
+        return len(self._uploads)
+
+
 ASSETS_DIR_PATH = "~/.daydream-scope/assets"
 # Connection timeout settings
 MAX_CONNECTION_DURATION_SECONDS = (
@@ -285,6 +597,12 @@ class ScopeApp(fal.App, keep_alive=300):
 
     auth_mode = "public"
 
+    # Shared by every WebSocket connection on this runner
+    scope_client: ScopeBackendClient | None = None
+    # Partial uploads, shared by every WebSocket on the runner so they
+    # survive a reconnect
+    partial_uploads: PartialUploads | None = None
+
     def setup(self):
         """
         Start the Scope backend server as a background process.
@@ -380,6 +698,8 @@ class ScopeApp(fal.App, keep_alive=300):
                 f"Scope server health check timed out after {max_wait}s, continuing anyway..."
             )
 
+        self.scope_client = ScopeBackendClient()
+
         print("Scope container setup complete")
 
     @fal.endpoint("/ws", is_websocket=True)
@@ -393,6 +713,15 @@ class ScopeApp(fal.App, keep_alive=300):
         - All messages are JSON with a "type" field
         - WebRTC signaling types: "get_ice_servers", "offer", "icecandidate"
         - API proxy type: "api" with "method", "path", "body" fields
+        - Chunked uploads: "upload_start", binary chunk frames, "upload_finish"
+        - "get_proxy_metrics" returns per-route backend latency
+
+        Proxy requests ("api", "icecandidate", "get_ice_servers") are handled
+        concurrently, so replies can arrive out of order and are matched to
+        requests by request_id. Mutating API calls (anything but GET) still
+        take effect in the order they were sent, as seen by every request
+        around them (see OrderedDispatcher). Other messages wait until
+        outstanding proxy requests are done.
 
         This keeps a persistent connection to prevent fal from spawning new runners.
         """
@@ -403,7 +732,12 @@ class ScopeApp(fal.App, keep_alive=300):
         import httpx
         from starlette.websockets import WebSocketDisconnect, WebSocketState
 
-        SCOPE_BASE_URL = "http://localhost:8000"
+        if self.scope_client is None:
+            self.scope_client = ScopeBackendClient()
+        scope_client = self.scope_client
+        if self.partial_uploads is None:
+            self.partial_uploads = PartialUploads()
+        uploads = self.partial_uploads
 
         # Initialize Kafka publisher if not already done
         global kafka_publisher
@@ -435,15 +769,19 @@ class ScopeApp(fal.App, keep_alive=300):
         # Track connection start time for max duration timeout
         connection_start_time = time.time()
 
+        # Replies from concurrent handlers must not interleave on the socket
+        send_lock = asyncio.Lock()
+
         async def safe_send_json(payload: dict):
             """Send JSON, handling connection errors gracefully."""
             try:
-                if (
-                    ws.client_state != WebSocketState.CONNECTED
-                    or ws.application_state != WebSocketState.CONNECTED
-                ):
-                    return
-                await ws.send_json(payload)
+                async with send_lock:
+                    if (
+                        ws.client_state != WebSocketState.CONNECTED
+                        or ws.application_state != WebSocketState.CONNECTED
+                    ):
+                        return
+                    await ws.send_json(payload)
             except (RuntimeError, WebSocketDisconnect):
                 pass
 
@@ -467,16 +805,15 @@ class ScopeApp(fal.App, keep_alive=300):
         async def handle_get_ice_servers(payload: dict):
             """Proxy GET /api/v1/webrtc/ice-servers"""
             request_id = payload.get("request_id")
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{SCOPE_BASE_URL}/api/v1/webrtc/ice-servers"
-                )
-                return {
-                    "type": "ice_servers",
-                    "request_id": request_id,
-                    "data": response.json(),
-                    "status": response.status_code,
-                }
+            response = await scope_client.request(
+                "GET", "/api/v1/webrtc/ice-servers", route="get_ice_servers"
+            )
+            return {
+                "type": "ice_servers",
+                "request_id": request_id,
+                "data": response.json(),
+                "status": response.status_code,
+            }
 
         # Parse fal_log_labels as JSON if possible, otherwise use raw string
         fal_log_labels_raw = os.getenv("FAL_LOG_LABELS", "unknown")
@@ -501,37 +838,38 @@ class ScopeApp(fal.App, keep_alive=300):
             request_id = payload.get("request_id")
 
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        f"{SCOPE_BASE_URL}/api/v1/webrtc/offer",
-                        json={
-                            "sdp": payload.get("sdp"),
-                            "type": payload.get("sdp_type", "offer"),
-                            "initialParameters": payload.get("initialParameters"),
-                            "user_id": payload.get("user_id"),
-                            "connection_id": connection_id,
-                            "connection_info": connection_info,
-                        },
-                        timeout=30.0,
-                    )
+                response = await scope_client.request(
+                    "POST",
+                    "/api/v1/webrtc/offer",
+                    route="offer",
+                    json={
+                        "sdp": payload.get("sdp"),
+                        "type": payload.get("sdp_type", "offer"),
+                        "initialParameters": payload.get("initialParameters"),
+                        "user_id": payload.get("user_id"),
+                        "connection_id": connection_id,
+                        "connection_info": connection_info,
+                    },
+                    timeout=30.0,
+                )
 
-                    if response.status_code == 200:
-                        data = response.json()
-                        session_id = data.get("sessionId")
-                        return {
-                            "type": "answer",
-                            "request_id": request_id,
-                            "sdp": data.get("sdp"),
-                            "sdp_type": data.get("type"),
-                            "sessionId": session_id,
-                        }
-                    else:
-                        return {
-                            "type": "error",
-                            "request_id": request_id,
-                            "error": f"Offer failed: {response.status_code}",
-                            "detail": response.text,
-                        }
+                if response.status_code == 200:
+                    data = response.json()
+                    session_id = data.get("sessionId")
+                    return {
+                        "type": "answer",
+                        "request_id": request_id,
+                        "sdp": data.get("sdp"),
+                        "sdp_type": data.get("type"),
+                        "sessionId": session_id,
+                    }
+                else:
+                    return {
+                        "type": "error",
+                        "request_id": request_id,
+                        "error": f"Offer failed: {response.status_code}",
+                        "detail": response.text,
+                    }
             except (httpx.TimeoutException, TimeoutError):
                 return {
                     "type": "error",
@@ -562,34 +900,35 @@ class ScopeApp(fal.App, keep_alive=300):
                     "status": "end_of_candidates",
                 }
 
-            async with httpx.AsyncClient() as client:
-                response = await client.patch(
-                    f"{SCOPE_BASE_URL}/api/v1/webrtc/offer/{target_session}",
-                    json={
-                        "candidates": [
-                            {
-                                "candidate": candidate.get("candidate"),
-                                "sdpMid": candidate.get("sdpMid"),
-                                "sdpMLineIndex": candidate.get("sdpMLineIndex"),
-                            }
-                        ]
-                    },
-                    timeout=10.0,
-                )
+            response = await scope_client.request(
+                "PATCH",
+                f"/api/v1/webrtc/offer/{target_session}",
+                route="icecandidate",
+                json={
+                    "candidates": [
+                        {
+                            "candidate": candidate.get("candidate"),
+                            "sdpMid": candidate.get("sdpMid"),
+                            "sdpMLineIndex": candidate.get("sdpMLineIndex"),
+                        }
+                    ]
+                },
+                timeout=10.0,
+            )
 
-                if response.status_code == 204:
-                    return {
-                        "type": "icecandidate_ack",
-                        "request_id": request_id,
-                        "status": "ok",
-                    }
-                else:
-                    return {
-                        "type": "error",
-                        "request_id": request_id,
-                        "error": f"ICE candidate failed: {response.status_code}",
-                        "detail": response.text,
-                    }
+            if response.status_code == 204:
+                return {
+                    "type": "icecandidate_ack",
+                    "request_id": request_id,
+                    "status": "ok",
+                }
+            else:
+                return {
+                    "type": "error",
+                    "request_id": request_id,
+                    "error": f"ICE candidate failed: {response.status_code}",
+                    "detail": response.text,
+                }
 
         async def handle_api_request(payload: dict):
             """
@@ -624,104 +963,207 @@ class ScopeApp(fal.App, keep_alive=300):
                 body["connection_info"] = connection_info
                 body["user_id"] = user_id
 
-            async with httpx.AsyncClient() as client:
-                try:
-                    # Check if this is a base64-encoded file upload
-                    is_binary_upload = (
-                        body and isinstance(body, dict) and "_base64_content" in body
-                    )
+            if method not in ("GET", "POST", "PATCH", "DELETE"):
+                return {
+                    "type": "api_response",
+                    "request_id": request_id,
+                    "status": 400,
+                    "error": f"Unsupported method: {method}",
+                }
 
-                    if method == "GET":
-                        # Use longer timeout for potential binary downloads (recordings)
-                        timeout = 120.0 if "/recordings/" in path else 30.0
-                        response = await client.get(
-                            f"{SCOPE_BASE_URL}{path}", timeout=timeout
-                        )
-                    elif method == "POST":
-                        if is_binary_upload:
-                            # Decode base64 and send as binary
-                            binary_content = base64.b64decode(body["_base64_content"])
-                            content_type = body.get(
-                                "_content_type", "application/octet-stream"
-                            )
-                            response = await client.post(
-                                f"{SCOPE_BASE_URL}{path}",
-                                content=binary_content,
-                                headers={"Content-Type": content_type},
-                                timeout=60.0,  # Longer timeout for uploads
-                            )
-                        else:
-                            response = await client.post(
-                                f"{SCOPE_BASE_URL}{path}", json=body, timeout=30.0
-                            )
-                    elif method == "PATCH":
-                        response = await client.patch(
-                            f"{SCOPE_BASE_URL}{path}", json=body, timeout=30.0
-                        )
-                    elif method == "DELETE":
-                        response = await client.delete(
-                            f"{SCOPE_BASE_URL}{path}", timeout=30.0
-                        )
-                    else:
-                        return {
-                            "type": "api_response",
-                            "request_id": request_id,
-                            "status": 400,
-                            "error": f"Unsupported method: {method}",
-                        }
+            try:
+                # Check if this is a base64-encoded file upload
+                is_binary_upload = (
+                    body and isinstance(body, dict) and "_base64_content" in body
+                )
 
-                    # Check if response is binary (e.g., video/mp4 download)
-                    content_type = response.headers.get("content-type", "")
-                    is_binary_response = any(
-                        ct in content_type
-                        for ct in [
-                            "video/",
-                            "audio/",
-                            "application/octet-stream",
-                            "image/",
-                        ]
+                if method == "GET":
+                    # Use longer timeout for potential binary downloads (recordings)
+                    timeout = 120.0 if "/recordings/" in path else 30.0
+                    response = await scope_client.request(method, path, timeout=timeout)
+                elif method == "POST" and is_binary_upload:
+                    # Decode base64 and send as binary
+                    binary_content = base64.b64decode(body["_base64_content"])
+                    content_type = body.get("_content_type", "application/octet-stream")
+                    response = await scope_client.request(
+                        method,
+                        path,
+                        content=binary_content,
+                        headers={"Content-Type": content_type},
+                        timeout=60.0,  # Longer timeout for uploads
                     )
+                elif method in ("POST", "PATCH"):
+                    response = await scope_client.request(
+                        method, path, json=body, timeout=30.0
+                    )
+                else:
+                    response = await scope_client.request(method, path, timeout=30.0)
+
+                # Check if response is binary (e.g., video/mp4 download)
+                content_type = response.headers.get("content-type", "")
+                is_binary_response = any(
+                    ct in content_type
+                    for ct in [
+                        "video/",
+                        "audio/",
+                        "application/octet-stream",
+                        "image/",
+                    ]
+                )
 
-                    if is_binary_response and response.status_code == 200:
-                        # Base64 encode binary content for JSON transport
-                        binary_content = response.content
-                        encoded = base64.b64encode(binary_content).decode("utf-8")
-                        return {
-                            "type": "api_response",
-                            "request_id": request_id,
-                            "status": response.status_code,
-                            "_base64_content": encoded,
-                            "_content_type": content_type,
-                            "_content_length": len(binary_content),
-                        }
-
-                    # Try to parse JSON response
-                    try:
-                        data = response.json()
-                    except Exception:
-                        data = response.text
-
+                if is_binary_response and response.status_code == 200:
+                    # Base64 encode binary content for JSON transport
+                    binary_content = response.content
+                    encoded = base64.b64encode(binary_content).decode("utf-8")
                     return {
                         "type": "api_response",
                         "request_id": request_id,
                         "status": response.status_code,
-                        "data": data,
+                        "_base64_content": encoded,
+                        "_content_type": content_type,
+                        "_content_length": len(binary_content),
                     }
 
-                except httpx.TimeoutException:
-                    return {
-                        "type": "api_response",
-                        "request_id": request_id,
-                        "status": 504,
-                        "error": "Request timeout",
-                    }
-                except Exception as e:
-                    return {
-                        "type": "api_response",
-                        "request_id": request_id,
-                        "status": 500,
-                        "error": str(e),
-                    }
+                # Try to parse JSON response
+                try:
+                    data = response.json()
+                except Exception:
+                    data = response.text
+
+                return {
+                    "type": "api_response",
+                    "request_id": request_id,
+                    "status": response.status_code,
+                    "data": data,
+                }
+
+            except httpx.TimeoutException:
+                return {
+                    "type": "api_response",
+                    "request_id": request_id,
+                    "status": 504,
+                    "error": "Request timeout",
+                }
+            except Exception as e:
+                return {
+                    "type": "api_response",
+                    "request_id": request_id,
+                    "status": 500,
+                    "error": str(e),
+                }
+
+        async def handle_upload_start(payload: dict):
+            """Begin (or resume) a chunked upload and report the next offset."""
+            request_id = payload.get("request_id")
+            upload_id = payload.get("upload_id")
+            if not upload_id:
+                return {
+                    "type": "error",
+                    "request_id": request_id,
+                    "error": "upload_start requires upload_id",
+                }
+
+            upload = uploads.start(
+                upload_id,
+                user_id,
+                connection_id,
+                path=payload.get("path", ""),
+                content_type=payload.get("content_type", "application/octet-stream"),
+                size=int(payload.get("size", 0)),
+            )
+            if upload is None:
+                return {
+                    "type": "error",
+                    "request_id": request_id,
+                    "error": f"Upload ID in use: {upload_id}",
+                }
+
+            return {
+                "type": "upload_ack",
+                "request_id": request_id,
+                "upload_id": upload_id,
+                "offset": upload["received"],
+            }
+
+        def handle_upload_chunk(data: bytes) -> None:
+            """Append a binary chunk if it continues its upload in sequence.
+
+            Unknown uploads and out-of-sequence chunks are dropped; the client
+            resends from the offset reported when it finishes the upload.
+            """
+            if len(data) < UPLOAD_CHUNK_HEADER.size:
+                return
+            raw_id, offset = UPLOAD_CHUNK_HEADER.unpack_from(data)
+            upload = uploads.get(str(uuid.UUID(bytes=raw_id)), connection_id)
+            if upload is None or offset != upload["received"]:
+                return
+            chunk = data[UPLOAD_CHUNK_HEADER.size :]
+            upload["file"].write(chunk)
+            upload["received"] += len(chunk)
+
+        async def handle_upload_finish(payload: dict):
+            """Forward a completed upload to the Scope backend."""
+            request_id = payload.get("request_id")
+            upload_id = payload.get("upload_id")
+            upload = uploads.get(upload_id, connection_id)
+            if upload is None:
+                return {
+                    "type": "error",
+                    "request_id": request_id,
+                    "error": f"Unknown upload: {upload_id}",
+                }
+
+            if upload["received"] < upload["size"]:
+                # Ask the client to resend from what actually arrived
+                return {
+                    "type": "upload_ack",
+                    "request_id": request_id,
+                    "upload_id": upload_id,
+                    "offset": upload["received"],
+                }
+
+            upload["file"].close()
+
+            async def read_chunks():
+                with open(upload["temp_path"], "rb") as f:
+                    while chunk := f.read(UPLOAD_READ_SIZE):
+                        yield chunk
+
+            try:
+                response = await scope_client.request(
+                    "POST",
+                    upload["path"],
+                    route="upload_finish",
+                    content=read_chunks(),
+                    headers={"Content-Type": upload["content_type"]},
+                    timeout=60.0,
+                )
+                try:
+                    data = response.json()
+                except Exception:
+                    data = response.text
+                return {
+                    "type": "api_response",
+                    "request_id": request_id,
+                    "status": response.status_code,
+                    "data": data,
+                }
+            except httpx.TimeoutException:
+                return {
+                    "type": "api_response",
+                    "request_id": request_id,
+                    "status": 504,
+                    "error": "Request timeout",
+                }
+            except Exception as e:
+                return {
+                    "type": "api_response",
+                    "request_id": request_id,
+                    "status": 500,
+                    "error": str(e),
+                }
+            finally:
+                uploads.discard(upload_id)
 
         async def handle_message(payload: dict) -> dict | None:
             """Route message to appropriate handler based on type."""
@@ -774,6 +1216,16 @@ class ScopeApp(fal.App, keep_alive=300):
                 return await handle_icecandidate(payload)
             elif msg_type == "api":
                 return await handle_api_request(payload)
+            elif msg_type == "upload_start":
+                return await handle_upload_start(payload)
+            elif msg_type == "upload_finish":
+                return await handle_upload_finish(payload)
+            elif msg_type == "get_proxy_metrics":
+                return {
+                    "type": "proxy_metrics",
+                    "request_id": request_id,
+                    "routes": scope_client.metrics(),
+                }
             elif msg_type == "ping":
                 return {"type": "pong", "request_id": request_id}
             else:
@@ -783,13 +1235,32 @@ class ScopeApp(fal.App, keep_alive=300):
                     "error": f"Unknown message type: {msg_type}",
                 }
 
+        # Proxy requests that do not depend on earlier messages run as tasks so
+        # a slow backend call does not hold up the rest of the connection
+        concurrent_message_types = {"api", "get_ice_servers", "icecandidate"}
+        dispatcher = OrderedDispatcher()
+
+        async def handle_and_respond(payload: dict):
+            try:
+                response = await handle_message(payload)
+                if response:
+                    await safe_send_json(response)
+            except Exception as e:
+                await safe_send_json(
+                    {
+                        "type": "error",
+                        "request_id": payload.get("request_id"),
+                        "error": f"{type(e).__name__}: {e}",
+                    }
+                )
+
         # Main message loop
         try:
             while True:
                 try:
                     # Use timeout on receive to periodically check connection duration
-                    message = await asyncio.wait_for(
-                        ws.receive_text(), timeout=TIMEOUT_CHECK_INTERVAL_SECONDS
+                    received = await asyncio.wait_for(
+                        ws.receive(), timeout=TIMEOUT_CHECK_INTERVAL_SECONDS
                     )
                 except (asyncio.TimeoutError, TimeoutError):  # noqa: UP041
                     if await check_max_duration_exceeded():
@@ -798,6 +1269,19 @@ class ScopeApp(fal.App, keep_alive=300):
                 except RuntimeError:
                     break
 
+                if received["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(received.get("code", 1000))
+
+                # Binary frames carry chunked upload data
+                if received.get("bytes") is not None:
+                    if user_id is not None:
+                        handle_upload_chunk(received["bytes"])
+                    continue
+
+                message = received.get("text")
+                if message is None:
+                    continue
+
                 # Check duration on each message as well (in case of constant activity)
                 if await check_max_duration_exceeded():
                     break
@@ -811,6 +1295,17 @@ class ScopeApp(fal.App, keep_alive=300):
                     continue
 
                 # Handle the message
+                if (
+                    user_id is not None
+                    and payload.get("type") in concurrent_message_types
+                ):
+                    # Waits here once MAX_INFLIGHT_REQUESTS are in flight
+                    await dispatcher.submit(
+                        handle_and_respond, payload, mutating=is_mutating(payload)
+                    )
+                    continue
+
+                await dispatcher.drain()
                 response = await handle_message(payload)
                 if response:
                     await safe_send_json(response)
@@ -821,6 +1316,8 @@ class ScopeApp(fal.App, keep_alive=300):
             print(f"[{log_prefix()}] WebSocket error ({type(e).__name__}): {e}")
             await safe_send_json({"type": "error", "error": f"{type(e).__name__}: {e}"})
         finally:
+            # Abandon proxy requests whose replies can no longer be delivered
+            await dispatcher.cancel()
             # Publish websocket disconnected event
             if kafka_publisher and kafka_publisher.is_running:
                 end_time = time.time()
@@ -836,6 +1333,8 @@ class ScopeApp(fal.App, keep_alive=300):
                         "session_end_time_ms": int(end_time * 1000),
                     },
                 )
+            # Keep partial uploads for a client that reconnects to resume
+            uploads.detach(connection_id)
             # Clean up session data to prevent data leakage between users
             cleanup_session_data()
             print(
@@ -857,3 +1356,12 @@ class ScopeApp(fal.App, keep_alive=300):
 #   5. Receive {"type": "answer", "sdp": "...", "sessionId": "..."}
 #   6. Exchange ICE candidates via {"type": "icecandidate", "candidate": {...}}
 #   7. For API calls: {"type": "api", "method": "GET", "path": "/api/v1/pipeline/status"}
+#      API calls are answered concurrently; match replies by "request_id".
+#      Non-GET calls are still applied in the order they were sent.
+#   8. For uploads: {"type": "upload_start", "upload_id": "<uuid>", "path": "...",
+#      "content_type": "...", "size": N}, then binary frames of
+#      <16-byte upload id><8-byte big-endian offset><data>, then
+#      {"type": "upload_finish", "upload_id": "<uuid>"}. An "upload_ack" reply
+#      carries the offset to resume from. Partial uploads are kept for
+#      UPLOAD_RESUME_TTL_SECONDS after a disconnect; sending upload_start with
+#      the same upload_id from a new connection resumes them.
@@ -7,17 +7,16 @@ NDI SDK downloads: https://ndi.video/tools/
 
 import ctypes
 import logging
-from typing import ClassVar
+from collections.abc import Callable
+from typing import TYPE_CHECKING, ClassVar, TypeVar
 
 import numpy as np
 
 from scope.core.ndi import (
     NDI_BANDWIDTH_HIGHEST,
     NDI_COLOR_FORMAT_RGBX_RGBA,
-    NDI_FOURCC_BGRA,
-    NDI_FOURCC_BGRX,
-    NDI_FOURCC_RGBA,
-    NDI_FOURCC_RGBX,
+    NDI_COLOR_FORMAT_UYVY_RGBA,
+    NDI_FOURCC_UYVY,
     NDI_FRAME_TYPE_VIDEO,
     NDIlib_audio_frame_v2_t,
     NDIlib_find_create_t,
@@ -25,8 +24,12 @@ from scope.core.ndi import (
     NDIlib_recv_create_v3_t,
     NDIlib_source_t,
     NDIlib_video_frame_v2_t,
+    copy_packed,
+    copy_rgb,
+    frame_view,
     load_library,
     setup_recv_functions,
+    uyvy_to_rgb,
 )
 from scope.core.ndi import (
     is_available as ndi_is_available,
@@ -34,8 +37,13 @@ from scope.core.ndi import (
 
 from .interface import InputSource, InputSourceInfo
 
+if TYPE_CHECKING:
+    import torch
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class NDIInputSource(InputSource):
     """Input source that receives video frames via NDI.
@@ -63,6 +71,13 @@ class NDIInputSource(InputSource):
         self._recv_instance = None
         self._connected_source_name: str | None = None
 
+        # When set before connect(), opaque frames arrive as UYVY and are
+        # converted by receive_frame_to_device instead of by the SDK on the CPU
+        self.device_conversion = False
+        # Pinned host staging buffers for receive_frame_to_device, by shape
+        self._staging: dict[tuple[int, ...], torch.Tensor] = {}
+        self._staging_event: torch.cuda.Event | None = None
+
     @classmethod
     def is_available(cls) -> bool:
         """Check if the NDI SDK is installed on this system."""
@@ -132,7 +147,11 @@ class NDIInputSource(InputSource):
 
         recv_create = NDIlib_recv_create_v3_t()
         recv_create.source_to_connect_to = ndi_source
-        recv_create.color_format = NDI_COLOR_FORMAT_RGBX_RGBA
+        recv_create.color_format = (
+            NDI_COLOR_FORMAT_UYVY_RGBA
+            if self.device_conversion
+            else NDI_COLOR_FORMAT_RGBX_RGBA
+        )
         recv_create.bandwidth = NDI_BANDWIDTH_HIGHEST
         recv_create.allow_video_fields = False
         recv_create.p_ndi_recv_name = b"Scope"
@@ -146,8 +165,69 @@ class NDIInputSource(InputSource):
         logger.info(f"NDI connected to '{identifier}'")
         return True
 
-    def receive_frame(self, timeout_ms: int = 100) -> np.ndarray | None:
-        """Receive a video frame. Returns (H, W, 3) RGB uint8 or None."""
+    def receive_frame(
+        self, timeout_ms: int = 100, out: np.ndarray | None = None
+    ) -> np.ndarray | None:
+        """Receive a video frame. Returns (H, W, 3) RGB uint8 or None.
+
+        The frame is written into out when it has the right shape, so callers
+        can reuse one buffer across frames; otherwise a new array is returned.
+        """
+
+        def convert(view: np.ndarray, fourcc: int) -> np.ndarray:
+            if fourcc == NDI_FOURCC_UYVY:
+                import torch
+
+                rgb = uyvy_to_rgb(torch.from_numpy(copy_packed(view))).numpy()
+                if out is not None and out.shape == rgb.shape:
+                    np.copyto(out, rgb)
+                    return out
+                return rgb
+            return copy_rgb(view, fourcc, out)
+
+        return self._receive(timeout_ms, convert)
+
+    def receive_frame_to_device(
+        self, device: "torch.device | str", timeout_ms: int = 100
+    ) -> "torch.Tensor | None":
+        """Receive a video frame as an (H, W, 3) RGB uint8 tensor on a CUDA device.
+
+        The frame is copied once into a pinned staging buffer and uploaded
+        asynchronously. UYVY frames are uploaded packed, at two bytes per
+        pixel, and converted to RGB on the device.
+        """
+        import torch
+
+        def upload(view: np.ndarray, fourcc: int) -> torch.Tensor:
+            packed = fourcc == NDI_FOURCC_UYVY
+            shape = view.shape if packed else (*view.shape[:2], 3)
+            staging = self._staging.get(shape)
+            if staging is None:
+                staging = torch.empty(shape, dtype=torch.uint8, pin_memory=True)
+                self._staging = {shape: staging}
+            elif self._staging_event is not None:
+                # The previous upload may still be reading the staging buffer
+                self._staging_event.synchronize()
+
+            if packed:
+                copy_packed(view, staging.numpy())
+            else:
+                copy_rgb(view, fourcc, staging.numpy())
+            frame = staging.to(device, non_blocking=True)
+            self._staging_event = torch.cuda.Event()
+            self._staging_event.record()
+            return uyvy_to_rgb(frame) if packed else frame
+
+        return self._receive(timeout_ms, upload)
+
+    def _receive(
+        self, timeout_ms: int, consume: Callable[[np.ndarray, int], T]
+    ) -> T | None:
+        """Capture one video frame and pass a view of it to consume.
+
+        The view points into the SDK's buffer and is only valid during the
+        call, so consume must copy what it keeps.
+        """
         if not self._recv_instance:
             return None
 
@@ -167,42 +247,18 @@ class NDIInputSource(InputSource):
             return None
 
         try:
-            width = video_frame.xres
-            height = video_frame.yres
-            stride = video_frame.line_stride_in_bytes
-            fourcc = video_frame.FourCC
-
-            if fourcc in (
-                NDI_FOURCC_RGBA,
-                NDI_FOURCC_RGBX,
-                NDI_FOURCC_BGRA,
-                NDI_FOURCC_BGRX,
-            ):
-                bpp = 4
-            else:
-                bpp = 2
-
-            if stride == width * bpp:
-                buffer_size = height * stride
-                buffer = (ctypes.c_uint8 * buffer_size).from_address(video_frame.p_data)
-                frame_data = np.frombuffer(buffer, dtype=np.uint8).reshape(
-                    (height, width, bpp if bpp == 4 else -1)
+            try:
+                view = frame_view(
+                    video_frame.p_data,
+                    video_frame.yres,
+                    video_frame.xres,
+                    video_frame.line_stride_in_bytes,
+                    video_frame.FourCC,
                 )
-            else:
-                frame_data = np.zeros((height, width, 4), dtype=np.uint8)
-                for y in range(height):
-                    row_start = video_frame.p_data + y * stride
-                    row_buffer = (ctypes.c_uint8 * (width * 4)).from_address(row_start)
-                    frame_data[y] = np.frombuffer(row_buffer, dtype=np.uint8).reshape(
-                        (width, 4)
-                    )
-
-            if fourcc in (NDI_FOURCC_BGRA, NDI_FOURCC_BGRX):
-                frame_data = frame_data[:, :, [2, 1, 0, 3]]
-
-            rgb_frame = frame_data[:, :, :3].copy()
-            return rgb_frame
-
+            except ValueError as e:
+                logger.warning(f"Dropping NDI frame: {e}")
+                return None
+            return consume(view, video_frame.FourCC)
         finally:
             self._lib.NDIlib_recv_free_video_v2(
                 self._recv_instance, ctypes.byref(video_frame)
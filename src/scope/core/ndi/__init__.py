@@ -1,5 +1,6 @@
 """Shared NDI SDK bindings used by both input and output modules."""
 
+from .frames import copy_packed, copy_rgb, frame_view, uyvy_to_rgb
 from .lib import (
     NDI_BANDWIDTH_HIGHEST,
     NDI_BANDWIDTH_LOWEST,
@@ -12,6 +13,7 @@ from .lib import (
     NDI_FOURCC_RGBA,
     NDI_FOURCC_RGBX,
     NDI_FOURCC_UYVY,
+    NDI_FRAME_FORMAT_PROGRESSIVE,
     NDI_FRAME_TYPE_AUDIO,
     NDI_FRAME_TYPE_VIDEO,
     NDIlib_audio_frame_v2_t,
@@ -46,10 +48,15 @@ __all__ = [
     "NDI_FOURCC_RGBA",
     "NDI_FOURCC_RGBX",
     "NDI_FOURCC_UYVY",
+    "NDI_FRAME_FORMAT_PROGRESSIVE",
     "NDI_FRAME_TYPE_AUDIO",
     "NDI_FRAME_TYPE_VIDEO",
+    "copy_packed",
+    "copy_rgb",
+    "frame_view",
     "is_available",
     "load_library",
     "setup_recv_functions",
     "setup_send_functions",
+    "uyvy_to_rgb",
 ]
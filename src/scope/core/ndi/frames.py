@@ -0,0 +1,119 @@
+"""Zero-copy views of NDI video buffers and pixel format conversion.
+
+NDI frames may carry padded rows (line_stride_in_bytes larger than the packed
+row size), so buffers are viewed with explicit strides instead of reshaped.
+A view is only valid until the frame is returned to the SDK.
+"""
+
+import ctypes
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .lib import (
+    NDI_FOURCC_BGRA,
+    NDI_FOURCC_BGRX,
+    NDI_FOURCC_RGBA,
+    NDI_FOURCC_RGBX,
+    NDI_FOURCC_UYVY,
+)
+
+if TYPE_CHECKING:
+    import torch
+
+RGB_FOURCCS = (NDI_FOURCC_RGBA, NDI_FOURCC_RGBX)
+BGR_FOURCCS = (NDI_FOURCC_BGRA, NDI_FOURCC_BGRX)
+
+# BT.709 limited-range YUV -> RGB, as used by NDI for HD sources
+_Y_OFFSET = 16.0
+_Y_SCALE = 255.0 / 219.0
+_C_SCALE = 255.0 / 224.0
+_R_FROM_V = 1.5748
+_G_FROM_U = -0.1873
+_G_FROM_V = -0.4681
+_B_FROM_U = 1.8556
+
+
+def frame_view(
+    address: int, height: int, width: int, stride: int, fourcc: int
+) -> np.ndarray:
+    """View an NDI video buffer as a uint8 array without copying.
+
+    RGBA-family formats give (H, W, 4). UYVY gives (H, W // 2, 4), one
+    U Y0 V Y1 macropixel per two pixels.
+
+    Raises:
+        ValueError: If the FourCC is not a supported format
+    """
+    if fourcc in RGB_FOURCCS or fourcc in BGR_FOURCCS:
+        shape = (height, width, 4)
+    elif fourcc == NDI_FOURCC_UYVY:
+        shape = (height, width // 2, 4)
+    else:
+        raise ValueError(f"Unsupported NDI FourCC: {fourcc:#x}")
+
+    row_bytes = shape[1] * 4
+    size = stride * (height - 1) + row_bytes if height > 0 else 0
+    buffer = (ctypes.c_uint8 * size).from_address(address)
+    flat = np.frombuffer(buffer, dtype=np.uint8)
+    return np.lib.stride_tricks.as_strided(
+        flat, shape=shape, strides=(stride, 4, 1), writeable=False
+    )
+
+
+def _output_buffer(out: np.ndarray | None, shape: tuple[int, ...]) -> np.ndarray:
+    if out is not None and out.shape == shape and out.dtype == np.uint8:
+        return out
+    return np.empty(shape, dtype=np.uint8)
+
+
+def copy_rgb(
+    view: np.ndarray, fourcc: int, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Copy an RGBA/BGRA-family view to (H, W, 3) RGB.
+
+    Each output byte is written once, straight from the source buffer, so the
+    swizzle and the alpha drop need no intermediate arrays. Writes into out
+    when it has the right shape, otherwise allocates.
+    """
+    height, width = view.shape[:2]
+    out = _output_buffer(out, (height, width, 3))
+    order = (2, 1, 0) if fourcc in BGR_FOURCCS else (0, 1, 2)
+    # Per-channel copies run several times faster than one copy whose
+    # innermost axis has only three elements
+    for channel, source_channel in enumerate(order):
+        out[:, :, channel] = view[:, :, source_channel]
+    return out
+
+
+def copy_packed(view: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """Copy a strided view into a contiguous buffer of the same shape."""
+    out = _output_buffer(out, view.shape)
+    np.copyto(out, view)
+    return out
+
+
+def uyvy_to_rgb(packed: "torch.Tensor") -> "torch.Tensor":
+    """Convert packed (H, W // 2, 4) UYVY to (H, W, 3) RGB uint8.
+
+    Runs on whatever device packed is on, so a GPU consumer can upload the
+    2-byte-per-pixel frame and convert it there.
+    """
+    import torch
+
+    pixels = packed.float()
+    u = (pixels[..., 0] - 128.0) * _C_SCALE
+    v = (pixels[..., 2] - 128.0) * _C_SCALE
+    y = (pixels[..., 1::2].flatten(-2) - _Y_OFFSET) * _Y_SCALE
+    u = u.repeat_interleave(2, dim=-1)
+    v = v.repeat_interleave(2, dim=-1)
+
+    rgb = torch.stack(
+        (
+            y + _R_FROM_V * v,
+            y + _G_FROM_U * u + _G_FROM_V * v,
+            y + _B_FROM_U * u,
+        ),
+        dim=-1,
+    )
+    return rgb.clamp_(0, 255).round_().to(torch.uint8)
@@ -108,6 +108,9 @@ NDI_FRAME_TYPE_METADATA = 3
 NDI_FRAME_TYPE_ERROR = 4
 NDI_FRAME_TYPE_STATUS_CHANGE = 100
 
+# Frame format types
+NDI_FRAME_FORMAT_PROGRESSIVE = 1
+
 # FourCC (as integers)
 NDI_FOURCC_UYVY = 0x59565955
 NDI_FOURCC_BGRA = 0x41524742
@@ -275,3 +278,11 @@ def setup_send_functions(lib: ctypes.CDLL) -> None:
         ctypes.c_void_p,
         ctypes.POINTER(NDIlib_video_frame_v2_t),
     ]
+
+    # Returns immediately; p_data must stay valid until the next async call.
+    # Passing NULL as the frame waits for the SDK to release the last buffer.
+    lib.NDIlib_send_send_video_async_v2.restype = None
+    lib.NDIlib_send_send_video_async_v2.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(NDIlib_video_frame_v2_t),
+    ]
@@ -58,6 +58,17 @@ class OutputSink(ABC):
         """Release all resources."""
         pass
 
+    def set_frame_rate(self, fps: float):
+        """Update the rate frames are being produced at.
+
+        Sinks that advertise a frame rate to receivers override this.
+        """
+        return
+
+    def get_stats(self) -> dict:
+        """Return sink-specific send statistics, if any."""
+        return {}
+
     def __enter__(self):
         return self
 
@@ -2,10 +2,17 @@
 
 Sends processed video frames over the network via NDI.
 Uses the shared NDI ctypes bindings from scope.core.ndi.
+
+Frames are submitted with the SDK's asynchronous send, which returns as soon
+as the frame is queued but keeps reading its buffer until the next send. The
+sink therefore rotates through a few preallocated RGBA buffers, so a frame is
+never written into memory the SDK may still be reading.
 """
 
 import ctypes
 import logging
+import time
+from fractions import Fraction
 from typing import ClassVar
 
 import numpy as np
@@ -13,6 +20,7 @@ import torch
 
 from scope.core.ndi import (
     NDI_FOURCC_RGBA,
+    NDI_FRAME_FORMAT_PROGRESSIVE,
     NDIlib_send_create_t,
     NDIlib_video_frame_v2_t,
     load_library,
@@ -26,6 +34,29 @@ from .interface import OutputSink
 
 logger = logging.getLogger(__name__)
 
+# Buffers rotated between async sends; two is the minimum the SDK allows
+NDI_SEND_BUFFER_COUNT = 2
+# Advertised until the producer reports its actual rate
+DEFAULT_FRAME_RATE = Fraction(30000, 1001)
+
+
+def frame_rate_fraction(fps: float) -> Fraction:
+    """Convert a measured FPS into the N/D pair advertised to receivers.
+
+    The rate is rounded to 0.01 fps so small fluctuations in the measurement
+    do not change the stream's metadata every frame. NTSC rates map to their
+    exact 1001-denominator fractions.
+    """
+    if fps <= 0:
+        return DEFAULT_FRAME_RATE
+    rate = Fraction(round(fps * 100), 100)
+    if rate <= 0:
+        return DEFAULT_FRAME_RATE
+    ntsc = Fraction(round(rate * Fraction(1001, 1000)) * 1000, 1001)
+    if abs(ntsc - rate) < Fraction(1, 100):
+        return ntsc
+    return rate
+
 
 class NDIOutputSink(OutputSink):
     """Output sink that sends video frames over the network via NDI.
@@ -40,13 +71,24 @@ class NDIOutputSink(OutputSink):
         "to receivers on the local network."
     )
 
-    def __init__(self):
+    def __init__(self, buffer_count: int = NDI_SEND_BUFFER_COUNT):
         self._send_instance = None
         self._name = ""
         self._width = 0
         self._height = 0
         self._lib = None
 
+        self._buffer_count = max(2, buffer_count)
+        self._buffers: list[np.ndarray] = []
+        self._video_frames: list[NDIlib_video_frame_v2_t] = []
+        self._next_buffer = 0
+        self._frame_rate = DEFAULT_FRAME_RATE
+
+        self._frames_sent = 0
+        self._send_errors = 0
+        self._total_send_seconds = 0.0
+        self._max_send_seconds = 0.0
+
     @classmethod
     def is_available(cls) -> bool:
         return ndi_is_available()
@@ -101,69 +143,110 @@ class NDIOutputSink(OutputSink):
             return False
 
     def send_frame(self, frame: np.ndarray | torch.Tensor) -> bool:
-        """Send a video frame over NDI."""
+        """Send a video frame over NDI without waiting for it to go out."""
         if self._send_instance is None or self._lib is None:
             return False
 
+        start = time.perf_counter()
         try:
-            # Convert torch tensor to numpy
-            if isinstance(frame, torch.Tensor):
-                if frame.is_cuda:
-                    frame = frame.cpu()
-                frame = frame.numpy()
-
-            # Ensure uint8
-            if frame.dtype != np.uint8:
-                if frame.max() <= 1.0:
-                    frame = (frame * 255).clip(0, 255).astype(np.uint8)
-                else:
-                    frame = frame.clip(0, 255).astype(np.uint8)
-
+            if frame.ndim == 2:
+                frame = frame[:, :, None]
             h, w = frame.shape[:2]
-            channels = frame.shape[2] if frame.ndim == 3 else 1
-
-            # Convert RGB to RGBA (NDI expects RGBA)
-            if channels == 3:
-                rgba = np.empty((h, w, 4), dtype=np.uint8)
-                rgba[:, :, :3] = frame
-                rgba[:, :, 3] = 255
-                frame = rgba
-            elif channels == 1:
-                rgba = np.empty((h, w, 4), dtype=np.uint8)
-                rgba[:, :, 0] = frame[:, :, 0]
-                rgba[:, :, 1] = frame[:, :, 0]
-                rgba[:, :, 2] = frame[:, :, 0]
-                rgba[:, :, 3] = 255
-                frame = rgba
-
-            if not frame.flags["C_CONTIGUOUS"]:
-                frame = np.ascontiguousarray(frame)
 
-            video_frame = NDIlib_video_frame_v2_t()
-            video_frame.xres = w
-            video_frame.yres = h
-            video_frame.FourCC = NDI_FOURCC_RGBA
-            video_frame.frame_rate_N = 30000
-            video_frame.frame_rate_D = 1001
-            video_frame.picture_aspect_ratio = 0.0
-            video_frame.frame_format_type = 1  # progressive
-            video_frame.timecode = -1  # auto
-            video_frame.p_data = frame.ctypes.data
-            video_frame.line_stride_in_bytes = w * 4
-            video_frame.p_metadata = None
-            video_frame.timestamp = -1  # auto
+            buffer = self._acquire_buffer(h, w)
+            self._copy_into(buffer, frame)
 
-            self._lib.NDIlib_send_send_video_v2(
+            video_frame = self._video_frames[self._next_buffer]
+            video_frame.frame_rate_N = self._frame_rate.numerator
+            video_frame.frame_rate_D = self._frame_rate.denominator
+            self._lib.NDIlib_send_send_video_async_v2(
                 self._send_instance, ctypes.byref(video_frame)
             )
-            return True
-
+            self._next_buffer = (self._next_buffer + 1) % self._buffer_count
         except Exception as e:
+            self._send_errors += 1
             logger.error(f"Error sending NDI frame: {e}")
             return False
 
+        elapsed = time.perf_counter() - start
+        self._frames_sent += 1
+        self._total_send_seconds += elapsed
+        self._max_send_seconds = max(self._max_send_seconds, elapsed)
+        return True
+
+    def set_frame_rate(self, fps: float):
+        """Advertise the producer's frame rate on subsequent frames."""
+        self._frame_rate = frame_rate_fraction(fps)
+
+    def get_stats(self) -> dict:
+        sent = self._frames_sent
+        return {
+            "frames_sent": sent,
+            "send_errors": self._send_errors,
+            "avg_send_ms": (self._total_send_seconds / sent * 1000) if sent else 0.0,
+            "max_send_ms": self._max_send_seconds * 1000,
+            "frame_rate": float(self._frame_rate),
+        }
+
+    def _acquire_buffer(self, height: int, width: int) -> np.ndarray:
+        """Return the next buffer to fill, (re)allocating for a new frame size."""
+        if not self._buffers or self._buffers[0].shape[:2] != (height, width):
+            self._allocate_buffers(height, width)
+        return self._buffers[self._next_buffer]
+
+    def _allocate_buffers(self, height: int, width: int):
+        # The SDK may still be reading the old buffers
+        self._flush()
+        self._buffers = []
+        self._video_frames = []
+        for _ in range(self._buffer_count):
+            # Alpha is written once here; frames only fill the colour channels
+            buffer = np.full((height, width, 4), 255, dtype=np.uint8)
+            video_frame = NDIlib_video_frame_v2_t()
+            video_frame.xres = width
+            video_frame.yres = height
+            video_frame.FourCC = NDI_FOURCC_RGBA
+            video_frame.picture_aspect_ratio = 0.0
+            video_frame.frame_format_type = NDI_FRAME_FORMAT_PROGRESSIVE
+            video_frame.timecode = -1  # auto
+            video_frame.p_data = buffer.ctypes.data
+            video_frame.line_stride_in_bytes = width * 4
+            video_frame.p_metadata = None
+            video_frame.timestamp = -1  # auto
+            self._buffers.append(buffer)
+            self._video_frames.append(video_frame)
+        self._next_buffer = 0
+
+    @staticmethod
+    def _copy_into(buffer: np.ndarray, frame: np.ndarray | torch.Tensor):
+        """Write an (H, W, C) frame into an RGBA buffer, converting to uint8."""
+        channels = frame.shape[2]
+        if isinstance(frame, torch.Tensor):
+            target = torch.from_numpy(buffer)
+            if frame.dtype != torch.uint8:
+                scale = 255.0 if frame.max() <= 1.0 else 1.0
+                frame = (frame * scale).clamp(0, 255).to(torch.uint8)
+            # One device-to-host copy straight into the send buffer
+            target[:, :, : min(channels, 4)].copy_(frame[:, :, :4])
+            if channels == 1:
+                target[:, :, 1:3].copy_(target[:, :, :1].expand(-1, -1, 2))
+            return
+
+        if frame.dtype != np.uint8:
+            scale = 255 if frame.max() <= 1.0 else 1
+            frame = (frame * scale).clip(0, 255).astype(np.uint8)
+        # Per-channel copies run several times faster than one copy whose
+        # innermost axis has only three or four elements
+        for channel in range(3 if channels < 4 else 4):
+            buffer[:, :, channel] = frame[:, :, min(channel, channels - 1)]
+
+    def _flush(self):
+        """Wait until the SDK has released every submitted buffer."""
+        if self._send_instance is not None and self._lib is not None:
+            self._lib.NDIlib_send_send_video_async_v2(self._send_instance, None)
+
     def resize(self, width: int, height: int):
-        """Update output dimensions (NDI rebuilds frame struct per-send)."""
+        """Update output dimensions (buffers follow the size of sent frames)."""
         self._width = width
         self._height = height
 
@@ -171,6 +254,7 @@ class NDIOutputSink(OutputSink):
         """Release NDI sender resources."""
         if self._send_instance is not None and self._lib is not None:
             try:
+                self._flush()
                 self._lib.NDIlib_send_destroy(self._send_instance)
             except Exception as e:
                 logger.error(f"Error destroying NDI sender: {e}")
@@ -179,3 +263,6 @@ class NDIOutputSink(OutputSink):
                 self._name = ""
                 self._width = 0
                 self._height = 0
+                self._buffers = []
+                self._video_frames = []
+                self._next_buffer = 0
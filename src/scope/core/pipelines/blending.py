@@ -1,4 +1,6 @@
+import copy
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 
@@ -21,24 +23,30 @@ SLERP_PARALLEL_THRESHOLD = 1e-4  # Threshold for detecting parallel embeddings i
 # Minimum embedding difference threshold for skipping transitions
 MIN_EMBEDDING_DIFF_THRESHOLD = 0.01
 
+# Number of spatial blends EmbeddingBlender keeps for repeated prompt sets
+BLEND_CACHE_SIZE = 4
+
+
+def _normalized_weight_values(weights) -> list[float]:
+    """Normalize weights to sum to 1.0, as Python floats"""
+    values = [float(weight) for weight in weights]
+    total = sum(values)
+    if total > 0:
+        return [value / total for value in values]
+    # Fallback: equal weights for all inputs
+    logger.warning(
+        "normalize_weights: All weights zero or negative, using equal weights"
+    )
+    return [1.0 / len(values)] * len(values)
+
 
 def normalize_weights(weights, dtype, device) -> torch.Tensor:
     """Normalize weights to sum to 1.0"""
-    weights_tensor = torch.tensor(weights, dtype=dtype, device=device)
-    total = weights_tensor.sum()
-    if total > 0:
-        weights_tensor = weights_tensor / total
-    else:
-        # Fallback: equal weights for all inputs
-        weights_tensor = torch.ones_like(weights_tensor) / len(weights_tensor)
-        logger.warning(
-            "normalize_weights: All weights zero or negative, using equal weights"
-        )
-    return weights_tensor
+    return torch.tensor(_normalized_weight_values(weights), dtype=dtype, device=device)
 
 
-def slerp(embed1, embed2, t) -> torch.Tensor:
-    """Spherical linear interpolation between two embeddings"""
+def slerp_angle(embed1, embed2) -> torch.Tensor | None:
+    """Angle between two embeddings along the last dim, or None if nearly parallel"""
     # Normalize embeddings
     embed1_norm = embed1 / (embed1.norm(dim=-1, keepdim=True) + EPSILON)
     embed2_norm = embed2 / (embed2.norm(dim=-1, keepdim=True) + EPSILON)
@@ -49,19 +57,30 @@ def slerp(embed1, embed2, t) -> torch.Tensor:
     dot_product = torch.clamp(dot_product, -1.0, 1.0)
     omega = torch.acos(dot_product)
 
-    # Fall back to linear interpolation when embeddings are nearly parallel
+    # Callers fall back to linear interpolation when embeddings are nearly parallel
     if omega.abs().max() < SLERP_PARALLEL_THRESHOLD:
+        return None
+    return omega
+
+
+def slerp_from_angle(embed1, embed2, omega, t) -> torch.Tensor:
+    """Slerp using an angle precomputed by slerp_angle()"""
+    if omega is None:
         return (1.0 - t) * embed1 + t * embed2
 
-    sin_omega = torch.sin(omega)
+    sin_omega = torch.sin(omega) + EPSILON
 
     # Compute interpolation coefficients
-    coeff1 = torch.sin((1.0 - t) * omega) / (sin_omega + EPSILON)
-    coeff2 = torch.sin(t * omega) / (sin_omega + EPSILON)
+    coeff1 = torch.sin((1.0 - t) * omega) / sin_omega
+    coeff2 = torch.sin(t * omega) / sin_omega
 
     # Interpolate
-    result = coeff1 * embed1 + coeff2 * embed2
-    return result
+    return coeff1 * embed1 + coeff2 * embed2
+
+
+def slerp(embed1, embed2, t) -> torch.Tensor:
+    """Spherical linear interpolation between two embeddings"""
+    return slerp_from_angle(embed1, embed2, slerp_angle(embed1, embed2), t)
 
 
 def blend_embeddings(embeddings, weights, method, dtype, device) -> torch.Tensor | None:
@@ -70,33 +89,78 @@ def blend_embeddings(embeddings, weights, method, dtype, device) -> torch.Tensor
         logger.warning("blend_embeddings: No embeddings provided")
         return None
 
-    # Normalize weights
-    normalized_weights = normalize_weights(weights, dtype, device)
+    # Normalize weights on the host, so reading them back never syncs the device
+    normalized_weights = _normalized_weight_values(weights)
 
     # Apply interpolation
     if method == "slerp" and len(embeddings) == 2:
         # Spherical linear interpolation for 2 prompts
-        t = normalized_weights[1].item()
-        combined_embeds = slerp(embeddings[0], embeddings[1], t)
-    else:
-        # Linear interpolation (weighted average) with normalization
-        # Compute weighted average of norms to preserve magnitude
-        target_norm = sum(
-            embed.norm() * weight
-            for embed, weight in zip(embeddings, normalized_weights, strict=False)
-        )
+        return slerp(embeddings[0], embeddings[1], normalized_weights[1])
+
+    if len(embeddings) == 1:
+        return embeddings[0].clone()
+
+    # Linear interpolation (weighted average) with normalization, as one
+    # batched reduction over the stacked embeddings
+    stacked = torch.stack(embeddings)
+    weights_tensor = torch.tensor(
+        normalized_weights, dtype=stacked.dtype, device=stacked.device
+    ).view(-1, *([1] * embeddings[0].dim()))
+
+    # Weighted average of norms, to preserve magnitude
+    norms = stacked.flatten(start_dim=1).norm(dim=1)
+    target_norm = (norms * weights_tensor.flatten()).sum()
+
+    # Compute linear blend
+    combined_embeds = (stacked * weights_tensor).sum(dim=0)
+
+    # Normalize to preserve embedding magnitude and prevent artifacts
+    current_norm = combined_embeds.norm()
+    scale = torch.where(
+        current_norm > EPSILON,
+        target_norm / current_norm.clamp_min(EPSILON),
+        torch.ones_like(current_norm),
+    )
+    return combined_embeds * scale
+
+
+class TransitionSchedule:
+    """Interpolated embeddings from a source to a target, produced step by step.
+
+    The slerp angle between source and target is computed once when the
+    transition starts, so each step only evaluates two sines and a weighted
+    sum instead of recomputing norms and acos over the full embedding. Steps
+    are produced when they are needed rather than all held in memory.
+    """
 
-        # Compute linear blend
-        combined_embeds = torch.zeros_like(embeddings[0])
-        for embed, weight in zip(embeddings, normalized_weights, strict=False):
-            combined_embeds += weight * embed
+    def __init__(
+        self,
+        source: torch.Tensor,
+        target: torch.Tensor,
+        num_steps: int,
+        method: str,
+    ) -> None:
+        self.source = source
+        self.target = target
+        self.method = method
+        self.t_values = torch.linspace(0, 1, steps=num_steps).tolist()
+        self.index = 0
+        self._omega = slerp_angle(source, target) if method == "slerp" else None
 
-        # Normalize to preserve embedding magnitude and prevent artifacts
-        current_norm = combined_embeds.norm()
-        if current_norm > EPSILON:
-            combined_embeds = combined_embeds * (target_norm / current_norm)
+    def __len__(self) -> int:
+        """Number of steps left."""
+        return len(self.t_values) - self.index
 
-    return combined_embeds
+    def embedding_at(self, t: float) -> torch.Tensor:
+        if self.method == "slerp":
+            return slerp_from_angle(self.source, self.target, self._omega, t)
+        return torch.lerp(self.source, self.target, t)
+
+    def pop(self) -> torch.Tensor:
+        """Return the next step's embedding and advance."""
+        t = self.t_values[self.index]
+        self.index += 1
+        return self.embedding_at(t).detach()
 
 
 @dataclass(frozen=True, slots=True)
@@ -178,11 +242,20 @@ class EmbeddingBlender:
         self._state = BlenderState.IDLE
 
         # Temporal interpolation state (embedding transitions)
-        self._transition_queue = []  # Queue of pre-computed interpolated embeddings
+        self._transition: TransitionSchedule | None = None  # Active transition
         self._current_blend_embedding = None  # Cached current blend for transitions
 
+        # Recent spatial blends by prompt key. Shared by every stream on the
+        # pipeline, since the same prompts always blend to the same embedding
+        self._blend_cache: OrderedDict = OrderedDict()
+
     def blend(
-        self, embeddings, weights, interpolation_method, cache_result=True
+        self,
+        embeddings,
+        weights,
+        interpolation_method,
+        cache_result=True,
+        cache_key=None,
     ) -> torch.Tensor | None:
         """Blend pre-encoded embeddings using specified interpolation method.
 
@@ -191,6 +264,9 @@ class EmbeddingBlender:
             weights: List of weights corresponding to each embedding
             interpolation_method: Method for spatial interpolation ('linear' or 'slerp')
             cache_result: Whether to cache the result as current blend (default True)
+            cache_key: Hashable key identifying the prompts the embeddings were
+                encoded from. Blends with a key are kept, and a repeated blend of
+                the same key, weights and method returns a copy without recomputing
 
         Returns:
             Blended embedding tensor, or None if inputs are invalid
@@ -205,10 +281,25 @@ class EmbeddingBlender:
             )
             return None
 
-        # Use the utility function for actual blending
-        result = blend_embeddings(
-            embeddings, weights, interpolation_method, self.dtype, self.device
-        )
+        key = None
+        result = None
+        if cache_key is not None:
+            key = (cache_key, tuple(weights), interpolation_method)
+            cached = self._blend_cache.get(key)
+            if cached is not None:
+                self._blend_cache.move_to_end(key)
+                # Callers keep the result in mutable pipeline state, so they
+                # get their own copy and the cached blend is never written to
+                result = cached.clone()
+        if result is None:
+            # Use the utility function for actual blending
+            result = blend_embeddings(
+                embeddings, weights, interpolation_method, self.dtype, self.device
+            )
+            if key is not None and result is not None:
+                self._blend_cache[key] = result.detach().clone()
+                while len(self._blend_cache) > BLEND_CACHE_SIZE:
+                    self._blend_cache.popitem(last=False)
 
         # Cache the current blend for potential transitions (unless explicitly disabled)
         if result is not None and cache_result:
@@ -237,7 +328,8 @@ class EmbeddingBlender:
     ) -> None:
         """Start a temporal transition from source embedding to target embedding.
 
-        This pre-computes interpolated embeddings.
+        This prepares the interpolation schedule; get_next_embedding() then
+        produces one step per call.
 
         Args:
             source_embedding: Pre-encoded current embedding tensor to transition from
@@ -273,45 +365,34 @@ class EmbeddingBlender:
         if diff_norm < MIN_EMBEDDING_DIFF_THRESHOLD:
             return
 
-        # Pre-compute interpolation steps
         # Generate num_steps embeddings from current to target
-        t_values = torch.linspace(0, 1, steps=num_steps).to(self.device)
-
-        interpolated_embeddings = []
-        for _i, t in enumerate(t_values):
-            if temporal_interpolation_method == "slerp":
-                interpolated = slerp(
-                    self._current_blend_embedding, target_embedding, t.item()
-                )
-            else:
-                # Linear interpolation
-                interpolated = torch.lerp(
-                    self._current_blend_embedding, target_embedding, t
-                )
-            interpolated_embeddings.append(interpolated.detach())
-
-        # Store interpolated embeddings in queue and update state
-        self._transition_queue = interpolated_embeddings
+        self._transition = TransitionSchedule(
+            self._current_blend_embedding,
+            target_embedding.detach(),
+            num_steps,
+            temporal_interpolation_method,
+        )
         self._state = BlenderState.TRANSITIONING
 
     def get_next_embedding(self) -> torch.Tensor | None:
         """Get the next interpolated embedding during a transition.
 
         This should be called on each generation call. If a transition is active,
-        it will return and pop the next interpolated embedding from the queue.
+        it will return the next interpolated embedding of the schedule.
         Otherwise, it returns None.
 
         Returns:
             Next interpolated embedding during transition, or None if not transitioning
         """
-        # If we have a transition in progress, pop from queue
-        if self._state == BlenderState.TRANSITIONING and self._transition_queue:
-            next_embedding = self._transition_queue.pop(0)
+        # If we have a transition in progress, take its next step
+        if self._state == BlenderState.TRANSITIONING and self._transition:
+            next_embedding = self._transition.pop()
 
             # Update cached current blend as we progress
             self._current_blend_embedding = next_embedding
 
-            if not self._transition_queue:
+            if not self._transition:
+                self._transition = None
                 self._state = BlenderState.IDLE
 
             return next_embedding
@@ -324,13 +405,31 @@ class EmbeddingBlender:
         return self._state == BlenderState.TRANSITIONING
 
     def cancel_transition(self) -> None:
-        """Cancel any active transition and clear the queue."""
+        """Cancel any active transition and drop its schedule."""
         if self._state == BlenderState.TRANSITIONING:
-            self._transition_queue.clear()
+            self._transition = None
             self._state = BlenderState.IDLE
 
     def reset(self) -> None:
         """Fully reset temporal state for fresh sessions (e.g., after cache reset)."""
-        self._transition_queue.clear()
+        self._transition = None
         self._current_blend_embedding = None
         self._state = BlenderState.IDLE
+
+    def stream_state(self) -> dict:
+        """Return the transition state of the current stream."""
+        return {
+            "state": self._state,
+            # Schedules advance in place, so save the position separately
+            "transition": copy.copy(self._transition),
+            "current_blend_embedding": self._current_blend_embedding,
+        }
+
+    def load_stream_state(self, stream_state: dict | None) -> None:
+        """Resume a stream saved by stream_state(), or start fresh if None."""
+        if stream_state is None:
+            self.reset()
+            return
+        self._state = stream_state["state"]
+        self._transition = copy.copy(stream_state["transition"])
+        self._current_blend_embedding = stream_state["current_blend_embedding"]
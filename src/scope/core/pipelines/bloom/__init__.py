@@ -1,4 +1,13 @@
-from .pipeline import BloomPipeline
 from .bloom_schema import BloomConfig
 
+
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "BloomPipeline":
+        from .pipeline import BloomPipeline
+
+        return BloomPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["BloomPipeline", "BloomConfig"]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import ClassVar
+from typing import ClassVar, Literal
 
 from pydantic import Field
 
@@ -59,8 +59,16 @@ class BloomConfig(BasePipelineConfig):
         description="Downsample factor for performance (higher = faster, lower quality)",
         json_schema_extra=ui_field_config(order=5, label="Downsample"),
     )
+    mode: Literal["gaussian", "pyramid"] = Field(
+        default="gaussian",
+        description=(
+            "Blur method: full-resolution Gaussian, or a mip pyramid whose cost "
+            "stays roughly constant as the radius grows"
+        ),
+        json_schema_extra=ui_field_config(order=6, label="Mode"),
+    )
     debug: bool = Field(
         default=False,
         description="Enable debug logging",
-        json_schema_extra=ui_field_config(order=6, label="Debug"),
+        json_schema_extra=ui_field_config(order=7, label="Debug"),
     )
@@ -15,6 +15,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Pyramid mode: deepest mip level, and the largest blur radius applied per level
+PYRAMID_MAX_LEVELS = 6
+PYRAMID_LEVEL_RADIUS = 2
+
 
 class BloomPipeline(Pipeline):
     """Applies a bloom/glow post-processing effect to video frames."""
@@ -31,6 +35,8 @@ class BloomPipeline(Pipeline):
         )
         self._cached_kernel: torch.Tensor | None = None
         self._cached_radius: int | None = None
+        # Pyramid level kernels, keyed by level radius
+        self._level_kernels: dict[int, torch.Tensor] = {}
 
     def prepare(self, **kwargs) -> Requirements:
         """Declare that we need 1 input frame."""
@@ -54,6 +60,7 @@ class BloomPipeline(Pipeline):
         intensity = float(kwargs.get("intensity", 1.0))
         radius = max(1, min(48, int(kwargs.get("radius", 8))))
         downsample = max(1, min(4, int(kwargs.get("downsample", 1))))
+        mode = kwargs.get("mode", "gaussian")
         debug = bool(kwargs.get("debug", False))
 
         # Stack frames and normalize [0, 255] -> [0, 1]
@@ -63,7 +70,8 @@ class BloomPipeline(Pipeline):
         if debug:
             logger.info(
                 "[Bloom] in: %s range [%.2f, %.2f] | params: threshold=%.2f "
-                "soft_knee=%.2f intensity=%.2f radius=%d downsample=%d device=%s",
+                "soft_knee=%.2f intensity=%.2f radius=%d downsample=%d mode=%s "
+                "device=%s",
                 tuple(frames.shape),
                 frames.min().item(),
                 frames.max().item(),
@@ -72,6 +80,7 @@ class BloomPipeline(Pipeline):
                 intensity,
                 radius,
                 downsample,
+                mode,
                 self.device,
             )
 
@@ -99,10 +108,14 @@ class BloomPipeline(Pipeline):
                 highlights, kernel_size=downsample, stride=downsample
             )
 
-        # Separable Gaussian blur
         effective_radius = max(1, radius // downsample) if downsample > 1 else radius
-        kernel = self._get_kernel(effective_radius)
-        blurred = _separable_blur(highlights, kernel, effective_radius)
+        if mode == "pyramid":
+            # Mip-pyramid blur: cost stays roughly constant as radius grows
+            blurred = self._pyramid_blur(highlights, effective_radius)
+        else:
+            # Separable Gaussian blur
+            kernel = self._get_kernel(effective_radius)
+            blurred = _separable_blur(highlights, kernel, effective_radius)
 
         if debug:
             logger.info("[Bloom] blurred mean: %.6f", blurred.mean().item())
@@ -139,6 +152,45 @@ class BloomPipeline(Pipeline):
         self._cached_radius = radius
         return kernel
 
+    def _get_level_kernel(self, radius: int) -> torch.Tensor:
+        """Return the cached 1-D Gaussian kernel for a pyramid level."""
+        kernel = self._level_kernels.get(radius)
+        if kernel is None or kernel.device != self.device:
+            kernel = _gaussian_kernel_1d(radius).to(self.device)
+            self._level_kernels[radius] = kernel
+        return kernel
+
+    def _pyramid_blur(self, x: torch.Tensor, radius: int) -> torch.Tensor:
+        """Approximate a wide blur with a downsample/blur/upsample-accumulate pyramid.
+
+        Each level halves the resolution and applies a small Gaussian, so a level
+        covers twice the footprint of the previous one at a quarter of the cost.
+        The number of levels grows with log2(radius) up to PYRAMID_MAX_LEVELS.
+        """
+        num_levels = min(PYRAMID_MAX_LEVELS, max(1, radius.bit_length()))
+
+        levels = []
+        level = x
+        for i in range(num_levels):
+            if min(level.shape[2], level.shape[3]) < 2:
+                break
+            level = F.avg_pool2d(level, kernel_size=2, stride=2, ceil_mode=True)
+            level_radius = max(1, min(PYRAMID_LEVEL_RADIUS, -(-radius // (2 << i))))
+            kernel = self._get_level_kernel(level_radius)
+            levels.append(_separable_blur(level, kernel, level_radius))
+
+        if not levels:
+            return x
+
+        # Upsample from the coarsest level, accumulating each finer level
+        acc = levels[-1]
+        for level in reversed(levels[:-1]):
+            acc = level + F.interpolate(
+                acc, size=level.shape[2:], mode="bilinear", align_corners=False
+            )
+        acc = F.interpolate(acc, size=x.shape[2:], mode="bilinear", align_corners=False)
+        return acc / len(levels)
+
 
 # ---------------------------------------------------------------------------
 # Pure functions (no state)
@@ -0,0 +1,42 @@
+import time
+
+import torch
+
+from scope.core.pipelines.utils import print_statistics
+
+from .pipeline import BloomPipeline
+
+RESOLUTIONS = [(720, 1280), (1080, 1920)]
+RADII = [4, 16, 48]
+NUM_ITERATIONS = 10
+
+
+def main():
+    """Benchmark the Gaussian and pyramid bloom modes on CPU."""
+    device = torch.device("cpu")
+    pipeline = BloomPipeline(device=device)
+
+    for height, width in RESOLUTIONS:
+        # Synthetic frame with bright highlights so the blur path is exercised
+        frame = torch.randint(0, 256, (1, height, width, 3), dtype=torch.uint8)
+
+        for radius in RADII:
+            for mode in ("gaussian", "pyramid"):
+                # Warmup to populate kernel caches
+                pipeline(video=[frame], radius=radius, mode=mode, threshold=0.5)
+
+                latency_measures = []
+                fps_measures = []
+                for _ in range(NUM_ITERATIONS):
+                    start = time.time()
+                    pipeline(video=[frame], radius=radius, mode=mode, threshold=0.5)
+                    latency = time.time() - start
+                    latency_measures.append(latency)
+                    fps_measures.append(1.0 / latency)
+
+                print(f"\n{width}x{height} radius={radius} mode={mode}")
+                print_statistics(latency_measures, fps_measures)
+
+
+if __name__ == "__main__":
+    main()
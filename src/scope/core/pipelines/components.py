@@ -8,6 +8,9 @@ class ComponentsManager:
     def add(self, name: str, component):
         self._components[name] = component
 
+    def items(self):
+        return self._components.items()
+
     def __getattr__(self, name):
         try:
             return self._components[name]
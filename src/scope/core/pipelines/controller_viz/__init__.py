@@ -1,6 +1,15 @@
 """Controller Visualizer pipeline for testing WASD and mouse input."""
 
-from .pipeline import ControllerVisualizerPipeline
 from .schema import ControllerVisualizerConfig
 
+
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "ControllerVisualizerPipeline":
+        from .pipeline import ControllerVisualizerPipeline
+
+        return ControllerVisualizerPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["ControllerVisualizerPipeline", "ControllerVisualizerConfig"]
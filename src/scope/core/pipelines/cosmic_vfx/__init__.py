@@ -1,4 +1,13 @@
-from .pipeline import CosmicVFXPipeline
 from .schema import CosmicVFXConfig
 
+
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "CosmicVFXPipeline":
+        from .pipeline import CosmicVFXPipeline
+
+        return CosmicVFXPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["CosmicVFXPipeline", "CosmicVFXConfig"]
@@ -1,3 +1,10 @@
-from .pipeline import GrayPipeline
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "GrayPipeline":
+        from .pipeline import GrayPipeline
+
+        return GrayPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["GrayPipeline"]
@@ -30,6 +30,10 @@ class Pipeline(ABC):
     from defaults.py (resolve_input_mode, apply_mode_defaults_to_state, etc.).
     """
 
+    # Instance attributes holding per-stream state. When several sessions share
+    # one instance, these are swapped per session so each keeps its own caches.
+    session_state_attributes: tuple[str, ...] = ("state", "first_call", "last_mode")
+
     @classmethod
     def get_config_class(cls) -> type["BasePipelineConfig"]:
         """Return the Pydantic config class for this pipeline.
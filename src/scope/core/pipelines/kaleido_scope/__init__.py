@@ -1,10 +1,23 @@
-from .pipeline import (
-    KaleidoScopePipeline,
-    KaleidoScopePrePipeline,
-    KaleidoScopePostPipeline,
-)
 from .schema import KaleidoScopeConfig, KaleidoScopePostConfig, KaleidoScopePreConfig
 
+
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "KaleidoScopePipeline":
+        from .pipeline import KaleidoScopePipeline
+
+        return KaleidoScopePipeline
+    elif name == "KaleidoScopePrePipeline":
+        from .pipeline import KaleidoScopePrePipeline
+
+        return KaleidoScopePrePipeline
+    elif name == "KaleidoScopePostPipeline":
+        from .pipeline import KaleidoScopePostPipeline
+
+        return KaleidoScopePostPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "KaleidoScopePipeline",
     "KaleidoScopePrePipeline",
@@ -1,3 +1,10 @@
-from .pipeline import KreaRealtimeVideoPipeline
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "KreaRealtimeVideoPipeline":
+        from .pipeline import KreaRealtimeVideoPipeline
+
+        return KreaRealtimeVideoPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["KreaRealtimeVideoPipeline"]
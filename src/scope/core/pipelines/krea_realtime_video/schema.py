@@ -10,8 +10,7 @@ from ..common_artifacts import (
     VACE_14B_ARTIFACT,
     WAN_1_3B_ARTIFACT,
 )
-from ..enums import Quantization
-from ..utils import VaeType
+from ..enums import Quantization, VaeType
 
 
 class KreaRealtimeVideoConfig(BasePipelineConfig):
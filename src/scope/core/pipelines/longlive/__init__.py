@@ -1,3 +1,10 @@
-from .pipeline import LongLivePipeline
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "LongLivePipeline":
+        from .pipeline import LongLivePipeline
+
+        return LongLivePipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["LongLivePipeline"]
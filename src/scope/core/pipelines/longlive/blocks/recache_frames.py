@@ -1,3 +1,5 @@
+import logging
+
 import torch
 from diffusers.modular_pipelines import ModularPipelineBlocks, PipelineState
 from diffusers.modular_pipelines.modular_pipeline_utils import (
@@ -12,6 +14,8 @@ from scope.core.pipelines.wan2_1.utils import (
     initialize_kv_cache,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class RecacheFramesBlock(ModularPipelineBlocks):
     @property
@@ -81,6 +85,16 @@ class RecacheFramesBlock(ModularPipelineBlocks):
                 type_hint=bool,
                 description="Whether conditioning_embeds were updated (requires frame recaching)",
             ),
+            InputParam(
+                "recache_transition_frames",
+                type_hint=int | None,
+                default=None,
+                description=(
+                    "Newest frames to recache on each step of a prompt transition "
+                    "(defaults to num_frame_per_block). The full window is recached "
+                    "when the transition ends"
+                ),
+            ),
         ]
 
     @property
@@ -129,6 +143,7 @@ class RecacheFramesBlock(ModularPipelineBlocks):
                 device=generator_param.device,
             )
 
+            state.set("_recache_pending_stats", None)
             self.set_block_state(state, block_state)
             return components, state
 
@@ -165,6 +180,22 @@ class RecacheFramesBlock(ModularPipelineBlocks):
         num_recache_frames = min(
             block_state.current_start_frame, components.config.local_attn_size
         )
+
+        # Every step of an embedding transition updates the conditioning. While
+        # more steps follow, only the newest frames are recached: older frames
+        # in the window keep the keys from the previous step, which differ from
+        # this step's by one small interpolation step. The step that ends the
+        # transition recaches the whole window under the final embedding.
+        # Without global_sink the cache is reset above, so the whole window
+        # must always be recached.
+        in_transition = state.get("_transition_active", False)
+        if in_transition and global_sink:
+            transition_frames = (
+                block_state.recache_transition_frames
+                or components.config.num_frame_per_block
+            )
+            num_recache_frames = min(num_recache_frames, transition_frames)
+
         recache_start = block_state.current_start_frame - num_recache_frames
         recache_frames = (
             block_state.recache_buffer[:, -num_recache_frames:]
@@ -218,5 +249,25 @@ class RecacheFramesBlock(ModularPipelineBlocks):
             crossattn_cache_existing=block_state.crossattn_cache,
         )
 
+        # Account recache compute to the prompt change in progress, and publish
+        # the total once it is complete
+        stats = state.get("_recache_pending_stats") or {
+            "frames": 0,
+            "tokens": 0,
+            "calls": 0,
+        }
+        stats["frames"] += num_recache_frames
+        stats["tokens"] += num_recache_frames * frame_seq_length
+        stats["calls"] += 1
+        if in_transition:
+            state.set("_recache_pending_stats", stats)
+        else:
+            state.set("_recache_pending_stats", None)
+            state.set("recache_stats", stats)
+            logger.info(
+                f"Recached {stats['frames']} frames ({stats['tokens']} tokens) in "
+                f"{stats['calls']} generator calls for prompt change"
+            )
+
         self.set_block_state(state, block_state)
         return components, state
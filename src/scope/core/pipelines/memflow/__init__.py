@@ -1,3 +1,10 @@
-from .pipeline import MemFlowPipeline
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "MemFlowPipeline":
+        from .pipeline import MemFlowPipeline
+
+        return MemFlowPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["MemFlowPipeline"]
@@ -0,0 +1,96 @@
+import torch
+
+# Smallest value range used as the divisor, so constant inputs map to 0
+EPSILON = 1e-6
+
+# torch.quantile rejects inputs above this many elements, so larger chunks are
+# strided down before estimating percentiles
+MAX_QUANTILE_SAMPLES = 1 << 20
+
+
+class StreamingNormalizer:
+    """Min/max normalization with statistics smoothed across chunks.
+
+    Control maps (depth, optical flow) normalized by each chunk's own min/max
+    pump in brightness from chunk to chunk, which downstream VACE conditioning
+    has to re-learn every time. This keeps an exponential moving average of the
+    low/high statistics instead. All statistics stay on the input device as 0-d
+    tensors, so updating them never forces a host sync.
+
+    Call reset() whenever the stream is cut (e.g. on init_cache) so the next
+    chunk re-seeds the statistics instead of blending with stale ones.
+    """
+
+    def __init__(
+        self,
+        momentum: float = 0.1,
+        percentiles: tuple[float, float] | None = None,
+    ):
+        """Initialize the normalizer.
+
+        Args:
+            momentum: Weight of the newest chunk in the moving average, in (0, 1].
+                1.0 reproduces plain per-chunk normalization.
+            percentiles: Optional (low, high) percentiles in [0, 100] used instead
+                of the chunk min/max, which makes the statistics robust to outliers.
+        """
+        if not 0.0 < momentum <= 1.0:
+            raise ValueError(f"momentum must be in (0, 1], got {momentum}")
+        if (
+            percentiles is not None
+            and not 0.0 <= percentiles[0] < percentiles[1] <= 100.0
+        ):
+            raise ValueError(f"Invalid percentiles: {percentiles}")
+
+        self.momentum = momentum
+        self.percentiles = percentiles
+        self.low: torch.Tensor | None = None
+        self.high: torch.Tensor | None = None
+
+    def reset(self) -> None:
+        """Forget the accumulated statistics."""
+        self.low = None
+        self.high = None
+
+    def _chunk_stats(self, x: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        x = x.detach().float()
+        if self.percentiles is None:
+            return x.amin(), x.amax()
+
+        flat = x.flatten()
+        if flat.numel() > MAX_QUANTILE_SAMPLES:
+            stride = -(-flat.numel() // MAX_QUANTILE_SAMPLES)
+            flat = flat[::stride]
+        q = torch.tensor(self.percentiles, device=flat.device) / 100.0
+        low, high = torch.quantile(flat, q)
+        return low, high
+
+    def update(self, x: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Fold the statistics of a chunk into the running estimate.
+
+        Args:
+            x: Chunk of values, any shape
+
+        Returns:
+            Tuple of (low, high) 0-d tensors after the update
+        """
+        low, high = self._chunk_stats(x)
+        if self.low is None or self.low.device != low.device:
+            self.low, self.high = low, high
+        else:
+            self.low = torch.lerp(self.low, low, self.momentum)
+            self.high = torch.lerp(self.high, high, self.momentum)
+        return self.low, self.high
+
+    def __call__(self, x: torch.Tensor) -> torch.Tensor:
+        """Update the statistics with a chunk and normalize it to [0, 1].
+
+        Args:
+            x: Chunk of values, any shape
+
+        Returns:
+            Float tensor with the same shape as x, clamped to [0, 1]
+        """
+        low, high = self.update(x)
+        scale = (high - low).clamp(min=EPSILON)
+        return ((x.float() - low) / scale).clamp(0.0, 1.0)
@@ -1,5 +1,13 @@
 """Optical Flow pipeline for VACE conditioning."""
 
-from .pipeline import OpticalFlowPipeline
+
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "OpticalFlowPipeline":
+        from .pipeline import OpticalFlowPipeline
+
+        return OpticalFlowPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["OpticalFlowPipeline"]
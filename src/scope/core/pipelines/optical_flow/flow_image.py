@@ -0,0 +1,85 @@
+"""Color coding of optical flow for visualization.
+
+Uses the color wheel of the Middlebury flow benchmark (Baker et al., "A Database
+and Evaluation Methodology for Optical Flow", ICCV 2007), as torchvision's
+flow_to_image does. torchvision's public function always rescales by the
+batch's largest vector, so the conversion of flow that is already normalized
+lives here.
+"""
+
+import functools
+
+import torch
+
+# Hues between each pair of primary and secondary colors around the wheel
+RED_YELLOW = 15
+YELLOW_GREEN = 6
+GREEN_CYAN = 4
+CYAN_BLUE = 11
+BLUE_MAGENTA = 13
+MAGENTA_RED = 6
+
+
+def make_colorwheel() -> torch.Tensor:
+    """Build the Middlebury color wheel.
+
+    Returns:
+        Colors around the wheel as tensor [55, 3], RGB in [0, 255]
+    """
+    # (hues, channel that ramps, whether it ramps up, channel held at 255)
+    segments = [
+        (RED_YELLOW, 1, True, 0),
+        (YELLOW_GREEN, 0, False, 1),
+        (GREEN_CYAN, 2, True, 1),
+        (CYAN_BLUE, 1, False, 2),
+        (BLUE_MAGENTA, 0, True, 2),
+        (MAGENTA_RED, 2, False, 0),
+    ]
+    colorwheel = torch.zeros(sum(hues for hues, *_ in segments), 3)
+    start = 0
+    for hues, ramp, rising, full in segments:
+        ramp_values = torch.floor(255 * torch.arange(hues) / hues)
+        end = start + hues
+        colorwheel[start:end, ramp] = ramp_values if rising else 255 - ramp_values
+        colorwheel[start:end, full] = 255
+        start = end
+    return colorwheel
+
+
+@functools.cache
+def _colorwheel(device: torch.device) -> torch.Tensor:
+    return make_colorwheel().to(device) / 255.0
+
+
+@torch.no_grad()
+def normalized_flow_to_image(normalized_flow: torch.Tensor) -> torch.Tensor:
+    """Color code flow whose vectors are no longer than 1.
+
+    The direction picks the hue and the length the saturation, so zero flow is
+    white and unit vectors get the fully saturated wheel color.
+
+    Args:
+        normalized_flow: Flow as tensor [N, 2, H, W]
+
+    Returns:
+        RGB images as float tensor [N, 3, H, W] in [0, 1], quantized to 8 bits
+    """
+    colorwheel = _colorwheel(normalized_flow.device)
+    num_colors = colorwheel.shape[0]
+
+    u, v = normalized_flow[:, 0], normalized_flow[:, 1]
+    norm = torch.sqrt(u.square() + v.square()).unsqueeze(1)
+    angle = torch.atan2(-v, -u) / torch.pi
+
+    # Interpolate between the two wheel colors either side of the angle
+    position = (angle + 1) / 2 * (num_colors - 1)
+    k0 = position.floor().long()
+    k1 = (k0 + 1) % num_colors
+    f = (position - k0).unsqueeze(1)
+    color0 = colorwheel[k0].permute(0, 3, 1, 2)
+    color1 = colorwheel[k1].permute(0, 3, 1, 2)
+    color = (1 - f) * color0 + f * color1
+
+    # Short vectors fade toward white
+    color = 1 - norm * (1 - color)
+    return torch.floor(255 * color) / 255.0
@@ -10,9 +10,10 @@ from typing import TYPE_CHECKING
 
 import torch
 import torch.nn.functional as F
-from torchvision.utils import flow_to_image
 
 from ..interface import Pipeline, Requirements
+from ..normalization import EPSILON, StreamingNormalizer
+from .flow_image import normalized_flow_to_image
 from .schema import OpticalFlowConfig
 
 if TYPE_CHECKING:
@@ -20,6 +21,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Weight of each new chunk in the flow magnitude moving average
+NORMALIZATION_MOMENTUM = 0.2
+
 
 class OpticalFlowPipeline(Pipeline):
     """Optical flow pipeline for VACE conditioning.
@@ -32,6 +36,9 @@ class OpticalFlowPipeline(Pipeline):
     The model is lazily initialized on first use.
     """
 
+    # Flow magnitude range carried from chunk to chunk
+    session_state_attributes = ("_normalizer",)
+
     @classmethod
     def get_config_class(cls) -> type["BasePipelineConfig"]:
         return OpticalFlowConfig
@@ -65,6 +72,9 @@ class OpticalFlowPipeline(Pipeline):
 
         self._pytorch_model = None
 
+        # Flow magnitude smoothed across chunks for a stable visualization scale
+        self._normalizer = StreamingNormalizer(momentum=NORMALIZATION_MOMENTUM)
+
         # Warmup: load model and run forward passes to trigger JIT compilation.
         # This avoids delay on first real frame since torch.compile only
         # triggers compilation on the first forward pass.
@@ -207,6 +217,9 @@ class OpticalFlowPipeline(Pipeline):
         if num_frames == 0:
             raise ValueError("Input video must have at least one frame")
 
+        if kwargs.get("init_cache", False):
+            self._normalizer.reset()
+
         # === BATCH PREPROCESSING ===
         # Convert all frames to tensor and stack at once to minimize overhead
         frame_tensors = []
@@ -255,35 +268,38 @@ class OpticalFlowPipeline(Pipeline):
         )
 
         # Process consecutive frame pairs
-        first_flow_idx = None
-        for i in range(1, num_frames):
-            prev_frame = frames_preprocessed[i - 1]
-            curr_frame = frames_preprocessed[i]
-
-            # Compute flow (frames are already preprocessed)
-            flow = self._compute_optical_flow(prev_frame, curr_frame, orig_h, orig_w)
+        flows = [
+            self._compute_optical_flow(
+                frames_preprocessed[i - 1], frames_preprocessed[i], orig_h, orig_w
+            )
+            for i in range(1, num_frames)
+        ]
+
+        if flows:
+            # Scale by the running flow magnitude rather than each frame's own
+            # maximum, so the visualization doesn't pump in brightness
+            flow_batch = torch.stack(flows, dim=0).float()  # [T-1, 2, flow_h, flow_w]
+            radius = flow_batch.square().sum(dim=1, keepdim=True).sqrt()
+            _, max_radius = self._normalizer.update(radius)
+            flow_batch = flow_batch / (max_radius + EPSILON)
+            # Keep vectors inside the color wheel when a frame exceeds the average
+            flow_batch = flow_batch / (radius / (max_radius + EPSILON)).clamp(min=1.0)
 
             # Convert to RGB visualization
-            flow_rgb = flow_to_image(flow).float() / 255.0  # [3, flow_h, flow_w]
+            flow_rgb = normalized_flow_to_image(flow_batch)
 
             # Resize to output size if needed
             if flow_rgb.shape[-2] != h or flow_rgb.shape[-1] != w:
                 flow_rgb = F.interpolate(
-                    flow_rgb.unsqueeze(0),
+                    flow_rgb,
                     size=(h, w),
                     mode="bilinear",
                     align_corners=False,
-                ).squeeze(0)
-
-            flow_rgb_tensor[i] = flow_rgb
-
-            # Track first computed flow
-            if first_flow_idx is None:
-                first_flow_idx = i
+                )
 
-        # Fill first frame with duplicated first flow (VACE behavior)
-        if first_flow_idx is not None:
-            flow_rgb_tensor[0] = flow_rgb_tensor[first_flow_idx]
+            flow_rgb_tensor[1:] = flow_rgb
+            # Fill first frame with duplicated first flow (VACE behavior)
+            flow_rgb_tensor[0] = flow_rgb_tensor[1]
         else:
             # Single frame - use zero flow
             flow_rgb_tensor[0] = 0.0
@@ -1,3 +1,10 @@
-from .pipeline import PassthroughPipeline
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "PassthroughPipeline":
+        from .pipeline import PassthroughPipeline
+
+        return PassthroughPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["PassthroughPipeline"]
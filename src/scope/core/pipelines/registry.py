@@ -3,14 +3,18 @@
 This module provides a registry pattern to eliminate if/elif chains when
 accessing pipelines by ID. It enables dynamic pipeline discovery and
 metadata retrieval.
+
+Built-in pipelines are registered from a static manifest: only their config
+classes are imported at startup, which is enough to list them and serve their
+schemas. A pipeline module (and the model code it pulls in) is imported the
+first time its class is requested.
 """
 
 import importlib
 import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-import torch
-
 if TYPE_CHECKING:
     from .interface import Pipeline
     from .schema import BasePipelineConfig
@@ -18,10 +22,169 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class PipelineManifestEntry:
+    """Location of a built-in pipeline's class and config class.
+
+    Module paths are relative to this package.
+    """
+
+    name: str
+    schema_module: str
+    config_class: str
+    pipeline_module: str
+    pipeline_class: str
+
+
+BUILTIN_PIPELINE_MANIFEST: list[PipelineManifestEntry] = [
+    PipelineManifestEntry(
+        "streamdiffusionv2",
+        ".streamdiffusionv2.schema",
+        "StreamDiffusionV2Config",
+        ".streamdiffusionv2.pipeline",
+        "StreamDiffusionV2Pipeline",
+    ),
+    PipelineManifestEntry(
+        "longlive",
+        ".longlive.schema",
+        "LongLiveConfig",
+        ".longlive.pipeline",
+        "LongLivePipeline",
+    ),
+    PipelineManifestEntry(
+        "krea_realtime_video",
+        ".krea_realtime_video.schema",
+        "KreaRealtimeVideoConfig",
+        ".krea_realtime_video.pipeline",
+        "KreaRealtimeVideoPipeline",
+    ),
+    PipelineManifestEntry(
+        "reward_forcing",
+        ".reward_forcing.schema",
+        "RewardForcingConfig",
+        ".reward_forcing.pipeline",
+        "RewardForcingPipeline",
+    ),
+    PipelineManifestEntry(
+        "memflow",
+        ".memflow.schema",
+        "MemFlowConfig",
+        ".memflow.pipeline",
+        "MemFlowPipeline",
+    ),
+    PipelineManifestEntry(
+        "passthrough",
+        ".passthrough.schema",
+        "PassthroughConfig",
+        ".passthrough.pipeline",
+        "PassthroughPipeline",
+    ),
+    PipelineManifestEntry(
+        "video_depth_anything",
+        ".video_depth_anything.schema",
+        "VideoDepthAnythingConfig",
+        ".video_depth_anything.pipeline",
+        "VideoDepthAnythingPipeline",
+    ),
+    PipelineManifestEntry(
+        "controller-viz",
+        ".controller_viz.schema",
+        "ControllerVisualizerConfig",
+        ".controller_viz.pipeline",
+        "ControllerVisualizerPipeline",
+    ),
+    PipelineManifestEntry(
+        "rife", ".rife.schema", "RIFEConfig", ".rife.pipeline", "RIFEPipeline"
+    ),
+    PipelineManifestEntry(
+        "scribble",
+        ".scribble.schema",
+        "ScribbleConfig",
+        ".scribble.pipeline",
+        "ScribblePipeline",
+    ),
+    PipelineManifestEntry(
+        "gray", ".gray.schema", "GrayConfig", ".gray.pipeline", "GrayPipeline"
+    ),
+    PipelineManifestEntry(
+        "optical_flow",
+        ".optical_flow.schema",
+        "OpticalFlowConfig",
+        ".optical_flow.pipeline",
+        "OpticalFlowPipeline",
+    ),
+    PipelineManifestEntry(
+        "kaleido-scope",
+        ".kaleido_scope.schema",
+        "KaleidoScopeConfig",
+        ".kaleido_scope.pipeline",
+        "KaleidoScopePipeline",
+    ),
+    PipelineManifestEntry(
+        "kaleido-scope-pre",
+        ".kaleido_scope.schema",
+        "KaleidoScopePreConfig",
+        ".kaleido_scope.pipeline",
+        "KaleidoScopePrePipeline",
+    ),
+    PipelineManifestEntry(
+        "kaleido-scope-post",
+        ".kaleido_scope.schema",
+        "KaleidoScopePostConfig",
+        ".kaleido_scope.pipeline",
+        "KaleidoScopePostPipeline",
+    ),
+    PipelineManifestEntry(
+        "yolo_mask",
+        ".yolo_mask.schema",
+        "YOLOMaskConfig",
+        ".yolo_mask.pipeline",
+        "YOLOMaskPipeline",
+    ),
+    PipelineManifestEntry(
+        "bloom",
+        ".bloom.bloom_schema",
+        "BloomConfig",
+        ".bloom.pipeline",
+        "BloomPipeline",
+    ),
+    PipelineManifestEntry(
+        "cosmic-vfx",
+        ".cosmic_vfx.schema",
+        "CosmicVFXConfig",
+        ".cosmic_vfx.pipeline",
+        "CosmicVFXPipeline",
+    ),
+    PipelineManifestEntry(
+        "vfx-pack",
+        ".vfx_pack.schema",
+        "VFXConfig",
+        ".vfx_pack.pipeline",
+        "VFXPipeline",
+    ),
+]
+
+
+@dataclass
+class LazyPipeline:
+    """A registered pipeline whose module has not been imported yet."""
+
+    entry: PipelineManifestEntry
+    config_class: type["BasePipelineConfig"]
+
+    def load(self) -> type["Pipeline"]:
+        module = importlib.import_module(
+            self.entry.pipeline_module, package=__package__
+        )
+        return getattr(module, self.entry.pipeline_class)
+
+
 class PipelineRegistry:
     """Registry for managing available pipelines."""
 
-    _pipelines: dict[str, type["Pipeline"]] = {}
+    _pipelines: dict[str, "type[Pipeline] | LazyPipeline"] = {}
+    # Bumped whenever the set of registered pipelines changes
+    _generation: int = 0
 
     @classmethod
     def register(cls, pipeline_id: str, pipeline_class: type["Pipeline"]) -> None:
@@ -32,18 +195,69 @@ class PipelineRegistry:
             pipeline_class: Pipeline class to register
         """
         cls._pipelines[pipeline_id] = pipeline_class
+        cls._generation += 1
+
+    @classmethod
+    def register_lazy(
+        cls,
+        pipeline_id: str,
+        entry: PipelineManifestEntry,
+        config_class: type["BasePipelineConfig"],
+    ) -> None:
+        """Register a pipeline without importing its module.
+
+        Args:
+            pipeline_id: Unique identifier for the pipeline
+            entry: Manifest entry locating the pipeline class
+            config_class: The pipeline's already imported config class
+        """
+        cls._pipelines[pipeline_id] = LazyPipeline(entry, config_class)
+        cls._generation += 1
 
     @classmethod
     def get(cls, pipeline_id: str) -> type["Pipeline"] | None:
         """Get a pipeline class by its ID.
 
+        Imports the pipeline module on first use if it was registered lazily.
+
         Args:
             pipeline_id: Pipeline identifier
 
         Returns:
             Pipeline class if found, None otherwise
         """
-        return cls._pipelines.get(pipeline_id)
+        pipeline = cls._pipelines.get(pipeline_id)
+        if not isinstance(pipeline, LazyPipeline):
+            return pipeline
+
+        try:
+            pipeline_class = pipeline.load()
+        except Exception as e:
+            logger.warning(
+                f"Could not import {pipeline.entry.name} pipeline: {e}. "
+                f"This pipeline will not be available."
+            )
+            cls.unregister(pipeline_id)
+            return None
+
+        # Replace in place so the pipeline keeps its position in list_pipelines
+        if cls._pipelines.get(pipeline_id) is pipeline:
+            cls._pipelines[pipeline_id] = pipeline_class
+        logger.debug(f"Imported {pipeline.entry.name} pipeline (ID: {pipeline_id})")
+        return pipeline_class
+
+    @classmethod
+    def is_loaded(cls, pipeline_id: str) -> bool:
+        """Check if a pipeline's class has been imported.
+
+        Args:
+            pipeline_id: Pipeline identifier
+
+        Returns:
+            True if the pipeline is registered and its module is imported
+        """
+        pipeline = cls._pipelines.get(pipeline_id)
+        return pipeline is not None and not isinstance(pipeline, LazyPipeline)
 
     @classmethod
     def unregister(cls, pipeline_id: str) -> bool:
@@ -57,6 +271,7 @@ class PipelineRegistry:
         """
         if pipeline_id in cls._pipelines:
             del cls._pipelines[pipeline_id]
+            cls._generation += 1
             return True
         return False
 
@@ -82,10 +297,24 @@ class PipelineRegistry:
         Returns:
             Pydantic config class if found, None otherwise
         """
-        pipeline_class = cls.get(pipeline_id)
-        if pipeline_class is None:
+        pipeline = cls._pipelines.get(pipeline_id)
+        if pipeline is None:
             return None
-        return pipeline_class.get_config_class()
+        if isinstance(pipeline, LazyPipeline):
+            return pipeline.config_class
+        return pipeline.get_config_class()
+
+    @classmethod
+    def generation(cls) -> int:
+        """Get a counter that changes whenever pipelines are added or removed.
+
+        Lets callers cache data derived from the registry, such as the
+        pipeline schemas, and rebuild it only when this value changes.
+
+        Returns:
+            Current registry generation
+        """
+        return cls._generation
 
     @classmethod
     def list_pipelines(cls) -> list[str]:
@@ -104,6 +333,8 @@ def _get_gpu_vram_gb() -> float | None:
         Total VRAM in GB if GPU is available, None otherwise
     """
     try:
+        import torch
+
         if torch.cuda.is_available():
             _, total_mem = torch.cuda.mem_get_info(0)
             return total_mem / (1024**3)
@@ -139,84 +370,38 @@ def _register_pipelines():
     else:
         logger.info("No GPU detected")
 
-    # Define pipeline imports with their module paths and class names
-    pipeline_configs = [
-        (
-            "streamdiffusionv2",
-            ".streamdiffusionv2.pipeline",
-            "StreamDiffusionV2Pipeline",
-        ),
-        ("longlive", ".longlive.pipeline", "LongLivePipeline"),
-        (
-            "krea_realtime_video",
-            ".krea_realtime_video.pipeline",
-            "KreaRealtimeVideoPipeline",
-        ),
-        (
-            "reward_forcing",
-            ".reward_forcing.pipeline",
-            "RewardForcingPipeline",
-        ),
-        ("memflow", ".memflow.pipeline", "MemFlowPipeline"),
-        ("passthrough", ".passthrough.pipeline", "PassthroughPipeline"),
-        (
-            "video_depth_anything",
-            ".video_depth_anything.pipeline",
-            "VideoDepthAnythingPipeline",
-        ),
-        (
-            "controller-viz",
-            ".controller_viz.pipeline",
-            "ControllerVisualizerPipeline",
-        ),
-        ("rife", ".rife.pipeline", "RIFEPipeline"),
-        ("scribble", ".scribble.pipeline", "ScribblePipeline"),
-        ("gray", ".gray.pipeline", "GrayPipeline"),
-        ("optical_flow", ".optical_flow.pipeline", "OpticalFlowPipeline"),
-        ("kaleido-scope", ".kaleido_scope.pipeline", "KaleidoScopePipeline"),
-        ("kaleido-scope-pre", ".kaleido_scope.pipeline", "KaleidoScopePrePipeline"),
-        ("kaleido-scope-post", ".kaleido_scope.pipeline", "KaleidoScopePostPipeline"),
-        ("yolo_mask", ".yolo_mask.pipeline", "YOLOMaskPipeline"),
-        ("bloom", ".bloom.pipeline", "BloomPipeline"),
-        ("cosmic-vfx", ".cosmic_vfx.pipeline", "CosmicVFXPipeline"),
-        ("vfx-pack", ".vfx_pack.pipeline", "VFXPipeline"),
-    ]
-
-    # Try to import and register each pipeline
-    for pipeline_name, module_path, class_name in pipeline_configs:
-        # Try to import the pipeline first to get its config
+    # Import only the config classes; pipeline modules load on first use
+    for entry in BUILTIN_PIPELINE_MANIFEST:
         try:
-            module = importlib.import_module(module_path, package=__package__)
-            pipeline_class = getattr(module, class_name)
-
-            # Get the config class to check VRAM requirements
-            config_class = pipeline_class.get_config_class()
+            module = importlib.import_module(entry.schema_module, package=__package__)
+            config_class = getattr(module, entry.config_class)
             estimated_vram_gb = config_class.estimated_vram_gb
 
             # Check if pipeline meets GPU requirements
             should_register = _should_register_pipeline(estimated_vram_gb, vram_gb)
             if not should_register:
                 logger.debug(
-                    f"Skipping {pipeline_name} pipeline - "
+                    f"Skipping {entry.name} pipeline - "
                     f"does not meet GPU requirements "
                     f"(required: {estimated_vram_gb} GB, "
                     f"available: {vram_gb} GB)"
                 )
                 continue
 
-            # Register the pipeline
-            PipelineRegistry.register(config_class.pipeline_id, pipeline_class)
+            PipelineRegistry.register_lazy(
+                config_class.pipeline_id, entry, config_class
+            )
             logger.debug(
-                f"Registered {pipeline_name} pipeline (ID: {config_class.pipeline_id})"
+                f"Registered {entry.name} pipeline (ID: {config_class.pipeline_id})"
             )
         except ImportError as e:
             logger.warning(
-                f"Could not import {pipeline_name} pipeline: {e}. "
+                f"Could not import {entry.name} pipeline config: {e}. "
                 f"This pipeline will not be available."
             )
         except Exception as e:
             logger.warning(
-                f"Error loading {pipeline_name} pipeline: {e}. "
+                f"Error loading {entry.name} pipeline config: {e}. "
                 f"This pipeline will not be available."
             )
 
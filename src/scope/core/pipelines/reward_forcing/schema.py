@@ -10,8 +10,7 @@ from ..common_artifacts import (
     VACE_ARTIFACT,
     WAN_1_3B_ARTIFACT,
 )
-from ..enums import Quantization
-from ..utils import VaeType
+from ..enums import Quantization, VaeType
 
 
 class RewardForcingConfig(BasePipelineConfig):
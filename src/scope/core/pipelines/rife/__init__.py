@@ -1,3 +1,10 @@
-from .pipeline import RIFEPipeline
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "RIFEPipeline":
+        from .pipeline import RIFEPipeline
+
+        return RIFEPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["RIFEPipeline"]
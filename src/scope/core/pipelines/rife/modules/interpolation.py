@@ -63,6 +63,8 @@ class RIFEInterpolator:
         )
         self.model = None
         self.model_path = model_path
+        # Last frame of the previous chunk for interpolate_stream
+        self._prev_frame = None
 
         if enabled:
             if not RIFE_AVAILABLE:
@@ -201,6 +203,80 @@ class RIFEInterpolator:
             # Can't interpolate with less than 2 frames
             return frames
 
+        self._check_model()
+
+        # Convert from [T, H, W, C] to [T, C, H, W] and normalize to [0, 1] on device
+        frames_chw = frames.to(self.device).permute(0, 3, 1, 2).float() / 255.0
+
+        with torch.no_grad():
+            mid_frames = self._interpolate_pairs(frames_chw[:-1], frames_chw[1:])
+
+            # Interleave original and interpolated frames
+            # Result: [orig[0], mid[0], orig[1], mid[1], ..., orig[T-2], mid[T-2], orig[T-1]]
+            result = self._interleave(frames_chw, mid_frames, leading_mid=False)
+
+        # Scale to [0, 255], convert to uint8 and transfer to CPU once at the end
+        result = (result * 255.0).clamp(0.0, 255.0).to(torch.uint8)
+        return result.permute(0, 2, 3, 1).contiguous().cpu()
+
+    def interpolate_stream(self, frames: torch.Tensor) -> torch.Tensor:
+        """Interpolate a chunk of a continuous stream to double its frame rate.
+
+        The last frame of the previous chunk is kept, so the gap between chunks is
+        interpolated too: a chunk of T frames yields 2*T frames (2*T-1 for the
+        first chunk after reset()), keeping a steady 2x cadence across chunk
+        boundaries.
+
+        Args:
+            frames: Input frames tensor of shape [T, C, H, W], float in [0, 1]
+
+        Returns:
+            Interpolated frames tensor of shape [N, C, H, W], float in [0, 1] on
+            the interpolator device
+
+        Raises:
+            RuntimeError: If RIFE is enabled but model is not available or loaded
+        """
+        frames = frames.to(self.device)
+        if not self.enabled:
+            return frames
+
+        prev_frame = self._prev_frame
+        if prev_frame is not None and prev_frame.shape[1:] != frames.shape[1:]:
+            # Resolution or channel change, can't interpolate across it
+            prev_frame = None
+        self._prev_frame = frames[-1:].clone()
+
+        if prev_frame is None and frames.shape[0] < 2:
+            return frames
+
+        self._check_model()
+
+        with torch.no_grad():
+            if prev_frame is None:
+                mid_frames = self._interpolate_pairs(frames[:-1], frames[1:])
+                return self._interleave(frames, mid_frames, leading_mid=False)
+
+            sources = torch.cat([prev_frame, frames[:-1]], dim=0)
+            mid_frames = self._interpolate_pairs(sources, frames)
+            return self._interleave(frames, mid_frames, leading_mid=True)
+
+    def reset(self):
+        """Forget the tail frame kept from the previous chunk."""
+        self._prev_frame = None
+
+    def stream_state(self) -> dict:
+        """Return the tail frame kept from the current stream's previous chunk."""
+        return {"prev_frame": self._prev_frame}
+
+    def load_stream_state(self, stream_state: dict | None):
+        """Resume a stream saved by stream_state(), or start a new one if None."""
+        if stream_state is None:
+            self.reset()
+            return
+        self._prev_frame = stream_state["prev_frame"]
+
+    def _check_model(self):
         if not RIFE_AVAILABLE or self.model is None:
             raise RuntimeError(
                 "RIFE interpolation is enabled but RIFE HDv3 model is not available. "
@@ -208,86 +284,74 @@ class RIFEInterpolator:
                 "See docs/rife.md for installation instructions."
             )
 
-        # Convert to float32 for processing
-        frames_float = frames.float()
-
-        # Use RIFE for interpolation
-        return self._rife_interpolate(frames_float)
-
-    def _rife_interpolate(self, frames: torch.Tensor) -> torch.Tensor:
-        """Use RIFE model for interpolation.
+    def _interpolate_pairs(
+        self, frames1: torch.Tensor, frames2: torch.Tensor
+    ) -> torch.Tensor:
+        """Use RIFE model to compute the midpoint of each frame pair.
 
         Optimized implementation with:
         - BF16 mixed precision for faster tensor core inference
         - Batched processing of all frame pairs in single forward pass
-        - Pre-computed padding applied once to all frames
-        - Minimal CPU-GPU transfers (single transfer at end)
+        - Padding skipped when dimensions are already aligned
 
         Args:
-            frames: Input frames tensor of shape [T, H, W, C] with values in [0, 255]
+            frames1: First frames of each pair [N, C, H, W], float in [0, 1]
+            frames2: Second frames of each pair [N, C, H, W], float in [0, 1]
 
         Returns:
-            Interpolated frames tensor of shape [T*2-1, H, W, C] with values in [0, 255] (uint8)
+            Interpolated frames [N, C, H, W], float32 in [0, 1]
         """
-        num_frames = frames.shape[0]
-        if num_frames < 2:
-            return frames.clamp(0, 255).to(torch.uint8)
-
-        T, H, W, C = frames.shape
-
-        # Convert from [T, H, W, C] to [T, C, H, W] and normalize to [0, 1]
-        # Move to GPU once at the start
-        frames_chw = (frames.permute(0, 3, 1, 2) / 255.0).to(self.device).contiguous()
+        _, _, H, W = frames1.shape
 
         # Calculate padding - RIFE v4.25 requires dimensions to be multiples of 32
-        # For v4.25, we need to ensure minimum padding to handle all scales properly
-        # Pad height to at least 512 if input is close (for v4.25 compatibility)
         tmp = 32
         ph = ((H - 1) // tmp + 1) * tmp
         pw = ((W - 1) // tmp + 1) * tmp
-        padding = (0, pw - W, 0, ph - H)
-
-        # Pre-compute padding for all frames at once (optimization)
-        frames_padded = F.pad(frames_chw, padding)  # [T, C, pH, pW]
-
-        with torch.no_grad():
-            # Use BF16 mixed precision for faster inference on modern GPUs
-            autocast_dtype = (
-                torch.bfloat16 if self.device.type == "cuda" else torch.float32
+        if ph != H or pw != W:
+            padding = (0, pw - W, 0, ph - H)
+            frames1 = F.pad(frames1, padding)
+            frames2 = F.pad(frames2, padding)
+
+        # Use BF16 mixed precision for faster inference on modern GPUs
+        with torch.amp.autocast(
+            device_type=self.device.type,
+            dtype=torch.bfloat16,
+            enabled=self.device.type == "cuda",
+        ):
+            # Batched inference - process all pairs at once
+            mid_frames = self.model.inference(
+                frames1.contiguous(), frames2.contiguous(), scale=1.0
             )
-            with torch.amp.autocast(device_type=self.device.type, dtype=autocast_dtype):
-                # Batch all frame pairs: frames[0:T-1] and frames[1:T]
-                frames1_padded = frames_padded[:-1]  # [T-1, C, pH, pW]
-                frames2_padded = frames_padded[1:]  # [T-1, C, pH, pW]
-
-                # Batched inference - process all pairs at once
-                mid_frames_padded = self.model.inference(
-                    frames1_padded, frames2_padded, scale=1.0
-                )  # [T-1, C, pH, pW]
-
-            # Remove padding from interpolated frames (stay on GPU)
-            mid_frames = mid_frames_padded[:, :, :H, :W].float()  # [T-1, C, H, W]
 
-            # Get original frames without padding (stay on GPU)
-            original_frames = frames_padded[:, :, :H, :W]  # [T, C, H, W]
-
-            # Interleave original and interpolated frames on GPU
-            # Result: [orig[0], mid[0], orig[1], mid[1], ..., orig[T-2], mid[T-2], orig[T-1]]
-            result_frames = torch.zeros(
-                (T * 2 - 1, C, H, W), dtype=torch.float32, device=self.device
-            )
-            result_frames[0::2] = original_frames  # Original frames at even indices
-            result_frames[1::2] = mid_frames  # Interpolated frames at odd indices
+        # Remove padding from interpolated frames
+        return mid_frames[:, :, :H, :W].float()
 
-            # Scale to [0, 255] and transfer to CPU once at the end
-            result_chw = (result_frames * 255.0).cpu()
+    @staticmethod
+    def _interleave(
+        frames: torch.Tensor, mid_frames: torch.Tensor, leading_mid: bool
+    ) -> torch.Tensor:
+        """Interleave original and interpolated frames into one buffer.
 
-        # Convert back to [T*2-1, H, W, C]
-        result = result_chw.permute(0, 2, 3, 1).contiguous()
-
-        # Clamp to valid range and convert to uint8
-        result = result.clamp(0.0, 255.0).to(torch.uint8)
+        Args:
+            frames: Original frames [T, C, H, W]
+            mid_frames: Interpolated frames, T-1 of them (T if leading_mid)
+            leading_mid: Whether the output starts with an interpolated frame
 
+        Returns:
+            Interleaved frames [T + len(mid_frames), C, H, W], float32
+        """
+        T, C, H, W = frames.shape
+        result = torch.empty(
+            (T + mid_frames.shape[0], C, H, W),
+            dtype=torch.float32,
+            device=frames.device,
+        )
+        if leading_mid:
+            result[0::2] = mid_frames
+            result[1::2] = frames
+        else:
+            result[0::2] = frames
+            result[1::2] = mid_frames
         return result
 
     def set_enabled(self, enabled: bool):
@@ -11,7 +11,7 @@ import torch
 from einops import rearrange
 
 from ..interface import Pipeline, Requirements
-from ..process import normalize_frame_sizes, postprocess_chunk, preprocess_chunk
+from ..process import normalize_frame_sizes
 from .schema import RIFEConfig
 
 if TYPE_CHECKING:
@@ -23,6 +23,9 @@ logger = logging.getLogger(__name__)
 class RIFEPipeline(Pipeline):
     """RIFE interpolation pipeline that doubles the frame rate of input video."""
 
+    # The interpolator keeps each stream's last frame to bridge chunk boundaries
+    session_state_attributes = ("interpolator_state",)
+
     @classmethod
     def get_config_class(cls) -> type["BasePipelineConfig"]:
         return RIFEConfig
@@ -54,6 +57,14 @@ class RIFEPipeline(Pipeline):
         self.rife_interpolator = RIFEInterpolator(enabled=True, device=self.device)
         logger.info("RIFE HDv3 model loaded successfully")
 
+    @property
+    def interpolator_state(self) -> dict:
+        return self.rife_interpolator.stream_state()
+
+    @interpolator_state.setter
+    def interpolator_state(self, stream_state: dict | None):
+        self.rife_interpolator.load_stream_state(stream_state)
+
     def prepare(self, **kwargs) -> Requirements:
         return Requirements(input_size=12)
 
@@ -66,27 +77,24 @@ class RIFEPipeline(Pipeline):
         if input is None:
             raise ValueError("Input cannot be None for RIFEPipeline")
 
-        if isinstance(input, list):
-            # Normalize frame sizes to handle resolution changes
-            input = normalize_frame_sizes(input)
-            # Preprocess: convert list of frames to BCTHW tensor in [-1, 1] range
-            input = preprocess_chunk(input, self.device, self.dtype)
-
-        # Convert from BCTHW to THWC format for RIFE
-        # First convert to BTCHW, then use postprocess_chunk to get THWC [0, 1]
-        input_btchw = rearrange(input, "B C T H W -> B T C H W")
-        input_thwc = postprocess_chunk(input_btchw)  # Now in THWC [0, 1] range
-
-        # Convert to [0, 255] uint8 for RIFE interpolation
-        input_uint8 = (input_thwc * 255.0).clamp(0, 255).to(torch.uint8)
+        # Drop the previous chunk's tail frame so we don't interpolate across a cut
+        if kwargs.get("init_cache", False):
+            self.rife_interpolator.reset()
 
-        # Apply RIFE interpolation (expects THWC [0, 255] uint8, returns THWC [0, 255] uint8)
-        # This doubles the frame rate: T frames -> 2*T-1 frames
-        interpolated = self.rife_interpolator.interpolate(input_uint8)
-
-        # Convert back to [0, 1] float range
-        # RIFE returns THWC [0, 255] uint8, convert to THWC [0, 1] float
-        interpolated_float = interpolated.float() / 255.0
+        if isinstance(input, list):
+            # Normalize frame sizes to handle resolution changes, moving the uint8
+            # frames to the device before the single conversion to float
+            input = normalize_frame_sizes(input, device=self.device)
+            frames = torch.cat(input, dim=0)  # [T, H, W, C] uint8
+            frames = frames.permute(0, 3, 1, 2).float() / 255.0  # [T, C, H, W]
+        else:
+            # BCTHW tensor in [-1, 1] range
+            frames = rearrange(input.squeeze(0), "C T H W -> T C H W")
+            frames = (frames.float() / 2 + 0.5).clamp(0, 1)
+
+        # Apply RIFE interpolation, including the gap to the previous chunk.
+        # This doubles the frame rate: T frames -> 2*T frames (2*T-1 after a reset)
+        interpolated = self.rife_interpolator.interpolate_stream(frames)
 
         # Return THWC [0, 1] float format (same as postprocess_chunk output)
-        return {"video": interpolated_float}
+        return {"video": interpolated.permute(0, 2, 3, 1)}
@@ -1,3 +1,10 @@
-from .pipeline import ScribblePipeline
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "ScribblePipeline":
+        from .pipeline import ScribblePipeline
+
+        return ScribblePipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["ScribblePipeline"]
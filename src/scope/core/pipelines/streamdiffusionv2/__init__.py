@@ -1,3 +1,10 @@
-from .pipeline import StreamDiffusionV2Pipeline
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "StreamDiffusionV2Pipeline":
+        from .pipeline import StreamDiffusionV2Pipeline
+
+        return StreamDiffusionV2Pipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["StreamDiffusionV2Pipeline"]
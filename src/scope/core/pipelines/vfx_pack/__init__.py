@@ -1,4 +1,13 @@
-from .pipeline import VFXPipeline
 from .schema import VFXConfig
 
+
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "VFXPipeline":
+        from .pipeline import VFXPipeline
+
+        return VFXPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["VFXPipeline", "VFXConfig"]
@@ -1,3 +1,10 @@
-from .pipeline import VideoDepthAnythingPipeline
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "VideoDepthAnythingPipeline":
+        from .pipeline import VideoDepthAnythingPipeline
+
+        return VideoDepthAnythingPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["VideoDepthAnythingPipeline"]
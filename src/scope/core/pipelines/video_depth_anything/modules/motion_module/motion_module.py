@@ -60,9 +60,9 @@ class TemporalModule(nn.Module):
         if zero_initialize:
             self.temporal_transformer.proj_out = zero_module(self.temporal_transformer.proj_out)
 
-    def forward(self, input_tensor, encoder_hidden_states, attention_mask=None, cached_hidden_state_list=None):
+    def forward(self, input_tensor, encoder_hidden_states, attention_mask=None, cached_hidden_state_list=None, streaming=False):
         hidden_states = input_tensor
-        hidden_states, output_hidden_state_list = self.temporal_transformer(hidden_states, encoder_hidden_states, attention_mask, cached_hidden_state_list)
+        hidden_states, output_hidden_state_list = self.temporal_transformer(hidden_states, encoder_hidden_states, attention_mask, cached_hidden_state_list, streaming=streaming)
 
         output = hidden_states
         return output, output_hidden_state_list  # list of hidden states
@@ -102,7 +102,7 @@ class TemporalTransformer3DModel(nn.Module):
         )
         self.proj_out = nn.Linear(inner_dim, in_channels)
 
-    def forward(self, hidden_states, encoder_hidden_states=None, attention_mask=None, cached_hidden_state_list=None):
+    def forward(self, hidden_states, encoder_hidden_states=None, attention_mask=None, cached_hidden_state_list=None, streaming=False):
         assert hidden_states.dim() == 5, f"Expected hidden_states to have ndim=5, but got ndim={hidden_states.dim()}."
         output_hidden_state_list = []
 
@@ -124,7 +124,7 @@ class TemporalTransformer3DModel(nn.Module):
             n = 0
         for i, block in enumerate(self.transformer_blocks):
             hidden_states, hidden_state_list = block(hidden_states, encoder_hidden_states=encoder_hidden_states, video_length=video_length, attention_mask=attention_mask,
-                                                     cached_hidden_state_list=cached_hidden_state_list[i*n:(i+1)*n] if n else None)
+                                                     cached_hidden_state_list=cached_hidden_state_list[i*n:(i+1)*n] if n else None, streaming=streaming)
             output_hidden_state_list.extend(hidden_state_list)
 
         # output
@@ -172,7 +172,7 @@ class TemporalTransformerBlock(nn.Module):
         self.ff_norm = nn.LayerNorm(dim)
 
 
-    def forward(self, hidden_states, encoder_hidden_states=None, attention_mask=None, video_length=None, cached_hidden_state_list=None):
+    def forward(self, hidden_states, encoder_hidden_states=None, attention_mask=None, video_length=None, cached_hidden_state_list=None, streaming=False):
         output_hidden_state_list = []
         for i, (attention_block, norm) in enumerate(zip(self.attention_blocks, self.norms)):
             norm_hidden_states = norm(hidden_states)
@@ -182,6 +182,7 @@ class TemporalTransformerBlock(nn.Module):
                 video_length=video_length,
                 attention_mask=attention_mask,
                 cached_hidden_states=cached_hidden_state_list[i] if cached_hidden_state_list is not None else None,
+                streaming=streaming,
             )
             hidden_states = residual_hidden_states + hidden_states
             output_hidden_state_list.append(output_hidden_states)
@@ -242,11 +243,14 @@ class TemporalAttention(CrossAttention):
         else:
             raise NotImplementedError
 
-    def forward(self, hidden_states, encoder_hidden_states=None, attention_mask=None, video_length=None, cached_hidden_states=None):
+    def forward(self, hidden_states, encoder_hidden_states=None, attention_mask=None, video_length=None, cached_hidden_states=None, streaming=False):
         # TODO: support cache for these
         assert encoder_hidden_states is None
         assert attention_mask is None
 
+        if streaming and video_length > 1:
+            return self._forward_streaming(hidden_states, video_length, cached_hidden_states)
+
         d = hidden_states.shape[1]
         d_in = 0
         if cached_hidden_states is None:
@@ -322,3 +326,40 @@ class TemporalAttention(CrossAttention):
         hidden_states = rearrange(hidden_states, "(b d) f c -> (b f) d c", d=d)
 
         return hidden_states, input_hidden_states
+
+    def _forward_streaming(self, hidden_states, video_length, cached_hidden_states=None):
+        """Process several frames at once with per-frame streaming semantics.
+
+        Equivalent to calling forward() once per frame with video_length=1 and
+        threading the returned hidden states through cached_hidden_states: each
+        frame attends to its predecessor (from the cache or the chunk) and itself.
+        The (predecessor, frame) pairs are folded into the batch dimension so the
+        whole chunk runs as a single attention call.
+        """
+        d = hidden_states.shape[1]
+        x = rearrange(hidden_states, "(b f) d c -> (b d) f c", f=video_length)
+        if cached_hidden_states is not None and cached_hidden_states.shape[0] != x.shape[0]:
+            # Resolution change, the cached tokens don't line up with this chunk's
+            cached_hidden_states = None
+
+        first = None
+        if cached_hidden_states is None:
+            # Without history the first frame only attends to itself
+            first, _ = self.forward(rearrange(x[:, :1], "(b d) f c -> (b f) d c", d=d), video_length=1)
+            first = rearrange(first, "(b f) d c -> (b d) f c", f=1)
+            prev, cur = x[:, :-1], x[:, 1:]
+        else:
+            prev, cur = torch.cat([cached_hidden_states, x[:, :-1]], dim=1), x
+
+        n = cur.shape[1]
+        paired, _ = self.forward(
+            rearrange(cur, "bd f c -> (bd f) 1 c"),
+            video_length=1,
+            cached_hidden_states=rearrange(prev, "bd f c -> (bd f) 1 c"),
+        )
+        paired = rearrange(paired, "(bd f) 1 c -> bd f c", f=n)
+        if first is not None:
+            paired = torch.cat([first, paired], dim=1)
+
+        hidden_states = rearrange(paired, "(b d) f c -> (b f) d c", d=d)
+        return hidden_states, x[:, -1:]
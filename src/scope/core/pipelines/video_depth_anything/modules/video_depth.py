@@ -97,11 +97,11 @@ class VideoDepthAnything(nn.Module):
         self.head = DPTHeadTemporal(self.pretrained.embed_dim, features, use_bn, out_channels=out_channels, use_clstoken=use_clstoken, num_frames=num_frames, pe=pe)
         self.metric = metric
 
-    def forward(self, x, cached_hidden_state_list=None):
+    def forward(self, x, cached_hidden_state_list=None, streaming=False):
         B, T, C, H, W = x.shape
         patch_h, patch_w = H // 14, W // 14
         features = self.pretrained.get_intermediate_layers(x.flatten(0,1), self.intermediate_layer_idx[self.encoder], return_class_token=True)
-        depth, hidden_states = self.head(features, patch_h, patch_w, T, cached_hidden_state_list=cached_hidden_state_list)
+        depth, hidden_states = self.head(features, patch_h, patch_w, T, cached_hidden_state_list=cached_hidden_state_list, streaming=streaming)
         depth = F.interpolate(depth, size=(H, W), mode="bilinear", align_corners=True)
         depth = F.relu(depth)
         return depth.squeeze(1).unflatten(0, (B, T)), hidden_states # return shape [B, T, H, W] and hidden states
@@ -271,3 +271,59 @@ class VideoDepthAnything(nn.Module):
                 depth = depth[0, 0].cpu().numpy()  # [H, W]
 
         return depth, hidden_states
+
+    def infer_video_depth_batch(self, frames, input_size=518, fp32=False, cached_hidden_state_list=None):
+        """Process a chunk of frames in streaming mode with a single forward pass.
+
+        Produces the same result as calling infer_video_depth_one for each frame in
+        order while threading cached_hidden_state_list, but resizes and normalizes
+        on the input device and runs the DINOv2 backbone once over the whole chunk.
+
+        Args:
+            frames: Frames as tensor [T, H, W, 3] in RGB format, uint8 [0, 255]
+            input_size: Input size for model inference
+            fp32: Use fp32 precision
+            cached_hidden_state_list: Cached hidden states from the previous chunk
+
+        Returns:
+            depth: Depth maps as tensor [T, H, W] on the input device
+            cached_hidden_state_list: Updated hidden states for the next chunk
+        """
+        frame_height, frame_width = frames.shape[1:3]
+        ratio = max(frame_height, frame_width) / min(frame_height, frame_width)
+        if ratio > 1.78:  # we recommend to process video with ratio smaller than 16:9 due to memory limitation
+            input_size = int(input_size * 1.777 / ratio)
+            input_size = round(input_size / 14) * 14
+
+        resize = Resize(
+            width=input_size,
+            height=input_size,
+            resize_target=False,
+            keep_aspect_ratio=True,
+            ensure_multiple_of=14,
+            resize_method='lower_bound',
+            image_interpolation_method=INTER_CUBIC,
+        )
+        width, height = resize.get_size(frame_width, frame_height)
+
+        # [T, H, W, 3] uint8 -> [T, 3, h, w] normalized float32
+        x = frames.permute(0, 3, 1, 2).float() / 255.0
+        x = F.interpolate(x, size=(int(height), int(width)), mode=INTER_CUBIC, align_corners=False)
+        mean = torch.tensor([0.485, 0.456, 0.406], device=x.device).view(1, 3, 1, 1)
+        std = torch.tensor([0.229, 0.224, 0.225], device=x.device).view(1, 3, 1, 1)
+        x = ((x - mean) / std).unsqueeze(0)
+
+        with torch.no_grad():
+            with torch.autocast(device_type=x.device.type, enabled=(not fp32)):
+                depth, hidden_states = self.forward(x, cached_hidden_state_list=cached_hidden_state_list, streaming=True)
+                depth = depth.to(x.dtype)
+
+                # Resize back to original frame size
+                depth = F.interpolate(
+                    depth.flatten(0, 1).unsqueeze(1),
+                    size=(frame_height, frame_width),
+                    mode='bilinear',
+                    align_corners=True
+                )
+
+        return depth[:, 0], hidden_states
@@ -8,12 +8,12 @@ import logging
 import time
 from typing import TYPE_CHECKING
 
-import numpy as np
 import torch
 
 from scope.core.config import get_model_file_path
 
 from ..interface import Pipeline, Requirements
+from ..normalization import StreamingNormalizer
 from ..process import normalize_frame_sizes
 from .schema import VideoDepthAnythingConfig
 
@@ -25,10 +25,20 @@ logger = logging.getLogger(__name__)
 # Model configuration for Small encoder (only model supported)
 MODEL_CONFIG = {"encoder": "vits", "features": 64, "out_channels": [48, 96, 192, 384]}
 
+# Weight of each new chunk in the depth range moving average
+NORMALIZATION_MOMENTUM = 0.2
+
 
 class VideoDepthAnythingPipeline(Pipeline):
     """Video depth estimation pipeline."""
 
+    # Motion module history and depth range carried from chunk to chunk
+    session_state_attributes = (
+        "_cached_hidden_state_list",
+        "_cached_size",
+        "_normalizer",
+    )
+
     @classmethod
     def get_config_class(cls) -> type["BasePipelineConfig"]:
         return VideoDepthAnythingConfig
@@ -74,6 +84,13 @@ class VideoDepthAnythingPipeline(Pipeline):
         self.model.eval()
         logger.info(f"Loaded Video Depth Anything in {time.time() - start:.3f}s")
 
+        # Motion module hidden states carried across chunks for temporal consistency
+        self._cached_hidden_state_list = None
+        # (height, width) of the frames the cached hidden states were computed from
+        self._cached_size = None
+        # Depth range smoothed across chunks to avoid brightness pumping
+        self._normalizer = StreamingNormalizer(momentum=NORMALIZATION_MOMENTUM)
+
     def prepare(self, **kwargs) -> Requirements:
         return Requirements(input_size=4)
 
@@ -87,6 +104,7 @@ class VideoDepthAnythingPipeline(Pipeline):
         Returns:
             Depth maps as tensor in THWC format with values in [0, 1] range,
             where higher values indicate greater depth (further from camera).
+            The tensor stays on the pipeline device.
         """
         video = kwargs.get("video")
         if video is None:
@@ -94,64 +112,42 @@ class VideoDepthAnythingPipeline(Pipeline):
                 "Input video cannot be None for VideoDepthAnythingPipeline"
             )
 
-        # Normalize frame sizes to handle resolution changes
-        video = normalize_frame_sizes(video)
-
-        # Convert input to numpy uint8 array
-        # Frames from frame_processor are always (1, H, W, C), so we squeeze the T dimension
-        frames = []
-        for frame in video:
-            frame_np = (
-                frame.cpu().numpy()
-                if isinstance(frame, torch.Tensor)
-                else np.array(frame)
-            )
-            # Squeeze T dimension: (1, H, W, C) -> (H, W, C)
-            frame_np = frame_np.squeeze(0)
-            frames.append(frame_np)
-        frames = np.stack(frames, axis=0)
+        # Normalize frame sizes and move frames to the model device.
+        # Frames from frame_processor are always (1, H, W, C), so concatenating
+        # along the T dimension gives a (T, H, W, C) chunk.
+        video = normalize_frame_sizes(video, device=self.device)
+        frames = torch.cat(video, dim=0)
+
+        # Reset temporal state so the motion modules don't attend across a cut.
+        # A resolution change is a cut too: the cached hidden states have the
+        # old size's token count and can't be attended to.
+        size = tuple(frames.shape[1:3])
+        if kwargs.get("init_cache", False) or size != self._cached_size:
+            self._cached_hidden_state_list = None
+            self._normalizer.reset()
+        self._cached_size = size
 
         # Ensure uint8 format [0, 255]
         # Note: Frames should be in RGB format [H, W, 3]
-        if frames.dtype != np.uint8:
+        if frames.dtype != torch.uint8:
             frames = (
-                (frames * 255).astype(np.uint8)
+                (frames * 255).to(torch.uint8)
                 if frames.max() <= 1.0
-                else frames.astype(np.uint8)
+                else frames.to(torch.uint8)
             )
 
-        num_frames = frames.shape[0]
-
-        # Process frames one at a time using streaming mode
-        depths = []
-        cached_hidden_state_list = None
-        device_str = "cuda" if self.device.type == "cuda" else "cpu"
-
-        with torch.no_grad():
-            for i in range(num_frames):
-                frame = frames[i]  # [H, W, 3] in RGB format
-
-                # Process single frame in streaming mode
-                depth, cached_hidden_state_list = self.model.infer_video_depth_one(
-                    frame,
-                    input_size=self.input_size,
-                    device=device_str,
-                    fp32=self.fp32,
-                    cached_hidden_state_list=cached_hidden_state_list,
-                )
-                depths.append(depth)
-
-        # Stack depths: [T, H, W]
-        depths = np.stack(depths, axis=0)
-
-        # Normalize depths to [0, 1] and convert to THWC format
-        depths = torch.from_numpy(depths).float()
-        d_min, d_max = depths.min(), depths.max()
-        depths = (
-            (depths - d_min) / (d_max - d_min)
-            if d_max > d_min
-            else torch.zeros_like(depths)
+        # Process the whole chunk in one streaming forward pass, carrying the
+        # motion module hidden state over from the previous chunk
+        depths, self._cached_hidden_state_list = self.model.infer_video_depth_batch(
+            frames,
+            input_size=self.input_size,
+            fp32=self.fp32,
+            cached_hidden_state_list=self._cached_hidden_state_list,
         )
+
+        # Normalize depths to [0, 1] with the running depth range and convert to
+        # THWC format
+        depths = self._normalizer(depths)
         return {
             "video": depths.unsqueeze(-1).repeat(1, 1, 1, 3)
         }  # THWC with 3 channels
@@ -159,11 +159,15 @@ class EmbeddingBlendingBlock(ModularPipelineBlocks):
             # Step 1: Spatial blending - compute target embedding when conditioning changes
             target_blend = None
             if embeds_list and embeds_weights and conditioning_changed:
+                # embeds_list was encoded from block_state.prompts, so the
+                # prompts identify the blend when the same set comes back
+                prompts = block_state.prompts
                 target_blend = components.embedding_blender.blend(
                     embeddings=embeds_list,
                     weights=embeds_weights,
                     interpolation_method=spatial_interpolation_method,
                     cache_result=False,
+                    cache_key=repr(prompts) if prompts is not None else None,
                 )
 
             # Step 2: Apply conditioning changes (snap or start transition)
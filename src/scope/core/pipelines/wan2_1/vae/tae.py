@@ -755,3 +755,24 @@ class TAEWrapper(nn.Module):
         self._first_decode = True
         self.model.clear_encode_state()
         self.model.clear_decode_state()
+
+    def stream_state(self) -> dict:
+        """Return the streaming encode/decode memory of the current sequence."""
+        return {
+            "encoder_cache": self._default_encoder_cache,
+            "first_decode": self._first_decode,
+            "encoder_mem": self.model._encoder_mem,
+            "decoder_mem": self.model._decoder_mem,
+            "frames_output": self.model._frames_output,
+        }
+
+    def load_stream_state(self, stream_state: dict | None):
+        """Resume a sequence saved by stream_state(), or start a new one if None."""
+        if stream_state is None:
+            self.clear_cache()
+            return
+        self._default_encoder_cache = stream_state["encoder_cache"]
+        self._first_decode = stream_state["first_decode"]
+        self.model._encoder_mem = stream_state["encoder_mem"]
+        self.model._decoder_mem = stream_state["decoder_mem"]
+        self.model._frames_output = stream_state["frames_output"]
@@ -205,3 +205,20 @@ class WanVAEWrapper(torch.nn.Module):
     def clear_cache(self):
         """Clear encoder/decoder cache for next sequence."""
         self.model.first_batch = True
+
+    def stream_state(self) -> dict:
+        """Return the streaming encode/decode caches of the current sequence."""
+        return {
+            "first_batch": self.model.first_batch,
+            "feat_map": getattr(self.model, "_feat_map", None),
+            "enc_feat_map": getattr(self.model, "_enc_feat_map", None),
+        }
+
+    def load_stream_state(self, stream_state: dict | None):
+        """Resume a sequence saved by stream_state(), or start a new one if None."""
+        if stream_state is None:
+            self.clear_cache()
+            return
+        self.model.first_batch = stream_state["first_batch"]
+        self.model._feat_map = stream_state["feat_map"]
+        self.model._enc_feat_map = stream_state["enc_feat_map"]
@@ -1,4 +1,13 @@
-from .pipeline import YOLOMaskPipeline
 from .schema import YOLOMaskConfig
 
+
+def __getattr__(name):
+    """Lazy import so loading the config does not import the pipeline."""
+    if name == "YOLOMaskPipeline":
+        from .pipeline import YOLOMaskPipeline
+
+        return YOLOMaskPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["YOLOMaskPipeline", "YOLOMaskConfig"]
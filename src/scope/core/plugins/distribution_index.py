@@ -0,0 +1,81 @@
+"""Index of installed distributions that provide plugin entry points.
+
+Iterating importlib.metadata.distributions() and parsing every package's
+entry points is slow in a large venv (thousands of dist-info directories
+for torch, CUDA and friends). The index does that scan once and keeps only
+the distributions with entry points in the plugin group. It is rebuilt when
+a directory on sys.path changes (installing or removing a package adds or
+removes a dist-info directory there) or when explicitly invalidated.
+"""
+
+import importlib.metadata
+import logging
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class IndexedDistribution:
+    """A distribution with at least one entry point in the indexed group."""
+
+    name: str
+    dist: Any
+    entry_points: tuple[Any, ...]
+
+
+class DistributionIndex:
+    """Thread-safe, lazily rebuilt index of plugin distributions."""
+
+    def __init__(self, group: str = "scope"):
+        self.group = group
+        self._lock = threading.Lock()
+        self._signature: tuple[tuple[str, int], ...] | None = None
+        self._distributions: list[IndexedDistribution] = []
+
+    def get(self) -> list[IndexedDistribution]:
+        """Return distributions with entry points in the group."""
+        signature = self._path_signature()
+        with self._lock:
+            if signature != self._signature:
+                self._distributions = self._scan()
+                self._signature = signature
+            return list(self._distributions)
+
+    def invalidate(self) -> None:
+        """Force a rescan on next access, e.g. after install or reload."""
+        with self._lock:
+            self._signature = None
+
+    def _scan(self) -> list[IndexedDistribution]:
+        indexed = []
+        for dist in importlib.metadata.distributions():
+            try:
+                entry_points = tuple(
+                    ep for ep in dist.entry_points if ep.group == self.group
+                )
+                if not entry_points:
+                    continue
+                name = dist.metadata.get("Name", "unknown")
+                indexed.append(IndexedDistribution(name, dist, entry_points))
+            except Exception as e:
+                logger.debug(f"Error checking distribution {dist}: {e}")
+        logger.debug(
+            f"Indexed {len(indexed)} distribution(s) with '{self.group}' entry points"
+        )
+        return indexed
+
+    @staticmethod
+    def _path_signature() -> tuple[tuple[str, int], ...]:
+        """Modification times of the directories distributions are found in."""
+        signature = []
+        for path in sys.path:
+            try:
+                signature.append((path, os.stat(path or ".").st_mtime_ns))
+            except OSError:
+                continue
+        return tuple(signature)
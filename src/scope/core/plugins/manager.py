@@ -8,6 +8,8 @@ import os
 import subprocess
 import sys
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -15,8 +17,15 @@ from typing import TYPE_CHECKING, Any
 import pluggy
 
 from .dependency_validator import DependencyValidator
+from .distribution_index import DistributionIndex
 from .hookspecs import ScopeHookSpec
 from .plugins_config import ensure_plugins_dir, get_plugins_file, get_resolved_file
+from .update_cache import (
+    UPDATE_CHECK_MAX_WORKERS,
+    UpdateCache,
+    UpdateCheckEntry,
+    fetch_pypi_release,
+)
 
 if TYPE_CHECKING:
     from scope.core.pipelines.registry import PipelineRegistry
@@ -104,6 +113,14 @@ class PluginManager:
         # Entry points that failed to load
         self._failed_plugins: list[FailedPluginInfo] = []
 
+        # Installed distributions that provide scope entry points
+        self._distribution_index = DistributionIndex("scope")
+
+        # Update check results, served from cache and refreshed in the background
+        self._update_cache = UpdateCache()
+        self._update_refresh_lock = threading.Lock()
+        self._update_refresh_thread: threading.Thread | None = None
+
     def _read_plugins_file(self) -> list[str]:
         """Read plugin specifiers from plugins.txt."""
         plugins_file = get_plugins_file()
@@ -255,16 +272,16 @@ class PluginManager:
         Args:
             group: Entry point group name (e.g. "scope")
         """
-        from importlib.metadata import distributions
+        index = (
+            self._distribution_index
+            if group == self._distribution_index.group
+            else DistributionIndex(group)
+        )
 
-        for dist in distributions():
+        for indexed in index.get():
             try:
-                eps = dist.entry_points
-                scope_eps = [ep for ep in eps if ep.group == group]
-                if not scope_eps:
-                    continue
-
-                package_name = dist.metadata.get("Name", "unknown")
+                scope_eps = list(indexed.entry_points)
+                package_name = indexed.name
 
                 if len(scope_eps) != 1:
                     ep_names = [ep.name for ep in scope_eps]
@@ -309,11 +326,12 @@ class PluginManager:
                     )
                     self._pm.set_blocked(ep.name)
             except Exception as e:
-                logger.debug(f"Error checking distribution {dist}: {e}")
+                logger.debug(f"Error checking distribution {indexed.dist}: {e}")
 
     def load_plugins(self) -> None:
         """Discover and load all plugins via entry points."""
         with self._lock:
+            self._distribution_index.invalidate()
             self._failed_plugins.clear()
             self._prevalidate_entrypoints("scope")
             self._pm.load_setuptools_entrypoints("scope")
@@ -359,8 +377,6 @@ class PluginManager:
 
     def _update_pipeline_plugin_mapping(self, registry: "PipelineRegistry") -> None:
         """Update the mapping of pipeline IDs to plugin names."""
-        from importlib.metadata import distributions
-
         # Get all pipeline IDs currently registered
         all_pipeline_ids = set(registry.list_pipelines())
 
@@ -368,15 +384,10 @@ class PluginManager:
         failed_packages = {fp.package_name for fp in self._failed_plugins}
 
         # Find which package provides each plugin
-        for dist in distributions():
-            # Check if this package has scope entry points
+        for indexed in self._distribution_index.get():
             try:
-                eps = dist.entry_points
-                scope_eps = [ep for ep in eps if ep.group == "scope"]
-                if not scope_eps:
-                    continue
-
-                package_name = dist.metadata["Name"]
+                scope_eps = indexed.entry_points
+                package_name = indexed.name
                 if package_name in failed_packages:
                     continue
                 self._registered_plugins.add(package_name)
@@ -403,7 +414,7 @@ class PluginManager:
                         )
 
             except Exception as e:
-                logger.debug(f"Error checking distribution {dist}: {e}")
+                logger.debug(f"Error checking distribution {indexed.dist}: {e}")
 
     def get_plugin_for_pipeline(self, pipeline_id: str) -> str | None:
         """Get the plugin package name that provides a pipeline.
@@ -462,27 +473,27 @@ class PluginManager:
     async def list_plugins_async(self) -> list[dict[str, Any]]:
         """Get all installed plugins with metadata.
 
+        Update info is returned from cache without waiting on the network;
+        missing or stale entries are refreshed in the background and show up
+        on a later call.
+
         Returns:
             List of plugin info dictionaries
         """
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._list_plugins_sync)
+        plugins = await loop.run_in_executor(None, self._list_plugins_sync)
+        self._refresh_updates_in_background(plugins)
+        return plugins
 
     def _list_plugins_sync(self) -> list[dict[str, Any]]:
         """Synchronous implementation of list_plugins."""
-        from importlib.metadata import distributions
-
         plugins = []
 
         with self._lock:
-            for dist in distributions():
+            for indexed in self._distribution_index.get():
+                dist = indexed.dist
                 try:
-                    eps = dist.entry_points
-                    scope_eps = [ep for ep in eps if ep.group == "scope"]
-                    if not scope_eps:
-                        continue
-
-                    package_name = dist.metadata["Name"]
+                    package_name = indexed.name
                     source, editable, editable_path, git_url = self._get_plugin_source(
                         dist
                     )
@@ -512,33 +523,29 @@ class PluginManager:
                         else package_name
                     )
 
-                    # Check for updates (skip local/editable plugins)
-                    if source == "local" or editable:
-                        latest_version = None
-                        update_available = None
-                    else:
-                        update_info = self._check_plugin_update(
-                            package_name, package_spec
-                        )
-                        latest_version = update_info.get("latest_version")
-                        update_available = update_info.get("update_available")
-
-                    plugins.append(
-                        {
-                            "name": package_name,
-                            "version": dist.metadata.get("Version"),
-                            "author": dist.metadata.get("Author")
-                            or dist.metadata.get("Author-email"),
-                            "description": dist.metadata.get("Summary"),
-                            "source": source,
-                            "editable": editable,
-                            "editable_path": editable_path,
-                            "pipelines": pipelines,
-                            "latest_version": latest_version,
-                            "update_available": update_available,
-                            "package_spec": package_spec,
-                        }
-                    )
+                    plugin = {
+                        "name": package_name,
+                        "version": dist.metadata.get("Version"),
+                        "author": dist.metadata.get("Author")
+                        or dist.metadata.get("Author-email"),
+                        "description": dist.metadata.get("Summary"),
+                        "source": source,
+                        "editable": editable,
+                        "editable_path": editable_path,
+                        "pipelines": pipelines,
+                        "latest_version": None,
+                        "update_available": None,
+                        "package_spec": package_spec,
+                    }
+
+                    # Update info from the last check (skip local/editable plugins)
+                    if self._needs_update_check(plugin):
+                        cached = self._update_cache.get(plugin)
+                        if cached is not None:
+                            plugin["latest_version"] = cached.latest_version
+                            plugin["update_available"] = cached.update_available
+
+                    plugins.append(plugin)
                 except Exception as e:
                     logger.warning(f"Error getting plugin info for {dist}: {e}")
 
@@ -643,6 +650,106 @@ class PluginManager:
         finally:
             Path(temp_resolved).unlink(missing_ok=True)
 
+    @staticmethod
+    def _needs_update_check(plugin: dict[str, Any]) -> bool:
+        """Local and editable plugins are not checked for updates."""
+        return plugin.get("source") != "local" and not plugin.get("editable")
+
+    def _refresh_updates_in_background(self, plugins: list[dict[str, Any]]) -> None:
+        """Start a background update check for plugins with stale results."""
+        stale = []
+        for plugin in plugins:
+            if not self._needs_update_check(plugin):
+                continue
+            cached = self._update_cache.get(plugin)
+            if cached is None or not cached.is_fresh():
+                stale.append(plugin)
+        if not stale:
+            return
+
+        with self._update_refresh_lock:
+            thread = self._update_refresh_thread
+            if thread is not None and thread.is_alive():
+                return
+            self._update_refresh_thread = threading.Thread(
+                target=self._check_plugin_updates,
+                args=(stale,),
+                name="plugin-update-check",
+                daemon=True,
+            )
+            self._update_refresh_thread.start()
+
+    def _check_plugin_updates(
+        self, plugins: list[dict[str, Any]]
+    ) -> dict[str, UpdateCheckEntry | None]:
+        """Check plugins for updates concurrently and cache the results.
+
+        Returns:
+            Mapping of plugin name to its check result, or None if the check
+            failed
+        """
+        if not plugins:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=UPDATE_CHECK_MAX_WORKERS,
+            thread_name_prefix="plugin-update",
+        ) as pool:
+            entries = pool.map(self._check_single_update, plugins)
+            return {
+                plugin["name"]: entry
+                for plugin, entry in zip(plugins, entries, strict=True)
+            }
+
+    def _check_single_update(self, plugin: dict[str, Any]) -> UpdateCheckEntry | None:
+        """Check one plugin for updates and cache the result.
+
+        PyPI plugins are revalidated against PyPI's JSON API. Only when PyPI
+        has a newer release is a compile run to find the newest version that
+        respects project constraints. Git plugins always need the compile.
+        """
+        name = plugin["name"]
+        package_spec = plugin.get("package_spec")
+        cached = self._update_cache.get(plugin)
+
+        try:
+            if plugin.get("source") == "git":
+                info = self._check_plugin_update(name, package_spec)
+                if info.get("update_available") is None:
+                    return None
+                entry = UpdateCheckEntry(
+                    latest_version=info["latest_version"],
+                    update_available=info["update_available"],
+                    checked_at=time.time(),
+                )
+            else:
+                release = fetch_pypi_release(name, cached)
+                latest_version = release.version
+                update_available = release.version != plugin.get("version")
+                if update_available:
+                    if cached is not None and cached.pypi_version == release.version:
+                        # Already resolved against this release
+                        latest_version = cached.latest_version
+                        update_available = cached.update_available
+                    else:
+                        info = self._check_plugin_update(name, package_spec)
+                        if info.get("update_available") is not None:
+                            latest_version = info["latest_version"]
+                            update_available = info["update_available"]
+                entry = UpdateCheckEntry(
+                    latest_version=latest_version,
+                    update_available=update_available,
+                    checked_at=time.time(),
+                    pypi_version=release.version,
+                    etag=release.etag,
+                    last_modified=release.last_modified,
+                )
+        except Exception as e:
+            logger.warning(f"Failed to check updates for {name}: {e}")
+            return None
+
+        self._update_cache.put(plugin, entry)
+        return entry
+
     def _get_version_from_resolved(self, name: str, resolved_file: str) -> str | None:
         """Extract package version/commit from resolved.txt.
 
@@ -707,72 +814,28 @@ class PluginManager:
         return await loop.run_in_executor(None, self._check_updates_sync)
 
     def _check_updates_sync(self) -> list[dict[str, Any]]:
-        """Synchronous implementation of check_updates."""
-        import urllib.request
+        """Synchronous implementation of check_updates.
 
+        Always revalidates (cheaply, for unchanged PyPI releases) instead of
+        serving cached results, running the checks concurrently.
+        """
         plugins = self._list_plugins_sync()
-        updates = []
+        results = self._check_plugin_updates(
+            [plugin for plugin in plugins if self._needs_update_check(plugin)]
+        )
 
+        updates = []
         for plugin in plugins:
-            name = plugin["name"]
-            source = plugin["source"]
-            installed_version = plugin["version"] or "unknown"
-
-            if source == "local":
-                # Skip local/editable plugins
-                updates.append(
-                    {
-                        "name": name,
-                        "installed_version": installed_version,
-                        "latest_version": None,
-                        "update_available": None,
-                        "source": source,
-                    }
-                )
-                continue
-
-            if source == "pypi":
-                # Query PyPI for latest version
-                try:
-                    url = f"https://pypi.org/pypi/{name}/json"
-                    with urllib.request.urlopen(url, timeout=10) as response:
-                        data = json.loads(response.read().decode())
-                        latest_version = data["info"]["version"]
-                        update_available = latest_version != installed_version
-
-                        updates.append(
-                            {
-                                "name": name,
-                                "installed_version": installed_version,
-                                "latest_version": latest_version,
-                                "update_available": update_available,
-                                "source": source,
-                            }
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to check PyPI updates for {name}: {e}")
-                    updates.append(
-                        {
-                            "name": name,
-                            "installed_version": installed_version,
-                            "latest_version": None,
-                            "update_available": None,
-                            "source": source,
-                        }
-                    )
-
-            elif source == "git":
-                # For git, we can't easily check without the original URL
-                # Would need to store it or run a dry-run upgrade
-                updates.append(
-                    {
-                        "name": name,
-                        "installed_version": installed_version,
-                        "latest_version": None,
-                        "update_available": None,
-                        "source": source,
-                    }
-                )
+            entry = results.get(plugin["name"])
+            updates.append(
+                {
+                    "name": plugin["name"],
+                    "installed_version": plugin["version"] or "unknown",
+                    "latest_version": entry.latest_version if entry else None,
+                    "update_available": entry.update_available if entry else None,
+                    "source": plugin["source"],
+                }
+            )
 
         return updates
 
@@ -919,6 +982,8 @@ class PluginManager:
 
         # Success - clean up snapshot files
         snapshot.discard()
+        self._distribution_index.invalidate()
+        self._update_cache.invalidate(package_base)
 
         # Don't try to reload plugins in-process - the server restart will
         # handle loading the new plugin with a clean slate (no caching issues)
@@ -1020,6 +1085,7 @@ class PluginManager:
 
         # Success - clean up snapshot files
         snapshot.discard()
+        self._distribution_index.invalidate()
 
         return {
             "success": True,
@@ -1159,6 +1225,9 @@ class PluginManager:
             self._compile_plugins()
             logger.info("Re-compiled plugins after uninstall")
 
+        self._distribution_index.invalidate()
+        self._update_cache.invalidate(name)
+
         return {
             "success": True,
             "message": f"Successfully uninstalled {name}",
@@ -1270,6 +1339,7 @@ class PluginManager:
             self._reload_module_tree(name, editable_path)
 
         # Re-load plugins via entry points (with prevalidation)
+        self._distribution_index.invalidate()
         self._failed_plugins.clear()
         self._prevalidate_entrypoints("scope")
         self._pm.load_setuptools_entrypoints("scope")
@@ -101,3 +101,15 @@ def get_freeze_backup_file() -> Path:
         Path: Absolute path to freeze.txt
     """
     return get_plugins_dir() / "freeze.txt"
+
+
+def get_update_cache_file() -> Path:
+    """
+    Get the path to update_cache.json file.
+
+    This file caches plugin update check results between server runs.
+
+    Returns:
+        Path: Absolute path to update_cache.json
+    """
+    return get_plugins_dir() / "update_cache.json"
@@ -0,0 +1,167 @@
+"""On-disk cache of plugin update check results.
+
+Entries are keyed by plugin name, source, installed version and package
+specifier, so installing a different version naturally misses the cache.
+Entries older than UPDATE_CHECK_TTL_SECONDS are stale: they are still served,
+but should be refreshed. PyPI entries keep the ETag and Last-Modified of the
+JSON API response so a refresh can be a cheap conditional request.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from .plugins_config import ensure_plugins_dir, get_update_cache_file
+
+logger = logging.getLogger(__name__)
+
+# How long an update check result is considered fresh
+UPDATE_CHECK_TTL_SECONDS = 6 * 60 * 60
+# Update checks run at once (PyPI requests and uv compile subprocesses)
+UPDATE_CHECK_MAX_WORKERS = 4
+PYPI_TIMEOUT_SECONDS = 10
+
+
+@dataclass
+class UpdateCheckEntry:
+    """Result of one plugin update check."""
+
+    latest_version: str | None
+    update_available: bool | None
+    checked_at: float
+    # Latest release on PyPI and the validators to revalidate it with
+    pypi_version: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        now = time.time() if now is None else now
+        return now - self.checked_at < UPDATE_CHECK_TTL_SECONDS
+
+
+@dataclass
+class PyPIRelease:
+    """Latest version from PyPI's JSON API, with response validators."""
+
+    version: str
+    etag: str | None
+    last_modified: str | None
+
+
+def fetch_pypi_release(
+    name: str, cached: UpdateCheckEntry | None = None
+) -> PyPIRelease:
+    """Get the latest release of a package from PyPI's JSON API.
+
+    If a cached entry carries validators, the request is conditional and a
+    304 response returns the cached version without downloading metadata.
+
+    Raises:
+        Exception: If the request fails or the response cannot be parsed
+    """
+    request = urllib.request.Request(f"https://pypi.org/pypi/{name}/json")
+    if cached is not None and cached.pypi_version:
+        if cached.etag:
+            request.add_header("If-None-Match", cached.etag)
+        if cached.last_modified:
+            request.add_header("If-Modified-Since", cached.last_modified)
+
+    try:
+        with urllib.request.urlopen(request, timeout=PYPI_TIMEOUT_SECONDS) as response:
+            data = json.loads(response.read().decode())
+            headers = response.headers
+            return PyPIRelease(
+                version=data["info"]["version"],
+                etag=_header(headers, "ETag"),
+                last_modified=_header(headers, "Last-Modified"),
+            )
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached is not None and cached.pypi_version:
+            return PyPIRelease(
+                version=cached.pypi_version,
+                etag=cached.etag,
+                last_modified=cached.last_modified,
+            )
+        raise
+
+
+def _header(headers: Any, name: str) -> str | None:
+    value = headers.get(name) if headers is not None else None
+    return value if isinstance(value, str) else None
+
+
+class UpdateCache:
+    """Thread-safe update check results, persisted to update_cache.json."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[str, UpdateCheckEntry] | None = None
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        return re.sub(r"[-_.]+", "-", name).lower()
+
+    @classmethod
+    def key(cls, plugin: dict[str, Any]) -> str:
+        return "|".join(
+            [cls._normalize(plugin["name"])]
+            + [
+                str(plugin.get(field) or "")
+                for field in ("source", "version", "package_spec")
+            ]
+        )
+
+    def get(self, plugin: dict[str, Any]) -> UpdateCheckEntry | None:
+        """Return the cached entry for a plugin, fresh or stale."""
+        with self._lock:
+            return self._load().get(self.key(plugin))
+
+    def put(self, plugin: dict[str, Any], entry: UpdateCheckEntry) -> None:
+        with self._lock:
+            self._load()[self.key(plugin)] = entry
+            self._save()
+
+    def invalidate(self, name: str) -> None:
+        """Drop every entry for a plugin, e.g. after it is (un)installed."""
+        prefix = f"{self._normalize(name)}|"
+        with self._lock:
+            entries = self._load()
+            stale = [key for key in entries if key.startswith(prefix)]
+            for key in stale:
+                del entries[key]
+            if stale:
+                self._save()
+
+    def _load(self) -> dict[str, UpdateCheckEntry]:
+        """Read the cache file on first use. Lock must be held."""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                data = json.loads(get_update_cache_file().read_text())
+                for key, value in data.items():
+                    self._entries[key] = UpdateCheckEntry(**value)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable plugin update cache: {e}")
+        return self._entries
+
+    def _save(self) -> None:
+        """Write the cache file atomically. Lock must be held."""
+        try:
+            ensure_plugins_dir()
+            cache_file = get_update_cache_file()
+            temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            temp_file.write_text(
+                json.dumps({k: asdict(v) for k, v in self._entries.items()})
+            )
+            os.replace(temp_file, cache_file)
+        except Exception as e:
+            logger.warning(f"Failed to write plugin update cache: {e}")
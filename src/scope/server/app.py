@@ -5,6 +5,7 @@ import logging
 import os
 import subprocess
 import sys
+import tempfile
 import threading
 import time
 import warnings
@@ -31,6 +32,14 @@ if TYPE_CHECKING:
     from .schema import PluginInfo
     from .webrtc import WebRTCManager
 
+from .asset_cache import (
+    ASSET_MEDIA_TYPES,
+    asset_type_for,
+    conditional_file_response,
+    file_etag,
+    get_asset_index,
+    get_thumbnail_cache,
+)
 from .cloud_proxy import (
     cloud_proxy,
     get_hardware_info_from_cloud,
@@ -50,12 +59,22 @@ from .kafka_publisher import (
     is_kafka_enabled,
     set_kafka_publisher,
 )
+from .log_tail import (
+    LOG_STREAM_POLL_INTERVAL,
+    LogFollower,
+    align_to_line,
+    iter_file_range,
+    parse_range_header,
+    resolve_log_start,
+)
 from .logs_config import (
     cleanup_old_logs,
     ensure_logs_dir,
     get_current_log_file,
     get_logs_dir,
     get_most_recent_log_file,
+    start_queued_logging,
+    stop_queued_logging,
 )
 from .models_config import (
     ensure_models_dir,
@@ -64,6 +83,7 @@ from .models_config import (
     models_are_downloaded,
 )
 from .pipeline_manager import PipelineManager
+from .preview_hub import preview_hub
 from .recording import (
     cleanup_recording_files,
     cleanup_temp_file,
@@ -86,9 +106,12 @@ from .schema import (
     PipelineLoadRequest,
     PipelineSchemasResponse,
     PipelineStatusResponse,
+    RenderJobRequest,
+    RenderJobResponse,
     WebRTCOfferRequest,
     WebRTCOfferResponse,
 )
+from .schema_cache import pipeline_schema_cache
 
 
 class STUNErrorFilter(logging.Filter):
@@ -131,6 +154,10 @@ file_handler.setFormatter(
 )
 root_logger.addHandler(file_handler)
 
+# Write records from a background thread so frame-path threads never block on
+# disk or console I/O
+start_queued_logging(root_logger)
+
 # Add the filter to suppress STUN/TURN errors
 stun_filter = STUNErrorFilter()
 logging.getLogger("asyncio").addFilter(stun_filter)
@@ -321,6 +348,8 @@ async def lifespan(app: FastAPI):
         await webrtc_manager.stop()
         logger.info("WebRTC manager shutdown complete")
 
+    preview_hub.stop_all()
+
     if pipeline_manager:
         logger.info("Shutting down pipeline manager...")
         pipeline_manager.unload_all_pipelines()
@@ -419,7 +448,9 @@ async def restart_server():
     def do_restart():
         time.sleep(0.5)  # Give time for response to be sent
 
-        # Close all logging handlers to avoid file descriptor warnings
+        # Flush queued records, then close all logging handlers to avoid file
+        # descriptor warnings
+        stop_queued_logging()
         for handler in logging.root.handlers[:]:
             handler.close()
             logging.root.removeHandler(handler)
@@ -568,24 +599,92 @@ async def get_pipeline_schemas(
     In cloud mode (when connected to cloud), this proxies the request to the
     cloud-hosted scope backend to get the available pipelines there.
     """
-    from scope.core.pipelines.registry import PipelineRegistry
-    from scope.core.plugins import get_plugin_manager
+    return pipeline_schema_cache.response(http_request)
+
+
+@app.post("/api/v1/render", response_model=RenderJobResponse, status_code=202)
+async def start_render(
+    request: RenderJobRequest,
+    pipeline_manager: "PipelineManager" = Depends(get_pipeline_manager),
+):
+    """Render a clip or prompt timeline through loaded pipelines to a file.
+
+    Frames go through the same pipeline chain as a stream, but at full speed
+    and without real-time dropping. Poll GET /api/v1/render/{job_id} for
+    progress.
+    """
+    from .pipeline_manager import PipelineNotAvailableException
+    from .render import (
+        RenderJob,
+        load_prompt_timeline,
+        render_jobs,
+        resolve_assets_path,
+    )
+
+    try:
+        pipelines = [
+            (pipeline_id, pipeline_manager.get_pipeline_by_id(pipeline_id))
+            for pipeline_id in request.pipeline_ids
+        ]
+    except PipelineNotAvailableException as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    try:
+        input_path, prompts_path, output_path = (
+            resolve_assets_path(path) if path else None
+            for path in (request.input_path, request.prompts_path, request.output_path)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e)) from e
+
+    for path in (input_path, prompts_path):
+        if path is not None and not path.is_file():
+            raise HTTPException(status_code=404, detail=f"File not found: {path.name}")
+
+    try:
+        prompts = load_prompt_timeline(prompts_path) if prompts_path else None
+        job = await asyncio.to_thread(
+            RenderJob,
+            pipelines,
+            output_path=output_path,
+            input_path=input_path,
+            prompts=prompts,
+            parameters=request.parameters,
+            fps=request.fps,
+            frames_per_prompt=request.frames_per_prompt,
+            max_frames=request.max_frames,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.error(f"Error starting render: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    render_jobs.start(job)
+    return RenderJobResponse(**job.to_dict())
 
-    plugin_manager = get_plugin_manager()
-    pipelines: dict = {}
-
-    for pipeline_id in PipelineRegistry.list_pipelines():
-        config_class = PipelineRegistry.get_config_class(pipeline_id)
-        if config_class:
-            # get_schema_with_metadata() includes supported_modes, default_mode,
-            # and mode_defaults directly from the config class
-            schema_data = config_class.get_schema_with_metadata()
-            schema_data["plugin_name"] = plugin_manager.get_plugin_for_pipeline(
-                pipeline_id
-            )
-            pipelines[pipeline_id] = schema_data
 
-    return PipelineSchemasResponse(pipelines=pipelines)
+@app.get("/api/v1/render/{job_id}", response_model=RenderJobResponse)
+async def get_render(job_id: str):
+    """Get the status and progress of a render job."""
+    from .render import render_jobs
+
+    job = render_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Render job {job_id} not found")
+    return RenderJobResponse(**job.to_dict())
+
+
+@app.delete("/api/v1/render/{job_id}", response_model=RenderJobResponse)
+async def cancel_render(job_id: str):
+    """Cancel a render job, keeping the frames already written."""
+    from .render import render_jobs
+
+    job = render_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Render job {job_id} not found")
+    job.cancel()
+    return RenderJobResponse(**job.to_dict())
 
 
 @app.get("/api/v1/webrtc/ice-servers", response_model=IceServersResponse)
@@ -721,8 +820,8 @@ async def download_recording(
     cloud_manager: "CloudConnectionManager" = Depends(get_cloud_connection_manager),
 ):
     """Download the recording file for the specified session.
-    This will finalize the current recording and create a copy for download,
-    then continue recording with a new file.
+    This copies the completed fragments of the current recording for download
+    without stopping or restarting the recording.
 
     In cloud mode, this proxies the download request to cloud.
     """
@@ -741,8 +840,8 @@ async def download_recording(
                 detail=f"Recording not available for session {session_id}",
             )
 
-        # Finalize the recording and get the download file
-        download_file = await session.recording_manager.finalize_and_get_recording()
+        # Snapshot the recording and get the download file
+        download_file = await session.recording_manager.create_download()
         if not download_file or not Path(download_file).exists():
             raise HTTPException(
                 status_code=404,
@@ -836,44 +935,9 @@ async def list_assets(
 
     When cloud mode is active, lists assets from the cloud server instead.
     """
-
-    def process_asset_file(
-        file_path: Path, assets_dir: Path, asset_type: str
-    ) -> AssetFileInfo:
-        """Extract asset file metadata."""
-        size_mb = file_path.stat().st_size / (1024 * 1024)
-        created_at = file_path.stat().st_ctime
-        relative_path = file_path.relative_to(assets_dir)
-        folder = (
-            str(relative_path.parent) if relative_path.parent != Path(".") else None
-        )
-        return AssetFileInfo(
-            name=file_path.stem,
-            path=str(file_path),
-            size_mb=round(size_mb, 2),
-            folder=folder,
-            type=asset_type,
-            created_at=created_at,
-        )
-
     try:
-        assets_dir = get_assets_dir()
-        asset_files: list[AssetFileInfo] = []
-
-        if type == "image":
-            extensions = IMAGE_EXTENSIONS
-        elif type == "video":
-            extensions = VIDEO_EXTENSIONS
-        else:
-            extensions = IMAGE_EXTENSIONS | VIDEO_EXTENSIONS
-
-        for file_path in iter_files(assets_dir, extensions):
-            ext = file_path.suffix.lower()
-            asset_type = "image" if ext in IMAGE_EXTENSIONS else "video"
-            asset_files.append(process_asset_file(file_path, assets_dir, asset_type))
-
-        # Sort by created_at (most recent first), then by folder and name
-        asset_files.sort(key=lambda x: (-x.created_at, x.folder or "", x.name))
+        asset_type = type if type in ("image", "video") else None
+        asset_files = await asyncio.to_thread(get_asset_index().list, asset_type)
         return AssetsResponse(assets=asset_files)
 
     except Exception as e:  # pragma: no cover - defensive logging
@@ -881,9 +945,52 @@ async def list_assets(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+MAX_ASSET_UPLOAD_BYTES = 50 * 1024 * 1024  # 50MB
+
+
+async def _stream_upload_to_file(
+    request: Request, destination: Path, max_size: int
+) -> int:
+    """Write a request body to destination chunk by chunk.
+
+    The body is written to a hidden temp file next to destination and only
+    renamed into place once complete, so an oversized or aborted upload never
+    leaves a partial asset behind.
+
+    Returns:
+        Number of bytes written
+    """
+    size_error = HTTPException(
+        status_code=400,
+        detail=f"File size exceeds maximum of {max_size / (1024 * 1024):.0f}MB",
+    )
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_size:
+        raise size_error
+
+    fd, temp_path = tempfile.mkstemp(
+        dir=destination.parent, prefix=".upload_", suffix=".part"
+    )
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            async for chunk in request.stream():
+                size += len(chunk)
+                if size > max_size:
+                    raise size_error
+                f.write(chunk)
+        os.replace(temp_path, destination)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        raise
+    return size
+
+
 @app.post("/api/v1/assets", response_model=AssetFileInfo)
 async def upload_asset(
     request: Request,
+    background_tasks: BackgroundTasks,
     filename: str = Query(...),
     cloud_manager: "CloudConnectionManager" = Depends(get_cloud_connection_manager),
 ):
@@ -924,52 +1031,32 @@ async def upload_asset(
             }
         content_type = content_type_map.get(file_extension, "application/octet-stream")
 
-        # Read file content from request body
-        content = await request.body()
-
-        # Validate file size (50MB limit)
-        max_size = 50 * 1024 * 1024  # 50MB
-        if len(content) > max_size:
-            raise HTTPException(
-                status_code=400,
-                detail=f"File size exceeds maximum of {max_size / (1024 * 1024):.0f}MB",
-            )
+        # Stream the body to disk, saving locally in cloud mode too so
+        # thumbnails can be served
+        assets_dir = get_assets_dir()
+        assets_dir.mkdir(parents=True, exist_ok=True)
+        file_path = assets_dir / filename
+        await _stream_upload_to_file(request, file_path, MAX_ASSET_UPLOAD_BYTES)
 
-        # If cloud mode is active, upload to cloud AND save locally for thumbnails
+        # If cloud mode is active, also upload to cloud
         if cloud_manager.is_connected:
-            return await upload_asset_to_cloud(
+            result = await upload_asset_to_cloud(
                 cloud_manager,
-                content,
+                file_path,
                 filename,
                 content_type,
                 asset_type,
             )
+            get_asset_index().add(file_path)
+            background_tasks.add_task(get_thumbnail_cache().warm, file_path)
+            return result
 
-        # Local mode: save to local assets directory
-        assets_dir = get_assets_dir()
-        assets_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save file to assets directory
-        file_path = assets_dir / filename
-        file_path.write_bytes(content)
-
-        # Return file info matching AssetFileInfo structure
-        size_mb = len(content) / (1024 * 1024)
-        created_at = file_path.stat().st_ctime
-        relative_path = file_path.relative_to(assets_dir)
-        folder = (
-            str(relative_path.parent) if relative_path.parent != Path(".") else None
-        )
+        # Record the file in the index and pre-generate its thumbnails
+        asset_info = get_asset_index().add(file_path)
+        background_tasks.add_task(get_thumbnail_cache().warm, file_path)
 
         logger.info(f"upload_asset: Uploaded {asset_type} file: {file_path}")
-        return AssetFileInfo(
-            name=file_path.stem,
-            path=str(file_path),
-            size_mb=round(size_mb, 2),
-            folder=folder,
-            type=asset_type,
-            created_at=created_at,
-        )
+        return asset_info
 
     except HTTPException:
         raise
@@ -979,11 +1066,18 @@ async def upload_asset(
 
 
 @app.get("/api/v1/assets/{asset_path:path}")
-async def serve_asset(asset_path: str):
-    """Serve an asset file (for thumbnails/previews).
+async def serve_asset(
+    request: Request,
+    asset_path: str,
+    thumbnail: int | None = Query(
+        None, ge=16, le=1024, description="Serve a WebP thumbnail of this max size"
+    ),
+):
+    """Serve an asset file, or a cached thumbnail / video poster frame of it.
 
     Handles both relative paths and absolute paths (e.g., from cloud).
     For absolute paths, extracts the filename and serves from local assets.
+    Responses carry an ETag and honor If-None-Match and Range requests.
     """
     try:
         assets_dir = get_assets_dir()
@@ -1012,23 +1106,21 @@ async def serve_asset(asset_path: str):
         if not file_path.exists() or not file_path.is_file():
             raise HTTPException(status_code=404, detail="Asset not found")
 
-        # Determine media type based on extension
-        file_extension = file_path.suffix.lower()
-        media_types = {
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".webp": "image/webp",
-            ".bmp": "image/bmp",
-            ".mp4": "video/mp4",
-            ".avi": "video/x-msvideo",
-            ".mov": "video/quicktime",
-            ".mkv": "video/x-matroska",
-            ".webm": "video/webm",
-        }
-        media_type = media_types.get(file_extension, "application/octet-stream")
+        if thumbnail is not None and asset_type_for(file_path) is not None:
+            thumbnail_path, etag = await asyncio.to_thread(
+                get_thumbnail_cache().get, file_path, thumbnail
+            )
+            return conditional_file_response(
+                request, thumbnail_path, "image/webp", etag
+            )
 
-        return FileResponse(file_path, media_type=media_type)
+        # Determine media type based on extension
+        media_type = ASSET_MEDIA_TYPES.get(
+            file_path.suffix.lower(), "application/octet-stream"
+        )
+        return conditional_file_response(
+            request, file_path, media_type, file_etag(file_path.stat())
+        )
 
     except HTTPException:
         raise
@@ -1248,59 +1340,34 @@ def get_input_source_resolution(
 
 @app.get("/api/v1/input-sources/{source_type}/sources/{identifier:path}/stream")
 async def stream_input_source_preview(
-    source_type: str, identifier: str, fps: int = Query(2, ge=1, le=30)
+    source_type: str,
+    identifier: str,
+    fps: int = Query(2, ge=1, le=30),
+    max_width: int = Query(320, ge=16, le=1920),
 ):
-    """MJPEG stream of an input source for live preview."""
+    """MJPEG stream of an input source for live preview.
+
+    Clients previewing the same source with the same settings share one
+    receiver and one JPEG encoder.
+    """
     source_class = _resolve_input_source_class(source_type)
 
     async def _generate():
-        from PIL import Image
-
-        max_w = 320
-        interval = 1.0 / fps
-        receiver = None
-        loop = asyncio.get_event_loop()
-
+        subscription = preview_hub.subscribe(
+            source_type, source_class, identifier, fps, max_width
+        )
         try:
-            # Create persistent receiver
-            receiver = source_class()
-            connected = await loop.run_in_executor(None, receiver.connect, identifier)
-            if not connected:
-                logger.warning(f"Preview stream: could not connect to '{identifier}'")
-                return
-
-            while True:
-                frame = await loop.run_in_executor(None, receiver.receive_frame, 200)
-
-                if frame is not None:
-                    h, w = frame.shape[:2]
-                    if w > max_w:
-                        scale = max_w / w
-                        new_w = max_w
-                        new_h = int(h * scale)
-                        img = Image.fromarray(frame).resize(
-                            (new_w, new_h), Image.NEAREST
-                        )
-                    else:
-                        img = Image.fromarray(frame)
-
-                    buf = io.BytesIO()
-                    img.save(buf, format="JPEG", quality=70)
-                    jpeg = buf.getvalue()
-
-                    yield (
-                        b"--frame\r\n"
-                        b"Content-Type: image/jpeg\r\n"
-                        b"Content-Length: " + str(len(jpeg)).encode() + b"\r\n"
-                        b"\r\n" + jpeg + b"\r\n"
-                    )
-
-                await asyncio.sleep(interval)
+            async for jpeg in subscription:
+                yield (
+                    b"--frame\r\n"
+                    b"Content-Type: image/jpeg\r\n"
+                    b"Content-Length: " + str(len(jpeg)).encode() + b"\r\n"
+                    b"\r\n" + jpeg + b"\r\n"
+                )
         except asyncio.CancelledError:
             pass
         finally:
-            if receiver is not None:
-                receiver.close()
+            preview_hub.unsubscribe(subscription)
 
     return StreamingResponse(
         _generate(),
@@ -1421,8 +1488,22 @@ async def delete_api_key(service_id: str):
 
 
 @app.get("/api/v1/logs/current")
-async def get_current_logs():
-    """Get the most recent application log file for bug reporting."""
+async def get_current_logs(
+    request: Request,
+    tail_bytes: int | None = Query(
+        None, ge=1, description="Only return the last N bytes, starting on a line"
+    ),
+    since_offset: int | None = Query(
+        None, ge=0, description="Only return bytes from this offset onward"
+    ),
+):
+    """Get the most recent application log file for bug reporting.
+
+    The file is streamed in chunks from a worker thread. Incremental fetching
+    is supported via ?tail_bytes=, ?since_offset= or an HTTP Range header; the
+    X-Log-Offset and X-Log-Size headers give the byte range returned, so a
+    client can pass X-Log-Size as since_offset on its next request.
+    """
     try:
         log_file_path = get_most_recent_log_file()
 
@@ -1432,19 +1513,52 @@ async def get_current_logs():
                 detail="Log file not found. The application may not have logged anything yet.",
             )
 
-        # Read the entire file into memory to avoid Content-Length issues
-        # with actively written log files.
-        # Use errors='replace' to handle non-UTF-8 bytes gracefully (e.g., Windows-1252
-        # characters from subprocess output or exception messages on Windows).
-        log_content = log_file_path.read_text(encoding="utf-8", errors="replace")
+        # Snapshot the size so an actively written log never sends more bytes
+        # than the declared Content-Length
+        size = log_file_path.stat().st_size
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Cache-Control": "no-cache",
+            "X-Log-File": log_file_path.name,
+        }
+        status_code = 200
 
-        # Return as a text response with proper headers for download
-        return Response(
-            content=log_content,
-            media_type="text/plain",
-            headers={
-                "Content-Disposition": f'attachment; filename="{log_file_path.name.replace(".log", ".txt")}"'
-            },
+        range_header = request.headers.get("range")
+        if range_header:
+            try:
+                start, end = parse_range_header(range_header, size)
+            except ValueError:
+                raise HTTPException(
+                    status_code=416,
+                    detail="Requested range not satisfiable",
+                    headers={"Content-Range": f"bytes */{size}"},
+                ) from None
+            status_code = 206
+            headers["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+        else:
+            end = size
+            start = resolve_log_start(size, tail_bytes, since_offset)
+            if tail_bytes is not None and since_offset is None:
+                start = await asyncio.to_thread(
+                    align_to_line, log_file_path, start, end
+                )
+
+        if start == 0 and end == size and status_code == 200:
+            # Full file: offer it as a download
+            headers["Content-Disposition"] = (
+                f'attachment; filename="{log_file_path.name.replace(".log", ".txt")}"'
+            )
+
+        headers["Content-Length"] = str(end - start)
+        headers["X-Log-Offset"] = str(start)
+        headers["X-Log-Size"] = str(end)
+
+        # Sync iterators are consumed in Starlette's threadpool
+        return StreamingResponse(
+            iter_file_range(log_file_path, start, end),
+            status_code=status_code,
+            media_type="text/plain; charset=utf-8",
+            headers=headers,
         )
     except HTTPException:
         raise
@@ -1453,6 +1567,60 @@ async def get_current_logs():
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@app.get("/api/v1/logs/stream")
+async def stream_current_logs(
+    request: Request,
+    tail_bytes: int = Query(
+        16 * 1024, ge=0, description="Bytes of history to send before following"
+    ),
+    since_offset: int | None = Query(
+        None, ge=0, description="Resume from this offset instead of the tail"
+    ),
+):
+    """Live-tail the most recent log file as server-sent events.
+
+    Each event carries complete log lines as "data:" fields and the byte
+    offset after them as its id, so a reconnecting EventSource resumes via
+    Last-Event-ID. Rollovers by the RotatingFileHandler are followed, and
+    announced with a "rotated" event.
+    """
+    log_file_path = get_most_recent_log_file()
+    if log_file_path is None or not log_file_path.exists():
+        raise HTTPException(
+            status_code=404,
+            detail="Log file not found. The application may not have logged anything yet.",
+        )
+
+    last_event_id = request.headers.get("last-event-id", "")
+    if last_event_id.isdigit():
+        since_offset = int(last_event_id)
+
+    size = log_file_path.stat().st_size
+    start = resolve_log_start(size, tail_bytes, since_offset)
+    if since_offset is None:
+        start = await asyncio.to_thread(align_to_line, log_file_path, start, size)
+    follower = LogFollower(log_file_path, start)
+
+    async def _events():
+        rotations = follower.rotations
+        while not await request.is_disconnected():
+            lines = await asyncio.to_thread(follower.read_lines)
+            if follower.rotations != rotations:
+                rotations = follower.rotations
+                yield "event: rotated\ndata: \n\n"
+            if lines:
+                data = "".join(f"data: {line}\n" for line in lines)
+                yield f"id: {follower.line_offset}\n{data}\n"
+            else:
+                await asyncio.sleep(LOG_STREAM_POLL_INTERVAL)
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Log-File": log_file_path.name},
+    )
+
+
 # Plugin Management API Endpoints
 
 
@@ -2062,6 +2230,136 @@ def pipelines():
         click.echo(f"  • {pipeline_id}")
 
 
+@main.command()
+@click.option(
+    "--pipeline",
+    "-p",
+    "pipeline_chain",
+    required=True,
+    help="Pipeline ID, or comma-separated IDs for a chain",
+)
+@click.option(
+    "--input",
+    "-i",
+    "input_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Video file to process (omit to render in text mode)",
+)
+@click.option(
+    "--prompts",
+    "prompts_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="JSONL prompt timeline; every line's prompts are played in order",
+)
+@click.option(
+    "--output",
+    "-o",
+    "output_path",
+    type=click.Path(dir_okay=False),
+    required=True,
+    help="MP4 file to write",
+)
+@click.option(
+    "--fps",
+    type=float,
+    default=None,
+    help="Output frame rate (default: the input's rate, or 16 in text mode)",
+)
+@click.option(
+    "--frames-per-prompt",
+    type=int,
+    default=81,
+    help="Output frames generated per timeline prompt (default: 81)",
+)
+@click.option(
+    "--max-frames", type=int, default=None, help="Stop after this many output frames"
+)
+@click.option(
+    "--param",
+    multiple=True,
+    help="Runtime parameter passed to every pipeline call, as KEY=VALUE",
+)
+@click.option(
+    "--load-param",
+    multiple=True,
+    help="Load parameter passed when instantiating pipelines, as KEY=VALUE",
+)
+def render(
+    pipeline_chain,
+    input_path,
+    prompts_path,
+    output_path,
+    fps,
+    frames_per_prompt,
+    max_frames,
+    param,
+    load_param,
+):
+    """Render a video or prompt timeline through a pipeline chain to a file."""
+    import argparse
+    import threading
+
+    from .bench import load_pipeline, parse_param
+    from .render import RenderJob, load_prompt_timeline
+    from .schema import RenderStatusEnum
+
+    if input_path is None and prompts_path is None:
+        raise click.UsageError("Provide --input, --prompts, or both")
+
+    try:
+        params = dict(parse_param(value) for value in param)
+        load_params = dict(parse_param(value) for value in load_param) or None
+        prompts = load_prompt_timeline(prompts_path) if prompts_path else None
+    except (argparse.ArgumentTypeError, ValueError) as e:
+        raise click.BadParameter(str(e)) from e
+
+    pipeline_ids = [p.strip() for p in pipeline_chain.split(",") if p.strip()]
+    try:
+        pipelines = [
+            (pipeline_id, load_pipeline(pipeline_id, load_params))
+            for pipeline_id in pipeline_ids
+        ]
+    except Exception as e:
+        click.echo(f"Error loading pipelines: {e}", err=True)
+        sys.exit(1)
+
+    job = RenderJob(
+        pipelines,
+        output_path=output_path,
+        input_path=input_path,
+        prompts=prompts,
+        parameters=params,
+        fps=fps,
+        frames_per_prompt=frames_per_prompt,
+        max_frames=max_frames,
+    )
+
+    thread = threading.Thread(target=job.run, daemon=True)
+    thread.start()
+    try:
+        while thread.is_alive():
+            thread.join(timeout=1.0)
+            progress = f" ({job.progress:.0%})" if job.progress is not None else ""
+            click.echo(
+                f"\r{job.frames_out} frames{progress}, {job.render_fps:.1f} fps",
+                nl=False,
+            )
+    except KeyboardInterrupt:
+        job.cancel()
+        thread.join()
+    click.echo()
+
+    if job.status == RenderStatusEnum.FAILED:
+        click.echo(f"Render failed: {job.error}", err=True)
+        sys.exit(1)
+    click.echo(
+        f"Wrote {job.frames_out} frames to {job.output_path} "
+        f"in {job.elapsed:.1f}s ({job.render_fps:.1f} fps)"
+    )
+
+
 @main.command()
 @click.argument("package", required=False)
 @click.option("--upgrade", is_flag=True, help="Upgrade package to latest version")
@@ -20,9 +20,8 @@ def get_artifacts_for_pipeline(pipeline_id: str) -> list[Artifact]:
     """
     from scope.core.pipelines.registry import PipelineRegistry
 
-    pipeline_class = PipelineRegistry.get(pipeline_id)
-    if pipeline_class is not None:
-        config_class = pipeline_class.get_config_class()
+    config_class = PipelineRegistry.get_config_class(pipeline_id)
+    if config_class is not None:
         return getattr(config_class, "artifacts", [])
 
     return []
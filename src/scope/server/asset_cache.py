@@ -0,0 +1,322 @@
+"""
+Asset index and thumbnail cache for the assets API.
+
+The index keeps asset metadata in memory and only rescans directories whose
+modification time changed, so listing assets costs one stat per directory
+instead of two per file. Thumbnails are downscaled WebP images (poster frames
+for videos) stored under the hash of the source file's content, so identical
+files share a thumbnail and the hash doubles as the ETag.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response
+
+from .file_utils import IMAGE_EXTENSIONS, VIDEO_EXTENSIONS
+from .models_config import get_assets_dir, get_thumbnails_dir
+from .schema import AssetFileInfo
+
+logger = logging.getLogger(__name__)
+
+ASSET_MEDIA_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".bmp": "image/bmp",
+    ".mp4": "video/mp4",
+    ".avi": "video/x-msvideo",
+    ".mov": "video/quicktime",
+    ".mkv": "video/x-matroska",
+    ".webm": "video/webm",
+}
+
+# Requested thumbnail sizes are rounded up to one of these to bound the cache
+THUMBNAIL_SIZES = (128, 256, 512)
+THUMBNAIL_QUALITY = 80
+
+# Directory mtimes this recent may hide a later change within the same
+# timestamp tick on coarse filesystems, so such directories are rescanned
+MTIME_SETTLE_SECONDS = 2.0
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def asset_type_for(path: Path) -> str | None:
+    """Return "image" or "video" for supported asset files, None otherwise."""
+    ext = path.suffix.lower()
+    if ext in IMAGE_EXTENSIONS:
+        return "image"
+    if ext in VIDEO_EXTENSIONS:
+        return "video"
+    return None
+
+
+def file_etag(stat_result: os.stat_result) -> str:
+    """Weak validator for a file derived from its size and modification time."""
+    return f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header matches the given ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def conditional_file_response(
+    request: Request, path: Path, media_type: str, etag: str
+) -> Response:
+    """Serve a file with ETag revalidation and Range support.
+
+    Returns 304 when the client's If-None-Match matches. Otherwise returns a
+    FileResponse, which handles Range and If-Range itself.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers)
+
+
+@dataclass
+class _DirectoryState:
+    mtime_ns: int
+    scanned_at: float
+    files: dict[str, AssetFileInfo] = field(default_factory=dict)
+    subdirs: list[str] = field(default_factory=list)
+
+    def is_stale(self, mtime_ns: int) -> bool:
+        if mtime_ns != self.mtime_ns:
+            return True
+        # Changes within the same mtime tick as the scan would go unnoticed
+        return self.scanned_at - mtime_ns / 1e9 < MTIME_SETTLE_SECONDS
+
+
+class AssetIndex:
+    """Incrementally maintained index of the asset files under a directory.
+
+    Symlinked directories are followed like iter_files does, with loops
+    skipped.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._dirs: dict[str, _DirectoryState] = {}
+        self._lock = threading.Lock()
+
+    def list(self, asset_type: str | None = None) -> list[AssetFileInfo]:
+        """Return assets sorted by most recent first, then folder and name."""
+        with self._lock:
+            self._refresh()
+            assets = [
+                info
+                for state in self._dirs.values()
+                for info in state.files.values()
+                if asset_type is None or info.type == asset_type
+            ]
+        assets.sort(key=lambda x: (-x.created_at, x.folder or "", x.name))
+        return assets
+
+    def add(self, file_path: Path) -> AssetFileInfo | None:
+        """Record a file that was just written, e.g. by an upload."""
+        info = self._make_info(file_path, file_path.stat())
+        if info is None:
+            return None
+        with self._lock:
+            state = self._dirs.get(str(file_path.parent))
+            if state is not None:
+                state.files[file_path.name] = info
+        return info
+
+    def remove(self, file_path: Path):
+        """Forget a file that was deleted."""
+        with self._lock:
+            state = self._dirs.get(str(file_path.parent))
+            if state is not None:
+                state.files.pop(file_path.name, None)
+
+    def _refresh(self):
+        visited: dict[str, str] = {}
+        self._refresh_dir(str(self.root), visited)
+        for path in set(self._dirs) - set(visited):
+            del self._dirs[path]
+
+    def _refresh_dir(self, path: str, visited: dict[str, str]):
+        try:
+            stat_result = os.stat(path)
+            real_path = os.path.realpath(path)
+        except OSError:
+            return
+        if real_path in visited.values():
+            return
+        visited[path] = real_path
+
+        state = self._dirs.get(path)
+        if state is None or state.is_stale(stat_result.st_mtime_ns):
+            state = self._scan_dir(path, stat_result.st_mtime_ns)
+            self._dirs[path] = state
+
+        for subdir in state.subdirs:
+            self._refresh_dir(subdir, visited)
+
+    def _scan_dir(self, path: str, mtime_ns: int) -> _DirectoryState:
+        state = _DirectoryState(mtime_ns=mtime_ns, scanned_at=time.time())
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            state.subdirs.append(entry.path)
+                            continue
+                        file_path = Path(entry.path)
+                        if asset_type_for(file_path) is None or not entry.is_file():
+                            continue
+                        info = self._make_info(file_path, entry.stat())
+                        if info is not None:
+                            state.files[entry.name] = info
+                    except OSError as e:
+                        logger.debug(f"AssetIndex: skipping {entry.path}: {e}")
+        except OSError as e:
+            logger.debug(f"AssetIndex: cannot scan {path}: {e}")
+        return state
+
+    def _make_info(
+        self, file_path: Path, stat_result: os.stat_result
+    ) -> AssetFileInfo | None:
+        asset_type = asset_type_for(file_path)
+        if asset_type is None:
+            return None
+        relative_path = file_path.relative_to(self.root)
+        folder = (
+            str(relative_path.parent) if relative_path.parent != Path(".") else None
+        )
+        return AssetFileInfo(
+            name=file_path.stem,
+            path=str(file_path),
+            size_mb=round(stat_result.st_size / (1024 * 1024), 2),
+            folder=folder,
+            type=asset_type,
+            created_at=stat_result.st_ctime,
+        )
+
+
+class ThumbnailCache:
+    """Content-addressed cache of WebP thumbnails and video poster frames."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        # path -> ((size, mtime_ns), sha256 hex digest)
+        self._digests: dict[str, tuple[tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def bucket_size(size: int) -> int:
+        """Round a requested size up to the nearest cached thumbnail size."""
+        for bucket in THUMBNAIL_SIZES:
+            if size <= bucket:
+                return bucket
+        return THUMBNAIL_SIZES[-1]
+
+    def content_digest(self, file_path: Path) -> str:
+        """SHA-256 of the file's content, cached until the file changes."""
+        stat_result = file_path.stat()
+        signature = (stat_result.st_size, stat_result.st_mtime_ns)
+        key = str(file_path)
+        with self._lock:
+            cached = self._digests.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            while chunk := f.read(HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        hexdigest = digest.hexdigest()
+        with self._lock:
+            self._digests[key] = (signature, hexdigest)
+        return hexdigest
+
+    def get(self, file_path: Path, size: int) -> tuple[Path, str]:
+        """Return (thumbnail path, ETag), generating the thumbnail if needed.
+
+        Blocking: decodes the source on a cache miss.
+        """
+        size = self.bucket_size(size)
+        digest = self.content_digest(file_path)
+        thumbnail_path = self.cache_dir / digest[:2] / f"{digest}-{size}.webp"
+        if not thumbnail_path.exists():
+            self._generate(file_path, thumbnail_path, size)
+        return thumbnail_path, f'"{digest}-{size}"'
+
+    def warm(self, file_path: Path):
+        """Generate every thumbnail size for a file, e.g. right after upload."""
+        for size in THUMBNAIL_SIZES:
+            try:
+                self.get(file_path, size)
+            except Exception as e:
+                logger.warning(f"Could not generate thumbnail for {file_path}: {e}")
+                return
+
+    def _generate(self, source: Path, destination: Path, size: int):
+        from PIL import Image
+
+        if asset_type_for(source) == "video":
+            image = self._poster_frame(source)
+        else:
+            with Image.open(source) as opened:
+                image = opened.copy()
+
+        image.thumbnail((size, size))
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+        # Write to a temp file and rename so readers never see partial output
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = destination.with_suffix(f".{os.getpid()}.{threading.get_ident()}")
+        image.save(temp_path, format="WEBP", quality=THUMBNAIL_QUALITY)
+        os.replace(temp_path, destination)
+        logger.debug(f"Generated thumbnail {destination} for {source}")
+
+    @staticmethod
+    def _poster_frame(source: Path):
+        import av
+
+        with av.open(str(source)) as container:
+            stream = container.streams.video[0]
+            for frame in container.decode(stream):
+                return frame.to_image()
+        raise ValueError(f"No video frames in {source}")
+
+
+_asset_index: AssetIndex | None = None
+_thumbnail_cache: ThumbnailCache | None = None
+_instances_lock = threading.Lock()
+
+
+def get_asset_index() -> AssetIndex:
+    """Get the asset index for the current assets directory."""
+    global _asset_index
+    assets_dir = get_assets_dir()
+    with _instances_lock:
+        if _asset_index is None or _asset_index.root != assets_dir:
+            _asset_index = AssetIndex(assets_dir)
+        return _asset_index
+
+
+def get_thumbnail_cache() -> ThumbnailCache:
+    """Get the thumbnail cache for the current cache directory."""
+    global _thumbnail_cache
+    cache_dir = get_thumbnails_dir()
+    with _instances_lock:
+        if _thumbnail_cache is None or _thumbnail_cache.cache_dir != cache_dir:
+            _thumbnail_cache = ThumbnailCache(cache_dir)
+        return _thumbnail_cache
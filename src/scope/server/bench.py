@@ -0,0 +1,490 @@
+"""
+Pipeline benchmark and regression harness
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Relative slack allowed against the baseline before a metric counts as a regression
+DEFAULT_TOLERANCE = 0.1
+DEFAULT_ITERATIONS = 20
+DEFAULT_WARMUP = 3
+
+
+def parse_resolution(value: str) -> tuple[int, int]:
+    """Parse a HEIGHTxWIDTH string, e.g. "512x512"."""
+    try:
+        height, width = (int(part) for part in value.lower().split("x"))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(
+            f"Invalid resolution '{value}', expected HEIGHTxWIDTH"
+        ) from e
+    if height <= 0 or width <= 0:
+        raise argparse.ArgumentTypeError(f"Invalid resolution '{value}'")
+    return height, width
+
+
+def parse_param(value: str) -> tuple[str, Any]:
+    """Parse a KEY=VALUE pipeline parameter, decoding VALUE as JSON when possible."""
+    key, sep, raw = value.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(
+            f"Invalid parameter '{value}', expected KEY=VALUE"
+        )
+    try:
+        return key, json.loads(raw)
+    except json.JSONDecodeError:
+        return key, raw
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Return the q-th percentile (0-100) of values using linear interpolation."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def synthetic_frames(num_frames: int, height: int, width: int, seed: int = 0) -> list:
+    """Generate uint8 frames shaped like frame_processor output: (1, H, W, C)."""
+    import torch
+
+    generator = torch.Generator().manual_seed(seed)
+    return [
+        torch.randint(
+            0, 256, (1, height, width, 3), dtype=torch.uint8, generator=generator
+        )
+        for _ in range(num_frames)
+    ]
+
+
+def recorded_frames(path: str | Path, height: int, width: int) -> list:
+    """Load a video file as uint8 frames shaped like frame_processor output."""
+    import torch
+
+    from scope.core.pipelines.video import load_video
+
+    video = load_video(path, resize_hw=(height, width), normalize=False)
+    # CTHW -> list of [1, H, W, C]
+    return [
+        video[:, i].permute(1, 2, 0).unsqueeze(0).round().clamp(0, 255).to(torch.uint8)
+        for i in range(video.shape[1])
+    ]
+
+
+def load_pipeline(pipeline_id: str, load_params: dict | None = None):
+    """Instantiate a registered pipeline the same way the server does."""
+    from .pipeline_manager import PipelineManager
+
+    return PipelineManager()._load_pipeline_implementation(pipeline_id, load_params)
+
+
+def _to_frames(output) -> list:
+    """Convert pipeline output (THWC in [0, 1]) to uint8 [1, H, W, C] frames.
+
+    Mirrors the conversion PipelineProcessor applies between chained pipelines.
+    """
+    import torch
+
+    output = (output * 255.0).clamp(0, 255).to(dtype=torch.uint8).contiguous()
+    return [frame.unsqueeze(0) for frame in output]
+
+
+def _synchronize(device) -> None:
+    import torch
+
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+
+
+def _peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MB, where the platform reports it."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor
+
+
+def run_benchmark(
+    pipelines: list,
+    frames: list,
+    iterations: int = DEFAULT_ITERATIONS,
+    warmup: int = DEFAULT_WARMUP,
+    chunk_size: int | None = None,
+    params: dict | None = None,
+    device=None,
+) -> dict[str, Any]:
+    """Run frames through a chain of pipelines and measure per-chunk cost.
+
+    Each iteration feeds one chunk into the first pipeline and then runs every
+    downstream pipeline as long as its input requirement is met, the same way
+    chained PipelineProcessors hand frames to each other but without any
+    real-time pacing or dropping.
+
+    Args:
+        pipelines: Pipeline instances, in chain order
+        frames: Input frames as uint8 [1, H, W, C] tensors, cycled as needed
+        iterations: Number of measured chunks
+        warmup: Number of unmeasured chunks run first
+        chunk_size: Frames per chunk for the first pipeline. Defaults to its
+            prepare() requirement.
+        params: Runtime parameters passed to every pipeline call
+        device: Device used for synchronization and memory statistics
+
+    Returns:
+        Dict with latency percentiles, fps, peak memory and allocation counts
+    """
+    import torch
+
+    if not pipelines:
+        raise ValueError("At least one pipeline is required")
+    if not frames:
+        raise ValueError("At least one input frame is required")
+
+    params = params or {}
+    device = device or torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    queues: list[list] = [[] for _ in pipelines]
+    initialized = [False] * len(pipelines)
+    frame_index = 0
+
+    def requirement(pipeline) -> int:
+        if hasattr(pipeline, "prepare"):
+            requirements = pipeline.prepare(video=True, **params)
+            if requirements is not None:
+                return requirements.input_size
+        return 1
+
+    def run_chunk() -> int:
+        nonlocal frame_index
+        size = chunk_size or requirement(pipelines[0])
+        for _ in range(size):
+            queues[0].append(frames[frame_index % len(frames)])
+            frame_index += 1
+
+        produced = 0
+        for i, pipeline in enumerate(pipelines):
+            size = chunk_size if i == 0 and chunk_size else requirement(pipeline)
+            while len(queues[i]) >= size:
+                chunk, queues[i] = queues[i][:size], queues[i][size:]
+                output = pipeline(
+                    video=chunk, init_cache=not initialized[i], **params
+                ).get("video")
+                initialized[i] = True
+                if output is None:
+                    continue
+                if i + 1 < len(pipelines):
+                    queues[i + 1].extend(_to_frames(output))
+                else:
+                    produced += output.shape[0]
+        _synchronize(device)
+        return produced
+
+    with torch.no_grad():
+        for _ in range(warmup):
+            run_chunk()
+
+        if device.type == "cuda":
+            torch.cuda.reset_peak_memory_stats(device)
+            allocations_before = torch.cuda.memory_stats(device).get(
+                "allocation.all.allocated", 0
+            )
+
+        latencies = []
+        total_frames = 0
+        start = time.perf_counter()
+        for _ in range(iterations):
+            chunk_start = time.perf_counter()
+            total_frames += run_chunk()
+            latencies.append(time.perf_counter() - chunk_start)
+        elapsed = time.perf_counter() - start
+
+    if device.type == "cuda":
+        peak_memory_mb = torch.cuda.max_memory_allocated(device) / (1024 * 1024)
+        allocations = (
+            torch.cuda.memory_stats(device).get("allocation.all.allocated", 0)
+            - allocations_before
+        )
+        allocations_per_chunk = allocations / max(iterations, 1)
+    else:
+        # The CPU allocator exposes no counters, fall back to process peak RSS
+        peak_memory_mb = _peak_rss_mb()
+        allocations_per_chunk = None
+
+    latencies_ms = [latency * 1000.0 for latency in latencies]
+    return {
+        "iterations": iterations,
+        "frames": total_frames,
+        "latency_ms": {
+            "p50": percentile(latencies_ms, 50),
+            "p99": percentile(latencies_ms, 99),
+            "mean": sum(latencies_ms) / len(latencies_ms) if latencies_ms else 0.0,
+        },
+        "fps": total_frames / elapsed if elapsed > 0 else 0.0,
+        "peak_memory_mb": peak_memory_mb,
+        "allocations_per_chunk": allocations_per_chunk,
+    }
+
+
+def result_key(result: dict[str, Any]) -> str:
+    """Identify a result by its pipeline chain, resolution and chunk size."""
+    chain = "+".join(result["pipelines"])
+    return f"{chain}@{result['height']}x{result['width']}/chunk={result['chunk_size']}"
+
+
+def compare_to_baseline(
+    results: list[dict[str, Any]],
+    baseline: dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """Compare benchmark results to a stored baseline report.
+
+    A metric regresses when it is worse than the baseline by more than the
+    relative tolerance: p50/p99 latency or peak memory higher, fps lower.
+    Results without a matching baseline entry are skipped.
+
+    Returns:
+        Human-readable descriptions of every regression found
+    """
+    baseline_results = {result_key(r): r for r in baseline.get("results", [])}
+    regressions = []
+
+    for result in results:
+        key = result_key(result)
+        reference = baseline_results.get(key)
+        if reference is None:
+            continue
+
+        checks = [
+            (
+                "p50 latency",
+                result["latency_ms"]["p50"],
+                reference["latency_ms"]["p50"],
+                True,
+            ),
+            (
+                "p99 latency",
+                result["latency_ms"]["p99"],
+                reference["latency_ms"]["p99"],
+                True,
+            ),
+            ("fps", result["fps"], reference["fps"], False),
+            (
+                "peak memory",
+                result.get("peak_memory_mb"),
+                reference.get("peak_memory_mb"),
+                True,
+            ),
+        ]
+        for name, value, expected, higher_is_worse in checks:
+            if value is None or expected is None or expected <= 0:
+                continue
+            if higher_is_worse:
+                regressed = value > expected * (1.0 + tolerance)
+            else:
+                regressed = value < expected * (1.0 - tolerance)
+            if regressed:
+                regressions.append(
+                    f"{key}: {name} {value:.2f} vs baseline {expected:.2f}"
+                )
+
+    return regressions
+
+
+def main():
+    """Main entry point for the scope-bench script."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark Daydream Scope pipelines and pipeline chains",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Benchmark a single effect pipeline on CPU at two resolutions
+  scope-bench -p bloom -r 720x1280 -r 1080x1920 --device cpu
+
+  # Benchmark a chain on recorded input and store the report
+  scope-bench -p video-depth-anything,longlive --input clip.mp4 -o report.json
+
+  # Compare against a stored baseline (exits with status 1 on regression)
+  scope-bench -p gray -p bloom --device cpu --baseline report.json
+        """,
+    )
+    parser.add_argument(
+        "--pipeline",
+        "-p",
+        action="append",
+        required=True,
+        help="Pipeline ID, or comma-separated IDs for a chain. Repeat to benchmark several.",
+    )
+    parser.add_argument(
+        "--resolution",
+        "-r",
+        action="append",
+        type=parse_resolution,
+        help="Input resolution as HEIGHTxWIDTH (default: 512x512). Repeatable.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        "-c",
+        action="append",
+        type=int,
+        help="Frames per chunk for the first pipeline (default: its own requirement). Repeatable.",
+    )
+    parser.add_argument(
+        "--input",
+        "-i",
+        default=None,
+        help="Video file to use as input instead of synthetic frames",
+    )
+    parser.add_argument("--iterations", "-n", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument(
+        "--device",
+        choices=["auto", "cpu", "cuda"],
+        default="auto",
+        help="Device to run on (default: CUDA if available)",
+    )
+    parser.add_argument(
+        "--param",
+        action="append",
+        type=parse_param,
+        default=[],
+        help="Runtime parameter passed to every pipeline call, as KEY=VALUE",
+    )
+    parser.add_argument(
+        "--load-param",
+        action="append",
+        type=parse_param,
+        default=[],
+        help="Load parameter passed when instantiating pipelines, as KEY=VALUE",
+    )
+    parser.add_argument(
+        "--output", "-o", default=None, help="Write the JSON report to this file"
+    )
+    parser.add_argument(
+        "--baseline", default=None, help="Baseline JSON report to compare against"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=f"Relative regression tolerance (default: {DEFAULT_TOLERANCE})",
+    )
+
+    args = parser.parse_args()
+
+    if args.device == "cpu":
+        # Hide GPUs before torch is imported so pipelines pick the CPU
+        os.environ["CUDA_VISIBLE_DEVICES"] = ""
+
+    import torch
+
+    if args.device == "cuda" and not torch.cuda.is_available():
+        print(
+            "ERROR: --device cuda requested but CUDA is not available", file=sys.stderr
+        )
+        sys.exit(1)
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+    chains = [
+        [pipeline_id.strip() for pipeline_id in value.split(",") if pipeline_id.strip()]
+        for value in args.pipeline
+    ]
+    resolutions = args.resolution or [(512, 512)]
+    chunk_sizes = args.chunk_size or [None]
+    params = dict(args.param)
+    load_params = dict(args.load_param) or None
+
+    results = []
+    try:
+        for chain in chains:
+            pipelines = [
+                load_pipeline(pipeline_id, load_params) for pipeline_id in chain
+            ]
+            for height, width in resolutions:
+                if args.input:
+                    frames = recorded_frames(args.input, height, width)
+                else:
+                    frames = synthetic_frames(
+                        max(max(chunk_sizes, key=lambda c: c or 0) or 0, 16),
+                        height,
+                        width,
+                    )
+                for chunk_size in chunk_sizes:
+                    logger.info(
+                        f"Benchmarking {'+'.join(chain)} at {height}x{width}, "
+                        f"chunk_size={chunk_size or 'auto'}"
+                    )
+                    stats = run_benchmark(
+                        pipelines,
+                        frames,
+                        iterations=args.iterations,
+                        warmup=args.warmup,
+                        chunk_size=chunk_size,
+                        params=params,
+                        device=device,
+                    )
+                    results.append(
+                        {
+                            "pipelines": chain,
+                            "height": height,
+                            "width": width,
+                            "chunk_size": chunk_size,
+                            **stats,
+                        }
+                    )
+            del pipelines
+    except KeyboardInterrupt:
+        print("\nCancelled.")
+        sys.exit(130)
+    except Exception as e:
+        print(f"\nERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    report = {
+        "device": device.type,
+        "gpu": torch.cuda.get_device_name(device) if device.type == "cuda" else None,
+        "torch_version": torch.__version__,
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+    report_json = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(report_json)
+        logger.info(f"Wrote benchmark report to {args.output}")
+    else:
+        print(report_json)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions against baseline:", file=sys.stderr)
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            sys.exit(1)
+        logger.info("No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
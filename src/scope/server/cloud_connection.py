@@ -18,11 +18,16 @@ Architecture:
 from __future__ import annotations
 
 import asyncio
+import base64
+import hashlib
 import json
 import logging
+import struct
 import time
 import uuid
+from collections import OrderedDict
 from collections.abc import Callable
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
@@ -38,6 +43,21 @@ logger = logging.getLogger(__name__)
 
 TOKEN_EXPIRATION_SECONDS = 120
 
+# Chunked uploads: binary WebSocket frames of header + data, where the header
+# is the upload ID (UUID bytes) and the byte offset of the data in the file.
+# Must match the cloud app.
+UPLOAD_CHUNK_SIZE = 256 * 1024
+UPLOAD_CHUNK_HEADER = struct.Struct("!16sQ")
+UPLOAD_MAX_ATTEMPTS = 3
+# Uploads cut off by a dropped connection that are remembered for resuming.
+# The cloud app keeps their partial data for a limited time after the drop.
+MAX_INTERRUPTED_UPLOADS = 8
+
+
+def _file_sha256(file_path: Path) -> str:
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
 
 class CloudConnectionManager:
     """Manages the WebSocket connection to cloud.ai cloud.
@@ -75,6 +95,12 @@ class CloudConnectionManager:
         self._webrtc_client: CloudWebRTCClient | None = None
         self._frame_callbacks: list[Callable[[VideoFrame], None]] = []
 
+        # Upload IDs of transfers cut off by a dropped connection, keyed by
+        # (path, size, sha256), so uploading the same file again resumes them
+        self._interrupted_uploads: OrderedDict[tuple[str, int, str], uuid.UUID] = (
+            OrderedDict()
+        )
+
         # Stats tracking
         self._stats = {
             "webrtc_offers_sent": 0,
@@ -428,6 +454,137 @@ class CloudConnectionManager:
 
         return response
 
+    async def upload_file(
+        self,
+        path: str,
+        file_path: Path,
+        content_type: str,
+        timeout: float = 60.0,
+    ) -> dict:
+        """Upload a file to a cloud API path as sequenced binary chunks.
+
+        The file is streamed from disk in UPLOAD_CHUNK_SIZE frames, so memory
+        stays flat and other API requests can interleave with the upload.
+
+        If the connection drops mid-transfer, the upload ID is remembered.
+        Uploading the same file to the same path after reconnecting reuses it,
+        and the cloud app, which keeps partial uploads for a while, reports
+        the offset to continue from.
+
+        Falls back to a single base64 API request if the cloud does not
+        support chunked uploads.
+
+        Args:
+            path: API path to POST the file to (e.g., "/api/v1/assets?filename=x")
+            file_path: Local file to upload
+            content_type: MIME type of the file
+            timeout: Timeout in seconds for each control message
+
+        Returns:
+            Response dict with "status" and "data" or "error"
+        """
+        self._stats["api_requests_sent"] += 1
+        self._stats["last_activity_at"] = time.time()
+        size = file_path.stat().st_size
+        digest = await asyncio.to_thread(_file_sha256, file_path)
+        key = (path, size, digest)
+        upload_id = self._interrupted_uploads.pop(key, None)
+        if upload_id is not None:
+            logger.info(f"[CLOUD] Resuming interrupted upload: {path}")
+        else:
+            upload_id = uuid.uuid4()
+            logger.info(f"[CLOUD] Chunked upload: {path} ({size} bytes)")
+
+        try:
+            return await self._upload_chunked(
+                upload_id, path, file_path, content_type, size, timeout
+            )
+        except Exception:
+            if not self.is_connected:
+                # Cut off by the connection, not rejected by the cloud
+                self._interrupted_uploads[key] = upload_id
+                while len(self._interrupted_uploads) > MAX_INTERRUPTED_UPLOADS:
+                    self._interrupted_uploads.popitem(last=False)
+            raise
+
+    async def _upload_chunked(
+        self,
+        upload_id: uuid.UUID,
+        path: str,
+        file_path: Path,
+        content_type: str,
+        size: int,
+        timeout: float,
+    ) -> dict:
+        response = await self.send_and_wait(
+            {
+                "type": "upload_start",
+                "upload_id": str(upload_id),
+                "path": path,
+                "content_type": content_type,
+                "size": size,
+            },
+            timeout=timeout,
+        )
+        if response.get("type") == "error":
+            logger.info("[CLOUD] Chunked upload not supported, sending as base64")
+            return await self._upload_file_base64(path, file_path, content_type)
+
+        offset = response.get("offset", 0)
+        for _ in range(UPLOAD_MAX_ATTEMPTS):
+            await self._send_upload_chunks(upload_id, file_path, offset)
+            response = await self.send_and_wait(
+                {"type": "upload_finish", "upload_id": str(upload_id)},
+                timeout=timeout,
+            )
+            if response.get("type") != "upload_ack":
+                break
+            offset = response.get("offset", 0)
+            logger.warning(f"[CLOUD] Upload incomplete, resuming from byte {offset}")
+        else:
+            raise RuntimeError(
+                f"Upload incomplete after {UPLOAD_MAX_ATTEMPTS} attempts"
+            )
+
+        if response.get("type") == "error":
+            logger.error(f"[CLOUD] Upload failed: {response.get('error')}")
+            raise RuntimeError(response.get("error", "Unknown error"))
+
+        self._stats["api_requests_successful"] += 1
+        logger.info(f"[CLOUD] Upload response: {response.get('status', 200)}")
+        return response
+
+    async def _send_upload_chunks(
+        self, upload_id: uuid.UUID, file_path: Path, offset: int
+    ) -> None:
+        """Send a file from offset onward as binary upload frames."""
+        with open(file_path, "rb") as f:
+            f.seek(offset)
+            while True:
+                chunk = await asyncio.to_thread(f.read, UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if not self.is_connected:
+                    raise RuntimeError("Not connected to cloud")
+                header = UPLOAD_CHUNK_HEADER.pack(upload_id.bytes, offset)
+                await self.ws.send_bytes(header + chunk)
+                offset += len(chunk)
+
+    async def _upload_file_base64(
+        self, path: str, file_path: Path, content_type: str
+    ) -> dict:
+        """Upload a file as one base64 API request (older cloud apps)."""
+        content = await asyncio.to_thread(file_path.read_bytes)
+        return await self.api_request(
+            method="POST",
+            path=path,
+            body={
+                "_base64_content": base64.b64encode(content).decode("utf-8"),
+                "_content_type": content_type,
+            },
+            timeout=60.0,
+        )
+
     async def webrtc_get_ice_servers(self) -> dict:
         """Get ICE servers from cloud-hosted scope backend."""
         logger.info("[CLOUD] Fetching ICE servers from cloud")
@@ -19,13 +19,13 @@ import time
 from collections.abc import Callable
 from datetime import datetime
 from functools import wraps
+from pathlib import Path
 from typing import Any
 
 from fastapi import HTTPException, Request
 from fastapi.responses import Response
 
 from .cloud_connection import CloudConnectionManager
-from .models_config import get_assets_dir
 from .schema import AssetFileInfo, HardwareInfoResponse
 
 logger = logging.getLogger(__name__)
@@ -137,42 +137,35 @@ async def get_hardware_info_from_cloud(
 
 async def upload_asset_to_cloud(
     cloud_manager: CloudConnectionManager,
-    content: bytes,
+    file_path: Path,
     filename: str,
     content_type: str,
     asset_type: str,
 ) -> AssetFileInfo:
-    """Upload asset to cloud (POST with base64 body) and save a local copy for thumbnails.
+    """Upload a locally saved asset to cloud as chunked binary frames.
 
+    The local copy stays in the assets directory for thumbnails.
     Call when cloud_manager.is_connected; raises HTTPException on cloud errors.
     """
-    logger.info(
-        f"upload_asset: Uploading {asset_type} to cloud and locally: {filename}"
-    )
-
-    # Save locally for thumbnail serving
-    assets_dir = get_assets_dir()
-    assets_dir.mkdir(parents=True, exist_ok=True)
-    local_file_path = assets_dir / filename
-    local_file_path.write_bytes(content)
-    logger.info(f"upload_asset: Saved local copy for thumbnails: {local_file_path}")
+    logger.info(f"upload_asset: Uploading {asset_type} to cloud: {filename}")
 
-    base64_content = base64.b64encode(content).decode("utf-8")
-    response = await cloud_manager.api_request(
-        method="POST",
+    response = await cloud_manager.upload_file(
         path=f"/api/v1/assets?filename={filename}",
-        body={
-            "_base64_content": base64_content,
-            "_content_type": content_type,
-        },
-        timeout=60.0,
+        file_path=file_path,
+        content_type=content_type,
     )
+    status = response.get("status", 200)
+    if status >= 400:
+        raise HTTPException(
+            status_code=status,
+            detail=response.get("error") or response.get("data") or "Upload failed",
+        )
 
     data = response.get("data", {})
     cloud_path = data.get("path", "")
     logger.info(f"upload_asset: Uploaded to cloud: {cloud_path}")
 
-    size_mb = round(len(content) / (1024 * 1024), 2)
+    size_mb = round(file_path.stat().st_size / (1024 * 1024), 2)
     return AssetFileInfo(
         name=data.get("name", filename),
         path=cloud_path,
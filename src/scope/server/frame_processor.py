@@ -468,7 +468,7 @@ class FrameProcessor:
                     try:
                         entry["queue"].put_nowait(frame_np)
                     except queue.Full:
-                        pass
+                        entry["dropped"] += 1
             except Exception as e:
                 logger.error(f"Error enqueueing output sink frame: {e}")
 
@@ -573,7 +573,8 @@ class FrameProcessor:
             "fps_out": self._frames_out / elapsed if elapsed > 0 else 0,
             "pipeline_fps": self.get_fps(),
             "output_sinks": {
-                k: {"name": v["name"]} for k, v in self.output_sinks.items()
+                k: {"name": v["name"], "dropped": v["dropped"], **v["sink"].get_stats()}
+                for k, v in self.output_sinks.items()
             },
             "input_source_enabled": self.input_source_enabled,
             "input_source_type": self.input_source_type,
@@ -681,6 +682,7 @@ class FrameProcessor:
                         "queue": q,
                         "thread": t,
                         "name": sink_name,
+                        "dropped": 0,
                     }
                     t.start()
                     logger.info(f"Output sink enabled: {sink_type} '{sink_name}'")
@@ -754,6 +756,8 @@ class FrameProcessor:
                 except queue.Empty:
                     continue
 
+                # Receivers are told the rate frames are actually produced at
+                entry["sink"].set_frame_rate(self.get_fps())
                 success = entry["sink"].send_frame(frame_np)
                 frame_count += 1
                 if frame_count % 100 == 0:
@@ -820,6 +824,12 @@ class FrameProcessor:
 
         try:
             self.input_source = source_class()
+            # Sources that can convert on the GPU may then deliver their
+            # native pixel format instead of converting on the CPU
+            if self._receive_input_on_device() and hasattr(
+                self.input_source, "device_conversion"
+            ):
+                self.input_source.device_conversion = True
             if self.input_source.connect(source_name):
                 self.input_source_enabled = True
                 self.input_source_type = source_type
@@ -844,10 +854,21 @@ class FrameProcessor:
                     pass
             self.input_source = None
 
+    def _receive_input_on_device(self) -> bool:
+        """Whether input source frames go straight to local GPU pipelines."""
+        return not self._cloud_mode and torch.cuda.is_available()
+
     def _input_source_receiver_loop(self):
         """Background thread that receives frames from a generic input source."""
         logger.info(f"Input source thread started ({self.input_source_type})")
 
+        # Sources that can upload frames themselves skip the numpy round trip
+        receive_to_device = (
+            getattr(self.input_source, "receive_frame_to_device", None)
+            if self._receive_input_on_device()
+            else None
+        )
+
         target_fps = self.get_fps()
         frame_interval = 1.0 / target_fps
         last_frame_time = 0.0
@@ -868,7 +889,10 @@ class FrameProcessor:
                     time.sleep(frame_interval - time_since_last)
                     continue
 
-                rgb_frame = self.input_source.receive_frame(timeout_ms=100)
+                if receive_to_device is not None:
+                    rgb_frame = receive_to_device("cuda", timeout_ms=100)
+                else:
+                    rgb_frame = self.input_source.receive_frame(timeout_ms=100)
                 if rgb_frame is not None:
                     last_frame_time = time.time()
 
@@ -879,7 +903,9 @@ class FrameProcessor:
                     elif self.pipeline_processors:
                         first_processor = self.pipeline_processors[0]
 
-                        if torch.cuda.is_available():
+                        if receive_to_device is not None:
+                            frame_tensor = rgb_frame
+                        elif torch.cuda.is_available():
                             shape = rgb_frame.shape
                             pinned_buffer = self._get_or_create_pinned_buffer(shape)
                             pinned_buffer.copy_(
@@ -14,7 +14,11 @@ import asyncio
 import json
 import logging
 import os
+import random
 import threading
+import time
+import uuid
+from collections import deque
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -31,170 +35,223 @@ def is_kafka_enabled() -> bool:
     return KAFKA_BOOTSTRAP_SERVERS is not None
 
 
+# Events buffered for the background sender before events are dropped
+KAFKA_MAX_PENDING_EVENTS = 1000
+# Maximum events per produce call
+KAFKA_BATCH_SIZE = 100
+# How long the sender waits for a batch to fill before sending it anyway
+KAFKA_LINGER_SECONDS = 0.05
+# How long stop() waits for buffered events to be sent
+KAFKA_FLUSH_TIMEOUT_SECONDS = 5.0
+
+# Periodic events that are dropped first when the buffer is full
+LOW_PRIORITY_EVENT_TYPES = frozenset({"stream_heartbeat"})
+
+
+def build_event(
+    event_type: str,
+    session_id: str | None = None,
+    connection_id: str | None = None,
+    pipeline_ids: list[str] | None = None,
+    user_id: str | None = None,
+    error: dict[str, Any] | None = None,
+    metadata: dict[str, Any] | None = None,
+    connection_info: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Build an event in the stream_trace format used by the Go services."""
+    # Generate a unique ID for this event (used as Kafka key)
+    event_id = str(uuid.uuid4())
+    # Timestamp as milliseconds string (matching Go format)
+    timestamp_ms = str(int(time.time() * 1000))
+
+    # Build data payload
+    data: dict[str, Any] = {
+        "type": event_type,
+        "client_source": "scope",
+        "timestamp": timestamp_ms,
+    }
+    if session_id:
+        data["session_id"] = session_id
+    if connection_id:
+        data["connection_id"] = connection_id
+    if pipeline_ids:
+        data["pipeline_ids"] = pipeline_ids
+    if user_id:
+        data["user_id"] = user_id
+    if error:
+        data["error"] = error
+    if connection_info:
+        data["connection_info"] = connection_info
+    if metadata:
+        data.update(metadata)
+
+    # Event structure matching Go kafka.go format
+    return {
+        "id": event_id,
+        "type": "stream_trace",
+        "timestamp": timestamp_ms,
+        "data": data,
+    }
+
+
 class KafkaPublisher:
-    """Async Kafka event publisher with thread-safe wrapper for sync contexts.
+    """Batched Kafka event publisher with a thread-safe, bounded buffer.
 
     This class provides:
-    - Async event publishing using aiokafka
-    - Thread-safe wrapper to allow calling from sync contexts (e.g., FrameProcessor threads)
-    - Automatic JSON serialization of events
+    - A bounded buffer that any thread can append to without blocking
+      (e.g., FrameProcessor threads)
+    - A single background task on the event loop that sends buffered events
+      in batches, once KAFKA_BATCH_SIZE events are waiting or
+      KAFKA_LINGER_SECONDS have passed
+    - Backpressure: when the buffer is full, low-priority events are dropped
+      first, and the depth and drop counts are exposed via stats
     - Graceful handling when Kafka is unavailable
+
+    A producer can be passed in for testing; otherwise an AIOKafkaProducer is
+    created from the environment on start().
     """
 
-    def __init__(self):
-        self._producer = None
+    def __init__(
+        self,
+        producer=None,
+        topic: str = KAFKA_TOPIC,
+        max_pending: int = KAFKA_MAX_PENDING_EVENTS,
+        batch_size: int = KAFKA_BATCH_SIZE,
+        linger: float = KAFKA_LINGER_SECONDS,
+    ):
+        self._producer = producer
+        self.topic = topic
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.linger = linger
+
         self._started = False
         self._event_loop: asyncio.AbstractEventLoop | None = None
         self._lock = threading.Lock()
+        # (low_priority, event) in publish order
+        self._pending: deque[tuple[bool, dict[str, Any]]] = deque()
+        self._wakeup: asyncio.Event | None = None
+        self._sender_task: asyncio.Task | None = None
+        self._stopping = False
+
+        self.sent_events = 0
+        self.failed_events = 0
+        self.dropped_events = 0
+        self.dropped_low_priority_events = 0
 
     async def start(self) -> bool:
-        """Start the Kafka producer.
+        """Start the Kafka producer and the background sender.
 
         Returns:
             True if started successfully, False if Kafka is not configured or failed.
         """
-        if not is_kafka_enabled():
-            logger.info("Kafka not configured, event publishing disabled")
-            return False
+        if self._producer is None:
+            self._producer = self._create_producer()
+            if self._producer is None:
+                return False
 
         try:
-            from aiokafka import AIOKafkaProducer
+            await self._producer.start()
+        except Exception as e:
+            logger.error(f"Failed to start Kafka producer: {e}")
+            self._producer = None
+            return False
 
-            # Build producer configuration
-            config = {
-                "bootstrap_servers": KAFKA_BOOTSTRAP_SERVERS,
-                "value_serializer": lambda v: json.dumps(v).encode("utf-8"),
-                "key_serializer": lambda k: k.encode("utf-8") if k else None,
-            }
-
-            # Add SASL authentication if configured
-            if KAFKA_SASL_USERNAME and KAFKA_SASL_PASSWORD:
-                import ssl
-
-                # Create SSL context for SASL_SSL (required for Confluent Cloud)
-                ssl_context = ssl.create_default_context()
-
-                config.update(
-                    {
-                        "security_protocol": "SASL_SSL",
-                        "sasl_mechanism": "PLAIN",
-                        "sasl_plain_username": KAFKA_SASL_USERNAME,
-                        "sasl_plain_password": KAFKA_SASL_PASSWORD,
-                        "ssl_context": ssl_context,
-                    }
-                )
+        self._event_loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._sender_task = asyncio.create_task(self._send_loop())
+        self._started = True
 
-            self._producer = AIOKafkaProducer(**config)
-            await self._producer.start()
-            self._started = True
-            self._event_loop = asyncio.get_running_loop()
+        logger.info(
+            f"Kafka publisher started, publishing to topic '{self.topic}' "
+            f"on {KAFKA_BOOTSTRAP_SERVERS}"
+        )
+        return True
 
-            logger.info(
-                f"Kafka publisher started, publishing to topic '{KAFKA_TOPIC}' "
-                f"on {KAFKA_BOOTSTRAP_SERVERS}"
-            )
-            return True
+    def _create_producer(self):
+        if not is_kafka_enabled():
+            logger.info("Kafka not configured, event publishing disabled")
+            return None
 
+        try:
+            from aiokafka import AIOKafkaProducer
         except ImportError:
             logger.warning(
                 "aiokafka not installed, Kafka event publishing disabled. "
                 "Install with: pip install aiokafka"
             )
-            return False
+            return None
+
+        # Build producer configuration. Events are serialized by the sender,
+        # since send_batch takes raw bytes.
+        config: dict[str, Any] = {"bootstrap_servers": KAFKA_BOOTSTRAP_SERVERS}
+
+        # Add SASL authentication if configured
+        if KAFKA_SASL_USERNAME and KAFKA_SASL_PASSWORD:
+            import ssl
+
+            # Create SSL context for SASL_SSL (required for Confluent Cloud)
+            ssl_context = ssl.create_default_context()
+
+            config.update(
+                {
+                    "security_protocol": "SASL_SSL",
+                    "sasl_mechanism": "PLAIN",
+                    "sasl_plain_username": KAFKA_SASL_USERNAME,
+                    "sasl_plain_password": KAFKA_SASL_PASSWORD,
+                    "ssl_context": ssl_context,
+                }
+            )
+
+        try:
+            return AIOKafkaProducer(**config)
         except Exception as e:
-            logger.error(f"Failed to start Kafka producer: {e}")
-            return False
+            logger.error(f"Failed to create Kafka producer: {e}")
+            return None
 
     async def stop(self):
-        """Stop the Kafka producer and flush pending messages."""
-        if self._producer and self._started:
+        """Send buffered events, then stop the Kafka producer."""
+        if not self._started:
+            return
+
+        self._started = False
+        self._stopping = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+        if self._sender_task is not None:
             try:
-                await self._producer.stop()
-                logger.info("Kafka publisher stopped")
+                await asyncio.wait_for(
+                    self._sender_task, timeout=KAFKA_FLUSH_TIMEOUT_SECONDS
+                )
+            except TimeoutError:
+                logger.warning(
+                    f"Timed out flushing Kafka events, "
+                    f"{self.queue_depth} event(s) not sent"
+                )
             except Exception as e:
-                logger.error(f"Error stopping Kafka producer: {e}")
-            finally:
-                self._started = False
-                self._producer = None
-                self._event_loop = None
+                logger.error(f"Kafka sender failed: {e}")
 
-    async def publish_async(
-        self,
-        event_type: str,
-        session_id: str | None = None,
-        connection_id: str | None = None,
-        pipeline_ids: list[str] | None = None,
-        user_id: str | None = None,
-        error: dict[str, Any] | None = None,
-        metadata: dict[str, Any] | None = None,
-        connection_info: dict[str, Any] | None = None,
-    ) -> bool:
-        """Publish an event to Kafka asynchronously.
+        try:
+            await self._producer.stop()
+            logger.info(f"Kafka publisher stopped: {self.stats}")
+        except Exception as e:
+            logger.error(f"Error stopping Kafka producer: {e}")
+        finally:
+            self._producer = None
+            self._event_loop = None
+            self._sender_task = None
+            self._wakeup = None
 
-        Args:
-            event_type: Type of event (e.g., "stream_started", "stream_stopped")
-            session_id: Optional session ID associated with the event
-            connection_id: Optional connection ID from fal.ai WebSocket for event correlation
-            pipeline_ids: Optional list of pipeline IDs associated with the event
-            user_id: Optional user ID associated with the event
-            error: Optional error details for error events
-            metadata: Optional additional metadata
-            connection_info: Optional connection metadata (e.g., gpu_type, region)
+    async def publish_async(self, event_type: str, **kwargs) -> bool:
+        """Buffer an event from the event loop.
+
+        Accepts the same arguments as publish().
 
         Returns:
-            True if published successfully, False otherwise.
+            True if the event was buffered, False if it was dropped.
         """
-        if not self._started or not self._producer:
-            return False
-
-        import time
-        import uuid
-
-        # Generate a unique ID for this event (used as Kafka key)
-        event_id = str(uuid.uuid4())
-        # Timestamp as milliseconds string (matching Go format)
-        timestamp_ms = str(int(time.time() * 1000))
-
-        # Build data payload
-        data: dict[str, Any] = {
-            "type": event_type,
-            "client_source": "scope",
-            "timestamp": timestamp_ms,
-        }
-        if session_id:
-            data["session_id"] = session_id
-        if connection_id:
-            data["connection_id"] = connection_id
-        if pipeline_ids:
-            data["pipeline_ids"] = pipeline_ids
-        if user_id:
-            data["user_id"] = user_id
-        if error:
-            data["error"] = error
-        if connection_info:
-            data["connection_info"] = connection_info
-        if metadata:
-            data.update(metadata)
-
-        # Event structure matching Go kafka.go format
-        event = {
-            "id": event_id,
-            "type": "stream_trace",
-            "timestamp": timestamp_ms,
-            "data": data,
-        }
-
-        try:
-            # Use event ID as key (matching Go format)
-            key = event_id
-            await self._producer.send_and_wait(KAFKA_TOPIC, value=event, key=key)
-            logger.info(
-                f"Published Kafka event: {event_type} (id={event_id}, session={session_id})"
-            )
-            return True
-        except Exception as e:
-            logger.error(f"Failed to publish Kafka event {event_type}: {e}")
-            return False
+        return self._enqueue(build_event(event_type, **kwargs))
 
     def publish(
         self,
@@ -207,10 +264,10 @@ class KafkaPublisher:
         metadata: dict[str, Any] | None = None,
         connection_info: dict[str, Any] | None = None,
     ) -> None:
-        """Publish an event to Kafka from a sync context (thread-safe).
+        """Buffer an event for publishing from any thread (thread-safe).
 
-        This method is safe to call from worker threads (e.g., FrameProcessor).
-        It schedules the async publish in the main event loop.
+        Never blocks: if the buffer is full the event, or an older
+        low-priority one, is dropped.
 
         Args:
             event_type: Type of event (e.g., "stream_started", "stream_stopped")
@@ -222,31 +279,158 @@ class KafkaPublisher:
             metadata: Optional additional metadata
             connection_info: Optional connection metadata (e.g., gpu_type, region)
         """
-        if not self._started or not self._event_loop:
+        if not self._started:
             return
 
+        self._enqueue(
+            build_event(
+                event_type,
+                session_id=session_id,
+                connection_id=connection_id,
+                pipeline_ids=pipeline_ids,
+                user_id=user_id,
+                error=error,
+                metadata=metadata,
+                connection_info=connection_info,
+            )
+        )
+
+    def _enqueue(self, event: dict[str, Any]) -> bool:
+        if not self._started:
+            return False
+
+        low_priority = event["data"]["type"] in LOW_PRIORITY_EVENT_TYPES
         with self._lock:
-            if not self._event_loop or not self._event_loop.is_running():
-                return
+            if len(self._pending) >= self.max_pending and not self._make_room(
+                low_priority
+            ):
+                self._count_drop(low_priority)
+                return False
+            self._pending.append((low_priority, event))
+            depth = len(self._pending)
+
+        # Only wake the sender when it may be idle or a batch is ready, so
+        # bursts do not schedule a callback per event
+        if depth == 1 or depth == self.batch_size:
+            self._wake_sender()
+        return True
+
+    def _make_room(self, low_priority: bool) -> bool:
+        """Drop the oldest low-priority event to fit a new one. Lock held."""
+        for index, (pending_low_priority, _) in enumerate(self._pending):
+            if pending_low_priority:
+                del self._pending[index]
+                self._count_drop(True)
+                return True
+        # Buffer is full of important events; the new one is the one to drop
+        return False
+
+    def _count_drop(self, low_priority: bool):
+        self.dropped_events += 1
+        if low_priority:
+            self.dropped_low_priority_events += 1
+        if self.dropped_events == 1 or self.dropped_events % 100 == 0:
+            logger.warning(
+                f"Kafka event buffer full, {self.dropped_events} event(s) dropped"
+            )
 
-            # Schedule the async publish in the main event loop
-            try:
-                asyncio.run_coroutine_threadsafe(
-                    self.publish_async(
-                        event_type=event_type,
-                        session_id=session_id,
-                        connection_id=connection_id,
-                        pipeline_ids=pipeline_ids,
-                        user_id=user_id,
-                        error=error,
-                        metadata=metadata,
-                        connection_info=connection_info,
-                    ),
-                    self._event_loop,
+    def _wake_sender(self):
+        loop, wakeup = self._event_loop, self._wakeup
+        if loop is None or wakeup is None:
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            # Event loop already closed
+            pass
+
+    def _take_batch(self) -> list[dict[str, Any]]:
+        with self._lock:
+            count = min(self.batch_size, len(self._pending))
+            return [self._pending.popleft()[1] for _ in range(count)]
+
+    async def _send_loop(self):
+        while True:
+            if not self._pending:
+                if self._stopping:
+                    return
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            # Linger so events published close together share a produce call
+            if len(self._pending) < self.batch_size and not self._stopping:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.linger)
+                except TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+            batch = self._take_batch()
+            if batch:
+                await self._send_batch(batch)
+
+    async def _send_batch(self, events: list[dict[str, Any]]):
+        try:
+            partitions = sorted(await self._producer.partitions_for(self.topic))
+            partition = random.choice(partitions)
+
+            batch = self._producer.create_batch()
+            for index, event in enumerate(events):
+                # Use event ID as key (matching Go format)
+                metadata = batch.append(
+                    key=event["id"].encode("utf-8"),
+                    value=json.dumps(event).encode("utf-8"),
+                    timestamp=None,
                 )
-                logger.debug(f"Scheduled Kafka event: {event_type}")
-            except Exception as e:
-                logger.error(f"Failed to schedule Kafka event publish: {e}")
+                if metadata is None:
+                    # Batch reached its byte limit; send the rest separately
+                    self._requeue(events[index + 1 if index == 0 else index :])
+                    if index == 0:
+                        self.failed_events += 1
+                        logger.error(
+                            f"Kafka event {event['data']['type']} is larger than "
+                            f"a produce batch, dropping it"
+                        )
+                        return
+                    events = events[:index]
+                    break
+
+            delivery = await self._producer.send_batch(
+                batch, self.topic, partition=partition
+            )
+            await delivery
+            self.sent_events += len(events)
+            logger.debug(
+                f"Published {len(events)} Kafka event(s) to partition {partition}"
+            )
+        except Exception as e:
+            self.failed_events += len(events)
+            logger.error(f"Failed to publish {len(events)} Kafka event(s): {e}")
+
+    def _requeue(self, events: list[dict[str, Any]]):
+        """Put unsent events back at the front of the buffer."""
+        with self._lock:
+            self._pending.extendleft(
+                (event["data"]["type"] in LOW_PRIORITY_EVENT_TYPES, event)
+                for event in reversed(events)
+            )
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting to be sent."""
+        return len(self._pending)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Buffer depth and sent, failed and dropped event counts."""
+        return {
+            "queue_depth": self.queue_depth,
+            "sent_events": self.sent_events,
+            "failed_events": self.failed_events,
+            "dropped_events": self.dropped_events,
+            "dropped_low_priority_events": self.dropped_low_priority_events,
+        }
 
     @property
     def is_running(self) -> bool:
@@ -0,0 +1,172 @@
+"""
+Incremental log file reading for the logs API.
+
+Supports byte-range reads of the current log (tail, since-offset and HTTP
+Range requests) and live tailing that follows the RotatingFileHandler when
+it rolls the file over.
+"""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+LOG_CHUNK_SIZE = 64 * 1024
+# Seconds between checks for new log lines while live-tailing
+LOG_STREAM_POLL_INTERVAL = 0.5
+# Upper bound on bytes returned by a single LogFollower.read
+LOG_FOLLOW_MAX_READ = 1024 * 1024
+# How far past a tail start to look for the next line break
+LINE_ALIGN_WINDOW = 4096
+
+
+def iter_file_range(
+    path: Path, start: int, end: int, chunk_size: int = LOG_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Yield bytes [start, end) of a file in chunks.
+
+    The end is fixed by the caller, so a file that keeps growing while it is
+    being sent never produces more bytes than the declared Content-Length.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def read_file_range(path: Path, start: int, end: int) -> bytes:
+    """Read bytes [start, end) of a file."""
+    return b"".join(iter_file_range(path, start, end))
+
+
+def parse_range_header(header: str, size: int) -> tuple[int, int]:
+    """Parse a single-range "bytes=" Range header into [start, end).
+
+    Supports "bytes=a-b", "bytes=a-" and suffix "bytes=-n" forms.
+
+    Raises:
+        ValueError: If the header is malformed, has multiple ranges or is
+            not satisfiable for a file of this size
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        raise ValueError(f"Unsupported range: {header}")
+
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        raise ValueError(f"Malformed range: {header}")
+
+    if not first:
+        # Suffix range: the last n bytes
+        length = int(last)
+        if length <= 0 or size == 0:
+            raise ValueError(f"Unsatisfiable range: {header}")
+        return max(0, size - length), size
+
+    start = int(first)
+    end = int(last) + 1 if last else size
+    if start >= size or end <= start:
+        raise ValueError(f"Unsatisfiable range: {header}")
+    return start, min(end, size)
+
+
+def resolve_log_start(
+    size: int, tail_bytes: int | None = None, since_offset: int | None = None
+) -> int:
+    """Pick where to start reading a log of the given size.
+
+    since_offset continues an earlier read; if the file has shrunk below it
+    (it was rotated), reading starts over from 0. tail_bytes returns only the
+    end of the file. With neither, the whole file is read.
+    """
+    if since_offset is not None:
+        return since_offset if since_offset <= size else 0
+    if tail_bytes is not None:
+        return max(0, size - tail_bytes)
+    return 0
+
+
+def align_to_line(path: Path, start: int, end: int) -> int:
+    """Move start forward past the next line break so output begins on a line.
+
+    Leaves start unchanged at offset 0, or if no line break is found nearby.
+    """
+    if start == 0:
+        return 0
+    window = read_file_range(path, start - 1, min(end, start + LINE_ALIGN_WINDOW))
+    newline = window.find(b"\n")
+    if newline == -1:
+        return start
+    return start - 1 + newline + 1
+
+
+class LogFollower:
+    """Follows a log file across RotatingFileHandler rollovers.
+
+    The file is opened only for each read, so the handler is free to rename
+    it (which fails on Windows while another handle is open). A rollover is
+    detected by the path pointing at a different file, or the file being
+    shorter than the current offset. When that happens, the rest of the
+    previous file is read from its rotated name (".1") before continuing at
+    the start of the new file.
+    """
+
+    def __init__(self, path: Path, offset: int = 0):
+        self.path = Path(path)
+        self.offset = offset
+        self.rotations = 0
+        self._inode: int | None = None
+        self._partial = b""
+
+    @property
+    def line_offset(self) -> int:
+        """Offset just past the last complete line returned by read_lines."""
+        return self.offset - len(self._partial)
+
+    def read(self) -> bytes:
+        """Return bytes appended since the last read, following rotations."""
+        try:
+            stat_result = os.stat(self.path)
+        except FileNotFoundError:
+            return b""
+
+        data = b""
+        if self._inode is None:
+            self._inode = stat_result.st_ino
+            if self.offset > stat_result.st_size:
+                self.offset = 0
+        elif stat_result.st_ino != self._inode or stat_result.st_size < self.offset:
+            data = self._read_rotated_remainder(stat_result)
+            self.rotations += 1
+            self._inode = stat_result.st_ino
+            self.offset = 0
+
+        end = min(stat_result.st_size, self.offset + LOG_FOLLOW_MAX_READ)
+        if end > self.offset:
+            new_data = read_file_range(self.path, self.offset, end)
+            self.offset += len(new_data)
+            data += new_data
+        return data
+
+    def read_lines(self) -> list[str]:
+        """Return complete lines appended since the last call."""
+        data = self._partial + self.read()
+        *lines, self._partial = data.split(b"\n")
+        return [line.decode("utf-8", errors="replace").rstrip("\r") for line in lines]
+
+    def _read_rotated_remainder(self, current: os.stat_result) -> bytes:
+        if current.st_ino == self._inode:
+            # Truncated in place, nothing left to recover
+            return b""
+        rotated = self.path.with_name(self.path.name + ".1")
+        try:
+            rotated_stat = os.stat(rotated)
+            if rotated_stat.st_ino != self._inode:
+                return b""
+            return read_file_range(rotated, self.offset, rotated_stat.st_size)
+        except OSError:
+            return b""
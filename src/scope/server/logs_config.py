@@ -4,11 +4,18 @@ Logs configuration module for daydream-scope.
 Provides centralized configuration for log storage location with support for:
 - Default location: ~/.daydream-scope/logs
 - Environment variable override: DAYDREAM_SCOPE_LOGS_DIR
+
+Also provides queued logging, so hot threads never block on log output.
 """
 
+import atexit
 import logging
 import os
+import queue
+import threading
+import time
 from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -122,3 +129,135 @@ def cleanup_old_logs(max_age_days: int = 1) -> None:
         logger.info(
             f"Cleaned up {deleted_count} old log file(s) older than {max_age_days} day(s)"
         )
+
+
+# Records buffered for the logging thread before new records are dropped
+LOG_QUEUE_SIZE = 10000
+# Identical messages from the same logger are logged at most once per interval
+LOG_RATE_LIMIT_INTERVAL = 5.0
+
+
+class RateLimitFilter(logging.Filter):
+    """Collapse repeats of the same message from the same logger.
+
+    The first record for a (logger, message) pair passes; repeats within
+    LOG_RATE_LIMIT_INTERVAL are suppressed, and the next one to pass reports
+    how many were skipped. ERROR and above are never suppressed.
+    """
+
+    def __init__(self, interval: float = LOG_RATE_LIMIT_INTERVAL):
+        super().__init__()
+        self.interval = interval
+        # (logger name, msg) -> (time last passed, suppressed count)
+        self._seen: dict[tuple[str, str], tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.ERROR:
+            return True
+
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            last_passed, suppressed = self._seen.get(key, (None, 0))
+            if last_passed is not None and now - last_passed < self.interval:
+                self._seen[key] = (last_passed, suppressed + 1)
+                return False
+            self._seen[key] = (now, 0)
+            if len(self._seen) > LOG_QUEUE_SIZE:
+                self._prune(now)
+
+        if suppressed:
+            record.msg = (
+                f"{record.getMessage()} (suppressed {suppressed} similar message(s))"
+            )
+            record.args = None
+        return True
+
+    def _prune(self, now: float):
+        for key, (last_passed, suppressed) in list(self._seen.items()):
+            if not suppressed and now - last_passed >= self.interval:
+                del self._seen[key]
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks the logging thread.
+
+    When the queue is full the record is dropped and counted. The count is
+    reported as a warning once the queue has room again.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._unreported = 0
+        self._lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord):
+        with self._lock:
+            try:
+                if self._unreported:
+                    self.queue.put_nowait(self._dropped_record())
+                    self._unreported = 0
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+                self._unreported += 1
+
+    def _dropped_record(self) -> logging.LogRecord:
+        return logging.LogRecord(
+            name=__name__,
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg=f"Logging queue full, dropped {self._unreported} log record(s)",
+            args=None,
+            exc_info=None,
+        )
+
+
+_queue_listener: QueueListener | None = None
+
+
+def start_queued_logging(
+    target: logging.Logger | None = None, queue_size: int = LOG_QUEUE_SIZE
+) -> DroppingQueueHandler:
+    """
+    Move a logger's handlers behind a bounded queue and a background thread.
+
+    The target logger (root by default) gets a single DroppingQueueHandler, and its
+    existing handlers (console, rotating file) are driven by a QueueListener,
+    so threads that log never wait on disk or terminal I/O.
+
+    Returns:
+        DroppingQueueHandler: The handler now attached to the logger
+    """
+    global _queue_listener
+
+    target = target or logging.getLogger()
+    handlers = list(target.handlers)
+    for handler in handlers:
+        target.removeHandler(handler)
+
+    queue_handler = DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+    queue_handler.addFilter(RateLimitFilter())
+    target.addHandler(queue_handler)
+
+    _queue_listener = QueueListener(
+        queue_handler.queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+    atexit.register(stop_queued_logging)
+    return queue_handler
+
+
+def stop_queued_logging() -> None:
+    """Flush queued records and stop the logging thread."""
+    global _queue_listener
+
+    if _queue_listener is None:
+        return
+    listener, _queue_listener = _queue_listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
@@ -25,6 +25,9 @@ MODELS_DIR_ENV_VAR = "DAYDREAM_SCOPE_MODELS_DIR"
 # Environment variable for overriding assets directory
 ASSETS_DIR_ENV_VAR = "DAYDREAM_SCOPE_ASSETS_DIR"
 
+# Environment variable for overriding the asset thumbnail cache directory
+THUMBNAILS_DIR_ENV_VAR = "DAYDREAM_SCOPE_THUMBNAILS_DIR"
+
 
 def get_models_dir() -> Path:
     """
@@ -104,6 +107,28 @@ def get_assets_dir() -> Path:
     return assets_dir
 
 
+def get_thumbnails_dir() -> Path:
+    """
+    Get the asset thumbnail cache directory path.
+
+    Priority order:
+    1. DAYDREAM_SCOPE_THUMBNAILS_DIR environment variable
+    2. "thumbnails" inside a cache directory next to the assets directory
+       (e.g., ~/.daydream-scope/cache/thumbnails)
+
+    The cache is kept outside the assets directory so thumbnails are never
+    listed as assets themselves.
+
+    Returns:
+        Path: Absolute path to the thumbnail cache directory
+    """
+    env_dir = os.environ.get(THUMBNAILS_DIR_ENV_VAR)
+    if env_dir:
+        return Path(env_dir).expanduser().resolve()
+
+    return get_assets_dir().parent / "cache" / "thumbnails"
+
+
 def get_required_model_files(pipeline_id: str | None = None) -> list[Path]:
     """
     Get the list of required model files that should exist for a given pipeline.
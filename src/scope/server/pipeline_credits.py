@@ -0,0 +1,91 @@
+"""Credit-based flow control between chained pipeline processors."""
+
+import math
+import threading
+from collections.abc import Callable
+
+# Chunks a processor lets its upstream queue ahead of it. Two keeps the next
+# chunk ready while the current one runs without letting latency build up.
+DEFAULT_CREDIT_CHUNKS = 2
+
+
+class InputCredits:
+    """Credits a processor grants to the processor feeding its input queue.
+
+    One credit is room for one more chunk in the input queue, so the credits
+    available are the free input capacity in chunk units. The upstream
+    processor waits for a credit before running a chunk, and the downstream
+    processor wakes it whenever it takes a chunk from the queue.
+
+    Credits are computed from the queue's current size rather than counted,
+    so they cannot drift when frames are dropped, flushed or the queue is
+    replaced.
+    """
+
+    def __init__(
+        self,
+        queued_frames: Callable[[], int],
+        capacity_chunks: int = DEFAULT_CREDIT_CHUNKS,
+        chunk_size: int = 1,
+    ):
+        """Initialize the credits.
+
+        Args:
+            queued_frames: Returns the number of frames waiting in the input queue
+            capacity_chunks: Number of chunks the input queue may hold
+            chunk_size: Frames the downstream processor takes per chunk
+        """
+        self._queued_frames = queued_frames
+        self.capacity_chunks = capacity_chunks
+        self._chunk_size = max(1, chunk_size)
+        self._condition = threading.Condition()
+        self._closed = False
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @property
+    def capacity_frames(self) -> int:
+        """Frames the input queue may hold before credits run out."""
+        return self.capacity_chunks * self._chunk_size
+
+    def set_chunk_size(self, chunk_size: int):
+        """Update the chunk size as the downstream pipeline's requirements change."""
+        chunk_size = max(1, chunk_size)
+        if chunk_size == self._chunk_size:
+            return
+        with self._condition:
+            self._chunk_size = chunk_size
+            self._condition.notify_all()
+
+    def available(self) -> int:
+        """Number of chunks the input queue has room for."""
+        used = math.ceil(self._queued_frames() / self._chunk_size)
+        return max(0, self.capacity_chunks - used)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until a credit is available.
+
+        Returns True when the caller may run its next chunk, False if the
+        timeout expired first. Closed credits never block.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._closed or self.available() > 0, timeout
+            )
+
+    def consumed(self):
+        """Wake the upstream processor after a chunk left the input queue."""
+        with self._condition:
+            self._condition.notify_all()
+
+    def close(self):
+        """Stop granting credits and release any waiting upstream processor."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def reopen(self):
+        with self._condition:
+            self._closed = False
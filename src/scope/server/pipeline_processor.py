@@ -13,8 +13,9 @@ from scope.core.pipelines.controller import parse_ctrl_input
 from scope.core.pipelines.wan2_1.vace import VACEEnabledPipeline
 
 from .kafka_publisher import publish_event
+from .pipeline_credits import InputCredits
 from .pipeline_manager import PipelineNotAvailableException
-from .pipeline_throttler import PipelineThrottler
+from .session_multiplexer import open_pipeline_session
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,7 @@ class PipelineProcessor:
         user_id: str | None = None,
         connection_id: str | None = None,
         connection_info: dict | None = None,
+        realtime: bool = True,
     ):
         """Initialize a pipeline processor.
 
@@ -53,13 +55,20 @@ class PipelineProcessor:
             user_id: User ID for event tracking
             connection_id: Connection ID from fal.ai WebSocket for event correlation
             connection_info: Connection metadata (gpu_type, region, etc.)
+            realtime: When False (offline rendering), chunks take queued frames
+                in order instead of sampling across the queue, and process_chunk
+                returns at once instead of waiting for input or for credits
         """
         self.pipeline = pipeline
         self.pipeline_id = pipeline_id
+        # Other sessions may be streaming through the same pipeline instance,
+        # so calls go through a session slot that keeps this stream's state
+        self.pipeline_session = open_pipeline_session(pipeline, session_id)
         self.session_id = session_id
         self.user_id = user_id
         self.connection_id = connection_id
         self.connection_info = connection_info
+        self.realtime = realtime
 
         # Each processor creates its own queues
         self.input_queue = queue.Queue(maxsize=30)
@@ -104,10 +113,13 @@ class PipelineProcessor:
         # Cache VACE support check to avoid isinstance on every chunk
         self._pipeline_supports_vace = isinstance(pipeline, VACEEnabledPipeline)
 
-        # Throttler for controlling processing rate in chained pipelines
-        # Throttling is applied when this pipeline produces frames faster than
-        # the next pipeline in the chain can consume them
-        self.throttler = PipelineThrottler()
+        # Credits granted to the processor feeding input_queue. An upstream
+        # processor only runs a chunk when this one has room for it, so a
+        # faster upstream waits instead of computing frames that get dropped
+        self.input_credits = InputCredits(self._queued_input_frames)
+        # Set when another processor feeds input_queue. Credits already keep
+        # that backlog short, so every frame it computed is consumed in order.
+        self._credited_input = False
 
     def _resize_output_queue(self, target_size: int):
         """Resize the output queue to the target size, transferring existing frames.
@@ -139,6 +151,10 @@ class PipelineProcessor:
                 with self.next_processor.input_queue_lock:
                     self.next_processor.input_queue = self.output_queue
 
+    def _queued_input_frames(self) -> int:
+        with self.input_queue_lock:
+            return self.input_queue.qsize()
+
     def set_next_processor(self, next_processor: "PipelineProcessor"):
         """Set the next processor in the chain and update output queue size accordingly.
 
@@ -147,14 +163,12 @@ class PipelineProcessor:
         """
         self.next_processor = next_processor
 
-        # Set throttler's reference to next processor for throttling decisions
-        self.throttler.set_next_processor(next_processor)
-
-        # Calculate output queue size based on next processor's requirements
+        # Size credits and the output queue from the next processor's chunk size
         next_pipeline = next_processor.pipeline
         if hasattr(next_pipeline, "prepare"):
             requirements = next_pipeline.prepare(video=True)
             input_size = requirements.input_size
+            next_processor.input_credits.set_chunk_size(input_size)
             target_size = max(8, input_size * OUTPUT_QUEUE_MAX_SIZE_FACTOR)
             self._resize_output_queue(target_size)
 
@@ -162,6 +176,7 @@ class PipelineProcessor:
         # Use lock to ensure thread-safe reference swapping
         with next_processor.input_queue_lock:
             next_processor.input_queue = self.output_queue
+        next_processor._credited_input = True
 
     def start(self):
         """Start the pipeline processor thread."""
@@ -170,6 +185,7 @@ class PipelineProcessor:
 
         self.running = True
         self.shutdown_event.clear()
+        self.input_credits.reopen()
 
         self.worker_thread = threading.Thread(target=self.worker_loop, daemon=True)
         self.worker_thread.start()
@@ -179,11 +195,14 @@ class PipelineProcessor:
     def stop(self):
         """Stop the pipeline processor thread."""
         if not self.running:
+            # Processors driven directly by process_chunk() never start a thread
+            self.pipeline_session.close()
             return
 
         self.running = False
         self.shutdown_event.set()
-        self.throttler.interrupt()
+        # Release an upstream processor waiting for room in our input queue
+        self.input_credits.close()
 
         if self.worker_thread and self.worker_thread.is_alive():
             if threading.current_thread() != self.worker_thread:
@@ -206,6 +225,8 @@ class PipelineProcessor:
                 except queue.Empty:
                     break
 
+        self.pipeline_session.close()
+
         logger.info(f"PipelineProcessor stopped for pipeline: {self.pipeline_id}")
 
     def update_parameters(self, parameters: dict[str, Any]):
@@ -272,7 +293,8 @@ class PipelineProcessor:
         This function implements uniform sampling across the entire queue to ensure
         temporal coverage of input frames. It samples frames at evenly distributed
         indices and removes all frames up to the last sampled frame to prevent
-        queue buildup.
+        queue buildup. Offline processors, and processors fed by another
+        processor, take the first chunk_size frames instead.
 
         Note:
             This function must be called with a queue reference obtained while holding
@@ -294,6 +316,12 @@ class PipelineProcessor:
             List of tensor frames, each (1, H, W, C) for downstream preprocess_chunk
         """
 
+        if not self.realtime or self._credited_input:
+            # Offline rendering consumes every frame, in order, and so does a
+            # processor fed by a credited upstream: sampling would throw away
+            # frames the upstream only computed because credits allowed it
+            return [input_queue_ref.get_nowait() for _ in range(chunk_size)]
+
         # Calculate uniform sampling step
         step = input_queue_ref.qsize() / chunk_size
         # Generate indices for uniform sampling
@@ -309,8 +337,13 @@ class PipelineProcessor:
                 video_frames.append(frame)
         return video_frames
 
-    def process_chunk(self):
-        """Process a single chunk of frames."""
+    def process_chunk(self) -> bool:
+        """Process a single chunk of frames.
+
+        Returns:
+            True if the pipeline was called, False if it was paused or waiting
+            for input
+        """
         # Check if there are new parameters
         try:
             new_parameters = self.parameters_queue.get_nowait()
@@ -355,12 +388,16 @@ class PipelineProcessor:
             self.paused = paused
         if self.paused:
             self.shutdown_event.wait(SLEEP_TIME)
-            return
+            return False
 
         # Prepare pipeline
         reset_cache = self.parameters.pop("reset_cache", None)
         lora_scales = self.parameters.pop("lora_scales", None)
 
+        bookmark = self.parameters.pop("bookmark", None)
+        if bookmark:
+            self._handle_bookmark(bookmark)
+
         # Handle reset_cache: clear this processor's cache
         if reset_cache:
             logger.info(f"Clearing cache for pipeline processor: {self.pipeline_id}")
@@ -380,10 +417,16 @@ class PipelineProcessor:
                 prepare_params["video"] = True
             requirements = self.pipeline.prepare(**prepare_params)
 
+        # Only run when the next processor has room for the chunk's output
+        if self.next_processor is not None:
+            timeout = SLEEP_TIME if self.realtime else 0
+            if not self.next_processor.input_credits.wait(timeout):
+                return False
+
         video_input = None
-        input_frame_count = 0
         if requirements is not None:
             current_chunk_size = requirements.input_size
+            self.input_credits.set_chunk_size(current_chunk_size)
 
             # Capture a local reference to input_queue while holding the lock
             # This ensures thread-safe access even if input_queue is reassigned
@@ -393,12 +436,13 @@ class PipelineProcessor:
             # Check if queue has enough frames before consuming them
             if input_queue_ref.qsize() < current_chunk_size:
                 # Not enough frames in queue, sleep briefly and try again next iteration
-                self.shutdown_event.wait(SLEEP_TIME)
-                return
+                if self.realtime:
+                    self.shutdown_event.wait(SLEEP_TIME)
+                return False
 
             # Use prepare_chunk to uniformly sample frames from the queue
             video_input = self.prepare_chunk(input_queue_ref, current_chunk_size)
-            input_frame_count = len(video_input) if video_input else 0
+            self.input_credits.consumed()
 
         try:
             # Pass parameters (excluding prepare-only parameters)
@@ -432,14 +476,12 @@ class PipelineProcessor:
                 else:
                     call_params["video"] = video_input
 
-            processing_start = time.time()
-            output_dict = self.pipeline(**call_params)
-            processing_time = time.time() - processing_start
+            output_dict = self.pipeline_session(**call_params)
 
             # Extract video from the returned dictionary
             output = output_dict.get("video")
             if output is None:
-                return
+                return True
 
             # Forward extra params to downstream pipeline (dual-output pattern)
             # Preprocessors return {"video": frames, "vace_input_frames": ..., "vace_input_masks": ...}
@@ -463,7 +505,7 @@ class PipelineProcessor:
             if "transition" in call_params and "transition" in self.parameters:
                 transition_active = False
                 if hasattr(self.pipeline, "state"):
-                    transition_active = self.pipeline.state.get(
+                    transition_active = self.pipeline_session.get_state(
                         "_transition_active", False
                     )
 
@@ -473,12 +515,6 @@ class PipelineProcessor:
 
             num_frames = output.shape[0]
 
-            # Record batch timing for throttling calculations
-            if input_frame_count > 0:
-                self.throttler.record_input_batch(input_frame_count, processing_time)
-            if num_frames > 0:
-                self.throttler.record_output_batch(num_frames, processing_time)
-
             # Normalize to [0, 255] and convert to uint8
             # Keep frames on GPU - frame_processor handles CPU transfer for streaming
             output = (
@@ -489,8 +525,14 @@ class PipelineProcessor:
                 .detach()
             )
 
-            # Resize output queue to meet target max size
-            target_output_queue_max_size = num_frames * OUTPUT_QUEUE_MAX_SIZE_FACTOR
+            # Resize output queue to meet target max size. Between chained
+            # processors credits bound the backlog to the next processor's
+            # credited chunks plus this chunk, so that is all it needs to hold
+            if self.next_processor is not None:
+                credits = self.next_processor.input_credits
+                target_output_queue_max_size = credits.capacity_frames + num_frames
+            else:
+                target_output_queue_max_size = num_frames * OUTPUT_QUEUE_MAX_SIZE_FACTOR
             self._resize_output_queue(target_output_queue_max_size)
 
             # Put frames in output queue
@@ -509,13 +551,10 @@ class PipelineProcessor:
                     )
                     continue
 
-            # Apply throttling if this pipeline is producing faster than next can consume
-            # Only throttle if: (1) has video input, (2) has next processor
-            if video_input is not None and self.next_processor is not None:
-                self.throttler.throttle()
-
         except Exception as e:
-            if self._is_recoverable(e):
+            # A live stream skips a failed chunk; an offline render must not
+            # treat it as output and carries on
+            if self.realtime and self._is_recoverable(e):
                 logger.error(
                     f"Error processing chunk for {self.pipeline_id}: {e}", exc_info=True
                 )
@@ -523,6 +562,32 @@ class PipelineProcessor:
                 raise e
 
         self.is_prepared = True
+        return True
+
+    def _handle_bookmark(self, bookmark: dict):
+        """Save, restore or delete a snapshot of this stream's generation state."""
+        action = bookmark.get("action")
+        name = bookmark.get("name")
+        try:
+            if action == "save":
+                self.pipeline_session.save_bookmark(
+                    name, offload=bookmark.get("offload", False)
+                )
+            elif action == "restore":
+                if not self.pipeline_session.restore_bookmark(name):
+                    logger.warning(
+                        f"No bookmark '{name}' for pipeline {self.pipeline_id}"
+                    )
+            elif action == "delete":
+                self.pipeline_session.delete_bookmark(name)
+            else:
+                logger.warning(f"Unknown bookmark action: {action}")
+        except Exception as e:
+            # A bookmark that does not fit leaves the stream itself untouched
+            logger.error(
+                f"Bookmark {action} '{name}' failed for {self.pipeline_id}: {e}",
+                exc_info=True,
+            )
 
     def _track_output_frame(self):
         """Track when a frame is added to the output queue (production rate).
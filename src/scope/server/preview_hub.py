@@ -0,0 +1,204 @@
+"""
+Shared MJPEG preview streams for input sources.
+
+Each distinct (source_type, identifier, fps, max_width) preview owns a single
+receiver and a single encoder thread, and every HTTP client previewing the
+same source subscribes to the JPEGs that thread produces.
+"""
+
+import asyncio
+import io
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator
+
+import numpy as np
+
+from scope.core.inputs.interface import InputSource
+
+logger = logging.getLogger(__name__)
+
+JPEG_QUALITY = 70
+RECEIVE_TIMEOUT_MS = 200
+
+
+def encode_preview_jpeg(frame: np.ndarray, max_width: int) -> bytes:
+    """Downscale an RGB frame to at most max_width and encode it as JPEG."""
+    from PIL import Image
+
+    img = Image.fromarray(frame)
+    h, w = frame.shape[:2]
+    if w > max_width:
+        img = img.resize((max_width, int(h * max_width / w)), Image.NEAREST)
+
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG", quality=JPEG_QUALITY)
+    return buf.getvalue()
+
+
+class PreviewSubscription:
+    """A single client's view of a preview stream.
+
+    Only the most recent JPEG is kept, so a slow client skips frames instead
+    of building up a backlog.
+    """
+
+    def __init__(self, stream: "PreviewStream"):
+        self.stream = stream
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+        self._last_sequence = 0
+
+    def notify(self):
+        """Wake the subscriber. Safe to call from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            # Event loop already closed, the subscriber is gone
+            pass
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self
+
+    async def __anext__(self) -> bytes:
+        while True:
+            sequence, jpeg = self.stream.latest
+            if sequence > self._last_sequence:
+                self._last_sequence = sequence
+                return jpeg
+            if self.stream.finished:
+                raise StopAsyncIteration
+            await self._event.wait()
+            self._event.clear()
+
+
+class PreviewStream:
+    """One receiver and encoder thread broadcasting to many subscribers."""
+
+    def __init__(
+        self,
+        source_class: type[InputSource],
+        identifier: str,
+        fps: int,
+        max_width: int,
+    ):
+        self.source_class = source_class
+        self.identifier = identifier
+        self.interval = 1.0 / fps
+        self.max_width = max_width
+
+        # Replaced rather than mutated so the thread can iterate it unlocked
+        self.subscribers: frozenset[PreviewSubscription] = frozenset()
+        # (sequence, jpeg); sequence 0 means no frame has been encoded yet
+        self.latest: tuple[int, bytes] = (0, b"")
+        self.finished = False
+
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"preview-{identifier}", daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """Signal the encoder thread to exit. Does not block."""
+        self._stop_event.set()
+
+    def _publish(self, jpeg: bytes | None = None):
+        if jpeg is not None:
+            self.latest = (self.latest[0] + 1, jpeg)
+        for subscriber in self.subscribers:
+            subscriber.notify()
+
+    def _run(self):
+        receiver = None
+        try:
+            receiver = self.source_class()
+            if not receiver.connect(self.identifier):
+                logger.warning(
+                    f"Preview stream: could not connect to '{self.identifier}'"
+                )
+                return
+
+            while not self._stop_event.is_set():
+                start = time.monotonic()
+                frame = receiver.receive_frame(RECEIVE_TIMEOUT_MS)
+                if frame is not None:
+                    self._publish(encode_preview_jpeg(frame, self.max_width))
+
+                remaining = self.interval - (time.monotonic() - start)
+                if remaining > 0:
+                    self._stop_event.wait(remaining)
+        except Exception as e:
+            logger.error(f"Preview stream for '{self.identifier}' failed: {e}")
+        finally:
+            self.finished = True
+            self._publish()
+            if receiver is not None:
+                try:
+                    receiver.close()
+                except Exception as e:
+                    logger.warning(f"Error closing preview receiver: {e}")
+
+
+class PreviewHub:
+    """Registry of shared preview streams keyed by source and preview settings."""
+
+    def __init__(self):
+        self._streams: dict[tuple, PreviewStream] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(
+        self,
+        source_type: str,
+        source_class: type[InputSource],
+        identifier: str,
+        fps: int,
+        max_width: int,
+    ) -> PreviewSubscription:
+        """Subscribe to a preview, starting its stream if nobody else is watching.
+
+        Must be called from the event loop that will consume the subscription.
+        """
+        key = (source_type, identifier, fps, max_width)
+        with self._lock:
+            stream = self._streams.get(key)
+            if stream is None or stream.finished:
+                stream = PreviewStream(source_class, identifier, fps, max_width)
+                self._streams[key] = stream
+                stream.start()
+                logger.info(f"Started preview stream {key}")
+            subscription = PreviewSubscription(stream)
+            stream.subscribers = stream.subscribers | {subscription}
+        return subscription
+
+    def unsubscribe(self, subscription: PreviewSubscription):
+        """Remove a subscriber and stop its stream when it was the last one."""
+        stream = subscription.stream
+        with self._lock:
+            stream.subscribers = stream.subscribers - {subscription}
+            if stream.subscribers:
+                return
+            for key, existing in list(self._streams.items()):
+                if existing is stream:
+                    del self._streams[key]
+                    logger.info(f"Stopped preview stream {key}")
+        stream.stop()
+
+    def stop_all(self):
+        """Stop every preview stream, e.g. on shutdown."""
+        with self._lock:
+            streams = list(self._streams.values())
+            self._streams.clear()
+        for stream in streams:
+            stream.stop()
+
+    @property
+    def active_streams(self) -> int:
+        with self._lock:
+            return len(self._streams)
+
+
+preview_hub = PreviewHub()
@@ -1,15 +1,17 @@
 """Recording-related utility functions for cleanup and download handling."""
 
+import asyncio
 import logging
 import os
-import shutil
+import queue
 import tempfile
 import threading
 import time
+from fractions import Fraction
 from pathlib import Path
 
+import numpy as np
 from aiortc import MediaStreamTrack
-from aiortc.contrib.media import MediaRecorder, MediaRelay
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +28,13 @@ RECORDING_STARTUP_CLEANUP_ENABLED = (
     os.getenv("RECORDING_STARTUP_CLEANUP_ENABLED", "true").lower() == "true"
 )
 
-RECORDING_MAX_FPS = 30.0  # Must match MediaRecorder's hardcoded rate=30
+RECORDING_MAX_FPS = 30.0
+RECORDING_TIME_BASE = Fraction(1, 1000)  # Millisecond timestamps
+RECORDING_FRAGMENT_SECONDS = 2.0  # Keyframe interval, one fragment per keyframe
+RECORDING_QUEUE_SIZE = 60  # Frames buffered ahead of the encoder before dropping
+RECORDING_FLUSH_TIMEOUT = 2.0  # Max wait for the current fragment on download
+FRAGMENTED_MP4_FLAGS = "frag_keyframe+empty_moov+default_base_moof"
+COPY_CHUNK_SIZE = 1024 * 1024
 
 
 def _parse_time_duration(duration_str: str) -> float:
@@ -61,86 +69,271 @@ def _parse_time_duration(duration_str: str) -> float:
 RECORDING_MAX_LENGTH_SECONDS = _parse_time_duration(RECORDING_MAX_LENGTH_STR)
 
 
-class TimestampNormalizingTrack(MediaStreamTrack):
-    """Wraps a track and normalizes frame timestamps to start from 0.
+def read_complete_fragments_size(file_path: str | Path) -> int:
+    """Return the size of the playable prefix of a fragmented MP4 file.
 
-    This is needed because when starting a new recording, the source track's
-    frames have PTS values that continue from the previous recording. Without
-    normalization, the MP4 encoder interprets these high PTS values as
-    indicating the frame should appear later in the video, causing black
-    frames at the start.
-
-    Important: We must create a copy of the frame rather than modifying it
-    in place, because the relay shares frame objects across all subscribers.
-    Modifying in place would affect the WebRTC sender and cause encoding errors.
+    The file is scanned box by box from the start. The prefix ends after the
+    last complete ``mdat`` box, so it contains the init segment (``ftyp`` and
+    ``moov``) followed only by complete ``moof``/``mdat`` fragments and is a
+    valid MP4 on its own. Returns 0 if no complete fragment has been written.
+    """
+    committed = 0
+    has_moov = False
+    with open(file_path, "rb") as f:
+        file_size = os.fstat(f.fileno()).st_size
+        offset = 0
+        while offset + 8 <= file_size:
+            f.seek(offset)
+            header = f.read(8)
+            box_size = int.from_bytes(header[:4], "big")
+            box_type = header[4:8]
+            if box_size == 1:
+                # 64-bit extended size follows the type
+                extended = f.read(8)
+                if len(extended) < 8:
+                    break
+                box_size = int.from_bytes(extended, "big")
+            if box_size < 8 or offset + box_size > file_size:
+                # Size 0 (box extends to EOF) or a box still being written
+                break
+            if box_type == b"moov":
+                has_moov = True
+            elif box_type == b"mdat" and has_moov:
+                committed = offset + box_size
+            offset += box_size
+    return committed
+
+
+class FragmentedMP4Encoder:
+    """Encodes output frames to a fragmented MP4 file on a dedicated thread.
+
+    Frames are handed over through a bounded queue so the caller (the asyncio
+    loop that also drives WebRTC) only pays for an enqueue. Conversion to
+    ``VideoFrame``, H.264 encoding and muxing all happen on the worker thread.
+
+    The file is written with ``empty_moov`` and one fragment per keyframe, so
+    at any point its prefix up to the last complete fragment is playable and
+    can be copied for download while encoding continues.
     """
 
-    def __init__(self, source_track: MediaStreamTrack):
-        super().__init__()
-        self.kind = source_track.kind
-        self._source = source_track
-        self._base_pts = None  # Will be set on first frame
+    def __init__(
+        self,
+        file_path: str,
+        max_fps: float = RECORDING_MAX_FPS,
+        max_length_seconds: float = RECORDING_MAX_LENGTH_SECONDS,
+    ):
+        self.file_path = file_path
+        self.max_length_seconds = max_length_seconds
+        self.max_length_reached = False
+        self.frames_encoded = 0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=RECORDING_QUEUE_SIZE)
+        self._min_frame_interval = 1.0 / max_fps
         self._last_frame_time: float | None = None
-        self._min_frame_interval = 1.0 / RECORDING_MAX_FPS
+        self._thread: threading.Thread | None = None
+        self._running = False
+
+        # Set by readers that want the current fragment closed early
+        self._keyframe_requested = threading.Event()
+        # Set by the worker once a requested fragment boundary has been written
+        self._fragment_flushed = threading.Event()
+
+    def start(self):
+        """Start the encoder thread."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._encode_loop, name="recording-encoder", daemon=True
+        )
+        self._thread.start()
 
-    async def recv(self):
-        import av
+    def put(self, frame_np: np.ndarray) -> bool:
+        """Queue an RGB24 frame (H, W, 3) for encoding without blocking.
 
-        while True:
-            frame = await self._source.recv()
+        Frames arriving faster than the recording frame rate, or while the
+        encoder is behind, are dropped.
+
+        Returns:
+            True if the frame was queued, False if it was dropped
+        """
+        if not self._running or self.max_length_reached:
+            return False
+
+        current_time = time.monotonic()
+        if (
+            self._last_frame_time is not None
+            and current_time - self._last_frame_time < self._min_frame_interval
+        ):
+            return False
 
-            # Frame rate limiting - skip frames arriving faster than MAX_RECORDING_FPS
-            current_time = time.monotonic()
-            if self._last_frame_time is not None:
-                elapsed = current_time - self._last_frame_time
-                if elapsed < self._min_frame_interval:
-                    continue  # Skip this frame
-            self._last_frame_time = current_time
+        try:
+            self._queue.put_nowait((current_time, frame_np))
+        except queue.Full:
+            return False
+        self._last_frame_time = current_time
+        return True
+
+    def flush_fragment(self, timeout: float = RECORDING_FLUSH_TIMEOUT) -> bool:
+        """Ask the encoder to close the current fragment and wait for it.
+
+        The next frame is encoded as a keyframe, which makes the muxer write
+        out every frame queued before it. Blocks, so call it off the event loop.
+
+        Returns:
+            True if the fragment was flushed within the timeout
+        """
+        if not self._running:
+            return False
+        self._fragment_flushed.clear()
+        self._keyframe_requested.set()
+        return self._fragment_flushed.wait(timeout)
+
+    def stop(self, timeout: float = 5.0):
+        """Flush pending frames, finalize the file and stop the encoder thread."""
+        if not self._running:
+            return
+        self._running = False
+        # Sentinel wakes the worker; block briefly if the queue is full
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("Recording encoder queue full while stopping")
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning(f"Recording encoder did not stop within {timeout}s")
+            self._thread = None
+
+    @staticmethod
+    def _add_stream(container, width: int, height: int):
+        """Add an H.264 stream tuned for low-latency, millisecond timestamps."""
+        stream = container.add_stream(
+            "libx264", options={"tune": "zerolatency", "preset": "veryfast"}
+        )
+        # yuv420p requires even dimensions
+        stream.width = width - width % 2
+        stream.height = height - height % 2
+        stream.pix_fmt = "yuv420p"
+        stream.time_base = RECORDING_TIME_BASE
+        stream.codec_context.time_base = RECORDING_TIME_BASE
+        stream.codec_context.gop_size = int(
+            RECORDING_MAX_FPS * RECORDING_FRAGMENT_SECONDS
+        )
+        return stream
+
+    def _mux(self, container, packets) -> bool:
+        """Mux packets and report whether any of them started a new fragment."""
+        keyframe = False
+        for packet in packets:
+            container.mux(packet)
+            keyframe = keyframe or packet.is_keyframe
+        return keyframe
+
+    def _encode_loop(self):
+        """Worker thread: convert, encode and mux queued frames."""
+        import av
 
-            # Capture the first frame's PTS as our base
-            if self._base_pts is None:
-                self._base_pts = frame.pts
+        container = None
+        stream = None
+        base_time = None
+        last_pts = -1
+        flush_pending = False
 
-            # Create a new frame with normalized timestamp
-            arr = frame.to_ndarray(format="rgb24")
-            new_frame = av.VideoFrame.from_ndarray(arr, format="rgb24")
-            new_frame.pts = frame.pts - self._base_pts
-            new_frame.time_base = frame.time_base
-            return new_frame
+        try:
+            container = av.open(
+                self.file_path,
+                mode="w",
+                format="mp4",
+                # Flush I/O at each write so completed fragments reach disk
+                # instead of waiting in the muxer's buffer
+                options={"movflags": FRAGMENTED_MP4_FLAGS, "flush_packets": "1"},
+            )
 
-    def stop(self):
-        self._source.stop()
-        super().stop()
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                timestamp, frame_np = item
+
+                if base_time is None:
+                    base_time = timestamp
+                elapsed = timestamp - base_time
+                if elapsed >= self.max_length_seconds:
+                    logger.info(
+                        f"Recording max length reached ({self.max_length_seconds}s). Stopping recording."
+                    )
+                    self.max_length_reached = True
+                    break
+
+                frame = av.VideoFrame.from_ndarray(frame_np, format="rgb24")
+                if stream is None:
+                    stream = self._add_stream(container, frame.width, frame.height)
+                if frame.width != stream.width or frame.height != stream.height:
+                    frame = frame.reformat(width=stream.width, height=stream.height)
+
+                # Timestamps come from arrival time, so they start at 0 and
+                # keep real-time pacing even when frames are dropped
+                pts = max(int(elapsed / RECORDING_TIME_BASE), last_pts + 1)
+                frame.pts = pts
+                frame.time_base = RECORDING_TIME_BASE
+                last_pts = pts
+
+                if self._keyframe_requested.is_set():
+                    self._keyframe_requested.clear()
+                    frame.pict_type = av.video.frame.PictureType.I
+                    flush_pending = True
+
+                keyframe = self._mux(container, stream.encode(frame))
+                self.frames_encoded += 1
+
+                if flush_pending and keyframe:
+                    flush_pending = False
+                    self._fragment_flushed.set()
+
+            if stream is not None:
+                self._mux(container, stream.encode(None))
+        except Exception as e:
+            logger.error(f"Error in recording encoder: {e}", exc_info=True)
+        finally:
+            self._running = False
+            if container is not None:
+                try:
+                    container.close()
+                except Exception as e:
+                    logger.warning(f"Error closing recording container: {e}")
+            # Wake any reader waiting on a fragment that will never come
+            self._fragment_flushed.set()
 
 
 class RecordingManager:
-    """Manages recording functionality for a video track."""
+    """Manages recording functionality for a video track.
+
+    Recording is fed directly from the track's output frames and encoded on a
+    ``FragmentedMP4Encoder`` thread. Downloads copy the completed fragments of
+    the live file, so they never stop or restart the recording.
+    """
 
     def __init__(self, video_track: MediaStreamTrack):
         """
         Initialize the recording manager.
 
         Args:
-            video_track: The video track to record from
+            video_track: The video track to record from. Must support
+                add_frame_callback/remove_frame_callback.
         """
         self.video_track = video_track
-        self.relay = None
 
         # Recording state
         self.recording_file = None
-        self.media_recorder = None
+        self.encoder: FragmentedMP4Encoder | None = None
         self.recording_started = False
         self.recording_lock = threading.Lock()
-        self.recording_track = None
 
         # Max length tracking
         self.first_recording_start_time = None
         self.max_length_reached = False
 
-    def set_relay(self, relay: MediaRelay):
-        """Set the MediaRelay instance for creating recording track."""
-        self.relay = relay
-
     @staticmethod
     def _create_temp_file(suffix: str, prefix: str) -> str:
         """Create a temporary file and return its path."""
@@ -149,86 +342,42 @@ class RecordingManager:
         os.close(fd)
         return file_path
 
-    @staticmethod
-    def _stop_track_safe(track: MediaStreamTrack | None) -> None:
-        """Safely stop a recording track, ignoring errors."""
-        if track:
-            try:
-                track.stop()
-            except Exception as e:
-                logger.warning(f"Error stopping recording track: {e}")
-
-    def _create_recording_track(self) -> MediaStreamTrack:
-        """Create a recording track from the video track.
-
-        The track is wrapped in TimestampNormalizingTrack to ensure frame
-        timestamps start from 0 for each new recording.
-        """
-        if self.relay:
-            relay_track = self.relay.subscribe(self.video_track)
-            return TimestampNormalizingTrack(relay_track)
-        else:
-            logger.warning("No relay available for recording, using track directly")
-            return TimestampNormalizingTrack(self.video_track)
-
-    def _create_media_recorder(self, file_path: str) -> MediaRecorder:
-        """Create a MediaRecorder instance with standard settings."""
-        return MediaRecorder(
-            file_path,
-            format="mp4",
-        )
+    def _on_frame(self, frame_np: np.ndarray) -> None:
+        """Frame callback registered on the video track."""
+        encoder = self.encoder
+        if encoder is not None:
+            encoder.put(frame_np)
 
     async def start_recording(self):
-        """Start recording frames to MP4 file using MediaRecorder."""
+        """Start recording frames to a fragmented MP4 file."""
         with self.recording_lock:
-            if self.recording_started:
+            if self.recording_started or self.max_length_reached:
                 return
 
-            # Check if max length has been reached
-            if self.max_length_reached:
-                return
-
-        recording_file = None
-        media_recorder = None
-        recording_track = None
-
-        try:
-            recording_file = self._create_temp_file(
-                ".mp4", TEMP_FILE_PREFIXES["recording"]
-            )
-            media_recorder = self._create_media_recorder(recording_file)
-            recording_track = self._create_recording_track()
-            media_recorder.addTrack(recording_track)
-            await media_recorder.start()
-
-            with self.recording_lock:
-                if self.recording_started:
-                    # Another thread started recording while we were doing I/O
-                    await self._cleanup_recording(
-                        media_recorder, recording_track, recording_file
-                    )
-                    return
-                self.recording_file = recording_file
-                self.media_recorder = media_recorder
-                self.recording_track = recording_track
-                self.recording_started = True
+            try:
+                recording_file = self._create_temp_file(
+                    ".mp4", TEMP_FILE_PREFIXES["recording"]
+                )
+                encoder = FragmentedMP4Encoder(recording_file)
+                encoder.start()
+            except Exception as e:
+                logger.error(f"Error starting recording: {e}")
+                raise
 
-                # Track first recording start time
-                if self.first_recording_start_time is None:
-                    self.first_recording_start_time = time.time()
+            self.recording_file = recording_file
+            self.encoder = encoder
+            self.recording_started = True
+            if self.first_recording_start_time is None:
+                self.first_recording_start_time = time.time()
 
-            logger.info(f"Started recording to {recording_file}")
-        except Exception as e:
-            logger.error(f"Error starting recording: {e}")
-            await self._cleanup_recording(
-                media_recorder, recording_track, recording_file
-            )
-            raise
+        self.video_track.add_frame_callback(self._on_frame)
+        logger.info(f"Started recording to {recording_file}")
 
     def check_max_length(self) -> bool:
         """
-        Check if recording has exceeded max length and stop if necessary.
-        This should be called periodically during recording.
+        Check if recording has exceeded max length.
+
+        The encoder enforces the limit itself; this reports whether it was hit.
 
         Returns:
             True if max length was reached and recording should be stopped, False otherwise
@@ -237,136 +386,90 @@ class RecordingManager:
             return False
 
         with self.recording_lock:
-            if not self.recording_started:
-                return False
-
-            # Calculate total duration from start time
-            if self.first_recording_start_time is not None:
-                total_duration = time.time() - self.first_recording_start_time
-
-                if total_duration >= RECORDING_MAX_LENGTH_SECONDS:
-                    if not self.max_length_reached:
-                        # Only log once when max length is first reached
-                        logger.info(
-                            f"Recording max length reached (total: {total_duration:.2f}s, max: {RECORDING_MAX_LENGTH_SECONDS}s). Stopping recording."
-                        )
-                    self.max_length_reached = True
-                    return True
+            if self.recording_started and self.encoder.max_length_reached:
+                self.max_length_reached = True
+                return True
 
         return False
 
     async def stop_recording_if_max_length_reached(self):
         """Stop current recording if max length has been reached."""
+        self.check_max_length()
         if self.max_length_reached and self.recording_started:
             await self.stop_recording()
 
-    async def _cleanup_recording(
-        self,
-        media_recorder: MediaRecorder | None,
-        recording_track: MediaStreamTrack | None,
-        recording_file: str | None,
-    ) -> None:
-        """Clean up recording resources."""
-        if media_recorder:
-            try:
-                await media_recorder.stop()
-            except Exception as e:
-                logger.warning(f"Error stopping media recorder: {e}")
-        self._stop_track_safe(recording_track)
-        if recording_file and os.path.exists(recording_file):
-            try:
-                os.remove(recording_file)
-            except Exception as e:
-                logger.warning(f"Error removing recording file: {e}")
-
     def _extract_recording_state(self):
         """Extract and clear recording state, returning resources for cleanup."""
         with self.recording_lock:
-            if not self.recording_started or not self.media_recorder:
-                return None, None, None
+            if not self.recording_started:
+                return None, None
 
             recording_file = self.recording_file
-            media_recorder = self.media_recorder
-            recording_track = self.recording_track
+            encoder = self.encoder
 
-            self.media_recorder = None
-            self.recording_track = None
+            self.encoder = None
             self.recording_started = False
-            self.recording_file = None
 
-            return recording_file, media_recorder, recording_track
+            return recording_file, encoder
 
     async def stop_recording(self):
-        """Stop recording and close the output file."""
-        try:
-            recording_file, media_recorder, recording_track = (
-                self._extract_recording_state()
-            )
-            if not recording_file:
-                return
+        """Stop recording and finalize the output file.
+
+        The file is kept so it can still be downloaded.
+        """
+        recording_file, encoder = self._extract_recording_state()
+        if encoder is None:
+            return
 
-            await media_recorder.stop()
-            self._stop_track_safe(recording_track)
+        self.video_track.remove_frame_callback(self._on_frame)
+        try:
+            await asyncio.to_thread(encoder.stop)
             logger.info(f"Stopped recording, saved to {recording_file}")
         except Exception as e:
             logger.error(f"Error stopping recording: {e}")
-            with self.recording_lock:
-                self.media_recorder = None
-                self.recording_started = False
-
-    async def finalize_and_get_recording(self):
-        """Finalize the current recording and return a copy for download."""
-        try:
-            with self.recording_lock:
-                has_active_recording = self.recording_started and self.media_recorder
-
-            if not has_active_recording:
-                return None
 
-            recording_file, media_recorder, recording_track = (
-                self._extract_recording_state()
-            )
+    async def create_download(self) -> str | None:
+        """Copy the recorded fragments to a new file for download.
 
-            if media_recorder:
-                await media_recorder.stop()
-                logger.info(f"Finalized recording: {recording_file}")
-
-            self._stop_track_safe(recording_track)
-
-            if recording_file and os.path.exists(recording_file):
-                # Create a copy for download
-                download_file = self._copy_single_segment(recording_file)
-
-                # Continue recording if max length not reached
-                if not self.max_length_reached:
-                    await self.start_recording()
-                    logger.info("Continued recording after download")
-                else:
-                    logger.info("Skipped starting new recording (max length reached)")
-
-                return download_file
+        The live recording keeps running. The current fragment is closed
+        first so the download includes frames up to the request.
+        """
+        with self.recording_lock:
+            recording_file = self.recording_file
+            encoder = self.encoder
 
-            return None
-        except Exception as e:
-            logger.error(f"Error finalizing recording: {e}", exc_info=True)
-            await self._try_restart_recording()
+        if not recording_file or not os.path.exists(recording_file):
             return None
 
-    async def _try_restart_recording(self):
-        """Try to restart recording if it was stopped."""
         try:
-            with self.recording_lock:
-                needs_restart = not self.recording_started
-            if needs_restart:
-                await self.start_recording()
+            return await asyncio.to_thread(
+                self._copy_completed_fragments, recording_file, encoder
+            )
         except Exception as e:
-            logger.error(f"Error restarting recording: {e}", exc_info=True)
+            logger.error(f"Error creating recording download: {e}", exc_info=True)
+            return None
+
+    def _copy_completed_fragments(
+        self, recording_file: str, encoder: FragmentedMP4Encoder | None
+    ) -> str | None:
+        """Copy the init segment and complete fragments to a download file."""
+        if encoder is not None and not encoder.flush_fragment():
+            logger.debug("Recording fragment not flushed in time, using last one")
+
+        length = read_complete_fragments_size(recording_file)
+        if length == 0:
+            return None
 
-    def _copy_single_segment(self, segment_path: str) -> str:
-        """Copy a recording file to a download file."""
         download_file = self._create_temp_file(".mp4", TEMP_FILE_PREFIXES["download"])
-        shutil.copy2(segment_path, download_file)
-        logger.info(f"Created download copy: {download_file}")
+        with open(recording_file, "rb") as src, open(download_file, "wb") as dst:
+            remaining = length
+            while remaining > 0:
+                chunk = src.read(min(COPY_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                dst.write(chunk)
+                remaining -= len(chunk)
+        logger.info(f"Created download copy: {download_file} ({length} bytes)")
         return download_file
 
     @staticmethod
@@ -378,36 +481,14 @@ class RecordingManager:
             logger.warning(f"Failed to remove file {file_path}: {e}")
 
     async def delete_recording(self):
-        """Delete all recording files."""
-        files_to_delete = []
-        media_recorder = None
-        recording_track = None
-
-        try:
-            # Extract recording state and stop the recorder before deleting
-            recording_file, media_recorder, recording_track = (
-                self._extract_recording_state()
-            )
-            if recording_file:
-                files_to_delete.append(recording_file)
-        except Exception as e:
-            logger.error(f"Error getting recording file paths: {e}")
+        """Stop recording and delete the recording file."""
+        await self.stop_recording()
 
-        # Stop the media recorder first to close the file handle
-        if media_recorder:
-            try:
-                await media_recorder.stop()
-            except Exception as e:
-                logger.warning(f"Error stopping media recorder during delete: {e}")
-
-        # Stop the recording track
-        self._stop_track_safe(recording_track)
-
-        # Now delete the file(s) - the file handle should be closed
-        for file_path in files_to_delete:
-            if file_path and os.path.exists(file_path):
-                self._safe_remove_file(file_path)
-                logger.info(f"Deleted recording file: {file_path}")
+        recording_file = self.recording_file
+        self.recording_file = None
+        if recording_file and os.path.exists(recording_file):
+            self._safe_remove_file(recording_file)
+            logger.info(f"Deleted recording file: {recording_file}")
 
     def get_recording_path(self):
         """Get the path to the recording file."""
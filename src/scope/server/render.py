@@ -0,0 +1,451 @@
+"""
+Offline rendering of pipeline chains to a video file.
+
+Streaming sessions are paced to real time: processors sample their input
+queues and drop frames, upstream stages wait on credits, and tracks schedule
+output timestamps. A render job instead pushes every frame of a clip (or a prompt
+timeline for text-to-video) through the same PipelineProcessor chain as fast
+as the pipelines allow, and encodes the output to disk as it is produced.
+
+Jobs run on the calling thread (the render CLI) or on a background thread
+started by RenderJobManager (the render API).
+"""
+
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from fractions import Fraction
+from pathlib import Path
+from typing import Any
+
+import torch
+
+from .pipeline_processor import PipelineProcessor
+from .schema import RenderStatusEnum
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RENDER_FPS = 16.0
+# Output frames generated per timeline prompt, as in the pipeline test scripts
+DEFAULT_FRAMES_PER_PROMPT = 81
+PROMPT_WEIGHT = 100
+# Frames buffered ahead of the encoder; writes block rather than drop
+ENCODER_QUEUE_SIZE = 32
+RENDERS_SUBDIR = "renders"
+
+
+def read_video_frames(path: str | Path) -> Iterator[torch.Tensor]:
+    """Decode a video file frame by frame as uint8 [1, H, W, C] RGB tensors.
+
+    Unlike load_video, frames are streamed rather than decoded up front into
+    one float tensor, so clip length does not bound memory.
+    """
+    import av
+
+    with av.open(str(path)) as container:
+        for frame in container.decode(video=0):
+            yield torch.from_numpy(frame.to_ndarray(format="rgb24")).unsqueeze(0)
+
+
+def probe_video(path: str | Path) -> tuple[float | None, int | None]:
+    """Return the frame rate and frame count of a video, where the container knows them."""
+    import av
+
+    with av.open(str(path)) as container:
+        stream = container.streams.video[0]
+        fps = float(stream.average_rate) if stream.average_rate else None
+        return fps, stream.frames or None
+
+
+def load_prompt_timeline(path: str | Path) -> list[str]:
+    """Read a JSONL prompt file as one timeline: every line's prompts, in order."""
+    from scope.core.pipelines.utils import parse_jsonl_prompts
+
+    return [
+        prompt for sequence in parse_jsonl_prompts(str(path)) for prompt in sequence
+    ]
+
+
+def resolve_assets_path(path: str | Path) -> Path:
+    """Resolve a path relative to the assets directory.
+
+    Raises:
+        ValueError: If the path resolves outside the assets directory
+    """
+    from scope.core.config import get_assets_dir
+
+    assets_dir = get_assets_dir().resolve()
+    resolved = (assets_dir / path).resolve()
+    if not resolved.is_relative_to(assets_dir):
+        raise ValueError(f"Path is outside the assets directory: {path}")
+    return resolved
+
+
+class VideoFileWriter:
+    """Encodes frames to an H.264 MP4 on a background thread.
+
+    Frames are timestamped by index at a fixed rate. write() blocks while the
+    encoder is behind, so no frame is ever dropped.
+    """
+
+    def __init__(self, path: str | Path, fps: float):
+        self.path = Path(path)
+        self.rate = Fraction(fps).limit_denominator(1001)
+        self.frames_encoded = 0
+        self.error: Exception | None = None
+        self._queue: queue.Queue = queue.Queue(maxsize=ENCODER_QUEUE_SIZE)
+        self._thread = threading.Thread(target=self._encode_loop, daemon=True)
+        self._thread.start()
+
+    def write(self, frame: torch.Tensor):
+        """Queue a uint8 [1, H, W, C] or [H, W, C] frame for encoding."""
+        if self.error is not None:
+            raise RuntimeError(f"Video encoder failed: {self.error}")
+        self._queue.put(frame)
+
+    def close(self):
+        """Flush the encoder and finish the file."""
+        self._queue.put(None)
+        self._thread.join()
+        if self.error is not None:
+            raise RuntimeError(f"Video encoder failed: {self.error}")
+
+    def _encode_loop(self):
+        import av
+
+        container = None
+        stream = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            container = av.open(str(self.path), mode="w")
+            while True:
+                frame = self._queue.get()
+                if frame is None:
+                    break
+                if frame.dim() == 4:
+                    frame = frame[0]
+                pixels = frame[..., :3].cpu().numpy()
+                video_frame = av.VideoFrame.from_ndarray(pixels, format="rgb24")
+
+                if stream is None:
+                    stream = container.add_stream("libx264", rate=self.rate)
+                    # yuv420p requires even dimensions
+                    stream.width = video_frame.width - video_frame.width % 2
+                    stream.height = video_frame.height - video_frame.height % 2
+                    stream.pix_fmt = "yuv420p"
+                if (
+                    video_frame.width != stream.width
+                    or video_frame.height != stream.height
+                ):
+                    video_frame = video_frame.reformat(
+                        width=stream.width, height=stream.height
+                    )
+
+                video_frame.pts = self.frames_encoded
+                video_frame.time_base = 1 / self.rate
+                for packet in stream.encode(video_frame):
+                    container.mux(packet)
+                self.frames_encoded += 1
+
+            if stream is not None:
+                for packet in stream.encode(None):
+                    container.mux(packet)
+        except Exception as e:
+            logger.error(f"Error encoding {self.path}: {e}", exc_info=True)
+            self.error = e
+            # Keep draining so a blocked write() can return and see the error
+            while self._queue.get() is not None:
+                pass
+        finally:
+            if container is not None:
+                container.close()
+
+
+class RenderJob:
+    """Renders a clip or prompt timeline through a pipeline chain to a file."""
+
+    def __init__(
+        self,
+        pipelines: list[tuple[str, Any]],
+        output_path: str | Path | None = None,
+        input_path: str | Path | None = None,
+        prompts: list[str] | None = None,
+        parameters: dict | None = None,
+        fps: float | None = None,
+        frames_per_prompt: int = DEFAULT_FRAMES_PER_PROMPT,
+        max_frames: int | None = None,
+    ):
+        """Initialize a render job.
+
+        Args:
+            pipelines: (pipeline_id, pipeline) pairs, in chain order
+            output_path: MP4 file to write. Defaults to
+                renders/render_<job_id>.mp4 in the assets directory.
+            input_path: Video to process. Without one the chain runs in text mode.
+            prompts: Prompt timeline, each held for frames_per_prompt output frames
+            parameters: Runtime parameters passed to every pipeline
+            fps: Output frame rate. Defaults to the input's rate, or
+                DEFAULT_RENDER_FPS in text mode.
+            frames_per_prompt: Output frames generated per timeline prompt
+            max_frames: Stop after this many output frames
+
+        Raises:
+            ValueError: If there are no pipelines, or neither input nor prompts
+        """
+        if not pipelines:
+            raise ValueError("At least one pipeline is required")
+        if input_path is None and not prompts:
+            raise ValueError("A render needs an input video or a prompt timeline")
+
+        self.job_id = uuid.uuid4().hex[:12]
+        self.pipelines = pipelines
+        if output_path is None:
+            from scope.core.config import get_assets_dir
+
+            output_path = (
+                get_assets_dir() / RENDERS_SUBDIR / f"render_{self.job_id}.mp4"
+            )
+        self.output_path = Path(output_path)
+        self.input_path = Path(input_path) if input_path is not None else None
+        self.prompts = prompts or []
+        self.parameters = parameters or {}
+        self.frames_per_prompt = frames_per_prompt
+        self.max_frames = max_frames
+
+        self.total_input_frames: int | None = None
+        if self.input_path is not None:
+            source_fps, self.total_input_frames = probe_video(self.input_path)
+            fps = fps or source_fps
+        self.fps = fps or DEFAULT_RENDER_FPS
+
+        self.status = RenderStatusEnum.PENDING
+        self.error: str | None = None
+        self.frames_in = 0
+        self.frames_out = 0
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self._cancel = threading.Event()
+
+    @property
+    def pipeline_ids(self) -> list[str]:
+        return [pipeline_id for pipeline_id, _ in self.pipelines]
+
+    @property
+    def target_frames(self) -> int | None:
+        """Output frames the job stops at, if known in advance."""
+        if self.input_path is None:
+            target = len(self.prompts) * self.frames_per_prompt
+            return min(target, self.max_frames) if self.max_frames else target
+        return self.max_frames
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def render_fps(self) -> float:
+        elapsed = self.elapsed
+        return self.frames_out / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def progress(self) -> float | None:
+        """Fraction of the job done, or None when the length is unknown."""
+        if self.status == RenderStatusEnum.COMPLETED:
+            return 1.0
+        if self.target_frames:
+            return min(self.frames_out / self.target_frames, 1.0)
+        if self.total_input_frames:
+            return min(self.frames_in / self.total_input_frames, 1.0)
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status.value,
+            "pipeline_ids": self.pipeline_ids,
+            "output_path": str(self.output_path),
+            "frames_in": self.frames_in,
+            "frames_out": self.frames_out,
+            "progress": self.progress,
+            "fps": self.render_fps,
+            "elapsed_seconds": self.elapsed,
+            "error": self.error,
+        }
+
+    def cancel(self):
+        """Stop the job after the chunk in progress; the file keeps what was rendered."""
+        self._cancel.set()
+
+    def run(self):
+        """Render to completion, recording the outcome in status and error."""
+        self.status = RenderStatusEnum.RUNNING
+        self.started_at = time.monotonic()
+        logger.info(
+            f"Render {self.job_id} started: {'+'.join(self.pipeline_ids)} -> "
+            f"{self.output_path}"
+        )
+        try:
+            self._render()
+            self.status = (
+                RenderStatusEnum.CANCELLED
+                if self._cancel.is_set()
+                else RenderStatusEnum.COMPLETED
+            )
+        except Exception as e:
+            logger.error(f"Render {self.job_id} failed: {e}", exc_info=True)
+            self.error = str(e)
+            self.status = RenderStatusEnum.FAILED
+        finally:
+            self.finished_at = time.monotonic()
+        logger.info(
+            f"Render {self.job_id} {self.status.value}: {self.frames_out} frames "
+            f"in {self.elapsed:.1f}s ({self.render_fps:.1f} fps)"
+        )
+
+    def _build_processors(self) -> list[PipelineProcessor]:
+        initial_parameters = {
+            **self.parameters,
+            "input_mode": "text" if self.input_path is None else "video",
+        }
+        processors = [
+            PipelineProcessor(
+                pipeline=pipeline,
+                pipeline_id=pipeline_id,
+                initial_parameters=initial_parameters.copy(),
+                session_id=f"render-{self.job_id}",
+                realtime=False,
+            )
+            for pipeline_id, pipeline in self.pipelines
+        ]
+        for previous, current in zip(processors, processors[1:], strict=False):
+            previous.set_next_processor(current)
+        return processors
+
+    def _render(self):
+        processors = self._build_processors()
+        first = processors[0]
+        frames = (
+            read_video_frames(self.input_path) if self.input_path is not None else None
+        )
+        exhausted = frames is None
+        prompt_index = -1
+        writer = VideoFileWriter(self.output_path, self.fps)
+
+        try:
+            while not self._cancel.is_set():
+                if self.prompts:
+                    index = min(
+                        self.frames_out // self.frames_per_prompt,
+                        len(self.prompts) - 1,
+                    )
+                    if index != prompt_index:
+                        prompt_index = index
+                        prompts = [
+                            {"text": self.prompts[index], "weight": PROMPT_WEIGHT}
+                        ]
+                        for processor in processors:
+                            processor.update_parameters({"prompts": prompts})
+
+                if not exhausted:
+                    exhausted = self._feed(first, frames)
+
+                progressed = self._advance(processors, 0, writer, once=frames is None)
+                if frames is None and not progressed:
+                    # Nothing is queued in text mode, so a pass that cannot run
+                    # is waiting for input that will never arrive
+                    raise RuntimeError(
+                        f"Pipeline {first.pipeline_id} requires video input and "
+                        "cannot render from prompts alone"
+                    )
+
+                target = self.target_frames
+                if target is not None and self.frames_out >= target:
+                    break
+                if exhausted and not progressed:
+                    # Every input frame has been fed and the chain has gone idle
+                    break
+        finally:
+            for processor in processors:
+                processor.stop()
+            writer.close()
+
+    def _feed(self, first: PipelineProcessor, frames: Iterator[torch.Tensor]) -> bool:
+        """Top up the first input queue; return True once the input is exhausted."""
+        input_queue = first.input_queue
+        while not input_queue.full():
+            frame = next(frames, None)
+            if frame is None:
+                return True
+            input_queue.put_nowait(frame)
+            self.frames_in += 1
+        return False
+
+    def _advance(
+        self,
+        processors: list[PipelineProcessor],
+        index: int,
+        writer: VideoFileWriter,
+        once: bool = False,
+    ) -> bool:
+        """Run processors[index] while it has input, depth first.
+
+        Each chunk is pushed through the rest of the chain before the next one
+        runs, so no queue ever holds more than one chunk's output and nothing
+        is dropped. Returns whether the processor ran at all.
+        """
+        processor = processors[index]
+        progressed = False
+        while once or not processor.input_queue.empty():
+            queued = processor.input_queue.qsize()
+            if not processor.process_chunk():
+                break
+            progressed = True
+            if index + 1 < len(processors):
+                self._advance(processors, index + 1, writer)
+            else:
+                self._drain(processor, writer)
+            if once or processor.input_queue.qsize() >= queued:
+                # Generation without input runs one chunk per pass
+                break
+        return progressed
+
+    def _drain(self, last: PipelineProcessor, writer: VideoFileWriter):
+        while self.max_frames is None or self.frames_out < self.max_frames:
+            try:
+                frame = last.output_queue.get_nowait()
+            except queue.Empty:
+                return
+            writer.write(frame)
+            self.frames_out += 1
+
+
+class RenderJobManager:
+    """Runs render jobs on background threads and keeps them for status queries."""
+
+    def __init__(self):
+        self._jobs: dict[str, RenderJob] = {}
+        self._lock = threading.Lock()
+
+    def start(self, job: RenderJob) -> RenderJob:
+        with self._lock:
+            self._jobs[job.job_id] = job
+        threading.Thread(
+            target=job.run, name=f"render-{job.job_id}", daemon=True
+        ).start()
+        return job
+
+    def get(self, job_id: str) -> RenderJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> list[RenderJob]:
+        with self._lock:
+            return list(self._jobs.values())
+
+
+render_jobs = RenderJobManager()
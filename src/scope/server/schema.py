@@ -66,6 +66,24 @@ class PromptTransition(BaseModel):
     )
 
 
+class StreamBookmarkRequest(BaseModel):
+    """Save, restore or delete a named snapshot of the stream's generation state.
+
+    A bookmark holds the KV and cross-attention caches, frame buffers, frame
+    position and VAE stream state, so restoring it returns to a scene without
+    recomputing the cache or hard cutting.
+    """
+
+    action: Literal["save", "restore", "delete"] = Field(
+        ..., description="What to do with the bookmark"
+    )
+    name: str = Field(..., min_length=1, description="Name of the bookmark")
+    offload: bool = Field(
+        default=False,
+        description="Keep a saved bookmark in pinned CPU memory instead of GPU memory",
+    )
+
+
 class Parameters(BaseModel):
     """Parameters for WebRTC session."""
 
@@ -104,6 +122,10 @@ class Parameters(BaseModel):
         description="Enable automatic cache management for parameter updates",
     )
     reset_cache: bool | None = Field(default=None, description="Trigger a cache reset")
+    bookmark: StreamBookmarkRequest | None = Field(
+        default=None,
+        description="Save, restore or delete a named snapshot of the generation state (one-shot)",
+    )
     kv_cache_attention_bias: float | None = Field(
         default=None,
         description="Controls how much to rely on past frames in the cache during generation. A lower value can help mitigate error accumulation and prevent repetitive motion. Uses log scale: 1.0 = full reliance on past frames, smaller values = less reliance on past frames. Typical values: 0.3-0.7 for moderate effect, 0.1-0.2 for strong effect.",
@@ -503,6 +525,69 @@ class PipelineSchemasResponse(BaseModel):
     pipelines: dict = Field(..., description="Pipeline schemas keyed by pipeline ID")
 
 
+class RenderStatusEnum(str, Enum):
+    """Render job status enumeration."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class RenderJobRequest(BaseModel):
+    """Offline render job request schema.
+
+    Paths are relative to the assets directory.
+    """
+
+    pipeline_ids: list[str] = Field(
+        ..., min_length=1, description="Loaded pipeline IDs to chain, in order"
+    )
+    input_path: str | None = Field(
+        default=None, description="Video to process. Omit to render in text mode."
+    )
+    prompts_path: str | None = Field(
+        default=None,
+        description="JSONL prompt timeline; every line's prompts are played in order",
+    )
+    output_path: str | None = Field(
+        default=None,
+        description="MP4 file to write. Defaults to renders/render_<job_id>.mp4.",
+    )
+    parameters: dict[str, Any] | None = Field(
+        default=None, description="Runtime parameters passed to every pipeline"
+    )
+    fps: float | None = Field(
+        default=None,
+        gt=0,
+        description="Output frame rate. Defaults to the input's rate, or 16 in text mode.",
+    )
+    frames_per_prompt: int = Field(
+        default=81, ge=1, description="Output frames generated per timeline prompt"
+    )
+    max_frames: int | None = Field(
+        default=None, ge=1, description="Stop after this many output frames"
+    )
+
+
+class RenderJobResponse(BaseModel):
+    """Render job status and progress."""
+
+    job_id: str
+    status: RenderStatusEnum
+    pipeline_ids: list[str]
+    output_path: str
+    frames_in: int = Field(..., description="Input frames fed to the chain")
+    frames_out: int = Field(..., description="Frames written to the output file")
+    progress: float | None = Field(
+        default=None, description="Fraction complete, when the length is known"
+    )
+    fps: float = Field(..., description="Output frames rendered per second")
+    elapsed_seconds: float
+    error: str | None = None
+
+
 class AssetFileInfo(BaseModel):
     """Metadata for an available asset file on disk."""
 
@@ -0,0 +1,95 @@
+"""
+Cached pipeline schemas for the pipeline schemas API.
+
+Generating the schemas runs Pydantic's model_json_schema for every registered
+pipeline, yet the result only changes when pipelines are registered or
+removed (plugin install, uninstall and reload). The bundle is therefore built
+once per registry generation, serialized once, and served as bytes with a
+strong ETag so clients can revalidate with If-None-Match.
+"""
+
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from .asset_cache import etag_matches
+from .schema import PipelineSchemasResponse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SchemaBundle:
+    generation: int
+    body: bytes
+    etag: str
+
+
+def build_pipeline_schemas() -> dict:
+    """Return get_schema_with_metadata() for every registered pipeline."""
+    from scope.core.pipelines.registry import PipelineRegistry
+    from scope.core.plugins import get_plugin_manager
+
+    plugin_manager = get_plugin_manager()
+    pipelines: dict = {}
+
+    for pipeline_id in PipelineRegistry.list_pipelines():
+        config_class = PipelineRegistry.get_config_class(pipeline_id)
+        if config_class:
+            # get_schema_with_metadata() includes supported_modes, default_mode,
+            # and mode_defaults directly from the config class
+            schema_data = config_class.get_schema_with_metadata()
+            schema_data["plugin_name"] = plugin_manager.get_plugin_for_pipeline(
+                pipeline_id
+            )
+            pipelines[pipeline_id] = schema_data
+
+    return pipelines
+
+
+class PipelineSchemaCache:
+    """Serialized pipeline schemas, rebuilt when the registry generation changes."""
+
+    def __init__(self):
+        self._bundle: SchemaBundle | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> SchemaBundle:
+        """Return the current bundle, building it if the registry changed."""
+        from scope.core.pipelines.registry import PipelineRegistry
+
+        with self._lock:
+            # Read the generation before building so a registration that
+            # races with the build leaves the bundle stale, not wrongly current
+            generation = PipelineRegistry.generation()
+            if self._bundle is None or self._bundle.generation != generation:
+                self._bundle = self._build(generation)
+            return self._bundle
+
+    def response(self, request: Request) -> Response:
+        """Serve the schemas, or 304 when the client's copy is current."""
+        bundle = self.get()
+        headers = {"ETag": bundle.etag, "Cache-Control": "no-cache"}
+        if etag_matches(request, bundle.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=bundle.body, media_type="application/json", headers=headers
+        )
+
+    @staticmethod
+    def _build(generation: int) -> SchemaBundle:
+        response = PipelineSchemasResponse(pipelines=build_pipeline_schemas())
+        body = response.model_dump_json().encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        logger.debug(
+            f"Built pipeline schemas for registry generation {generation} "
+            f"({len(response.pipelines)} pipelines, {len(body)} bytes)"
+        )
+        return SchemaBundle(generation=generation, body=body, etag=etag)
+
+
+pipeline_schema_cache = PipelineSchemaCache()
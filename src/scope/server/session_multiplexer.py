@@ -0,0 +1,331 @@
+"""
+Share one loaded pipeline between concurrent streaming sessions.
+
+Every WebRTC session builds its own PipelineProcessor, and the processors for a
+pipeline id all call the same loaded instance. Stateful pipelines keep their
+stream on that instance (the PipelineState holding the KV and cross-attention
+caches, first_call, last_mode) and on components such as the VAE and the
+embedding blender, so two sessions calling it directly overwrite each other's
+caches.
+
+The multiplexer gives each session a slot for that state. Calls are gathered:
+whichever worker gets the pipeline runs every chunk queued so far, in arrival
+order, swapping each session's slot in before its chunk. Every waiting session
+is served once per round, and a lone session never swaps anything.
+
+This isolates each session's state; it does not add throughput. Chunks from
+different sessions still run one after another, so a pipeline's frame rate is
+shared between its viewers. Running them as one batched denoise would need
+per-sequence cache indices in the causal attention path, which is left for a
+follow-up.
+
+Sessions can also bookmark their stream under a name and return to it later
+(see stream_bookmarks).
+"""
+
+import copy
+import logging
+import threading
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+import torch
+
+from .stream_bookmarks import StreamBookmark
+
+logger = logging.getLogger(__name__)
+
+# Bookmarks kept per session; the oldest is dropped to make room for a new one
+MAX_BOOKMARKS = 4
+
+
+def _holds_tensor(value: Any) -> bool:
+    if isinstance(value, torch.Tensor):
+        return True
+    if isinstance(value, dict):
+        return any(_holds_tensor(item) for item in value.values())
+    if isinstance(value, list | tuple):
+        return any(_holds_tensor(item) for item in value)
+    return False
+
+
+def _template_copy(value: Any) -> Any:
+    """Deep-copy a stream attribute for new sessions, leaving out its tensors.
+
+    Tensors are what the stream has computed so far, such as the KV caches a
+    pipeline's warmup leaves behind. A new session's first call initializes
+    them again, so copying them would only hold a second set in memory.
+    """
+    values = getattr(value, "values", None)
+    if isinstance(values, dict):
+        kept = {
+            key: copy.deepcopy(item)
+            for key, item in values.items()
+            if not _holds_tensor(item)
+        }
+        return copy.deepcopy(value, {id(values): kept})
+    if _holds_tensor(value):
+        return None
+    return copy.deepcopy(value)
+
+
+@dataclass
+class _PendingCall:
+    session: "PipelineSession"
+    kwargs: dict
+    done: threading.Event = field(default_factory=threading.Event)
+    result: dict | None = None
+    error: Exception | None = None
+
+
+class PipelineSession:
+    """A session's handle on a shared pipeline, called like the pipeline itself."""
+
+    def __init__(self, multiplexer: "SessionMultiplexer", session_id: str | None):
+        self.multiplexer = multiplexer
+        self.session_id = session_id
+        self.closed = False
+        # Saved stream state while another session owns the pipeline.
+        # None means the session has never run and starts from the template.
+        self._attributes: dict[str, Any] | None = None
+        self._components: dict[str, Any] = {}
+        self.bookmarks: OrderedDict[str, StreamBookmark] = OrderedDict()
+
+    def __call__(self, **kwargs) -> dict:
+        return self.multiplexer.submit(self, kwargs)
+
+    def get_state(self, key: str, default: Any = None) -> Any:
+        """Read a value from this session's PipelineState."""
+        return self.multiplexer.get_state(self, key, default)
+
+    def save_bookmark(self, name: str, offload: bool = False) -> StreamBookmark:
+        """Snapshot this session's stream under name."""
+        return self.multiplexer.save_bookmark(self, name, offload)
+
+    def restore_bookmark(self, name: str) -> bool:
+        """Return this session's stream to a bookmark; False if there is none."""
+        return self.multiplexer.restore_bookmark(self, name)
+
+    def delete_bookmark(self, name: str) -> bool:
+        return self.bookmarks.pop(name, None) is not None
+
+    def close(self):
+        """Release this session's slot."""
+        self.multiplexer.close(self)
+
+
+class SessionMultiplexer:
+    """Runs the chunks of several sessions on one pipeline instance."""
+
+    def __init__(self, pipeline: Any):
+        self._pipeline_ref = weakref.ref(pipeline)
+        self._attribute_names = tuple(
+            name
+            for name in getattr(pipeline, "session_state_attributes", ())
+            if hasattr(pipeline, name)
+        )
+        # Taken before any session runs, so later sessions start from the state
+        # the pipeline was constructed with
+        self._template = {
+            name: _template_copy(getattr(pipeline, name))
+            for name in self._attribute_names
+        }
+
+        self._sessions: list[PipelineSession] = []
+        self._active: PipelineSession | None = None
+        self._pending: deque[_PendingCall] = deque()
+        self._pending_lock = threading.Lock()
+        # Held while a round of chunks runs on the pipeline
+        self._run_lock = threading.Lock()
+        # Held while slots are swapped, so state reads never see a half swap
+        self._slot_lock = threading.Lock()
+
+        self.rounds = 0
+        self.switches = 0
+
+    @property
+    def pipeline(self) -> Any:
+        return self._pipeline_ref()
+
+    def open_session(self, session_id: str | None = None) -> PipelineSession:
+        """Create a slot for a new session."""
+        session = PipelineSession(self, session_id)
+        with self._slot_lock:
+            if self._active is None and not self._sessions:
+                # Nobody else is using the pipeline, so the session takes over
+                # its live state and a single stream never pays for swapping
+                self._active = session
+            self._sessions.append(session)
+            count = len(self._sessions)
+        if count > 1:
+            logger.info(
+                f"Sharing {type(self.pipeline).__name__} between {count} sessions"
+            )
+        return session
+
+    def close(self, session: PipelineSession):
+        """Drop a session's slot and any state it saved."""
+        with self._slot_lock:
+            if session.closed:
+                return
+            session.closed = True
+            self._sessions.remove(session)
+            session._attributes = None
+            session._components = {}
+            session.bookmarks.clear()
+            if self._active is session:
+                self._active = None
+
+    def submit(self, session: PipelineSession, kwargs: dict) -> dict:
+        """Run one chunk for session in the next round of waiting chunks."""
+        call = _PendingCall(session, kwargs)
+        with self._pending_lock:
+            self._pending.append(call)
+
+        with self._run_lock:
+            # Another worker may have run this call in its round while we waited
+            if not call.done.is_set():
+                self._run_pending()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def save_bookmark(
+        self, session: PipelineSession, name: str, offload: bool = False
+    ) -> StreamBookmark:
+        """Snapshot session's stream between chunks."""
+        with self._run_lock:
+            self._activate(session)
+            pipeline = self.pipeline
+            bookmark = StreamBookmark.capture(
+                pipeline,
+                self._attribute_names,
+                self._stateful_components(pipeline),
+                offload=offload,
+            )
+
+        session.bookmarks.pop(name, None)
+        session.bookmarks[name] = bookmark
+        while len(session.bookmarks) > MAX_BOOKMARKS:
+            dropped, _ = session.bookmarks.popitem(last=False)
+            logger.info(f"Dropping oldest bookmark '{dropped}'")
+        logger.info(
+            f"Saved bookmark '{name}' ({bookmark.nbytes / 2**20:.1f} MiB"
+            f"{', offloaded' if offload else ''})"
+        )
+        return bookmark
+
+    def restore_bookmark(self, session: PipelineSession, name: str) -> bool:
+        """Copy a bookmark back onto the pipeline as session's stream."""
+        bookmark = session.bookmarks.get(name)
+        if bookmark is None:
+            return False
+        with self._run_lock:
+            self._activate(session)
+            pipeline = self.pipeline
+            with self._slot_lock:
+                bookmark.restore(pipeline, self._stateful_components(pipeline))
+        session.bookmarks.move_to_end(name)
+        logger.info(f"Restored bookmark '{name}'")
+        return True
+
+    def get_state(self, session: PipelineSession, key: str, default: Any = None):
+        with self._slot_lock:
+            if session is self._active:
+                state = getattr(self.pipeline, "state", None)
+            elif session._attributes is not None:
+                state = session._attributes.get("state")
+            else:
+                state = self._template.get("state")
+        return state.get(key, default) if state is not None else default
+
+    def _run_pending(self):
+        with self._pending_lock:
+            calls = list(self._pending)
+            self._pending.clear()
+
+        self.rounds += 1
+        pipeline = self.pipeline
+        for call in calls:
+            try:
+                self._activate(call.session)
+                call.result = pipeline(**call.kwargs)
+            except Exception as e:
+                call.error = e
+            finally:
+                call.done.set()
+
+    def _activate(self, session: PipelineSession):
+        """Swap session's stream state onto the pipeline."""
+        with self._slot_lock:
+            if session.closed:
+                raise RuntimeError("Pipeline session is closed")
+            if session is self._active:
+                return
+
+            pipeline = self.pipeline
+            components = self._stateful_components(pipeline)
+
+            previous = self._active
+            if previous is not None:
+                previous._attributes = {
+                    name: getattr(pipeline, name) for name in self._attribute_names
+                }
+                previous._components = {
+                    name: component.stream_state()
+                    for name, component in components
+                    if hasattr(component, "stream_state")
+                }
+
+            if session._attributes is None:
+                attributes = copy.deepcopy(self._template)
+            else:
+                attributes = session._attributes
+            for name, value in attributes.items():
+                setattr(pipeline, name, value)
+
+            for name, component in components:
+                if hasattr(component, "load_stream_state"):
+                    component.load_stream_state(session._components.get(name))
+                else:
+                    # No way to save this component's stream, so restart it
+                    component.clear_cache()
+
+            # The pipeline now owns these objects
+            session._attributes = None
+            session._components = {}
+            self._active = session
+            self.switches += 1
+
+    @staticmethod
+    def _stateful_components(pipeline: Any) -> list[tuple[str, Any]]:
+        components = getattr(pipeline, "components", None)
+        if components is None or not hasattr(components, "items"):
+            return []
+        return [
+            (name, component)
+            for name, component in components.items()
+            if hasattr(component, "load_stream_state")
+            or hasattr(component, "clear_cache")
+        ]
+
+
+_multiplexers: "weakref.WeakKeyDictionary[Any, SessionMultiplexer]" = (
+    weakref.WeakKeyDictionary()
+)
+_multiplexers_lock = threading.Lock()
+
+
+def open_pipeline_session(
+    pipeline: Any, session_id: str | None = None
+) -> PipelineSession:
+    """Open a session on the multiplexer shared by every user of pipeline."""
+    with _multiplexers_lock:
+        multiplexer = _multiplexers.get(pipeline)
+        if multiplexer is None:
+            multiplexer = SessionMultiplexer(pipeline)
+            _multiplexers[pipeline] = multiplexer
+    return multiplexer.open_session(session_id)
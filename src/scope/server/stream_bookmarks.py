@@ -0,0 +1,187 @@
+"""
+Named snapshots of a stream's generation state.
+
+A bookmark copies everything a session's stream keeps on a pipeline: the
+PipelineState (KV and cross-attention caches, recache and context frame
+buffers, current_start_frame, conditioning), the pipeline's session
+attributes, and the stream state of components such as the VAE and the
+embedding blender. Restoring copies the saved KV and cross-attention caches
+back into their live buffers in place, so jumping back to an earlier scene
+costs a memcpy instead of recomputing the cache or hard cutting with
+init_cache. Other tensors may be shared outside the stream and are replaced
+with fresh copies.
+
+Bookmarks can be spilled to pinned CPU memory to keep them off the GPU; they
+are copied back asynchronously on restore.
+"""
+
+import copy
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+# PipelineState entries whose buffers belong to the stream alone, and are
+# restored by copying into them. Any other tensor may be shared with something
+# outside the stream (a cached blend, a component), so it is replaced instead.
+IN_PLACE_STATE_KEYS = ("kv_cache", "crossattn_cache", "kv_bank")
+
+
+@dataclass
+class _SavedTensor:
+    tensor: torch.Tensor
+    # Where the tensor lived when it was saved, and goes back to on restore
+    device: torch.device
+
+
+@dataclass
+class _SavedState:
+    """Saved values of a PipelineState-like object."""
+
+    values: dict
+
+
+def _save(value: Any, offload: bool) -> Any:
+    if isinstance(value, torch.Tensor):
+        tensor = value.detach()
+        if offload and tensor.device.type != "cpu":
+            saved = torch.empty(
+                tensor.shape,
+                dtype=tensor.dtype,
+                pin_memory=torch.cuda.is_available(),
+            )
+            saved.copy_(tensor, non_blocking=True)
+        else:
+            saved = tensor.clone()
+        return _SavedTensor(saved, tensor.device)
+    if isinstance(value, dict):
+        return {key: _save(item, offload) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return type(value)(_save(item, offload) for item in value)
+    if isinstance(getattr(value, "values", None), dict):
+        return _SavedState(_save(value.values, offload))
+    try:
+        return copy.deepcopy(value)
+    except Exception:
+        # Opaque objects (locks, handles) are shared rather than copied
+        return value
+
+
+def _restore(live: Any, saved: Any, in_place: bool = False) -> Any:
+    """Return saved as a live value.
+
+    With in_place, saved tensors are copied into live's tensors where they
+    fit; otherwise every tensor is a fresh copy.
+    """
+    if isinstance(saved, _SavedTensor):
+        if (
+            in_place
+            and isinstance(live, torch.Tensor)
+            and live.shape == saved.tensor.shape
+            and live.dtype == saved.tensor.dtype
+            and live.device == saved.device
+        ):
+            live.copy_(saved.tensor, non_blocking=True)
+            return live
+        return saved.tensor.to(saved.device, copy=True)
+    if isinstance(saved, dict):
+        live = live if isinstance(live, dict) else {}
+        return {
+            key: _restore(live.get(key), item, in_place) for key, item in saved.items()
+        }
+    if isinstance(saved, list | tuple):
+        if not isinstance(live, list | tuple) or len(live) != len(saved):
+            live = [None] * len(saved)
+        return type(saved)(
+            _restore(live_item, item, in_place)
+            for live_item, item in zip(live, saved, strict=True)
+        )
+    if isinstance(saved, _SavedState):
+        if not isinstance(getattr(live, "values", None), dict):
+            logger.warning("Cannot restore bookmarked pipeline state onto %r", live)
+            return live
+        values = {
+            key: _restore(
+                live.values.get(key), item, in_place=key in IN_PLACE_STATE_KEYS
+            )
+            for key, item in saved.values.items()
+        }
+        live.values.clear()
+        live.values.update(values)
+        return live
+    try:
+        return copy.deepcopy(saved)
+    except Exception:
+        return saved
+
+
+def _nbytes(saved: Any) -> int:
+    if isinstance(saved, _SavedTensor):
+        return saved.tensor.numel() * saved.tensor.element_size()
+    if isinstance(saved, dict):
+        return sum(_nbytes(item) for item in saved.values())
+    if isinstance(saved, list | tuple):
+        return sum(_nbytes(item) for item in saved)
+    if isinstance(saved, _SavedState):
+        return _nbytes(saved.values)
+    return 0
+
+
+class StreamBookmark:
+    """A snapshot of one stream's generation state on a pipeline."""
+
+    def __init__(self, attributes: dict[str, Any], components: dict[str, Any]):
+        self._attributes = attributes
+        self._components = components
+        self.nbytes = _nbytes(attributes) + _nbytes(components)
+
+    @classmethod
+    @torch.no_grad()
+    def capture(
+        cls,
+        pipeline: Any,
+        attribute_names: tuple[str, ...],
+        components: list[tuple[str, Any]],
+        offload: bool = False,
+    ) -> "StreamBookmark":
+        """Snapshot the stream currently loaded on pipeline.
+
+        Args:
+            pipeline: Pipeline whose stream is captured
+            attribute_names: Pipeline attributes holding the stream's state
+            components: (name, component) pairs whose stream_state() is captured
+            offload: Keep the snapshot in pinned CPU memory instead of on the
+                pipeline's device
+        """
+        attributes = {
+            name: _save(getattr(pipeline, name), offload) for name in attribute_names
+        }
+        component_states = {
+            name: _save(component.stream_state(), offload)
+            for name, component in components
+            if hasattr(component, "stream_state")
+        }
+        if offload and torch.cuda.is_available():
+            # Device-to-host copies are asynchronous; finish them before the
+            # live tensors move on
+            torch.cuda.synchronize()
+        return cls(attributes, component_states)
+
+    @torch.no_grad()
+    def restore(self, pipeline: Any, components: list[tuple[str, Any]]):
+        """Copy the snapshot back onto pipeline.
+
+        The KV and cross-attention caches are copied into their live buffers;
+        everything else is replaced with fresh copies.
+        """
+        for name, saved in self._attributes.items():
+            setattr(pipeline, name, _restore(getattr(pipeline, name, None), saved))
+
+        for name, component in components:
+            saved = self._components.get(name)
+            if saved is None or not hasattr(component, "load_stream_state"):
+                continue
+            component.load_stream_state(_restore(component.stream_state(), saved))
@@ -46,6 +46,8 @@ class VideoProcessingTrack(MediaStreamTrack):
         self._paused = False
         self._paused_lock = threading.Lock()
         self._last_frame = None
+        # Callbacks receiving each new output frame as an RGB24 ndarray (H, W, 3)
+        self._frame_callbacks: list[callable] = []
 
         # Server-side input mode - when enabled, frames come from the backend
         # instead of WebRTC (no browser video track needed)
@@ -146,9 +148,9 @@ class VideoProcessingTrack(MediaStreamTrack):
                     # When video is not paused, get the next frame from the frame processor
                     frame_tensor = self.frame_processor.get()
                     if frame_tensor is not None:
-                        frame = VideoFrame.from_ndarray(
-                            frame_tensor.numpy(), format="rgb24"
-                        )
+                        frame_np = frame_tensor.numpy()
+                        frame = VideoFrame.from_ndarray(frame_np, format="rgb24")
+                        self._notify_frame_callbacks(frame_np)
 
                 if frame is not None:
                     pts, time_base = await self.next_timestamp()
@@ -167,6 +169,27 @@ class VideoProcessingTrack(MediaStreamTrack):
 
         raise Exception("Track stopped")
 
+    def add_frame_callback(self, callback: callable):
+        """Register a callback for each new output frame.
+
+        Callbacks run on the event loop and must not block, e.g. hand the
+        frame to a worker queue.
+        """
+        if callback not in self._frame_callbacks:
+            self._frame_callbacks.append(callback)
+
+    def remove_frame_callback(self, callback: callable):
+        """Unregister a callback added with add_frame_callback."""
+        if callback in self._frame_callbacks:
+            self._frame_callbacks.remove(callback)
+
+    def _notify_frame_callbacks(self, frame_np):
+        for callback in self._frame_callbacks:
+            try:
+                callback(frame_np)
+            except Exception as e:
+                logger.error(f"Error in frame callback: {e}")
+
     def pause(self, paused: bool):
         """Pause or resume the video track processing"""
         with self._paused_lock:
@@ -237,7 +237,7 @@ class WebRTCManager:
             )
             session.video_track = video_track
 
-            # Create a MediaRelay to allow multiple consumers (WebRTC and recording)
+            # Create a MediaRelay for the WebRTC consumer
             relay = MediaRelay()
             relayed_track = relay.subscribe(video_track)
 
@@ -251,12 +251,10 @@ class WebRTCManager:
             )
             if recording_enabled:
                 # Create RecordingManager and store it in the session
-                # Pass the original video_track - RecordingManager will subscribe to relay itself
+                # It receives output frames directly from the video track and
+                # encodes them off the event loop
                 recording_manager = RecordingManager(video_track=video_track)
                 session.recording_manager = recording_manager
-
-                # Set the relay on the recording manager so it can create a recording track
-                recording_manager.set_relay(relay)
             else:
                 session.recording_manager = None
 
@@ -344,7 +342,7 @@ class WebRTCManager:
                     try:
                         # Parse the JSON message
                         data = json.loads(message)
-                        logger.info(f"Received parameter update: {data}")
+                        logger.debug(f"Received parameter update: {data}")
 
                         # Check for paused parameter and call pause() method on video track
                         if "paused" in data and session.video_track:
@@ -514,7 +512,7 @@ class WebRTCManager:
                 def on_data_channel_message(message):
                     try:
                         data = json.loads(message)
-                        logger.info(f"[CLOUD] Parameter update: {data}")
+                        logger.debug(f"[CLOUD] Parameter update: {data}")
 
                         # Forward parameters to cloud
                         cloud_track.update_parameters(data)
@@ -0,0 +1,258 @@
+"""Unit tests for the asset index and thumbnail cache."""
+
+import os
+import time
+from fractions import Fraction
+from io import BytesIO
+
+import numpy as np
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from scope.server import asset_cache
+from scope.server.asset_cache import (
+    AssetIndex,
+    ThumbnailCache,
+    conditional_file_response,
+)
+
+
+def _write_image(path, size=(640, 480), color=(255, 0, 0)):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", size, color).save(path)
+    return path
+
+
+def _write_video(path, num_frames=3, size=(96, 64)):
+    import av
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with av.open(str(path), mode="w") as container:
+        stream = container.add_stream("libx264", rate=30)
+        stream.width, stream.height = size
+        stream.pix_fmt = "yuv420p"
+        for i in range(num_frames):
+            frame = av.VideoFrame.from_ndarray(
+                np.full((size[1], size[0], 3), i * 40, dtype=np.uint8), format="rgb24"
+            )
+            frame.pts = i
+            frame.time_base = Fraction(1, 30)
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def settled_mtimes(monkeypatch):
+    """Treat directory mtimes as settled so tests exercise the incremental path."""
+    monkeypatch.setattr(asset_cache, "MTIME_SETTLE_SECONDS", 0.0)
+
+
+class TestAssetIndex:
+    """Tests for AssetIndex."""
+
+    def test_lists_nested_assets_with_metadata(self, tmp_path):
+        """Should list supported files with folder and type."""
+        _write_image(tmp_path / "a.png")
+        _write_image(tmp_path / "refs" / "b.jpg")
+        (tmp_path / "notes.txt").write_text("ignored")
+
+        assets = AssetIndex(tmp_path).list()
+
+        by_name = {a.name: a for a in assets}
+        assert set(by_name) == {"a", "b"}
+        assert by_name["a"].folder is None
+        assert by_name["b"].folder == "refs"
+        assert by_name["b"].type == "image"
+
+    def test_filters_by_type(self, tmp_path):
+        """Should return only assets of the requested type."""
+        _write_image(tmp_path / "a.png")
+        _write_video(tmp_path / "clip.mp4")
+
+        index = AssetIndex(tmp_path)
+
+        assert [a.name for a in index.list("video")] == ["clip"]
+        assert [a.name for a in index.list("image")] == ["a"]
+
+    def test_picks_up_added_and_removed_files(self, tmp_path):
+        """Should notice directory changes between listings."""
+        index = AssetIndex(tmp_path)
+        _write_image(tmp_path / "a.png")
+        assert [a.name for a in index.list()] == ["a"]
+
+        _write_image(tmp_path / "sub" / "b.png")
+        (tmp_path / "a.png").unlink()
+
+        assert [a.name for a in index.list()] == ["b"]
+
+    def test_unchanged_directories_are_not_rescanned(self, tmp_path, monkeypatch):
+        """Should reuse cached entries when directory mtimes are unchanged."""
+        _write_image(tmp_path / "a.png")
+        index = AssetIndex(tmp_path)
+        index.list()
+
+        scanned = []
+        original = index._scan_dir
+        monkeypatch.setattr(
+            index, "_scan_dir", lambda *args: scanned.append(args) or original(*args)
+        )
+        index.list()
+
+        assert scanned == []
+
+    def test_recent_directory_changes_are_rescanned(self, tmp_path, monkeypatch):
+        """Should rescan directories modified within the mtime settle window."""
+        monkeypatch.setattr(asset_cache, "MTIME_SETTLE_SECONDS", 60.0)
+        index = AssetIndex(tmp_path)
+        index.list()
+
+        # Keep the directory mtime identical to the scanned one
+        stat_result = os.stat(tmp_path)
+        _write_image(tmp_path / "a.png")
+        os.utime(tmp_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+
+        assert [a.name for a in index.list()] == ["a"]
+
+    def test_add_updates_overwritten_file(self, tmp_path):
+        """Should refresh metadata for files rewritten in place."""
+        path = _write_image(tmp_path / "a.png", size=(8, 8))
+        index = AssetIndex(tmp_path)
+        index.list()
+
+        path.write_bytes(os.urandom(2 * 1024 * 1024))
+        index.add(path)
+
+        assert index.list()[0].size_mb == 2.0
+
+    def test_skips_symlink_loops(self, tmp_path):
+        """Should not recurse forever through a symlink to a parent."""
+        _write_image(tmp_path / "sub" / "a.png")
+        os.symlink(tmp_path, tmp_path / "sub" / "loop")
+
+        assert [a.name for a in AssetIndex(tmp_path).list()] == ["a"]
+
+
+class TestThumbnailCache:
+    """Tests for ThumbnailCache."""
+
+    def test_image_thumbnail_is_downscaled_webp(self, tmp_path):
+        """Should write a WebP no larger than the requested bucket."""
+        source = _write_image(tmp_path / "assets" / "a.png")
+        cache = ThumbnailCache(tmp_path / "cache")
+
+        thumbnail_path, etag = cache.get(source, 200)
+
+        with Image.open(thumbnail_path) as image:
+            assert image.format == "WEBP"
+            assert image.size == (256, 192)
+        assert etag.endswith('-256"')
+
+    def test_video_poster_frame(self, tmp_path):
+        """Should use the first video frame as the poster."""
+        source = _write_video(tmp_path / "assets" / "clip.mp4")
+        cache = ThumbnailCache(tmp_path / "cache")
+
+        thumbnail_path, _ = cache.get(source, 128)
+
+        with Image.open(thumbnail_path) as image:
+            assert image.size == (96, 64)
+
+    def test_identical_files_share_thumbnail(self, tmp_path):
+        """Should address thumbnails by content, not path."""
+        first = _write_image(tmp_path / "assets" / "a.png")
+        second = tmp_path / "assets" / "copy.png"
+        second.write_bytes(first.read_bytes())
+        cache = ThumbnailCache(tmp_path / "cache")
+
+        assert cache.get(first, 128) == cache.get(second, 128)
+
+    def test_changed_file_gets_new_thumbnail(self, tmp_path):
+        """Should rehash a file once its size or mtime changes."""
+        source = _write_image(tmp_path / "assets" / "a.png")
+        cache = ThumbnailCache(tmp_path / "cache")
+        _, before = cache.get(source, 128)
+
+        time.sleep(0.01)
+        _write_image(source, color=(0, 0, 255))
+
+        _, after = cache.get(source, 128)
+        assert before != after
+
+    def test_warm_generates_all_sizes(self, tmp_path):
+        """Should pre-generate every bucket size."""
+        source = _write_image(tmp_path / "assets" / "a.png")
+        cache = ThumbnailCache(tmp_path / "cache")
+
+        cache.warm(source)
+
+        assert len(list((tmp_path / "cache").rglob("*.webp"))) == len(
+            asset_cache.THUMBNAIL_SIZES
+        )
+
+
+class TestConditionalFileResponse:
+    """Tests for ETag and Range handling."""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        path = tmp_path / "data.bin"
+        path.write_bytes(bytes(range(100)))
+        app = FastAPI()
+
+        @app.get("/file")
+        async def serve(request: Request):
+            return conditional_file_response(
+                request, path, "application/octet-stream", '"abc"'
+            )
+
+        return TestClient(app)
+
+    def test_sets_etag(self, client):
+        """Should return the content with the given ETag."""
+        response = client.get("/file")
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == '"abc"'
+
+    def test_matching_if_none_match_returns_304(self, client):
+        """Should skip the body when the client already has this version."""
+        response = client.get("/file", headers={"If-None-Match": '"x", "abc"'})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_range_request(self, client):
+        """Should serve partial content for Range requests."""
+        response = client.get("/file", headers={"Range": "bytes=10-19"})
+
+        assert response.status_code == 206
+        assert response.content == bytes(range(10, 20))
+
+
+class TestServeAssetThumbnail:
+    """Tests for GET /api/v1/assets/{path}?thumbnail=."""
+
+    def test_serves_thumbnail_and_revalidates(self, tmp_path, monkeypatch):
+        """Should serve a cached WebP and answer revalidation with 304."""
+        monkeypatch.setenv("DAYDREAM_SCOPE_ASSETS_DIR", str(tmp_path / "assets"))
+        monkeypatch.setenv("DAYDREAM_SCOPE_THUMBNAILS_DIR", str(tmp_path / "thumbs"))
+        _write_image(tmp_path / "assets" / "a.png")
+        from scope.server.app import app
+
+        client = TestClient(app)
+        response = client.get("/api/v1/assets/a.png?thumbnail=128")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/webp"
+        assert Image.open(BytesIO(response.content)).size == (128, 96)
+
+        revalidated = client.get(
+            "/api/v1/assets/a.png?thumbnail=128",
+            headers={"If-None-Match": response.headers["etag"]},
+        )
+        assert revalidated.status_code == 304
@@ -0,0 +1,235 @@
+"""Tests for streaming asset uploads and chunked cloud transfer."""
+
+import asyncio
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from scope.server import app as app_module
+from scope.server.cloud_connection import (
+    UPLOAD_CHUNK_HEADER,
+    CloudConnectionManager,
+)
+
+
+class DisconnectedCloud:
+    """Cloud manager stand-in for local mode."""
+
+    is_connected = False
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv("DAYDREAM_SCOPE_ASSETS_DIR", str(tmp_path / "assets"))
+    monkeypatch.setenv("DAYDREAM_SCOPE_THUMBNAILS_DIR", str(tmp_path / "thumbs"))
+    app = app_module.app
+    app.dependency_overrides[app_module.get_cloud_connection_manager] = (
+        DisconnectedCloud
+    )
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+class TestStreamingUpload:
+    """Tests for POST /api/v1/assets in local mode."""
+
+    def test_streams_body_to_assets_dir(self, client, tmp_path):
+        """Should write the streamed body and report its metadata."""
+
+        def body():
+            for _ in range(4):
+                yield b"\0" * (256 * 1024)
+
+        response = client.post("/api/v1/assets?filename=clip.mp4", content=body())
+
+        assert response.status_code == 200
+        assert response.json()["size_mb"] == 1.0
+        assert (tmp_path / "assets" / "clip.mp4").stat().st_size == 1024 * 1024
+
+    def test_rejects_oversized_upload_without_leftovers(
+        self, client, tmp_path, monkeypatch
+    ):
+        """Should stop at the size limit and remove the partial file."""
+        monkeypatch.setattr(app_module, "MAX_ASSET_UPLOAD_BYTES", 1000)
+
+        def body():
+            for _ in range(3):
+                yield b"\0" * 600
+
+        response = client.post("/api/v1/assets?filename=big.png", content=body())
+
+        assert response.status_code == 400
+        assert list((tmp_path / "assets").iterdir()) == []
+
+    def test_rejects_oversized_content_length(self, client, monkeypatch):
+        """Should reject a declared size over the limit before reading."""
+        monkeypatch.setattr(app_module, "MAX_ASSET_UPLOAD_BYTES", 10)
+
+        response = client.post("/api/v1/assets?filename=a.png", content=b"x" * 11)
+
+        assert response.status_code == 400
+
+
+class FakeCloudWebSocket:
+    """WebSocket stand-in emulating the cloud app's upload handling.
+
+    Partial uploads live in cloud, keyed by upload ID, so a new socket on the
+    same cloud can resume them like the runner's PartialUploads store.
+    """
+
+    def __init__(
+        self,
+        manager,
+        cloud=None,
+        drop_chunk_at=None,
+        disconnect_after=None,
+        supports_chunks=True,
+    ):
+        self.manager = manager
+        self.cloud = {} if cloud is None else cloud
+        self.closed = False
+        self.drop_chunk_at = drop_chunk_at
+        self.disconnect_after = disconnect_after
+        self.supports_chunks = supports_chunks
+        self.upload_id = None
+        self.chunk_offsets = []
+        self.messages = []
+
+    @property
+    def received(self):
+        return self.cloud[self.upload_id]["received"]
+
+    async def send_bytes(self, data):
+        if len(self.chunk_offsets) == self.disconnect_after:
+            self.closed = True
+            raise ConnectionResetError("Cannot write to closing transport")
+        raw_id, offset = UPLOAD_CHUNK_HEADER.unpack_from(data)
+        self.chunk_offsets.append(offset)
+        if offset == self.drop_chunk_at:
+            self.drop_chunk_at = None
+            return
+        received = self.cloud[str(uuid.UUID(bytes=raw_id))]["received"]
+        if offset == len(received):
+            received += data[UPLOAD_CHUNK_HEADER.size :]
+
+    async def send_json(self, message):
+        self.messages.append(message)
+        reply = {"request_id": message["request_id"]}
+        if message["type"] == "upload_start":
+            if not self.supports_chunks:
+                reply.update(type="error", error="Unknown message type")
+            else:
+                self.upload_id = str(uuid.UUID(message["upload_id"]))
+                upload = self.cloud.setdefault(
+                    self.upload_id, {"size": message["size"], "received": bytearray()}
+                )
+                reply.update(type="upload_ack", offset=len(upload["received"]))
+        elif message["type"] == "upload_finish":
+            upload = self.cloud[message["upload_id"]]
+            if len(upload["received"]) < upload["size"]:
+                reply.update(type="upload_ack", offset=len(upload["received"]))
+            else:
+                reply.update(type="api_response", status=200, data={"ok": True})
+        else:
+            reply.update(type="api_response", status=200, data={"legacy": True})
+        asyncio.get_running_loop().call_soon(
+            asyncio.ensure_future, self.manager._handle_message(reply)
+        )
+
+
+def _manager_with(ws_factory):
+    manager = CloudConnectionManager()
+    manager.ws = ws_factory(manager)
+    manager._connected = True
+    return manager
+
+
+class TestChunkedCloudUpload:
+    """Tests for CloudConnectionManager.upload_file."""
+
+    def test_sends_sequenced_chunks(self, tmp_path, monkeypatch):
+        """Should send the file as ordered binary chunks."""
+        monkeypatch.setattr("scope.server.cloud_connection.UPLOAD_CHUNK_SIZE", 100)
+        path = tmp_path / "a.bin"
+        path.write_bytes(bytes(range(250)))
+        manager = _manager_with(FakeCloudWebSocket)
+
+        response = asyncio.run(
+            manager.upload_file("/api/v1/assets?filename=a.bin", path, "x/y")
+        )
+
+        assert response["data"] == {"ok": True}
+        assert manager.ws.chunk_offsets == [0, 100, 200]
+        assert bytes(manager.ws.received) == path.read_bytes()
+
+    def test_resumes_from_acknowledged_offset(self, tmp_path, monkeypatch):
+        """Should resend from the offset the cloud reports as missing."""
+        monkeypatch.setattr("scope.server.cloud_connection.UPLOAD_CHUNK_SIZE", 100)
+        path = tmp_path / "a.bin"
+        path.write_bytes(bytes(range(250)))
+        manager = _manager_with(lambda m: FakeCloudWebSocket(m, drop_chunk_at=100))
+
+        response = asyncio.run(manager.upload_file("/p", path, "x/y"))
+
+        assert response["status"] == 200
+        assert manager.ws.chunk_offsets == [0, 100, 200, 100, 200]
+        assert bytes(manager.ws.received) == path.read_bytes()
+
+    def test_falls_back_to_base64(self, tmp_path):
+        """Should use a single base64 request when chunks are unsupported."""
+        path = tmp_path / "a.bin"
+        path.write_bytes(b"hello")
+        manager = _manager_with(lambda m: FakeCloudWebSocket(m, supports_chunks=False))
+
+        response = asyncio.run(manager.upload_file("/p", path, "x/y"))
+
+        assert response["data"] == {"legacy": True}
+        assert manager.ws.messages[-1]["body"]["_base64_content"] == "aGVsbG8="
+
+    def test_resumes_after_reconnect(self, tmp_path, monkeypatch):
+        """Should continue an upload cut off by a disconnect on a new socket."""
+        monkeypatch.setattr("scope.server.cloud_connection.UPLOAD_CHUNK_SIZE", 100)
+        path = tmp_path / "a.bin"
+        path.write_bytes(bytes(range(250)))
+        cloud = {}
+        manager = _manager_with(
+            lambda m: FakeCloudWebSocket(m, cloud=cloud, disconnect_after=2)
+        )
+
+        async def upload_reconnect_and_retry():
+            with pytest.raises(ConnectionResetError):
+                await manager.upload_file("/p", path, "x/y")
+            manager.ws = FakeCloudWebSocket(manager, cloud=cloud)
+            return await manager.upload_file("/p", path, "x/y")
+
+        response = asyncio.run(upload_reconnect_and_retry())
+
+        assert response["status"] == 200
+        assert len(cloud) == 1
+        assert manager.ws.chunk_offsets == [200]
+        assert bytes(manager.ws.received) == path.read_bytes()
+
+    def test_changed_file_starts_new_upload(self, tmp_path, monkeypatch):
+        """Should not resume an interrupted upload once the file changed."""
+        monkeypatch.setattr("scope.server.cloud_connection.UPLOAD_CHUNK_SIZE", 100)
+        path = tmp_path / "a.bin"
+        path.write_bytes(bytes(range(250)))
+        cloud = {}
+        manager = _manager_with(
+            lambda m: FakeCloudWebSocket(m, cloud=cloud, disconnect_after=2)
+        )
+
+        async def upload_reconnect_and_retry():
+            with pytest.raises(ConnectionResetError):
+                await manager.upload_file("/p", path, "x/y")
+            path.write_bytes(bytes(reversed(range(250))))
+            manager.ws = FakeCloudWebSocket(manager, cloud=cloud)
+            return await manager.upload_file("/p", path, "x/y")
+
+        response = asyncio.run(upload_reconnect_and_retry())
+
+        assert response["status"] == 200
+        assert len(cloud) == 2
+        assert manager.ws.chunk_offsets == [0, 100, 200]
+        assert bytes(manager.ws.received) == path.read_bytes()
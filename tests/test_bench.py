@@ -0,0 +1,132 @@
+"""Unit tests for the scope-bench pipeline benchmark harness."""
+
+import pytest
+import torch
+
+from scope.core.pipelines.bloom.pipeline import BloomPipeline
+from scope.core.pipelines.gray.pipeline import GrayPipeline
+from scope.server.bench import (
+    compare_to_baseline,
+    parse_param,
+    parse_resolution,
+    percentile,
+    run_benchmark,
+    synthetic_frames,
+)
+
+
+def _result(p50=10.0, p99=20.0, fps=100.0, peak_memory_mb=500.0):
+    return {
+        "pipelines": ["gray"],
+        "height": 32,
+        "width": 32,
+        "chunk_size": None,
+        "latency_ms": {"p50": p50, "p99": p99, "mean": p50},
+        "fps": fps,
+        "peak_memory_mb": peak_memory_mb,
+        "allocations_per_chunk": None,
+    }
+
+
+class TestRunBenchmark:
+    """Tests for run_benchmark on CPU."""
+
+    def test_single_pipeline_report(self):
+        """Should report latency, fps and memory for one pipeline."""
+        pipeline = GrayPipeline(device=torch.device("cpu"))
+        frames = synthetic_frames(4, 32, 48)
+
+        stats = run_benchmark(
+            [pipeline], frames, iterations=3, warmup=1, device=torch.device("cpu")
+        )
+
+        assert stats["iterations"] == 3
+        assert stats["frames"] > 0
+        assert stats["fps"] > 0
+        assert stats["latency_ms"]["p99"] >= stats["latency_ms"]["p50"] > 0
+        assert stats["allocations_per_chunk"] is None
+
+    def test_chain_passes_frames_downstream(self):
+        """Should feed the output of each stage into the next."""
+        pipelines = [
+            GrayPipeline(device=torch.device("cpu")),
+            BloomPipeline(device=torch.device("cpu")),
+        ]
+        frames = synthetic_frames(4, 32, 32)
+
+        stats = run_benchmark(
+            pipelines,
+            frames,
+            iterations=2,
+            warmup=0,
+            chunk_size=2,
+            device=torch.device("cpu"),
+        )
+
+        assert stats["frames"] == 4
+
+    def test_requires_pipelines(self):
+        """Should reject an empty chain."""
+        with pytest.raises(ValueError):
+            run_benchmark([], synthetic_frames(1, 8, 8))
+
+
+class TestCompareToBaseline:
+    """Tests for compare_to_baseline."""
+
+    def test_no_regression_within_tolerance(self):
+        """Should accept results within the tolerance."""
+        baseline = {"results": [_result()]}
+
+        assert compare_to_baseline([_result(p50=10.5, fps=95.0)], baseline) == []
+
+    def test_flags_slower_latency_and_lower_fps(self):
+        """Should flag higher latency and lower fps beyond the tolerance."""
+        baseline = {"results": [_result()]}
+
+        regressions = compare_to_baseline([_result(p50=15.0, fps=50.0)], baseline)
+
+        assert len(regressions) == 2
+        assert any("p50 latency" in r for r in regressions)
+        assert any("fps" in r for r in regressions)
+
+    def test_flags_memory_growth(self):
+        """Should flag peak memory growth beyond the tolerance."""
+        baseline = {"results": [_result()]}
+
+        regressions = compare_to_baseline([_result(peak_memory_mb=800.0)], baseline)
+
+        assert regressions == [
+            "gray@32x32/chunk=None: peak memory 800.00 vs baseline 500.00"
+        ]
+
+    def test_skips_results_missing_from_baseline(self):
+        """Should ignore results without a matching baseline entry."""
+        baseline = {"results": [{**_result(), "height": 64}]}
+
+        assert compare_to_baseline([_result(p50=100.0)], baseline) == []
+
+
+class TestArgumentParsing:
+    """Tests for the command line argument parsers."""
+
+    def test_parse_resolution(self):
+        """Should parse HEIGHTxWIDTH."""
+        assert parse_resolution("720x1280") == (720, 1280)
+
+    def test_parse_resolution_rejects_invalid(self):
+        """Should reject malformed resolutions."""
+        import argparse
+
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_resolution("720")
+
+    def test_parse_param_decodes_json(self):
+        """Should decode JSON values and keep other values as strings."""
+        assert parse_param("radius=16") == ("radius", 16)
+        assert parse_param("mode=pyramid") == ("mode", "pyramid")
+
+    def test_percentile_interpolates(self):
+        """Should interpolate linearly between samples."""
+        assert percentile([1.0, 2.0, 3.0, 4.0], 50) == pytest.approx(2.5)
+        assert percentile([5.0], 99) == 5.0
@@ -0,0 +1,155 @@
+"""Tests for spatial and temporal embedding blending."""
+
+import pytest
+import torch
+
+from scope.core.pipelines.blending import (
+    EmbeddingBlender,
+    TransitionSchedule,
+    blend_embeddings,
+    slerp,
+)
+
+
+def _reference_slerp(embed1, embed2, t):
+    embed1_norm = embed1 / (embed1.norm(dim=-1, keepdim=True) + 1e-8)
+    embed2_norm = embed2 / (embed2.norm(dim=-1, keepdim=True) + 1e-8)
+    dot = torch.clamp((embed1_norm * embed2_norm).sum(dim=-1, keepdim=True), -1, 1)
+    omega = torch.acos(dot)
+    sin_omega = torch.sin(omega)
+    return (
+        torch.sin((1.0 - t) * omega) / (sin_omega + 1e-8) * embed1
+        + torch.sin(t * omega) / (sin_omega + 1e-8) * embed2
+    )
+
+
+@pytest.fixture
+def embeddings():
+    generator = torch.Generator().manual_seed(0)
+    return [torch.randn(1, 16, 32, generator=generator) for _ in range(3)]
+
+
+class TestBlendEmbeddings:
+    """Tests for blend_embeddings."""
+
+    def test_linear_blend_preserves_weighted_norm(self, embeddings):
+        weights = [1.0, 2.0, 1.0]
+        result = blend_embeddings(embeddings, weights, "linear", torch.float32, "cpu")
+
+        expected = sum(e * w / 4.0 for e, w in zip(embeddings, weights, strict=True))
+        target_norm = sum(
+            e.norm() * w / 4.0 for e, w in zip(embeddings, weights, strict=True)
+        )
+        expected = expected * (target_norm / expected.norm())
+        torch.testing.assert_close(result, expected)
+
+    def test_slerp_blend_uses_second_weight(self, embeddings):
+        a, b = embeddings[:2]
+        result = blend_embeddings([a, b], [3.0, 1.0], "slerp", torch.float32, "cpu")
+
+        torch.testing.assert_close(result, _reference_slerp(a, b, 0.25))
+
+    def test_zero_weights_fall_back_to_equal(self, embeddings):
+        a, b = embeddings[:2]
+        zero = blend_embeddings([a, b], [0.0, 0.0], "linear", torch.float32, "cpu")
+        equal = blend_embeddings([a, b], [1.0, 1.0], "linear", torch.float32, "cpu")
+
+        torch.testing.assert_close(zero, equal)
+
+
+class TestTransitionSchedule:
+    """Tests for TransitionSchedule."""
+
+    @pytest.mark.parametrize("method", ["slerp", "linear"])
+    def test_steps_match_per_step_interpolation(self, embeddings, method):
+        """Steps from the precomputed angle should equal a full slerp per step."""
+        source, target = embeddings[:2]
+        schedule = TransitionSchedule(source, target, 5, method)
+
+        steps = [schedule.pop() for _ in range(5)]
+
+        assert len(schedule) == 0
+        for step, t in zip(steps, torch.linspace(0, 1, 5).tolist(), strict=True):
+            if method == "slerp":
+                expected = _reference_slerp(source, target, t)
+            else:
+                expected = torch.lerp(source, target, t)
+            torch.testing.assert_close(step, expected)
+
+    def test_slerp_matches_reference(self, embeddings):
+        a, b = embeddings[:2]
+
+        torch.testing.assert_close(slerp(a, b, 0.3), _reference_slerp(a, b, 0.3))
+
+
+class TestEmbeddingBlender:
+    """Tests for EmbeddingBlender."""
+
+    def test_transition_yields_each_step_then_idles(self, embeddings):
+        blender = EmbeddingBlender("cpu", torch.float32)
+        source, target = embeddings[:2]
+
+        blender.start_transition(source, target, 4, "slerp")
+        steps = []
+        while blender.is_transitioning():
+            steps.append(blender.get_next_embedding())
+
+        assert len(steps) == 4
+        torch.testing.assert_close(steps[0], source)
+        torch.testing.assert_close(steps[-1], target)
+        assert blender.get_next_embedding() is None
+
+    def test_saved_stream_resumes_at_its_step(self, embeddings):
+        """A restored stream should continue from where it was saved."""
+        blender = EmbeddingBlender("cpu", torch.float32)
+        source, target = embeddings[:2]
+        blender.start_transition(source, target, 4, "linear")
+        blender.get_next_embedding()
+        saved = blender.stream_state()
+
+        blender.get_next_embedding()
+        blender.load_stream_state(saved)
+
+        torch.testing.assert_close(
+            blender.get_next_embedding(), torch.lerp(source, target, 1 / 3)
+        )
+
+    def test_repeated_blend_is_served_from_cache(self, embeddings, monkeypatch):
+        """Blending the same prompts and weights again should not recompute."""
+        blender = EmbeddingBlender("cpu", torch.float32)
+        calls = []
+        monkeypatch.setattr(
+            "scope.core.pipelines.blending.blend_embeddings",
+            lambda *args: calls.append(args) or args[0][0].clone(),
+        )
+
+        first = blender.blend(embeddings, [1, 1, 1], "linear", cache_key="a|b|c")
+        again = blender.blend(embeddings, [1, 1, 1], "linear", cache_key="a|b|c")
+        blender.blend(embeddings, [1, 2, 1], "linear", cache_key="a|b|c")
+        blender.blend(embeddings, [1, 1, 1], "linear")
+
+        torch.testing.assert_close(again, first)
+        assert len(calls) == 3
+
+    def test_cached_blend_is_not_shared_with_callers(self, embeddings):
+        """Writing into a returned blend should not change the cached one."""
+        blender = EmbeddingBlender("cpu", torch.float32)
+        first = blender.blend(embeddings, [1, 1, 1], "linear", cache_key="a|b|c")
+        expected = first.clone()
+
+        first.zero_()
+        again = blender.blend(embeddings, [1, 1, 1], "linear", cache_key="a|b|c")
+        again.fill_(5.0)
+
+        torch.testing.assert_close(
+            blender.blend(embeddings, [1, 1, 1], "linear", cache_key="a|b|c"),
+            expected,
+        )
+
+    def test_blend_cache_is_bounded(self, embeddings):
+        blender = EmbeddingBlender("cpu", torch.float32)
+
+        for index in range(10):
+            blender.blend(embeddings, [1, 1, 1], "linear", cache_key=str(index))
+
+        assert len(blender._blend_cache) == 4
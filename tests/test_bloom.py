@@ -0,0 +1,66 @@
+"""Unit tests for the Bloom pipeline blur modes."""
+
+import pytest
+import torch
+
+from scope.core.pipelines.bloom.pipeline import BloomPipeline
+
+
+@pytest.fixture
+def pipeline():
+    return BloomPipeline(device=torch.device("cpu"))
+
+
+def _frame(h=64, w=96):
+    frame = torch.zeros((1, h, w, 3), dtype=torch.uint8)
+    frame[:, h // 2 - 2 : h // 2 + 2, w // 2 - 2 : w // 2 + 2] = 255
+    return frame
+
+
+class TestPyramidBloom:
+    """Tests for the mip-pyramid bloom mode."""
+
+    def test_output_shape_and_range(self, pipeline):
+        """Should keep the input shape and [0, 1] range."""
+        out = pipeline(video=[_frame()], mode="pyramid", radius=16)["video"]
+
+        assert out.shape == (1, 64, 96, 3)
+        assert out.min() >= 0.0
+        assert out.max() <= 1.0
+
+    def test_spreads_glow_beyond_highlight(self, pipeline):
+        """Should brighten pixels around the highlight."""
+        out = pipeline(video=[_frame()], mode="pyramid", radius=16)["video"]
+
+        assert out[0, 32, 40].sum() > 0.0
+
+    def test_wider_radius_spreads_further(self, pipeline):
+        """Should spread the glow further with a larger radius."""
+        near = pipeline(video=[_frame()], mode="pyramid", radius=2)["video"]
+        far = pipeline(video=[_frame()], mode="pyramid", radius=32)["video"]
+
+        assert far[0, 32, 16].sum() > near[0, 32, 16].sum()
+
+    def test_caches_level_kernels(self, pipeline):
+        """Should reuse the per-level kernels across calls."""
+        pipeline(video=[_frame()], mode="pyramid", radius=48)
+        kernels = dict(pipeline._level_kernels)
+
+        pipeline(video=[_frame()], mode="pyramid", radius=48)
+
+        assert kernels
+        for radius, kernel in pipeline._level_kernels.items():
+            assert kernel is kernels[radius]
+
+    def test_handles_tiny_frames(self, pipeline):
+        """Should stop descending once a level would vanish."""
+        out = pipeline(video=[_frame(h=3, w=3)], mode="pyramid", radius=48)["video"]
+
+        assert out.shape == (1, 3, 3, 3)
+
+    def test_gaussian_mode_is_default(self, pipeline):
+        """Should keep the full-resolution Gaussian blur as the default."""
+        default = pipeline(video=[_frame()], radius=8)["video"]
+        gaussian = pipeline(video=[_frame()], radius=8, mode="gaussian")["video"]
+
+        torch.testing.assert_close(default, gaussian)
@@ -0,0 +1,110 @@
+"""Tests for the plugin distribution index."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+from scope.core.plugins.distribution_index import DistributionIndex
+from scope.core.plugins.manager import PluginManager
+
+
+def make_dist(name, groups=("scope",)):
+    dist = MagicMock()
+    entry_points = []
+    for group in groups:
+        ep = MagicMock()
+        ep.group = group
+        ep.name = f"{name}-{group}"
+        entry_points.append(ep)
+    dist.entry_points = entry_points
+    dist.metadata = {"Name": name, "Version": "1.0.0"}
+    dist._path = None
+    return dist
+
+
+class TestDistributionIndex:
+    """Tests for DistributionIndex."""
+
+    def test_keeps_only_group_distributions(self):
+        """Should index only distributions with entry points in the group."""
+        dists = [make_dist("plugin"), make_dist("torch", groups=("console_scripts",))]
+
+        with patch("importlib.metadata.distributions", return_value=dists):
+            indexed = DistributionIndex("scope").get()
+
+        assert [d.name for d in indexed] == ["plugin"]
+        assert [ep.name for ep in indexed[0].entry_points] == ["plugin-scope"]
+
+    def test_scans_once_until_paths_change(self, tmp_path, monkeypatch):
+        """Should reuse the scan until a sys.path directory changes."""
+        monkeypatch.setattr("sys.path", [str(tmp_path)])
+        index = DistributionIndex("scope")
+
+        with patch(
+            "importlib.metadata.distributions", return_value=[make_dist("a")]
+        ) as distributions:
+            index.get()
+            index.get()
+            assert distributions.call_count == 1
+
+            # Installing a package adds a dist-info directory
+            (tmp_path / "b-1.0.dist-info").mkdir()
+            stat = tmp_path.stat()
+            os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            index.get()
+            assert distributions.call_count == 2
+
+    def test_invalidate_forces_rescan(self):
+        """Should rescan after invalidate()."""
+        index = DistributionIndex("scope")
+
+        with patch(
+            "importlib.metadata.distributions", return_value=[make_dist("a")]
+        ) as distributions:
+            index.get()
+            index.invalidate()
+            index.get()
+
+        assert distributions.call_count == 2
+
+    def test_skips_broken_distributions(self):
+        """Should skip distributions whose metadata cannot be read."""
+        broken = MagicMock()
+        type(broken).entry_points = property(
+            lambda self: (_ for _ in ()).throw(OSError("bad"))
+        )
+
+        with patch(
+            "importlib.metadata.distributions",
+            return_value=[broken, make_dist("ok")],
+        ):
+            indexed = DistributionIndex("scope").get()
+
+        assert [d.name for d in indexed] == ["ok"]
+
+
+class TestPluginManagerUsesIndex:
+    """Tests for PluginManager sharing one scan across operations."""
+
+    def test_load_list_and_mapping_share_one_scan(self):
+        """Should scan installed distributions once for load, mapping and list."""
+        pm = PluginManager()
+        dist = make_dist("plugin")
+        module = MagicMock()
+        dist.entry_points[0].load.return_value = module
+
+        registry = MagicMock()
+        registry.list_pipelines.return_value = []
+
+        with (
+            patch(
+                "importlib.metadata.distributions", return_value=[dist]
+            ) as distributions,
+            patch.object(pm._pm, "load_setuptools_entrypoints"),
+        ):
+            pm.load_plugins()
+            pm.register_plugin_pipelines(registry)
+            plugins = pm._list_plugins_sync()
+            pm._list_plugins_sync()
+
+        assert distributions.call_count == 1
+        assert [p["name"] for p in plugins] == ["plugin"]
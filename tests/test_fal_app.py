@@ -0,0 +1,358 @@
+"""Tests for the fal.ai cloud app's WebSocket proxy helpers."""
+
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("fal")
+
+from starlette.websockets import WebSocketState  # noqa: E402
+
+from scope.cloud import fal_app  # noqa: E402
+from scope.cloud.fal_app import (  # noqa: E402
+    PartialUploads,
+    RouteLatency,
+    ScopeApp,
+    ScopeBackendClient,
+    route_key,
+)
+
+
+def _start(uploads, upload_id="u1", user_id="alice", connection_id="c1", size=10):
+    return uploads.start(
+        upload_id,
+        user_id,
+        connection_id,
+        path="/api/v1/assets?filename=a.bin",
+        content_type="application/octet-stream",
+        size=size,
+    )
+
+
+class TestPartialUploads:
+    """Tests for partial uploads surviving a reconnect."""
+
+    def test_resumes_detached_upload_on_new_connection(self):
+        """Should keep the received bytes and append after a reconnect."""
+        uploads = PartialUploads()
+        upload = _start(uploads)
+        upload["file"].write(b"hello")
+        upload["received"] += 5
+
+        uploads.detach("c1")
+        assert uploads.get("u1", "c1") is None
+
+        resumed = _start(uploads, connection_id="c2")
+        resumed["file"].write(b"world")
+        resumed["received"] += 5
+        resumed["file"].close()
+
+        assert resumed["received"] == 10
+        with open(resumed["temp_path"], "rb") as f:
+            assert f.read() == b"helloworld"
+        uploads.discard("u1")
+
+    def test_rejects_another_users_upload(self):
+        """Should not hand an upload to a different user."""
+        uploads = PartialUploads()
+        _start(uploads)
+        uploads.detach("c1")
+
+        assert _start(uploads, user_id="mallory", connection_id="c2") is None
+        uploads.discard("u1")
+
+    def test_restarts_when_file_differs(self):
+        """Should start from zero when the same ID names another size."""
+        uploads = PartialUploads()
+        upload = _start(uploads)
+        upload["file"].write(b"hello")
+        upload["received"] += 5
+        old_path = upload["temp_path"]
+        uploads.detach("c1")
+
+        restarted = _start(uploads, connection_id="c2", size=20)
+
+        assert restarted["received"] == 0
+        assert not os.path.exists(old_path)
+        uploads.discard("u1")
+
+    def test_expires_detached_uploads(self):
+        """Should delete detached uploads once the TTL has passed."""
+        uploads = PartialUploads(ttl=0)
+        upload = _start(uploads)
+
+        uploads.detach("c1")
+
+        assert len(uploads) == 0
+        assert not os.path.exists(upload["temp_path"])
+
+    def test_late_detach_leaves_resumed_upload_attached(self):
+        """Should not detach an upload another connection has taken over."""
+        uploads = PartialUploads()
+        _start(uploads)
+        _start(uploads, connection_id="c2")
+
+        uploads.detach("c1")
+
+        assert uploads.get("u1", "c2") is not None
+        uploads.discard("u1")
+
+
+class TestRouteMetrics:
+    """Tests for per-route backend latency metrics."""
+
+    def test_route_key_masks_ids(self):
+        """Should drop queries and mask ID segments but keep API versions."""
+        assert (
+            route_key("GET", "/api/v1/recordings/1712345678?download=1")
+            == "GET /api/v1/recordings/{id}"
+        )
+        assert route_key("POST", "/api/v1/pipeline/load") == (
+            "POST /api/v1/pipeline/load"
+        )
+
+    def test_summary_percentiles(self):
+        """Should report counts, errors and latency percentiles in ms."""
+        stats = RouteLatency()
+        for i in range(1, 101):
+            stats.record(i / 1000, ok=i % 10 != 0)
+
+        assert stats.summary() == {
+            "count": 100,
+            "errors": 10,
+            "p50_ms": 51.0,
+            "p95_ms": 96.0,
+            "max_ms": 100.0,
+        }
+
+    def test_empty_summary(self):
+        """Should report zero latency before any request."""
+        assert RouteLatency().summary()["p95_ms"] == 0.0
+
+
+class FakeResponse:
+    """httpx response stand-in echoing the requested path."""
+
+    def __init__(self, path, status_code=200):
+        self.status_code = status_code
+        self.headers = {"content-type": "application/json"}
+        self.path = path
+
+    def json(self):
+        return {"path": self.path}
+
+
+class TestScopeBackendClient:
+    """Tests for the pooled backend client."""
+
+    def test_reuses_client_until_closed(self):
+        """Should share one pooled client and drop it on close."""
+        backend = ScopeBackendClient()
+
+        async def use_and_close():
+            first = backend._get_client()
+            assert backend._get_client() is first
+            await backend.aclose()
+            assert backend._client is None
+            assert first.is_closed
+            second = backend._get_client()
+            await backend.aclose()
+            return first, second
+
+        first, second = asyncio.run(use_and_close())
+
+        assert second is not first
+
+    def test_records_latency_per_route(self):
+        """Should count requests and server errors under the route key."""
+        backend = ScopeBackendClient()
+
+        async def request(method, path, **kwargs):
+            return FakeResponse(path, status_code=503 if "bad" in path else 200)
+
+        backend._client = SimpleNamespace(request=request)
+
+        async def send():
+            await backend.request("GET", "/api/v1/sessions/42")
+            await backend.request("GET", "/api/v1/sessions/42/bad")
+
+        asyncio.run(send())
+        metrics = backend.metrics()
+
+        assert metrics["GET /api/v1/sessions/{id}"]["errors"] == 0
+        assert metrics["GET /api/v1/sessions/{id}/bad"]["errors"] == 1
+
+    def test_caps_tracked_routes(self, monkeypatch):
+        """Should group routes past the limit under "other"."""
+        monkeypatch.setattr(fal_app, "MAX_TRACKED_ROUTES", 1)
+        backend = ScopeBackendClient()
+
+        backend._route("GET /a").record(0.1, ok=True)
+        backend._route("GET /b").record(0.1, ok=True)
+
+        assert set(backend.metrics()) == {"GET /a", "other"}
+
+
+class FakeBackend:
+    """Scope backend whose replies are released by the test, path by path."""
+
+    def __init__(self):
+        self.log = []
+        self.gates = {}
+
+    def gate(self, path):
+        return self.gates.setdefault(path, asyncio.Event())
+
+    async def request(self, method, path, route=None, **kwargs):
+        self.log.append(f"start {method} {path}")
+        await self.gate(path).wait()
+        self.log.append(f"end {method} {path}")
+        return FakeResponse(path)
+
+
+class FakeWebSocket:
+    """Client side of the cloud WebSocket."""
+
+    def __init__(self):
+        self.incoming = asyncio.Queue()
+        self.sent = []
+        self.client_state = WebSocketState.CONNECTED
+        self.application_state = WebSocketState.CONNECTED
+
+    async def accept(self):
+        pass
+
+    async def close(self, code=1000, reason=None):
+        pass
+
+    async def receive(self):
+        return await self.incoming.get()
+
+    async def send_json(self, payload):
+        self.sent.append(payload)
+
+    def send(self, message):
+        self.incoming.put_nowait(
+            {"type": "websocket.receive", "text": json.dumps(message)}
+        )
+
+    def disconnect(self):
+        self.incoming.put_nowait({"type": "websocket.disconnect", "code": 1000})
+
+    def api_replies(self):
+        return [m for m in self.sent if m.get("type") == "api_response"]
+
+
+async def until(condition, timeout=2.0):
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+@pytest.fixture
+def run_handler(monkeypatch):
+    """Run the WebSocket handler against a fake backend while drive() runs."""
+
+    async def allow(user_id):
+        return True, ""
+
+    monkeypatch.setattr(fal_app, "validate_user_access", allow)
+    monkeypatch.setattr(fal_app, "cleanup_session_data", lambda: None)
+    monkeypatch.setattr(fal_app, "kafka_publisher", SimpleNamespace(is_running=False))
+
+    def run(backend, drive):
+        async def main():
+            app = ScopeApp.__new__(ScopeApp)
+            app.scope_client = backend
+            ws = FakeWebSocket()
+            handler = asyncio.create_task(ScopeApp.websocket_handler(app, ws))
+            ws.send({"type": "set_user_id", "user_id": "alice"})
+            await drive(ws)
+            ws.disconnect()
+            await handler
+            return ws
+
+        return asyncio.run(main())
+
+    return run
+
+
+class TestConcurrentDispatch:
+    """Tests for concurrent proxying of API messages."""
+
+    def test_out_of_order_replies_keep_request_ids(self, run_handler):
+        """Should answer each request with its own request_id and data."""
+        backend = FakeBackend()
+
+        async def drive(ws):
+            for request_id, path in (("1", "/a"), ("2", "/b"), ("3", "/c")):
+                ws.send(
+                    {
+                        "type": "api",
+                        "method": "GET",
+                        "path": path,
+                        "request_id": request_id,
+                    }
+                )
+            await until(lambda: len(backend.log) == 3)
+            for path in ("/c", "/b", "/a"):
+                backend.gate(path).set()
+                await until(lambda path=path: f"end GET {path}" in backend.log)
+            await until(lambda: len(ws.api_replies()) == 3)
+
+        ws = run_handler(backend, drive)
+
+        assert [(m["request_id"], m["data"]["path"]) for m in ws.api_replies()] == [
+            ("3", "/c"),
+            ("2", "/b"),
+            ("1", "/a"),
+        ]
+
+    def test_mutations_keep_their_order(self, run_handler):
+        """Should not run a mutation alongside the reads around it."""
+        backend = FakeBackend()
+
+        async def drive(ws):
+            for request_id, method, path in (
+                ("1", "GET", "/a"),
+                ("2", "PATCH", "/b"),
+                ("3", "GET", "/c"),
+            ):
+                ws.send(
+                    {
+                        "type": "api",
+                        "method": method,
+                        "path": path,
+                        "body": {},
+                        "request_id": request_id,
+                    }
+                )
+            await until(lambda: backend.log == ["start GET /a"])
+            await asyncio.sleep(0.05)
+            assert backend.log == ["start GET /a"]
+
+            backend.gate("/a").set()
+            await until(lambda: "start PATCH /b" in backend.log)
+            await asyncio.sleep(0.05)
+            assert "start GET /c" not in backend.log
+
+            backend.gate("/b").set()
+            backend.gate("/c").set()
+            await until(lambda: len(ws.api_replies()) == 3)
+
+        ws = run_handler(backend, drive)
+
+        assert backend.log == [
+            "start GET /a",
+            "end GET /a",
+            "start PATCH /b",
+            "end PATCH /b",
+            "start GET /c",
+            "end GET /c",
+        ]
+        assert [m["request_id"] for m in ws.api_replies()] == ["1", "2", "3"]
@@ -0,0 +1,52 @@
+"""Tests for the optical flow color coding."""
+
+import torch
+from torchvision.utils import flow_to_image
+
+from scope.core.pipelines.optical_flow.flow_image import (
+    make_colorwheel,
+    normalized_flow_to_image,
+)
+
+
+def _unit_flow(seed: int) -> torch.Tensor:
+    """Random flow whose longest vector has length 1."""
+    generator = torch.Generator().manual_seed(seed)
+    flow = torch.randn(2, 2, 16, 24, generator=generator)
+    return flow / flow.square().sum(dim=1).sqrt().max()
+
+
+class TestNormalizedFlowToImage:
+    """Tests for normalized_flow_to_image."""
+
+    def test_matches_torchvision_colors(self):
+        """Should color flow the way torchvision's flow_to_image does."""
+        flow = _unit_flow(0)
+
+        expected = flow_to_image(flow).float() / 255.0
+
+        torch.testing.assert_close(
+            normalized_flow_to_image(flow), expected, atol=1 / 255, rtol=0
+        )
+
+    def test_keeps_the_given_scale(self):
+        """Scaled-down flow should fade toward white instead of being rescaled."""
+        flow = _unit_flow(1)
+
+        full = normalized_flow_to_image(flow)
+        half = normalized_flow_to_image(flow * 0.5)
+
+        assert (half >= full - 1 / 255).all()
+        assert half.mean() > full.mean()
+
+    def test_zero_flow_is_white(self):
+        image = normalized_flow_to_image(torch.zeros(1, 2, 4, 4))
+
+        assert image.eq(1.0).all()
+
+    def test_colorwheel_has_middlebury_hues(self):
+        colorwheel = make_colorwheel()
+
+        assert colorwheel.shape == (55, 3)
+        assert colorwheel[0].tolist() == [255, 0, 0]
+        assert colorwheel.max() == 255
@@ -0,0 +1,208 @@
+"""Tests for the batched Kafka event publisher."""
+
+import asyncio
+import json
+import threading
+
+from scope.server.kafka_publisher import KafkaPublisher
+
+
+class FakeBatch:
+    def __init__(self, max_records: int):
+        self.max_records = max_records
+        self.records: list[tuple[bytes, bytes]] = []
+
+    def append(self, *, key, value, timestamp):
+        if len(self.records) >= self.max_records:
+            return None
+        self.records.append((key, value))
+        return object()
+
+
+class FakeProducer:
+    """In-process stand-in for AIOKafkaProducer's batch API."""
+
+    def __init__(self, max_records_per_batch: int = 1000, fail: bool = False):
+        self.max_records_per_batch = max_records_per_batch
+        self.fail = fail
+        self.started = False
+        self.batches: list[list[dict]] = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def start(self):
+        self.started = True
+
+    async def stop(self):
+        self.started = False
+
+    async def partitions_for(self, topic):
+        return {0, 1}
+
+    def create_batch(self):
+        return FakeBatch(self.max_records_per_batch)
+
+    async def send_batch(self, batch, topic, partition):
+        await self.release.wait()
+        if self.fail:
+            raise ConnectionError("broker unavailable")
+        self.batches.append([json.loads(value) for _, value in batch.records])
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(None)
+        return future
+
+    @property
+    def event_types(self) -> list[str]:
+        return [event["data"]["type"] for batch in self.batches for event in batch]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestKafkaPublisher:
+    """Tests for KafkaPublisher."""
+
+    def test_batches_events_published_together(self):
+        """Should send a burst of events in batch_size produce calls."""
+        producer = FakeProducer()
+
+        async def scenario():
+            publisher = KafkaPublisher(producer=producer, batch_size=10, linger=0.05)
+            assert await publisher.start()
+            for i in range(25):
+                publisher.publish("stream_started", session_id=f"s{i}")
+            await publisher.stop()
+            return publisher
+
+        publisher = run(scenario())
+
+        assert [len(batch) for batch in producer.batches] == [10, 10, 5]
+        sessions = [e["data"]["session_id"] for b in producer.batches for e in b]
+        assert sessions == [f"s{i}" for i in range(25)]
+        assert publisher.stats["sent_events"] == 25
+        assert not producer.started
+
+    def test_event_format(self):
+        """Should keep the stream_trace event structure."""
+        producer = FakeProducer()
+
+        async def scenario():
+            publisher = KafkaPublisher(producer=producer)
+            await publisher.start()
+            publisher.publish(
+                "error", session_id="s", error={"message": "x"}, metadata={"k": 1}
+            )
+            await publisher.stop()
+
+        run(scenario())
+
+        event = producer.batches[0][0]
+        assert event["type"] == "stream_trace"
+        assert event["data"]["type"] == "error"
+        assert event["data"]["client_source"] == "scope"
+        assert event["data"]["error"] == {"message": "x"}
+        assert event["data"]["k"] == 1
+
+    def test_publish_from_worker_threads(self):
+        """Should accept events from other threads without blocking."""
+        producer = FakeProducer()
+
+        async def scenario():
+            publisher = KafkaPublisher(producer=producer, linger=0.01)
+            await publisher.start()
+
+            def publish_many():
+                for _ in range(20):
+                    publisher.publish("stream_heartbeat")
+
+            threads = [threading.Thread(target=publish_many) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            await asyncio.sleep(0.1)
+            await publisher.stop()
+
+        run(scenario())
+
+        assert len(producer.event_types) == 80
+
+    def test_drops_low_priority_events_first(self):
+        """Should evict heartbeats before rejecting lifecycle events."""
+        producer = FakeProducer()
+        producer.release.clear()
+
+        async def scenario():
+            publisher = KafkaPublisher(producer=producer, max_pending=3, linger=0)
+            await publisher.start()
+            # Let the sender pick up the first event and block in send_batch
+            publisher.publish("stream_started")
+            await asyncio.sleep(0.01)
+
+            publisher.publish("stream_heartbeat")
+            publisher.publish("session_created")
+            publisher.publish("stream_heartbeat")
+            publisher.publish("error")
+            publisher.publish("stream_stopped")
+            publisher.publish("session_closed")
+            assert publisher.queue_depth == 3
+            stats = publisher.stats
+
+            producer.release.set()
+            await publisher.stop()
+            return stats
+
+        stats = run(scenario())
+
+        assert stats["dropped_events"] == 3
+        assert stats["dropped_low_priority_events"] == 2
+        assert producer.event_types == [
+            "stream_started",
+            "session_created",
+            "error",
+            "stream_stopped",
+        ]
+
+    def test_splits_batches_at_producer_limit(self):
+        """Should carry events that do not fit into the next produce call."""
+        producer = FakeProducer(max_records_per_batch=4)
+
+        async def scenario():
+            publisher = KafkaPublisher(producer=producer, batch_size=10, linger=0)
+            await publisher.start()
+            for _ in range(10):
+                publisher.publish("stream_started")
+            await publisher.stop()
+
+        run(scenario())
+
+        assert [len(batch) for batch in producer.batches] == [4, 4, 2]
+
+    def test_counts_failed_sends(self):
+        """Should count events whose produce call failed."""
+        producer = FakeProducer(fail=True)
+
+        async def scenario():
+            publisher = KafkaPublisher(producer=producer, linger=0)
+            await publisher.start()
+            publisher.publish("stream_started")
+            publisher.publish("stream_stopped")
+            await publisher.stop()
+            return publisher.stats
+
+        stats = run(scenario())
+
+        assert stats["failed_events"] == 2
+        assert stats["sent_events"] == 0
+
+    def test_not_started_without_configuration(self, monkeypatch):
+        """Should stay disabled when no brokers are configured."""
+        monkeypatch.setattr(
+            "scope.server.kafka_publisher.KAFKA_BOOTSTRAP_SERVERS", None
+        )
+        publisher = KafkaPublisher()
+
+        assert not run(publisher.start())
+        publisher.publish("stream_started")
+        assert publisher.queue_depth == 0
@@ -0,0 +1,186 @@
+"""Tests for incremental log retrieval and live tailing."""
+
+import logging
+from logging.handlers import RotatingFileHandler
+
+import pytest
+from fastapi.testclient import TestClient
+
+from scope.server.log_tail import (
+    LogFollower,
+    align_to_line,
+    parse_range_header,
+    resolve_log_start,
+)
+from scope.server.logs_config import LOGS_DIR_ENV_VAR
+
+
+class TestParseRangeHeader:
+    """Tests for parse_range_header."""
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("bytes=0-9", (0, 10)),
+            ("bytes=90-", (90, 100)),
+            ("bytes=-10", (90, 100)),
+            ("bytes=95-200", (95, 100)),
+        ],
+    )
+    def test_valid_ranges(self, header, expected):
+        """Should convert inclusive ranges to [start, end)."""
+        assert parse_range_header(header, 100) == expected
+
+    @pytest.mark.parametrize(
+        "header", ["bytes=100-", "bytes=0-1,5-6", "items=0-1", "bytes=5", "bytes=-0"]
+    )
+    def test_rejects_invalid_ranges(self, header):
+        """Should reject unsatisfiable, multi-part and malformed ranges."""
+        with pytest.raises(ValueError):
+            parse_range_header(header, 100)
+
+
+class TestResolveLogStart:
+    """Tests for resolve_log_start and align_to_line."""
+
+    def test_since_offset_resets_after_rotation(self):
+        """Should restart from 0 when the file shrank below the offset."""
+        assert resolve_log_start(50, since_offset=40) == 40
+        assert resolve_log_start(50, since_offset=60) == 0
+
+    def test_tail_bytes(self):
+        """Should start tail_bytes before the end."""
+        assert resolve_log_start(50, tail_bytes=20) == 30
+        assert resolve_log_start(50, tail_bytes=80) == 0
+
+    def test_align_to_line(self, tmp_path):
+        """Should skip the partial line at the tail start."""
+        path = tmp_path / "a.log"
+        path.write_bytes(b"first line\nsecond line\n")
+
+        assert align_to_line(path, 3, 23) == 11
+        assert align_to_line(path, 11, 23) == 11
+        assert align_to_line(path, 0, 23) == 0
+
+
+class TestLogFollower:
+    """Tests for LogFollower."""
+
+    def test_returns_complete_lines_only(self, tmp_path):
+        """Should hold back a trailing partial line until it is finished."""
+        path = tmp_path / "a.log"
+        path.write_bytes(b"one\ntw")
+        follower = LogFollower(path)
+
+        assert follower.read_lines() == ["one"]
+        assert follower.line_offset == 4
+
+        with open(path, "ab") as f:
+            f.write(b"o\nthree\n")
+        assert follower.read_lines() == ["two", "three"]
+        assert follower.line_offset == path.stat().st_size
+
+    def test_follows_rotating_file_handler(self, tmp_path):
+        """Should read the rest of the rotated file, then the new file."""
+        path = tmp_path / "scope.log"
+        handler = RotatingFileHandler(path, maxBytes=200, backupCount=2)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger = logging.getLogger("test_log_tail.rotation")
+        logger.propagate = False
+        logger.addHandler(handler)
+        try:
+            follower = LogFollower(path)
+            logger.warning("line 0")
+            lines = follower.read_lines()
+
+            for i in range(1, 40):
+                logger.warning(f"line {i}")
+            lines += follower.read_lines()
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+        assert follower.rotations == 1
+        assert lines[0] == "line 0"
+        # Everything written before the single rollover plus the new file
+        assert lines == [f"line {i}" for i in range(len(lines))]
+        assert lines[-1] == "line 39"
+
+    def test_truncation_restarts_from_zero(self, tmp_path):
+        """Should start over when the file is truncated in place."""
+        path = tmp_path / "a.log"
+        path.write_bytes(b"old line one\nold line two\n")
+        follower = LogFollower(path)
+        follower.read_lines()
+
+        path.write_bytes(b"new\n")
+
+        assert follower.read_lines() == ["new"]
+
+
+@pytest.fixture
+def log_client(tmp_path, monkeypatch):
+    logs_dir = tmp_path / "logs"
+    logs_dir.mkdir()
+    monkeypatch.setenv(LOGS_DIR_ENV_VAR, str(logs_dir))
+    log_path = logs_dir / "scope-logs-2099-01-01-00-00-00.log"
+    log_path.write_bytes(b"".join(f"line {i}\n".encode() for i in range(100)))
+
+    from scope.server.app import app
+
+    return TestClient(app), log_path
+
+
+class TestLogsEndpoint:
+    """Tests for GET /api/v1/logs/current."""
+
+    def test_full_download(self, log_client):
+        """Should stream the whole file as an attachment."""
+        client, log_path = log_client
+
+        response = client.get("/api/v1/logs/current")
+
+        assert response.status_code == 200
+        assert response.content == log_path.read_bytes()
+        assert "attachment" in response.headers["content-disposition"]
+        assert response.headers["x-log-size"] == str(log_path.stat().st_size)
+
+    def test_tail_starts_on_line(self, log_client):
+        """Should return only whole lines from the end of the file."""
+        client, _ = log_client
+
+        response = client.get("/api/v1/logs/current?tail_bytes=20")
+
+        assert response.text == "line 98\nline 99\n"
+        assert "content-disposition" not in response.headers
+
+    def test_since_offset_continues(self, log_client):
+        """Should return only what was appended since the last fetch."""
+        client, log_path = log_client
+        size = client.get("/api/v1/logs/current").headers["x-log-size"]
+        with open(log_path, "ab") as f:
+            f.write(b"appended\n")
+
+        response = client.get(f"/api/v1/logs/current?since_offset={size}")
+
+        assert response.text == "appended\n"
+        assert response.headers["x-log-offset"] == size
+
+    def test_range_request(self, log_client):
+        """Should answer Range requests with 206 and Content-Range."""
+        client, log_path = log_client
+        size = log_path.stat().st_size
+
+        response = client.get("/api/v1/logs/current", headers={"Range": "bytes=0-6"})
+
+        assert response.status_code == 206
+        assert response.text == "line 0\n"
+        assert response.headers["content-range"] == f"bytes 0-6/{size}"
+
+    def test_unsatisfiable_range(self, log_client):
+        """Should answer 416 for ranges past the end of the file."""
+        client, log_path = log_client
+
+        response = client.get("/api/v1/logs/current", headers={"Range": "bytes=99999-"})
+
+        assert response.status_code == 416
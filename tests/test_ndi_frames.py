@@ -0,0 +1,181 @@
+"""Tests for NDI frame views, pixel conversion and the NDI receive path."""
+
+import numpy as np
+import pytest
+import torch
+
+from scope.core.inputs.ndi import NDIInputSource
+from scope.core.ndi import (
+    NDI_FOURCC_BGRA,
+    NDI_FOURCC_RGBX,
+    NDI_FOURCC_UYVY,
+    NDI_FRAME_TYPE_VIDEO,
+    copy_rgb,
+    frame_view,
+    uyvy_to_rgb,
+)
+
+
+def _padded_buffer(pixels: np.ndarray, padding: int) -> np.ndarray:
+    """Lay out (H, W, C) pixels with padding bytes after every row."""
+    height = pixels.shape[0]
+    row = pixels.reshape(height, -1)
+    buffer = np.full((height, row.shape[1] + padding), 0xEE, dtype=np.uint8)
+    buffer[:, : row.shape[1]] = row
+    return buffer
+
+
+def _random_pixels(height, width, channels=4, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, (height, width, channels), dtype=np.uint8)
+
+
+class TestFrameView:
+    """Tests for frame_view."""
+
+    def test_padded_stride_is_viewed_without_copy(self):
+        """Should expose the pixels of a padded buffer, skipping the padding."""
+        pixels = _random_pixels(4, 6)
+        buffer = _padded_buffer(pixels, padding=8)
+
+        view = frame_view(buffer.ctypes.data, 4, 6, buffer.strides[0], NDI_FOURCC_RGBX)
+
+        assert view.shape == (4, 6, 4)
+        np.testing.assert_array_equal(view, pixels)
+        assert not view.flags.writeable
+        buffer[1, 0] = 7
+        assert view[1, 0, 0] == 7
+
+    def test_uyvy_has_two_pixels_per_macropixel(self):
+        """UYVY views should be (H, W // 2, 4)."""
+        buffer = np.zeros((2, 8 * 2 + 4), dtype=np.uint8)
+
+        view = frame_view(buffer.ctypes.data, 2, 8, buffer.strides[0], NDI_FOURCC_UYVY)
+
+        assert view.shape == (2, 4, 4)
+
+    def test_rejects_unknown_fourcc(self):
+        """Should raise ValueError for formats it cannot view."""
+        buffer = np.zeros(16, dtype=np.uint8)
+
+        with pytest.raises(ValueError):
+            frame_view(buffer.ctypes.data, 1, 4, 16, 0x12345678)
+
+
+class TestCopyRgb:
+    """Tests for copy_rgb."""
+
+    def test_bgra_is_swizzled_and_alpha_dropped(self):
+        """Should reorder BGRA to RGB in the output."""
+        pixels = _random_pixels(3, 5)
+        buffer = _padded_buffer(pixels, padding=12)
+        view = frame_view(buffer.ctypes.data, 3, 5, buffer.strides[0], NDI_FOURCC_BGRA)
+
+        rgb = copy_rgb(view, NDI_FOURCC_BGRA)
+
+        np.testing.assert_array_equal(rgb, pixels[:, :, [2, 1, 0]])
+        assert rgb.flags.c_contiguous
+
+    def test_reuses_matching_output_buffer(self):
+        """Should write into out when the shape matches and allocate otherwise."""
+        pixels = _random_pixels(3, 5)
+        out = np.zeros((3, 5, 3), dtype=np.uint8)
+
+        assert copy_rgb(pixels, NDI_FOURCC_RGBX, out) is out
+        np.testing.assert_array_equal(out, pixels[:, :, :3])
+
+        wrong_shape = np.zeros((2, 2, 3), dtype=np.uint8)
+        assert copy_rgb(pixels, NDI_FOURCC_RGBX, wrong_shape) is not wrong_shape
+
+
+class TestUyvyToRgb:
+    """Tests for uyvy_to_rgb."""
+
+    def test_limited_range_extremes(self):
+        """Video black and white should map to 0 and 255."""
+        # U Y0 V Y1: one black and one white pixel with neutral chroma
+        packed = torch.tensor([[[128, 16, 128, 235]]], dtype=torch.uint8)
+
+        rgb = uyvy_to_rgb(packed)
+
+        assert rgb.shape == (1, 2, 3)
+        assert rgb.dtype == torch.uint8
+        assert rgb[0, 0].tolist() == [0, 0, 0]
+        assert rgb[0, 1].tolist() == [255, 255, 255]
+
+    def test_chroma_is_shared_by_pixel_pairs(self):
+        """Strong red chroma should give red pixels for both Y samples."""
+        packed = torch.tensor([[[102, 63, 240, 63]]], dtype=torch.uint8)
+
+        rgb = uyvy_to_rgb(packed)
+
+        for pixel in rgb[0].tolist():
+            red, green, blue = pixel
+            assert red > 200 and green < 30 and blue < 30
+
+
+class _FakeNDILib:
+    """Hands out one padded video frame per capture call."""
+
+    def __init__(self, buffer: np.ndarray, width: int, height: int, fourcc: int):
+        self.buffer = buffer
+        self.width = width
+        self.height = height
+        self.fourcc = fourcc
+        self.freed = 0
+
+    def NDIlib_recv_capture_v2(self, recv, video_ref, audio_ref, meta_ref, timeout):
+        frame = video_ref._obj
+        frame.xres = self.width
+        frame.yres = self.height
+        frame.FourCC = self.fourcc
+        frame.line_stride_in_bytes = self.buffer.strides[0]
+        frame.p_data = self.buffer.ctypes.data
+        return NDI_FRAME_TYPE_VIDEO
+
+    def NDIlib_recv_free_video_v2(self, recv, video_ref):
+        self.freed += 1
+
+
+def _source(lib: _FakeNDILib) -> NDIInputSource:
+    source = NDIInputSource.__new__(NDIInputSource)
+    source._lib = lib
+    source._recv_instance = object()
+    return source
+
+
+class TestNDIReceiveFrame:
+    """Tests for NDIInputSource.receive_frame."""
+
+    def test_padded_bgra_frame(self):
+        """Should return RGB for a padded BGRA frame and free it."""
+        pixels = _random_pixels(4, 6)
+        lib = _FakeNDILib(_padded_buffer(pixels, padding=16), 6, 4, NDI_FOURCC_BGRA)
+        source = _source(lib)
+
+        rgb = source.receive_frame()
+
+        np.testing.assert_array_equal(rgb, pixels[:, :, [2, 1, 0]])
+        assert lib.freed == 1
+
+    def test_writes_into_caller_buffer(self):
+        """Should fill the caller's buffer across frames."""
+        pixels = _random_pixels(4, 6)
+        lib = _FakeNDILib(_padded_buffer(pixels, padding=0), 6, 4, NDI_FOURCC_RGBX)
+        source = _source(lib)
+        out = np.zeros((4, 6, 3), dtype=np.uint8)
+
+        assert source.receive_frame(out=out) is out
+        assert source.receive_frame(out=out) is out
+        np.testing.assert_array_equal(out, pixels[:, :, :3])
+
+    def test_uyvy_frame_is_converted(self):
+        """UYVY frames should come back as RGB on the CPU path too."""
+        packed = np.tile(np.array([128, 235, 128, 235], dtype=np.uint8), (2, 2, 1))
+        lib = _FakeNDILib(_padded_buffer(packed, padding=4), 4, 2, NDI_FOURCC_UYVY)
+        source = _source(lib)
+
+        rgb = source.receive_frame()
+
+        assert rgb.shape == (2, 4, 3)
+        assert (rgb == 255).all()
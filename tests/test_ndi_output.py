@@ -0,0 +1,169 @@
+"""Tests for the asynchronous, double-buffered NDI output sink."""
+
+import ctypes
+from fractions import Fraction
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import torch
+
+from scope.core.ndi import NDI_FOURCC_RGBA
+from scope.core.outputs.ndi import NDIOutputSink, frame_rate_fraction
+
+
+class FakeNDISendLib:
+    """Records async sends, snapshotting each frame's pixels as the SDK sees them."""
+
+    def __init__(self):
+        self.sent: list[dict] = []
+        self.flushes = 0
+        self.destroyed = False
+
+    def NDIlib_initialize(self):
+        return True
+
+    def NDIlib_send_create(self, create_ref):
+        return 1234
+
+    def NDIlib_send_destroy(self, instance):
+        self.destroyed = True
+
+    def NDIlib_send_send_video_async_v2(self, instance, video_ref):
+        if video_ref is None:
+            self.flushes += 1
+            return
+        frame = video_ref._obj
+        size = frame.yres * frame.line_stride_in_bytes
+        pixels = np.ctypeslib.as_array(
+            (ctypes.c_uint8 * size).from_address(frame.p_data)
+        ).reshape(frame.yres, frame.xres, 4)
+        self.sent.append(
+            {
+                "address": frame.p_data,
+                "fourcc": frame.FourCC,
+                "rate": Fraction(frame.frame_rate_N, frame.frame_rate_D),
+                "pixels": pixels.copy(),
+            }
+        )
+
+
+@pytest.fixture
+def sink_and_lib():
+    lib = FakeNDISendLib()
+    with (
+        patch("scope.core.outputs.ndi.load_library", return_value=lib),
+        patch("scope.core.outputs.ndi.setup_send_functions"),
+    ):
+        sink = NDIOutputSink()
+        assert sink.create("test", 8, 4)
+        yield sink, lib
+        sink.close()
+
+
+def _frame(value, height=4, width=8, channels=3):
+    return np.full((height, width, channels), value, dtype=np.uint8)
+
+
+class TestNDIOutputSink:
+    """Tests for NDIOutputSink."""
+
+    def test_rotates_preallocated_buffers(self, sink_and_lib):
+        """Consecutive frames should alternate between two fixed buffers."""
+        sink, lib = sink_and_lib
+
+        for value in (10, 20, 30, 40):
+            assert sink.send_frame(_frame(value))
+
+        addresses = [sent["address"] for sent in lib.sent]
+        assert addresses[0] != addresses[1]
+        assert addresses[0] == addresses[2]
+        assert addresses[1] == addresses[3]
+
+    def test_rgb_is_padded_with_opaque_alpha(self, sink_and_lib):
+        """RGB frames should be sent as RGBA with alpha 255."""
+        sink, lib = sink_and_lib
+        frame = np.random.default_rng(0).integers(0, 256, (4, 8, 3), dtype=np.uint8)
+
+        sink.send_frame(frame)
+
+        sent = lib.sent[0]
+        assert sent["fourcc"] == NDI_FOURCC_RGBA
+        np.testing.assert_array_equal(sent["pixels"][:, :, :3], frame)
+        assert (sent["pixels"][:, :, 3] == 255).all()
+
+    def test_float_tensor_and_grayscale_frames(self, sink_and_lib):
+        """Float tensors are scaled to uint8 and grayscale is expanded to RGB."""
+        sink, lib = sink_and_lib
+
+        sink.send_frame(torch.full((4, 8, 3), 1.0))
+        sink.send_frame(_frame(77, channels=1))
+
+        assert (lib.sent[0]["pixels"][:, :, :3] == 255).all()
+        assert (lib.sent[1]["pixels"][:, :, :3] == 77).all()
+        assert (lib.sent[1]["pixels"][:, :, 3] == 255).all()
+
+    def test_frame_rate_follows_producer(self, sink_and_lib):
+        """Frames should advertise the most recently reported frame rate."""
+        sink, lib = sink_and_lib
+
+        sink.send_frame(_frame(0))
+        sink.set_frame_rate(12.5)
+        sink.send_frame(_frame(0))
+
+        assert lib.sent[0]["rate"] == Fraction(30000, 1001)
+        assert lib.sent[1]["rate"] == Fraction(25, 2)
+        assert sink.get_stats()["frame_rate"] == 12.5
+
+    def test_size_change_flushes_before_reallocating(self, sink_and_lib):
+        """A new frame size should wait for in-flight buffers before replacing them."""
+        sink, lib = sink_and_lib
+        sink.send_frame(_frame(1))
+        flushes = lib.flushes
+
+        sink.send_frame(_frame(2, height=6, width=10))
+
+        assert lib.flushes == flushes + 1
+        assert lib.sent[-1]["pixels"].shape == (6, 10, 4)
+
+    def test_close_flushes_then_destroys(self, sink_and_lib):
+        """Closing should release the last async frame before destroying."""
+        sink, lib = sink_and_lib
+        sink.send_frame(_frame(1))
+        flushes = lib.flushes
+
+        sink.close()
+
+        assert lib.flushes == flushes + 1
+        assert lib.destroyed
+        assert sink.send_frame(_frame(1)) is False
+
+    def test_stats_count_sends_and_errors(self, sink_and_lib):
+        """Stats should report sent frames, errors and send latency."""
+        sink, lib = sink_and_lib
+
+        sink.send_frame(_frame(1))
+        sink.send_frame(_frame(2))
+        assert sink.send_frame(np.zeros((4, 8, 3, 2), dtype=np.uint8)) is False
+
+        stats = sink.get_stats()
+        assert stats["frames_sent"] == 2
+        assert stats["send_errors"] == 1
+        assert stats["max_send_ms"] >= stats["avg_send_ms"] > 0
+
+
+class TestFrameRateFraction:
+    """Tests for frame_rate_fraction."""
+
+    @pytest.mark.parametrize(
+        ("fps", "expected"),
+        [
+            (29.97, Fraction(30000, 1001)),
+            (59.94, Fraction(60000, 1001)),
+            (30.0, Fraction(30)),
+            (12.341, Fraction(1234, 100)),
+            (0.0, Fraction(30000, 1001)),
+        ],
+    )
+    def test_fractions(self, fps, expected):
+        assert frame_rate_fraction(fps) == expected
@@ -0,0 +1,82 @@
+"""Unit tests for the streaming control-map normalizer."""
+
+import pytest
+import torch
+
+from scope.core.pipelines.normalization import StreamingNormalizer
+
+
+class TestStreamingNormalizer:
+    """Tests for StreamingNormalizer."""
+
+    def test_first_chunk_uses_chunk_range(self):
+        """Should normalize the first chunk by its own min/max."""
+        normalizer = StreamingNormalizer(momentum=0.1)
+        x = torch.tensor([2.0, 4.0, 6.0])
+
+        result = normalizer(x)
+
+        torch.testing.assert_close(result, torch.tensor([0.0, 0.5, 1.0]))
+
+    def test_smooths_range_across_chunks(self):
+        """Should blend the new chunk's range into the running estimate."""
+        normalizer = StreamingNormalizer(momentum=0.25)
+        normalizer(torch.tensor([0.0, 1.0]))
+
+        low, high = normalizer.update(torch.tensor([0.0, 5.0]))
+
+        assert low.item() == pytest.approx(0.0)
+        assert high.item() == pytest.approx(2.0)
+
+    def test_momentum_one_matches_per_chunk_normalization(self):
+        """Should reproduce plain per-chunk min/max normalization."""
+        normalizer = StreamingNormalizer(momentum=1.0)
+        normalizer(torch.rand(8))
+        x = torch.rand(4, 3) * 10
+
+        result = normalizer(x)
+
+        expected = (x - x.min()) / (x.max() - x.min())
+        torch.testing.assert_close(result, expected)
+
+    def test_reset_reseeds_statistics(self):
+        """Should start from the next chunk's range after reset."""
+        normalizer = StreamingNormalizer(momentum=0.1)
+        normalizer(torch.tensor([0.0, 100.0]))
+
+        normalizer.reset()
+        result = normalizer(torch.tensor([0.0, 1.0]))
+
+        torch.testing.assert_close(result, torch.tensor([0.0, 1.0]))
+
+    def test_constant_input_maps_to_zero(self):
+        """Should map a constant chunk to zeros instead of dividing by zero."""
+        normalizer = StreamingNormalizer()
+
+        result = normalizer(torch.full((2, 2), 3.0))
+
+        torch.testing.assert_close(result, torch.zeros(2, 2))
+
+    def test_percentiles_ignore_outliers(self):
+        """Should use the requested percentiles instead of min/max."""
+        normalizer = StreamingNormalizer(momentum=1.0, percentiles=(0.0, 90.0))
+        x = torch.cat([torch.linspace(0.0, 1.0, 99), torch.tensor([1000.0])])
+
+        low, high = normalizer.update(x)
+
+        assert low.item() == pytest.approx(0.0)
+        assert high.item() < 2.0
+
+    def test_statistics_stay_on_device(self):
+        """Should keep statistics as tensors rather than Python floats."""
+        normalizer = StreamingNormalizer()
+        normalizer(torch.rand(4))
+
+        assert isinstance(normalizer.low, torch.Tensor)
+        assert isinstance(normalizer.high, torch.Tensor)
+
+    @pytest.mark.parametrize("momentum", [0.0, -0.5, 1.5])
+    def test_rejects_invalid_momentum(self, momentum):
+        """Should reject momentum outside (0, 1]."""
+        with pytest.raises(ValueError):
+            StreamingNormalizer(momentum=momentum)
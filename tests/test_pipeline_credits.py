@@ -0,0 +1,193 @@
+"""Tests for credit-based flow control between chained pipeline processors."""
+
+import queue
+import threading
+import time
+
+import torch
+
+from scope.core.pipelines.interface import Requirements
+from scope.server.pipeline_credits import InputCredits
+from scope.server.pipeline_processor import PipelineProcessor
+
+
+class VideoPipeline:
+    """Video pipeline that returns its input after an optional delay."""
+
+    def __init__(self, chunk_size: int = 4, delay: float = 0.0):
+        self.chunk_size = chunk_size
+        self.delay = delay
+        self.calls = 0
+        self.frames = 0
+        self.on_call = None
+
+    def prepare(self, **kwargs):
+        return Requirements(input_size=self.chunk_size)
+
+    def __call__(self, **kwargs):
+        self.calls += 1
+        self.frames += len(kwargs["video"])
+        if self.on_call is not None:
+            self.on_call()
+        if self.delay:
+            time.sleep(self.delay)
+        return {"video": torch.cat(kwargs["video"]).float() / 255.0}
+
+
+def _frame():
+    return torch.zeros(1, 8, 8, 3, dtype=torch.uint8)
+
+
+class TestInputCredits:
+    """Tests for InputCredits."""
+
+    def test_credits_are_free_capacity_in_chunks(self):
+        """A partly filled chunk should use up a whole credit."""
+        q = queue.Queue()
+        credits = InputCredits(q.qsize, capacity_chunks=2, chunk_size=4)
+
+        assert credits.available() == 2
+        q.put(_frame())
+        assert credits.available() == 1
+        for _ in range(4):
+            q.put(_frame())
+        assert credits.available() == 0
+        assert credits.capacity_frames == 8
+
+    def test_wait_times_out_without_credits(self):
+        q = queue.Queue()
+        q.put(_frame())
+        credits = InputCredits(q.qsize, capacity_chunks=1)
+
+        assert credits.wait(0) is False
+        assert credits.wait(0.01) is False
+
+    def test_consumer_wakes_waiting_producer(self):
+        """Taking a chunk should release a producer blocked on credits."""
+        q = queue.Queue()
+        q.put(_frame())
+        credits = InputCredits(q.qsize, capacity_chunks=1)
+        woke = threading.Event()
+
+        def produce():
+            if credits.wait(5):
+                woke.set()
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        time.sleep(0.02)
+        assert not woke.is_set()
+
+        q.get_nowait()
+        credits.consumed()
+        thread.join(timeout=5)
+
+        assert woke.is_set()
+
+    def test_close_releases_waiters(self):
+        q = queue.Queue()
+        q.put(_frame())
+        credits = InputCredits(q.qsize, capacity_chunks=1)
+
+        credits.close()
+
+        assert credits.wait(5) is True
+
+
+class TestChainedBackpressure:
+    """Tests for credits between PipelineProcessor stages."""
+
+    def test_upstream_waits_for_downstream_credits(self):
+        """Upstream should not run while the next stage's input is full."""
+        first = PipelineProcessor(VideoPipeline(chunk_size=2), "first", realtime=False)
+        second = PipelineProcessor(
+            VideoPipeline(chunk_size=4), "second", realtime=False
+        )
+        first.set_next_processor(second)
+        for _ in range(8):
+            first.input_queue.put_nowait(_frame())
+
+        ran = []
+        for _ in range(4):
+            ran.append(first.process_chunk())
+
+        # Two credits of four frames: the third chunk would overfill them
+        assert ran == [True, True, True, False]
+        assert second.input_queue.qsize() == 6
+
+        assert second.process_chunk()
+        assert first.process_chunk()
+
+        first.stop()
+        second.stop()
+
+    def test_fast_upstream_keeps_downstream_backlog_bounded(self):
+        """A fast stage feeding a slow one should never queue past its credits."""
+        upstream = VideoPipeline(chunk_size=2)
+        downstream = VideoPipeline(chunk_size=2, delay=0.02)
+        first = PipelineProcessor(upstream, "first")
+        second = PipelineProcessor(downstream, "second")
+        first.set_next_processor(second)
+        second.output_queue = queue.Queue(maxsize=1000)
+        backlog = []
+        downstream.on_call = lambda: backlog.append(second.input_queue.qsize())
+
+        stop = threading.Event()
+
+        def feed():
+            while not stop.is_set():
+                try:
+                    first.input_queue.put_nowait(_frame())
+                except queue.Full:
+                    time.sleep(0.001)
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        feeder.start()
+        first.start()
+        second.start()
+        time.sleep(0.5)
+        stop.set()
+        first.stop()
+        second.stop()
+        feeder.join(timeout=5)
+
+        # Upstream only runs while the backlog leaves room for its two frames,
+        # so the queue never holds more than the two credited chunks
+        assert downstream.calls > 5
+        assert max(backlog) <= 4
+
+    def test_downstream_consumes_every_upstream_frame(self):
+        """A realtime stage fed by a credited upstream should not sample frames away."""
+        upstream = VideoPipeline(chunk_size=2)
+        downstream = VideoPipeline(chunk_size=4, delay=0.02)
+        first = PipelineProcessor(upstream, "first")
+        second = PipelineProcessor(downstream, "second")
+        first.set_next_processor(second)
+        second.output_queue = queue.Queue(maxsize=1000)
+
+        stop = threading.Event()
+
+        def feed():
+            while not stop.is_set():
+                try:
+                    first.input_queue.put_nowait(_frame())
+                except queue.Full:
+                    time.sleep(0.001)
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        feeder.start()
+        first.start()
+        second.start()
+        time.sleep(0.5)
+        stop.set()
+        feeder.join(timeout=5)
+        # Let both stages run out of whole chunks before counting
+        time.sleep(0.2)
+        queued = second.input_queue.qsize()
+        first.stop()
+        second.stop()
+
+        # Whatever upstream computed was consumed, bar a partial last chunk
+        assert downstream.frames > 20
+        assert queued < 4
+        assert upstream.frames == downstream.frames + queued
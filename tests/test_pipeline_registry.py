@@ -1,6 +1,8 @@
 """Unit tests for PipelineRegistry unregister and is_registered methods."""
 
-from unittest.mock import MagicMock
+import sys
+import types
+from unittest.mock import MagicMock, patch
 
 
 class TestPipelineRegistryUnregister:
@@ -71,3 +73,95 @@ class TestPipelineRegistryIsRegistered:
         from scope.core.pipelines.registry import PipelineRegistry
 
         assert PipelineRegistry.is_registered("unknown-pipeline-xyz") is False
+
+
+class TestPipelineRegistryLazy:
+    """Tests for pipelines registered from the manifest without importing them."""
+
+    def _entry(self, module_name: str):
+        from scope.core.pipelines.registry import PipelineManifestEntry
+
+        return PipelineManifestEntry(
+            name="lazy-test",
+            schema_module=".lazy_test_schema",
+            config_class="LazyTestConfig",
+            pipeline_module=f".{module_name}",
+            pipeline_class="LazyTestPipeline",
+        )
+
+    def test_config_class_served_without_import(self):
+        """Should return the config class without importing the pipeline module."""
+        from scope.core.pipelines.registry import PipelineRegistry
+
+        module_name = "lazy_test_not_imported"
+        config_class = MagicMock()
+        PipelineRegistry.register_lazy(
+            "test-lazy-1", self._entry(module_name), config_class
+        )
+        try:
+            assert PipelineRegistry.is_registered("test-lazy-1")
+            assert "test-lazy-1" in PipelineRegistry.list_pipelines()
+            assert PipelineRegistry.get_config_class("test-lazy-1") is config_class
+            assert PipelineRegistry.is_loaded("test-lazy-1") is False
+            assert f"scope.core.pipelines.{module_name}" not in sys.modules
+        finally:
+            PipelineRegistry.unregister("test-lazy-1")
+
+    def test_get_imports_on_first_use(self):
+        """Should import the module on get and keep the pipeline's list position."""
+        from scope.core.pipelines.registry import PipelineRegistry
+
+        module_name = "lazy_test_module"
+        module = types.ModuleType(f"scope.core.pipelines.{module_name}")
+        pipeline_class = MagicMock()
+        module.LazyTestPipeline = pipeline_class
+        PipelineRegistry.register_lazy(
+            "test-lazy-2", self._entry(module_name), MagicMock()
+        )
+        PipelineRegistry.register("test-lazy-2-after", MagicMock())
+        try:
+            with patch.dict(sys.modules, {module.__name__: module}):
+                assert PipelineRegistry.get("test-lazy-2") is pipeline_class
+            assert PipelineRegistry.is_loaded("test-lazy-2") is True
+            # Served from the cached class afterwards
+            assert PipelineRegistry.get("test-lazy-2") is pipeline_class
+            ids = PipelineRegistry.list_pipelines()
+            assert ids.index("test-lazy-2") < ids.index("test-lazy-2-after")
+        finally:
+            PipelineRegistry.unregister("test-lazy-2")
+            PipelineRegistry.unregister("test-lazy-2-after")
+
+    def test_failed_import_unregisters(self):
+        """Should drop a pipeline whose module cannot be imported."""
+        from scope.core.pipelines.registry import PipelineRegistry
+
+        PipelineRegistry.register_lazy(
+            "test-lazy-3", self._entry("lazy_test_missing_module"), MagicMock()
+        )
+
+        assert PipelineRegistry.get("test-lazy-3") is None
+        assert PipelineRegistry.is_registered("test-lazy-3") is False
+
+    def test_manifest_matches_pipeline_classes(self):
+        """Manifest config classes should be the ones the pipelines report."""
+        from scope.core.pipelines.registry import PipelineRegistry
+
+        config_class = PipelineRegistry.get_config_class("passthrough")
+        assert config_class is not None
+        assert config_class.pipeline_id == "passthrough"
+
+        pipeline_class = PipelineRegistry.get("passthrough")
+        assert pipeline_class.get_config_class() is config_class
+        assert PipelineRegistry.get_config_class("passthrough") is config_class
+
+    def test_manifest_config_classes_import(self):
+        """Every manifest entry should name an importable config class."""
+        import importlib
+
+        from scope.core.pipelines import registry
+
+        for entry in registry.BUILTIN_PIPELINE_MANIFEST:
+            module = importlib.import_module(
+                entry.schema_module, package=registry.__package__
+            )
+            assert hasattr(module, entry.config_class), entry.name
@@ -0,0 +1,187 @@
+"""Tests for cached, concurrent plugin update checks."""
+
+import asyncio
+import io
+import json
+import threading
+import time
+import urllib.error
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scope.core.plugins.manager import PluginManager
+from scope.core.plugins.update_cache import (
+    UPDATE_CHECK_TTL_SECONDS,
+    PyPIRelease,
+    UpdateCache,
+    UpdateCheckEntry,
+    fetch_pypi_release,
+)
+
+
+@pytest.fixture(autouse=True)
+def plugins_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("DAYDREAM_SCOPE_PLUGINS_DIR", str(tmp_path))
+    return tmp_path
+
+
+def pypi_plugin(name="pypi-plugin", version="1.0.0"):
+    return {"name": name, "version": version, "source": "pypi", "package_spec": name}
+
+
+def pypi_response(version, etag='"abc"'):
+    response = MagicMock()
+    response.read.return_value = json.dumps({"info": {"version": version}}).encode()
+    response.headers = {"ETag": etag, "Last-Modified": "Mon, 01 Jan 2024 00:00:00"}
+    response.__enter__ = lambda s: s
+    response.__exit__ = MagicMock(return_value=False)
+    return response
+
+
+class TestFetchPyPIRelease:
+    """Tests for fetch_pypi_release."""
+
+    def test_returns_version_and_validators(self):
+        """Should return the latest version with the response's ETag."""
+        with patch("urllib.request.urlopen", return_value=pypi_response("2.0.0")):
+            release = fetch_pypi_release("pypi-plugin")
+
+        assert release.version == "2.0.0"
+        assert release.etag == '"abc"'
+
+    def test_revalidates_with_cached_validators(self):
+        """Should send conditional headers and reuse the cached version on 304."""
+        cached = UpdateCheckEntry(
+            latest_version="2.0.0",
+            update_available=True,
+            checked_at=0,
+            pypi_version="2.0.0",
+            etag='"abc"',
+            last_modified="Mon, 01 Jan 2024 00:00:00",
+        )
+        not_modified = urllib.error.HTTPError(
+            "https://pypi.org", 304, "Not Modified", {}, io.BytesIO()
+        )
+
+        with patch("urllib.request.urlopen", side_effect=not_modified) as urlopen:
+            release = fetch_pypi_release("pypi-plugin", cached)
+
+        request = urlopen.call_args.args[0]
+        assert request.get_header("If-none-match") == '"abc"'
+        assert request.get_header("If-modified-since") == cached.last_modified
+        assert release == PyPIRelease("2.0.0", '"abc"', cached.last_modified)
+
+
+class TestUpdateCache:
+    """Tests for UpdateCache."""
+
+    def test_persists_between_instances(self):
+        """Should read entries written by an earlier process."""
+        entry = UpdateCheckEntry("2.0.0", True, time.time())
+        UpdateCache().put(pypi_plugin(), entry)
+
+        assert UpdateCache().get(pypi_plugin()) == entry
+
+    def test_keyed_by_installed_version(self):
+        """Should miss once a different version is installed."""
+        cache = UpdateCache()
+        cache.put(pypi_plugin(), UpdateCheckEntry("2.0.0", True, time.time()))
+
+        assert cache.get(pypi_plugin(version="2.0.0")) is None
+
+    def test_invalidate_normalizes_name(self):
+        """Should drop entries regardless of -/_ spelling."""
+        cache = UpdateCache()
+        cache.put(pypi_plugin("my_plugin"), UpdateCheckEntry(None, False, 0))
+
+        cache.invalidate("My-Plugin")
+
+        assert UpdateCache().get(pypi_plugin("my_plugin")) is None
+
+    def test_freshness(self):
+        """Should go stale after the TTL."""
+        now = time.time()
+        assert UpdateCheckEntry(None, False, now).is_fresh(now)
+        assert not UpdateCheckEntry(None, False, now).is_fresh(
+            now + UPDATE_CHECK_TTL_SECONDS
+        )
+
+
+class TestPluginUpdateChecks:
+    """Tests for PluginManager update checking."""
+
+    def test_checks_run_concurrently(self):
+        """Should not wait for one plugin's check before starting the next."""
+        pm = PluginManager()
+        plugins = [pypi_plugin(f"plugin-{i}") for i in range(3)]
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch(name, cached=None):
+            # Only returns if all three checks are in flight at once
+            barrier.wait()
+            return PyPIRelease("1.0.0", None, None)
+
+        with patch("scope.core.plugins.manager.fetch_pypi_release", side_effect=fetch):
+            results = pm._check_plugin_updates(plugins)
+
+        assert all(entry.update_available is False for entry in results.values())
+
+    def test_newer_release_is_resolved_once(self):
+        """Should run the constraint-aware compile only for a new release."""
+        pm = PluginManager()
+        release = PyPIRelease("2.0.0", '"abc"', None)
+
+        with (
+            patch(
+                "scope.core.plugins.manager.fetch_pypi_release", return_value=release
+            ),
+            patch.object(
+                pm,
+                "_check_plugin_update",
+                return_value={"latest_version": "1.5.0", "update_available": True},
+            ) as compile_check,
+        ):
+            first = pm._check_single_update(pypi_plugin())
+            second = pm._check_single_update(pypi_plugin())
+
+        assert compile_check.call_count == 1
+        assert first.latest_version == second.latest_version == "1.5.0"
+
+    def test_failed_checks_are_not_cached(self):
+        """Should retry failed checks next time rather than cache the failure."""
+        pm = PluginManager()
+
+        with patch(
+            "scope.core.plugins.manager.fetch_pypi_release",
+            side_effect=OSError("offline"),
+        ):
+            assert pm._check_single_update(pypi_plugin()) is None
+
+        assert pm._update_cache.get(pypi_plugin()) is None
+
+    def test_list_serves_cache_and_refreshes_in_background(self):
+        """Should return cached info immediately and refresh stale entries."""
+        pm = PluginManager()
+        stale = UpdateCheckEntry("2.0.0", True, time.time() - UPDATE_CHECK_TTL_SECONDS)
+        pm._update_cache.put(pypi_plugin(), stale)
+        checked = threading.Event()
+
+        def fetch(name, cached=None):
+            checked.set()
+            return PyPIRelease("1.0.0", None, None)
+
+        with (
+            patch.object(
+                pm,
+                "_list_plugins_sync",
+                return_value=[{**pypi_plugin(), "latest_version": "2.0.0"}],
+            ),
+            patch("scope.core.plugins.manager.fetch_pypi_release", side_effect=fetch),
+        ):
+            plugins = asyncio.run(pm.list_plugins_async())
+            assert plugins[0]["latest_version"] == "2.0.0"
+            assert checked.wait(timeout=5)
+            pm._update_refresh_thread.join(timeout=5)
+
+        assert pm._update_cache.get(pypi_plugin()).update_available is False
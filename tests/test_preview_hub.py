@@ -0,0 +1,149 @@
+"""Unit tests for the shared input-source preview hub."""
+
+import asyncio
+import threading
+
+import numpy as np
+
+from scope.core.inputs.interface import InputSource
+from scope.server.preview_hub import PreviewHub, encode_preview_jpeg
+
+
+class FakeSource(InputSource):
+    """Input source producing solid frames and counting receivers."""
+
+    source_id = "fake"
+    source_name = "Fake"
+    source_description = "Fake source for tests"
+
+    instances = 0
+    closed = 0
+    connect_result = True
+    lock = threading.Lock()
+
+    def __init__(self):
+        with FakeSource.lock:
+            FakeSource.instances += 1
+
+    def list_sources(self, timeout_ms=5000):
+        return []
+
+    def connect(self, identifier):
+        return FakeSource.connect_result
+
+    def receive_frame(self, timeout_ms=100):
+        return np.full((48, 640, 3), 128, dtype=np.uint8)
+
+    def disconnect(self):
+        pass
+
+    def close(self):
+        with FakeSource.lock:
+            FakeSource.closed += 1
+
+
+def _reset_fake(connect_result=True):
+    FakeSource.instances = 0
+    FakeSource.closed = 0
+    FakeSource.connect_result = connect_result
+
+
+async def _wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+class TestPreviewHub:
+    """Tests for PreviewHub."""
+
+    def test_subscribers_share_one_receiver(self):
+        """Should open a single receiver for clients of the same preview."""
+        _reset_fake()
+
+        async def run():
+            hub = PreviewHub()
+            first = hub.subscribe("fake", FakeSource, "cam", 30, 320)
+            second = hub.subscribe("fake", FakeSource, "cam", 30, 320)
+
+            jpegs = await asyncio.wait_for(
+                asyncio.gather(anext(first), anext(second)), timeout=2.0
+            )
+
+            assert hub.active_streams == 1
+            assert FakeSource.instances == 1
+            assert jpegs[0] == jpegs[1]
+            assert jpegs[0][:2] == b"\xff\xd8"
+
+            hub.unsubscribe(first)
+            hub.unsubscribe(second)
+
+        asyncio.run(run())
+
+    def test_last_unsubscribe_closes_receiver(self):
+        """Should stop the stream only once every subscriber has left."""
+        _reset_fake()
+
+        async def run():
+            hub = PreviewHub()
+            first = hub.subscribe("fake", FakeSource, "cam", 30, 320)
+            second = hub.subscribe("fake", FakeSource, "cam", 30, 320)
+            await asyncio.wait_for(anext(first), timeout=2.0)
+
+            hub.unsubscribe(first)
+            assert hub.active_streams == 1
+
+            hub.unsubscribe(second)
+            assert hub.active_streams == 0
+            await _wait_for(lambda: FakeSource.closed == 1)
+
+        asyncio.run(run())
+
+    def test_different_settings_use_separate_streams(self):
+        """Should key streams by fps and max width."""
+        _reset_fake()
+
+        async def run():
+            hub = PreviewHub()
+            subscriptions = [
+                hub.subscribe("fake", FakeSource, "cam", 30, 320),
+                hub.subscribe("fake", FakeSource, "cam", 15, 320),
+                hub.subscribe("fake", FakeSource, "cam", 30, 160),
+            ]
+
+            assert hub.active_streams == 3
+            hub.stop_all()
+            for subscription in subscriptions:
+                hub.unsubscribe(subscription)
+
+        asyncio.run(run())
+
+    def test_connect_failure_ends_subscription(self):
+        """Should end iteration when the source cannot be connected."""
+        _reset_fake(connect_result=False)
+
+        async def run():
+            hub = PreviewHub()
+            subscription = hub.subscribe("fake", FakeSource, "missing", 30, 320)
+
+            jpegs = [jpeg async for jpeg in subscription]
+
+            assert jpegs == []
+            hub.unsubscribe(subscription)
+
+        asyncio.run(run())
+
+
+class TestEncodePreviewJpeg:
+    """Tests for encode_preview_jpeg."""
+
+    def test_downscales_wide_frames(self):
+        """Should limit the preview width while keeping the aspect ratio."""
+        from io import BytesIO
+
+        from PIL import Image
+
+        jpeg = encode_preview_jpeg(np.zeros((100, 640, 3), dtype=np.uint8), 320)
+
+        assert Image.open(BytesIO(jpeg)).size == (320, 50)
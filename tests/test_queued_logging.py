@@ -0,0 +1,107 @@
+"""Tests for queued, rate-limited logging."""
+
+import logging
+import queue
+
+import pytest
+
+from scope.server.logs_config import (
+    DroppingQueueHandler,
+    RateLimitFilter,
+    start_queued_logging,
+    stop_queued_logging,
+)
+
+
+def make_record(msg, level=logging.WARNING, name="scope.test", args=None):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+class TestRateLimitFilter:
+    """Tests for RateLimitFilter."""
+
+    def test_suppresses_repeats_and_reports_count(self, monkeypatch):
+        """Should pass one record per interval and count the rest."""
+        now = [100.0]
+        monkeypatch.setattr("scope.server.logs_config.time.monotonic", lambda: now[0])
+        rate_limit = RateLimitFilter(interval=5.0)
+
+        assert rate_limit.filter(make_record("queue full, dropping frame"))
+        assert not rate_limit.filter(make_record("queue full, dropping frame"))
+        assert not rate_limit.filter(make_record("queue full, dropping frame"))
+
+        now[0] += 5.0
+        record = make_record("queue full, dropping frame")
+        assert rate_limit.filter(record)
+        assert record.getMessage() == (
+            "queue full, dropping frame (suppressed 2 similar message(s))"
+        )
+
+    def test_keys_on_logger_and_message(self):
+        """Should limit each logger and message independently."""
+        rate_limit = RateLimitFilter(interval=60.0)
+
+        assert rate_limit.filter(make_record("a", name="scope.one"))
+        assert rate_limit.filter(make_record("a", name="scope.two"))
+        assert rate_limit.filter(make_record("b", name="scope.one"))
+        assert not rate_limit.filter(make_record("a", name="scope.one"))
+
+    def test_never_suppresses_errors(self):
+        """Should always pass ERROR and above."""
+        rate_limit = RateLimitFilter(interval=60.0)
+
+        for _ in range(3):
+            assert rate_limit.filter(make_record("boom", level=logging.ERROR))
+
+
+class TestDroppingQueueHandler:
+    """Tests for DroppingQueueHandler."""
+
+    def test_drops_when_full_without_blocking(self):
+        """Should count dropped records and report them once there is room."""
+        log_queue = queue.Queue(maxsize=2)
+        handler = DroppingQueueHandler(log_queue)
+
+        for i in range(5):
+            handler.handle(make_record(f"record {i}"))
+        assert handler.dropped == 3
+
+        log_queue.get_nowait()
+        log_queue.get_nowait()
+        handler.handle(make_record("after"))
+
+        messages = [log_queue.get_nowait().getMessage() for _ in range(2)]
+        assert messages == [
+            "Logging queue full, dropped 3 log record(s)",
+            "after",
+        ]
+
+
+class TestStartQueuedLogging:
+    """Tests for start_queued_logging."""
+
+    @pytest.fixture
+    def target(self):
+        target = logging.getLogger("scope.test.queued")
+        target.propagate = False
+        yield target
+        stop_queued_logging()
+        for handler in list(target.handlers):
+            target.removeHandler(handler)
+
+    def test_moves_handlers_behind_queue(self, target, tmp_path):
+        """Should deliver records to the original handlers from a thread."""
+        log_path = tmp_path / "queued.log"
+        file_handler = logging.FileHandler(log_path)
+        file_handler.setLevel(logging.INFO)
+        target.addHandler(file_handler)
+        target.setLevel(logging.DEBUG)
+
+        queue_handler = start_queued_logging(target)
+        assert target.handlers == [queue_handler]
+
+        target.debug("below handler level")
+        target.info("hello")
+        stop_queued_logging()
+
+        assert log_path.read_text() == "hello\n"
@@ -0,0 +1,200 @@
+"""Unit tests for the fragmented MP4 recording encoder and downloads."""
+
+import asyncio
+import os
+import time
+
+import av
+import numpy as np
+
+from scope.server.recording import (
+    FragmentedMP4Encoder,
+    RecordingManager,
+    read_complete_fragments_size,
+)
+
+
+class FakeTrack:
+    """Stand-in for VideoProcessingTrack exposing frame callbacks."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def add_frame_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def remove_frame_callback(self, callback):
+        self.callbacks.remove(callback)
+
+    def emit(self, frame_np):
+        for callback in self.callbacks:
+            callback(frame_np)
+
+
+def _frame(value, h=64, w=96):
+    return np.full((h, w, 3), value, dtype=np.uint8)
+
+
+def _feed(encoder_or_track, count, interval=1.0 / 30):
+    put = getattr(encoder_or_track, "put", None) or encoder_or_track.emit
+    for i in range(count):
+        put(_frame(i * 8 % 256))
+        time.sleep(interval)
+
+
+def _count_frames(path):
+    with av.open(str(path)) as container:
+        return sum(1 for _ in container.decode(video=0))
+
+
+class TestReadCompleteFragmentsSize:
+    """Tests for read_complete_fragments_size."""
+
+    def _box(self, box_type, payload=b""):
+        return (8 + len(payload)).to_bytes(4, "big") + box_type + payload
+
+    def test_stops_at_last_complete_mdat(self, tmp_path):
+        """Should include only complete fragments after the init segment."""
+        data = (
+            self._box(b"ftyp", b"isom")
+            + self._box(b"moov", b"x" * 16)
+            + self._box(b"moof", b"y" * 8)
+            + self._box(b"mdat", b"z" * 32)
+        )
+        partial = self._box(b"moof", b"y" * 8) + (100).to_bytes(4, "big") + b"mdat"
+        path = tmp_path / "rec.mp4"
+        path.write_bytes(data + partial)
+
+        assert read_complete_fragments_size(path) == len(data)
+
+    def test_returns_zero_without_fragments(self, tmp_path):
+        """Should report nothing playable before the first fragment."""
+        path = tmp_path / "rec.mp4"
+        path.write_bytes(self._box(b"ftyp", b"isom") + self._box(b"moov"))
+
+        assert read_complete_fragments_size(path) == 0
+
+
+class TestFragmentedMP4Encoder:
+    """Tests for FragmentedMP4Encoder."""
+
+    def test_encodes_playable_file(self, tmp_path):
+        """Should produce a decodable MP4 with the queued frames."""
+        path = tmp_path / "rec.mp4"
+        encoder = FragmentedMP4Encoder(str(path))
+        encoder.start()
+        _feed(encoder, 10)
+        encoder.stop()
+
+        assert encoder.frames_encoded == 10
+        assert _count_frames(path) == 10
+
+    def test_rate_limits_frames(self, tmp_path):
+        """Should drop frames arriving faster than the max fps."""
+        encoder = FragmentedMP4Encoder(str(tmp_path / "rec.mp4"), max_fps=10)
+        encoder.start()
+
+        assert encoder.put(_frame(0))
+        assert not encoder.put(_frame(1))
+        encoder.stop()
+
+    def test_flush_fragment_makes_frames_readable(self, tmp_path):
+        """Should write a fragment boundary on request while still encoding."""
+        path = tmp_path / "rec.mp4"
+        encoder = FragmentedMP4Encoder(str(path))
+        encoder.start()
+        _feed(encoder, 5)
+
+        encoder._keyframe_requested.set()
+        encoder._fragment_flushed.clear()
+        _feed(encoder, 1)
+        assert encoder._fragment_flushed.wait(2.0)
+
+        assert read_complete_fragments_size(path) > 0
+        encoder.stop()
+
+    def test_stops_at_max_length(self, tmp_path):
+        """Should stop encoding once the max length is reached."""
+        encoder = FragmentedMP4Encoder(
+            str(tmp_path / "rec.mp4"), max_length_seconds=0.1
+        )
+        encoder.start()
+        _feed(encoder, 10)
+        encoder.stop()
+
+        assert encoder.max_length_reached
+        assert encoder.frames_encoded < 10
+
+    def test_resizes_frames_after_resolution_change(self, tmp_path):
+        """Should keep encoding at the first resolution when frames change size."""
+        path = tmp_path / "rec.mp4"
+        encoder = FragmentedMP4Encoder(str(path))
+        encoder.start()
+        encoder.put(_frame(0, h=64, w=96))
+        time.sleep(1.0 / 30)
+        encoder.put(_frame(0, h=32, w=48))
+        encoder.stop()
+
+        with av.open(str(path)) as container:
+            frames = list(container.decode(video=0))
+        assert len(frames) == 2
+        assert all((f.height, f.width) == (64, 96) for f in frames)
+
+
+class TestRecordingManager:
+    """Tests for RecordingManager downloads."""
+
+    def test_download_does_not_interrupt_recording(self, tmp_path):
+        """Should serve a playable download while the recording continues."""
+
+        async def run():
+            track = FakeTrack()
+            manager = RecordingManager(track)
+            await manager.start_recording()
+            recording_file = manager.recording_file
+
+            _feed(track, 8)
+            task = asyncio.create_task(manager.create_download())
+            await asyncio.sleep(0)
+            # The download waits for the next frame to close the fragment
+            await asyncio.to_thread(_feed, track, 2)
+            download = await task
+
+            assert manager.is_recording_started
+            assert manager.recording_file == recording_file
+            downloaded_frames = _count_frames(download)
+
+            _feed(track, 5)
+            await manager.stop_recording()
+            total_frames = _count_frames(recording_file)
+            await manager.delete_recording()
+            return download, downloaded_frames, total_frames
+
+        download, downloaded_frames, total_frames = asyncio.run(run())
+
+        assert downloaded_frames >= 8
+        assert total_frames == 15
+        RecordingManager._safe_remove_file(download)
+
+    def test_download_without_recording(self):
+        """Should return None when nothing has been recorded."""
+        manager = RecordingManager(FakeTrack())
+
+        assert asyncio.run(manager.create_download()) is None
+
+    def test_delete_removes_file(self):
+        """Should stop the encoder and remove the recording file."""
+
+        async def run():
+            track = FakeTrack()
+            manager = RecordingManager(track)
+            await manager.start_recording()
+            recording_file = manager.recording_file
+            await manager.delete_recording()
+            return track, manager, recording_file
+
+        track, manager, recording_file = asyncio.run(run())
+
+        assert not track.callbacks
+        assert not manager.is_recording_started
+        assert not os.path.exists(recording_file)
@@ -0,0 +1,263 @@
+"""Tests for offline rendering of pipeline chains to video files."""
+
+import time
+
+import av
+import numpy as np
+import pytest
+import torch
+from fastapi.testclient import TestClient
+
+from scope.core.pipelines.interface import Requirements
+from scope.server.render import RenderJob, VideoFileWriter
+from scope.server.schema import RenderStatusEnum
+
+
+class ChunkPipeline:
+    """Video pipeline that returns each chunk unchanged and records what it saw."""
+
+    def __init__(self, chunk_size: int = 4):
+        self.chunk_size = chunk_size
+        self.chunks: list[list[int]] = []
+
+    def prepare(self, **kwargs):
+        return Requirements(input_size=self.chunk_size) if kwargs.get("video") else None
+
+    def __call__(self, **kwargs):
+        frames = kwargs["video"]
+        # Frames carry their index in the first pixel
+        self.chunks.append([int(frame[0, 0, 0, 0]) for frame in frames])
+        video = torch.cat(frames).float() / 255.0
+        return {"video": video}
+
+
+class PromptPipeline:
+    """Text-mode generator that emits three frames per call."""
+
+    def __init__(self):
+        self.prompts: list[str] = []
+        self.on_call = None
+
+    def prepare(self, **kwargs):
+        return None
+
+    def __call__(self, **kwargs):
+        self.prompts.append(kwargs["prompts"][0]["text"])
+        if self.on_call is not None:
+            self.on_call()
+        return {"video": torch.zeros(3, 16, 16, 3)}
+
+
+class FailingPipeline:
+    """Takes another pipeline's input requirements, then fails every call."""
+
+    def __init__(self, pipeline):
+        self.prepare = pipeline.prepare
+
+    def __call__(self, **kwargs):
+        raise ValueError("bad chunk")
+
+
+def _write_clip(path, num_frames: int, size: int = 16):
+    writer = VideoFileWriter(path, fps=8)
+    for index in range(num_frames):
+        writer.write(torch.full((size, size, 3), index * 10, dtype=torch.uint8))
+    writer.close()
+
+
+def _count_frames(path) -> int:
+    with av.open(str(path)) as container:
+        return sum(1 for _ in container.decode(video=0))
+
+
+class TestRenderJob:
+    """Tests for RenderJob."""
+
+    def test_video_is_rendered_without_dropping(self, tmp_path):
+        """Every input frame should be processed in order, in whole chunks."""
+        source = tmp_path / "in.mp4"
+        _write_clip(source, 10)
+        pipeline = ChunkPipeline(chunk_size=4)
+
+        job = RenderJob([("chunk", pipeline)], tmp_path / "out.mp4", input_path=source)
+        job.run()
+
+        assert job.status == RenderStatusEnum.COMPLETED
+        assert job.fps == 8
+        assert job.frames_in == 10
+        # Two full chunks; the last two frames never fill a chunk
+        assert job.frames_out == 8
+        assert _count_frames(tmp_path / "out.mp4") == 8
+        flat = [index for chunk in pipeline.chunks for index in chunk]
+        assert flat == sorted(flat)
+        assert len(set(flat)) == 8
+
+    def test_chain_passes_every_frame_downstream(self, tmp_path):
+        """A downstream pipeline with another chunk size should still see every frame."""
+        source = tmp_path / "in.mp4"
+        _write_clip(source, 12)
+        first = ChunkPipeline(chunk_size=4)
+        second = ChunkPipeline(chunk_size=3)
+
+        job = RenderJob(
+            [("first", first), ("second", second)],
+            tmp_path / "out.mp4",
+            input_path=source,
+        )
+        job.run()
+
+        assert job.status == RenderStatusEnum.COMPLETED
+        assert sum(len(chunk) for chunk in second.chunks) == 12
+        assert job.frames_out == 12
+
+    def test_prompt_timeline_switches_on_output_frames(self, tmp_path):
+        """Each prompt should be held for frames_per_prompt output frames."""
+        pipeline = PromptPipeline()
+
+        job = RenderJob(
+            [("gen", pipeline)],
+            tmp_path / "out.mp4",
+            prompts=["a cat", "a dog"],
+            frames_per_prompt=6,
+        )
+        job.run()
+
+        assert job.status == RenderStatusEnum.COMPLETED
+        assert job.frames_out == 12
+        assert job.progress == 1.0
+        assert pipeline.prompts == ["a cat", "a cat", "a dog", "a dog"]
+        assert _count_frames(tmp_path / "out.mp4") == 12
+
+    def test_cancel_keeps_rendered_frames(self, tmp_path):
+        """A cancelled job should stop and leave a playable file."""
+        pipeline = PromptPipeline()
+        job = RenderJob(
+            [("gen", pipeline)],
+            tmp_path / "out.mp4",
+            prompts=["a cat"],
+            frames_per_prompt=3000,
+        )
+        pipeline.on_call = lambda: len(pipeline.prompts) == 2 and job.cancel()
+
+        job.run()
+
+        assert job.status == RenderStatusEnum.CANCELLED
+        assert job.frames_out == 6
+        assert _count_frames(tmp_path / "out.mp4") == 6
+
+    def test_text_render_through_video_pipeline_fails(self, tmp_path):
+        """A prompt-only job should fail, not spin, when the pipeline needs input."""
+        pipeline = ChunkPipeline()
+        pipeline.prepare = lambda **kwargs: Requirements(input_size=4)
+        job = RenderJob([("chunk", pipeline)], tmp_path / "out.mp4", prompts=["a cat"])
+
+        job.run()
+
+        assert job.status == RenderStatusEnum.FAILED
+        assert "requires video input" in job.error
+        assert pipeline.chunks == []
+
+    def test_pipeline_error_fails_video_render(self, tmp_path):
+        """A chunk that raises should fail the job instead of completing it empty."""
+        source = tmp_path / "in.mp4"
+        _write_clip(source, 8)
+        pipeline = FailingPipeline(ChunkPipeline())
+
+        job = RenderJob([("chunk", pipeline)], tmp_path / "out.mp4", input_path=source)
+        job.run()
+
+        assert job.status == RenderStatusEnum.FAILED
+        assert job.error == "bad chunk"
+        assert job.frames_out == 0
+
+    def test_pipeline_error_fails_text_render(self, tmp_path):
+        """A failing generator should end a prompt-only job rather than retry forever."""
+        job = RenderJob(
+            [("gen", FailingPipeline(PromptPipeline()))],
+            tmp_path / "out.mp4",
+            prompts=["a cat"],
+        )
+
+        job.run()
+
+        assert job.status == RenderStatusEnum.FAILED
+        assert job.error == "bad chunk"
+
+    def test_requires_input_or_prompts(self, tmp_path):
+        """A job with nothing to render should be rejected."""
+        with pytest.raises(ValueError):
+            RenderJob([("gen", PromptPipeline())], tmp_path / "out.mp4")
+
+
+class TestRenderEndpoint:
+    """Tests for the /api/v1/render job API."""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        from scope.server.app import app, get_pipeline_manager
+        from scope.server.pipeline_manager import PipelineNotAvailableException
+
+        monkeypatch.setenv("DAYDREAM_SCOPE_MODELS_DIR", str(tmp_path / "models"))
+        (tmp_path / "assets").mkdir()
+
+        class FakeManager:
+            def get_pipeline_by_id(self, pipeline_id):
+                if pipeline_id != "chunk":
+                    raise PipelineNotAvailableException(
+                        f"Pipeline {pipeline_id} not loaded"
+                    )
+                return ChunkPipeline()
+
+        app.dependency_overrides[get_pipeline_manager] = FakeManager
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_renders_into_assets(self, client, tmp_path):
+        """A job should run in the background and report progress until done."""
+        _write_clip(tmp_path / "assets" / "in.mp4", 8)
+
+        response = client.post(
+            "/api/v1/render", json={"pipeline_ids": ["chunk"], "input_path": "in.mp4"}
+        )
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        for _ in range(100):
+            status = client.get(f"/api/v1/render/{job_id}").json()
+            if status["status"] not in ("pending", "running"):
+                break
+            time.sleep(0.05)
+
+        assert status["status"] == "completed"
+        assert status["frames_out"] == 8
+        assert status["output_path"].endswith(f"renders/render_{job_id}.mp4")
+        assert _count_frames(status["output_path"]) == 8
+
+    def test_unloaded_pipeline_is_rejected(self, client):
+        response = client.post(
+            "/api/v1/render", json={"pipeline_ids": ["missing"], "prompts_path": "p"}
+        )
+        assert response.status_code == 400
+
+    def test_paths_outside_assets_are_rejected(self, client):
+        response = client.post(
+            "/api/v1/render",
+            json={"pipeline_ids": ["chunk"], "input_path": "../../etc/passwd"},
+        )
+        assert response.status_code == 403
+
+    def test_unknown_job_is_404(self, client):
+        assert client.get("/api/v1/render/nope").status_code == 404
+
+
+def test_writer_timestamps_frames_by_index(tmp_path):
+    """Frames should be spaced exactly 1/fps apart regardless of arrival time."""
+    path = tmp_path / "clip.mp4"
+    writer = VideoFileWriter(path, fps=10)
+    for _ in range(5):
+        writer.write(torch.from_numpy(np.zeros((16, 16, 3), dtype=np.uint8)))
+    writer.close()
+
+    with av.open(str(path)) as container:
+        times = [frame.time for frame in container.decode(video=0)]
+    assert times == pytest.approx([0.0, 0.1, 0.2, 0.3, 0.4])
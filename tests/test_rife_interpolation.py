@@ -0,0 +1,135 @@
+"""Unit tests for RIFEInterpolator streaming interpolation."""
+
+import pytest
+import torch
+
+from scope.core.pipelines.rife.modules.interpolation import RIFEInterpolator
+from scope.core.pipelines.rife.pipeline import RIFEPipeline
+from scope.server.session_multiplexer import SessionMultiplexer
+
+
+class AverageModel:
+    """Stand-in for the RIFE model that returns the mean of each frame pair."""
+
+    def __init__(self):
+        self.calls = []
+
+    def inference(self, img0, img1, scale=1.0):
+        self.calls.append((img0.shape, img1.shape))
+        return (img0 + img1) / 2
+
+
+@pytest.fixture
+def interpolator():
+    interpolator = RIFEInterpolator(enabled=False, device=torch.device("cpu"))
+    interpolator.model = AverageModel()
+    interpolator.enabled = True
+    return interpolator
+
+
+def _frames(values, h=4, w=6):
+    return torch.stack([torch.full((3, h, w), v) for v in values])
+
+
+class TestInterpolateStream:
+    """Tests for RIFEInterpolator.interpolate_stream."""
+
+    def test_first_chunk_doubles_minus_one(self, interpolator):
+        """Should yield 2*T-1 frames when there is no previous chunk."""
+        result = interpolator.interpolate_stream(_frames([0.0, 0.2, 0.4]))
+
+        assert result.shape == (5, 3, 4, 6)
+        torch.testing.assert_close(
+            result[:, 0, 0, 0], torch.tensor([0.0, 0.1, 0.2, 0.3, 0.4])
+        )
+
+    def test_interpolates_across_chunk_boundary(self, interpolator):
+        """Should interpolate between the previous tail and the new chunk."""
+        interpolator.interpolate_stream(_frames([0.0, 0.2]))
+
+        result = interpolator.interpolate_stream(_frames([0.4, 0.6]))
+
+        assert result.shape == (4, 3, 4, 6)
+        torch.testing.assert_close(
+            result[:, 0, 0, 0], torch.tensor([0.3, 0.4, 0.5, 0.6])
+        )
+
+    def test_single_frame_chunk_after_first(self, interpolator):
+        """Should still emit two frames for a one-frame chunk mid-stream."""
+        interpolator.interpolate_stream(_frames([0.0, 0.2]))
+
+        result = interpolator.interpolate_stream(_frames([0.4]))
+
+        torch.testing.assert_close(result[:, 0, 0, 0], torch.tensor([0.3, 0.4]))
+
+    def test_reset_drops_tail(self, interpolator):
+        """Should not interpolate across a reset."""
+        interpolator.interpolate_stream(_frames([0.0, 0.2]))
+        interpolator.reset()
+
+        result = interpolator.interpolate_stream(_frames([0.4, 0.6]))
+
+        torch.testing.assert_close(result[:, 0, 0, 0], torch.tensor([0.4, 0.5, 0.6]))
+
+    def test_resolution_change_drops_tail(self, interpolator):
+        """Should not interpolate between frames of different sizes."""
+        interpolator.interpolate_stream(_frames([0.0, 0.2]))
+
+        result = interpolator.interpolate_stream(_frames([0.4, 0.6], h=8, w=8))
+
+        assert result.shape == (3, 3, 8, 8)
+
+    def test_pads_to_multiple_of_32(self, interpolator):
+        """Should pad model input to multiples of 32 and crop the output."""
+        interpolator.interpolate_stream(_frames([0.0, 0.2], h=40, w=50))
+
+        ((shape0, shape1),) = interpolator.model.calls
+        assert shape0[-2:] == (64, 64)
+        assert shape1[-2:] == (64, 64)
+
+
+class TestInterpolate:
+    """Tests for the uint8 RIFEInterpolator.interpolate API."""
+
+    def test_uint8_round_trip(self, interpolator):
+        """Should return uint8 THWC frames with interpolated midpoints."""
+        frames = torch.stack(
+            [
+                torch.full((4, 6, 3), 0, dtype=torch.uint8),
+                torch.full((4, 6, 3), 200, dtype=torch.uint8),
+            ]
+        )
+
+        result = interpolator.interpolate(frames)
+
+        assert result.dtype == torch.uint8
+        assert result.shape == (3, 4, 6, 3)
+        assert result[:, 0, 0, 0].tolist() == [0, 100, 200]
+
+
+class TestSharedPipeline:
+    """Tests for RIFEPipeline streams sharing one instance."""
+
+    def test_sessions_keep_their_own_tail_frame(self, interpolator):
+        """Each session should bridge its chunks from its own previous frame."""
+        pipeline = RIFEPipeline.__new__(RIFEPipeline)
+        pipeline.device = torch.device("cpu")
+        pipeline.rife_interpolator = interpolator
+        multiplexer = SessionMultiplexer(pipeline)
+        a = multiplexer.open_session("a")
+        b = multiplexer.open_session("b")
+
+        def chunk(*values):
+            return [torch.full((1, 4, 6, 3), v, dtype=torch.uint8) for v in values]
+
+        a(video=chunk(0, 100))
+        b(video=chunk(200, 250))
+        first = a(video=chunk(150))["video"]
+        second = b(video=chunk(150))["video"]
+
+        torch.testing.assert_close(
+            first[:, 0, 0, 0] * 255, torch.tensor([125.0, 150.0])
+        )
+        torch.testing.assert_close(
+            second[:, 0, 0, 0] * 255, torch.tensor([200.0, 150.0])
+        )
@@ -0,0 +1,119 @@
+"""Tests for the cached pipeline schemas endpoint."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from scope.core.pipelines.base_schema import BasePipelineConfig, ModeDefaults
+from scope.core.pipelines.registry import PipelineRegistry
+from scope.server.schema_cache import PipelineSchemaCache, build_pipeline_schemas
+
+
+class SchemaCacheTestConfig(BasePipelineConfig):
+    pipeline_id = "schema-cache-test"
+    pipeline_name = "Schema Cache Test"
+    pipeline_description = "Pipeline used by the schema cache tests."
+
+    modes = {"video": ModeDefaults(default=True)}
+
+
+def _pipeline_class():
+    pipeline_class = MagicMock()
+    pipeline_class.get_config_class.return_value = SchemaCacheTestConfig
+    return pipeline_class
+
+
+@pytest.fixture
+def registered_pipeline():
+    PipelineRegistry.register("schema-cache-test", _pipeline_class())
+    yield
+    PipelineRegistry.unregister("schema-cache-test")
+
+
+class TestPipelineSchemaCache:
+    """Tests for PipelineSchemaCache."""
+
+    def test_reuses_bundle_within_generation(self, registered_pipeline):
+        """Should build once and reuse the bytes until the registry changes."""
+        cache = PipelineSchemaCache()
+
+        with patch(
+            "scope.server.schema_cache.build_pipeline_schemas",
+            wraps=build_pipeline_schemas,
+        ) as build:
+            first = cache.get()
+            second = cache.get()
+
+        assert build.call_count == 1
+        assert second is first
+        pipelines = json.loads(first.body)["pipelines"]
+        assert pipelines["schema-cache-test"]["config_schema"]["title"] == (
+            "SchemaCacheTestConfig"
+        )
+
+    def test_rebuilds_when_registry_changes(self, registered_pipeline):
+        """Registering or removing a pipeline should produce a new bundle."""
+        cache = PipelineSchemaCache()
+        before = cache.get()
+
+        PipelineRegistry.unregister("schema-cache-test")
+        removed = cache.get()
+        assert removed.generation != before.generation
+        assert removed.etag != before.etag
+        assert "schema-cache-test" not in json.loads(removed.body)["pipelines"]
+
+        PipelineRegistry.register("schema-cache-test", _pipeline_class())
+        restored = cache.get()
+        assert "schema-cache-test" in json.loads(restored.body)["pipelines"]
+        # Same content, same strong validator
+        assert restored.etag == before.etag
+
+
+class TestPipelineSchemasEndpoint:
+    """Tests for GET /api/v1/pipelines/schemas."""
+
+    @pytest.fixture
+    def client(self, registered_pipeline):
+        from scope.server.app import app
+
+        return TestClient(app)
+
+    def test_serves_schemas_with_etag(self, client):
+        """Should return the schemas with a strong ETag and no-cache."""
+        response = client.get("/api/v1/pipelines/schemas")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["cache-control"] == "no-cache"
+        etag = response.headers["etag"]
+        assert etag.startswith('"') and not etag.startswith("W/")
+        schema = response.json()["pipelines"]["schema-cache-test"]
+        assert schema["supported_modes"] == ["video"]
+        assert schema["plugin_name"] is None
+
+    def test_matching_etag_returns_304(self, client):
+        """Should answer a revalidation with 304 and an empty body."""
+        etag = client.get("/api/v1/pipelines/schemas").headers["etag"]
+
+        response = client.get(
+            "/api/v1/pipelines/schemas", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_etag_returns_new_schemas(self, client):
+        """Should return the full body once the registry has changed."""
+        etag = client.get("/api/v1/pipelines/schemas").headers["etag"]
+        PipelineRegistry.unregister("schema-cache-test")
+
+        response = client.get(
+            "/api/v1/pipelines/schemas", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert "schema-cache-test" not in response.json()["pipelines"]
@@ -0,0 +1,196 @@
+"""Tests for sharing one pipeline instance between streaming sessions."""
+
+import threading
+import time
+
+import pytest
+import torch
+
+from scope.core.pipelines.components import ComponentsManager
+from scope.server.session_multiplexer import SessionMultiplexer, open_pipeline_session
+
+
+class FakeState:
+    """Minimal stand-in for diffusers' PipelineState."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+
+class FakeVAE:
+    """Streaming component whose memory is the frames it has decoded."""
+
+    def __init__(self):
+        self.decoded = []
+
+    def clear_cache(self):
+        self.decoded = []
+
+    def stream_state(self):
+        return {"decoded": self.decoded}
+
+    def load_stream_state(self, stream_state):
+        if stream_state is None:
+            self.clear_cache()
+            return
+        self.decoded = stream_state["decoded"]
+
+
+class CountingPipeline:
+    """Counts chunks per stream the way generation pipelines advance frames."""
+
+    session_state_attributes = ("state", "first_call", "last_mode")
+
+    def __init__(self, delay: float = 0.0):
+        self.state = FakeState()
+        self.state.set("current_start_frame", 0)
+        self.first_call = True
+        self.last_mode = None
+        self.components = ComponentsManager({})
+        self.components.add("vae", FakeVAE())
+        self.delay = delay
+        self.calls: list[str] = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs["prompt"])
+        if self.delay:
+            time.sleep(self.delay)
+        frame = self.state.get("current_start_frame")
+        self.state.set("current_start_frame", frame + 1)
+        self.state.set("prompt", kwargs["prompt"])
+        self.first_call = False
+        self.components.vae.decoded = [*self.components.vae.decoded, frame]
+        return {"frame": frame, "decoded": list(self.components.vae.decoded)}
+
+
+class TestSessionMultiplexer:
+    """Tests for SessionMultiplexer."""
+
+    def test_sessions_keep_their_own_state(self):
+        """Interleaved sessions should each see their own stream."""
+        pipeline = CountingPipeline()
+        multiplexer = SessionMultiplexer(pipeline)
+        a = multiplexer.open_session("a")
+        b = multiplexer.open_session("b")
+
+        assert a(prompt="cat")["frame"] == 0
+        assert a(prompt="cat")["frame"] == 1
+        assert b(prompt="dog")["frame"] == 0
+        result = a(prompt="cat")
+
+        assert result["frame"] == 2
+        assert result["decoded"] == [0, 1, 2]
+        assert b(prompt="dog")["decoded"] == [0, 1]
+        assert a.get_state("prompt") == "cat"
+        assert b.get_state("prompt") == "dog"
+
+    def test_single_session_adopts_live_state(self):
+        """A lone session should run on the pipeline's own state without swaps."""
+        pipeline = CountingPipeline()
+        state = pipeline.state
+        multiplexer = SessionMultiplexer(pipeline)
+        session = multiplexer.open_session()
+
+        for _ in range(3):
+            session(prompt="cat")
+
+        assert pipeline.state is state
+        assert multiplexer.switches == 0
+
+    def test_new_session_starts_from_constructed_state(self):
+        """A session opened mid-stream should not inherit another session's progress."""
+        pipeline = CountingPipeline()
+        multiplexer = SessionMultiplexer(pipeline)
+        a = multiplexer.open_session("a")
+        a(prompt="cat")
+        a(prompt="cat")
+
+        b = multiplexer.open_session("b")
+
+        assert b.get_state("current_start_frame") == 0
+        assert b(prompt="dog")["frame"] == 0
+        assert pipeline.first_call is False
+
+    def test_template_leaves_out_warmup_caches(self):
+        """Caches left by a warmup should not be copied for later sessions."""
+        pipeline = CountingPipeline()
+        cache = torch.zeros(8)
+        pipeline.state.set("kv_cache", [{"k": cache}])
+        multiplexer = SessionMultiplexer(pipeline)
+        a = multiplexer.open_session("a")
+        b = multiplexer.open_session("b")
+        a(prompt="cat")
+
+        assert pipeline.state.get("kv_cache")[0]["k"] is cache
+        b(prompt="dog")
+        assert pipeline.state.get("kv_cache") is None
+        assert pipeline.state.get("current_start_frame") == 1
+
+    def test_closed_session_is_released(self):
+        """Closing should drop the slot and refuse further calls."""
+        pipeline = CountingPipeline()
+        multiplexer = SessionMultiplexer(pipeline)
+        a = multiplexer.open_session("a")
+        b = multiplexer.open_session("b")
+        a(prompt="cat")
+        b(prompt="dog")
+
+        a.close()
+
+        with pytest.raises(RuntimeError):
+            a(prompt="cat")
+        assert b(prompt="dog")["frame"] == 1
+
+    def test_errors_reach_the_calling_session(self):
+        """An exception from the pipeline should be raised in the caller's thread."""
+        pipeline = CountingPipeline()
+        session = SessionMultiplexer(pipeline).open_session()
+
+        with pytest.raises(KeyError):
+            session(other="value")
+
+    def test_waiting_sessions_are_served_in_one_round(self):
+        """Chunks queued while the pipeline is busy should run together, in order."""
+        pipeline = CountingPipeline(delay=0.1)
+        multiplexer = SessionMultiplexer(pipeline)
+        sessions = [multiplexer.open_session(str(i)) for i in range(4)]
+        results = {}
+
+        def run(index):
+            results[index] = sessions[index](prompt=str(index))["frame"]
+
+        first = threading.Thread(target=run, args=(0,))
+        first.start()
+        time.sleep(0.01)
+        others = [threading.Thread(target=run, args=(i,)) for i in (1, 2, 3)]
+        for thread in others:
+            thread.start()
+            time.sleep(0.005)
+        for thread in [first, *others]:
+            thread.join(timeout=5)
+
+        assert results == {0: 0, 1: 0, 2: 0, 3: 0}
+        assert pipeline.calls == ["0", "1", "2", "3"]
+        # One round for the first chunk, one for the three gathered behind it
+        assert multiplexer.rounds == 2
+
+
+class TestOpenPipelineSession:
+    """Tests for open_pipeline_session."""
+
+    def test_sessions_on_one_pipeline_share_a_multiplexer(self):
+        """Processors built for the same instance should share one multiplexer."""
+        pipeline = CountingPipeline()
+
+        a = open_pipeline_session(pipeline, "a")
+        b = open_pipeline_session(pipeline, "b")
+        other = open_pipeline_session(CountingPipeline(), "c")
+
+        assert a.multiplexer is b.multiplexer
+        assert other.multiplexer is not a.multiplexer
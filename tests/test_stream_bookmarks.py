@@ -0,0 +1,210 @@
+"""Tests for named snapshots of a stream's generation state."""
+
+import torch
+
+from scope.core.pipelines.components import ComponentsManager
+from scope.server.pipeline_processor import PipelineProcessor
+from scope.server.session_multiplexer import MAX_BOOKMARKS, SessionMultiplexer
+
+
+class FakeState:
+    """Minimal stand-in for diffusers' PipelineState."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+
+class FakeVAE:
+    """Streaming component holding a feature cache tensor."""
+
+    def __init__(self):
+        self.clear_cache()
+
+    def clear_cache(self):
+        self.feat = torch.zeros(4)
+
+    def stream_state(self):
+        return {"feat": self.feat}
+
+    def load_stream_state(self, stream_state):
+        if stream_state is None:
+            self.clear_cache()
+            return
+        self.feat = stream_state["feat"]
+
+
+class CachePipeline:
+    """Writes each chunk's frame index into a KV cache, like a causal generator."""
+
+    session_state_attributes = ("state", "first_call", "last_mode")
+
+    def __init__(self):
+        self.state = FakeState()
+        self.state.set("current_start_frame", 0)
+        self.state.set("kv_cache", [{"k": torch.zeros(8), "v": torch.zeros(8)}])
+        self.first_call = True
+        self.last_mode = None
+        self.components = ComponentsManager({})
+        self.components.add("vae", FakeVAE())
+
+    def prepare(self, **kwargs):
+        return None
+
+    def __call__(self, **kwargs):
+        if self.state.get("kv_cache") is None:
+            # A new session's caches are set up on its first chunk
+            self.state.set("kv_cache", [{"k": torch.zeros(8), "v": torch.zeros(8)}])
+        frame = self.state.get("current_start_frame")
+        cache = self.state.get("kv_cache")[0]
+        # Caches are updated in place, as the real generator does
+        cache["k"][frame] = frame + 1
+        cache["v"][frame] = -(frame + 1)
+        self.components.vae.feat += 1
+        self.state.set("current_start_frame", frame + 1)
+        self.state.set("prompt", kwargs.get("prompt"))
+        self.first_call = False
+        return {"frame": frame}
+
+
+class TestBookmarks:
+    """Tests for saving and restoring bookmarks through a session."""
+
+    def test_restore_returns_to_saved_stream(self):
+        pipeline = CachePipeline()
+        session = SessionMultiplexer(pipeline).open_session()
+        session(prompt="forest")
+        session(prompt="forest")
+        session.save_bookmark("forest")
+
+        for _ in range(3):
+            session(prompt="city")
+        assert session.restore_bookmark("forest")
+
+        assert pipeline.state.get("current_start_frame") == 2
+        assert pipeline.state.get("prompt") == "forest"
+        k = pipeline.state.get("kv_cache")[0]["k"]
+        assert k.tolist() == [1, 2, 0, 0, 0, 0, 0, 0]
+        assert pipeline.components.vae.feat.tolist() == [2, 2, 2, 2]
+        assert session(prompt="forest")["frame"] == 2
+
+    def test_restore_copies_into_live_tensors(self):
+        """Restoring should reuse the live cache buffers rather than replace them."""
+        pipeline = CachePipeline()
+        session = SessionMultiplexer(pipeline).open_session()
+        session(prompt="a")
+        cache = pipeline.state.get("kv_cache")[0]["k"]
+        session.save_bookmark("a")
+        session(prompt="b")
+
+        session.restore_bookmark("a")
+
+        assert pipeline.state.get("kv_cache")[0]["k"] is cache
+        assert cache.tolist()[:2] == [1, 0]
+
+    def test_restore_does_not_write_into_shared_tensors(self):
+        """Tensors outside the caches may be shared, so they are replaced, not overwritten."""
+        pipeline = CachePipeline()
+        session = SessionMultiplexer(pipeline).open_session()
+        forest = torch.full((4,), 1.0)
+        city = torch.full((4,), 2.0)
+        pipeline.state.set("conditioning_embeds", forest)
+        session(prompt="forest")
+        session.save_bookmark("forest")
+        pipeline.state.set("conditioning_embeds", city)
+        session(prompt="city")
+
+        session.restore_bookmark("forest")
+
+        assert city.tolist() == [2.0] * 4
+        restored = pipeline.state.get("conditioning_embeds")
+        assert restored is not city
+        assert restored.tolist() == [1.0] * 4
+
+    def test_bookmark_survives_repeated_restores(self):
+        pipeline = CachePipeline()
+        session = SessionMultiplexer(pipeline).open_session()
+        session(prompt="a")
+        session.save_bookmark("a")
+
+        for _ in range(2):
+            session(prompt="b")
+            session(prompt="b")
+            session.restore_bookmark("a")
+
+        assert pipeline.state.get("kv_cache")[0]["k"].tolist()[:3] == [1, 0, 0]
+
+    def test_offloaded_bookmark_is_kept_on_cpu(self):
+        pipeline = CachePipeline()
+        session = SessionMultiplexer(pipeline).open_session()
+        session(prompt="a")
+
+        bookmark = session.save_bookmark("a", offload=True)
+
+        # Two cache tensors and the VAE feature cache
+        assert bookmark.nbytes == (8 + 8 + 4) * 4
+        session(prompt="b")
+        assert session.restore_bookmark("a")
+        assert pipeline.state.get("current_start_frame") == 1
+
+    def test_bookmarks_belong_to_their_session(self):
+        """Restoring one session's bookmark should not touch another session."""
+        pipeline = CachePipeline()
+        multiplexer = SessionMultiplexer(pipeline)
+        a = multiplexer.open_session("a")
+        b = multiplexer.open_session("b")
+        a(prompt="a")
+        a.save_bookmark("start")
+        a(prompt="a")
+        b(prompt="b")
+
+        assert not b.restore_bookmark("start")
+        assert a.restore_bookmark("start")
+
+        assert b.get_state("current_start_frame") == 1
+        assert a(prompt="a")["frame"] == 1
+        assert b(prompt="b")["frame"] == 1
+
+    def test_oldest_bookmark_is_dropped(self):
+        pipeline = CachePipeline()
+        session = SessionMultiplexer(pipeline).open_session()
+
+        for index in range(MAX_BOOKMARKS + 1):
+            session.save_bookmark(str(index))
+
+        assert "0" not in session.bookmarks
+        assert len(session.bookmarks) == MAX_BOOKMARKS
+        assert session.delete_bookmark("1")
+        assert not session.restore_bookmark("1")
+
+
+class TestBookmarkParameter:
+    """Tests for the bookmark data-channel parameter."""
+
+    def test_processor_saves_and_restores(self):
+        pipeline = CachePipeline()
+        processor = PipelineProcessor(pipeline, "cache", {"prompt": "a"})
+        processor.process_chunk()
+
+        processor.update_parameters({"bookmark": {"action": "save", "name": "a"}})
+        processor.process_chunk()
+        processor.process_chunk()
+        processor.update_parameters({"bookmark": {"action": "restore", "name": "a"}})
+        processor.process_chunk()
+
+        # Restored to one frame, then the chunk after the restore ran
+        assert pipeline.state.get("current_start_frame") == 2
+        assert "bookmark" not in processor.parameters
+        processor.stop()
+
+    def test_unknown_bookmark_does_not_stop_the_stream(self):
+        processor = PipelineProcessor(CachePipeline(), "cache", {"prompt": "a"})
+        processor.update_parameters({"bookmark": {"action": "restore", "name": "x"}})
+
+        assert processor.process_chunk()
+        processor.stop()
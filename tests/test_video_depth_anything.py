@@ -0,0 +1,131 @@
+"""Regression tests for the batched Video Depth Anything inference path."""
+
+import numpy as np
+import pytest
+import torch
+
+from scope.core.pipelines.normalization import StreamingNormalizer
+from scope.core.pipelines.video_depth_anything.modules import VideoDepthAnything
+from scope.core.pipelines.video_depth_anything.pipeline import (
+    MODEL_CONFIG,
+    NORMALIZATION_MOMENTUM,
+    VideoDepthAnythingPipeline,
+)
+
+INPUT_SIZE = 42
+
+
+@pytest.fixture(scope="module")
+def model():
+    """Randomly initialized Small model with active motion modules."""
+    torch.manual_seed(0)
+    model = VideoDepthAnything(**MODEL_CONFIG, metric=False)
+    # Motion modules are zero-initialized; give their output projections weights
+    # so the temporal attention actually contributes to the result.
+    for motion_module in model.head.motion_modules:
+        torch.nn.init.normal_(motion_module.temporal_transformer.proj_out.weight)
+    return model.eval()
+
+
+@pytest.fixture
+def pipeline(model):
+    """Pipeline around the random model, skipping the checkpoint download."""
+    pipeline = VideoDepthAnythingPipeline.__new__(VideoDepthAnythingPipeline)
+    pipeline.device = torch.device("cpu")
+    pipeline.fp32 = True
+    pipeline.input_size = INPUT_SIZE
+    pipeline.model = model
+    pipeline._cached_hidden_state_list = None
+    pipeline._cached_size = None
+    pipeline._normalizer = StreamingNormalizer(momentum=NORMALIZATION_MOMENTUM)
+    return pipeline
+
+
+def _frames(
+    num_frames: int, seed: int, height: int = 48, width: int = 64
+) -> torch.Tensor:
+    generator = torch.Generator().manual_seed(seed)
+    return torch.randint(
+        0, 256, (num_frames, height, width, 3), dtype=torch.uint8, generator=generator
+    )
+
+
+def _per_frame(model, frames, cached_hidden_state_list=None):
+    depths = []
+    for frame in frames:
+        depth, cached_hidden_state_list = model.infer_video_depth_one(
+            frame.numpy(),
+            input_size=INPUT_SIZE,
+            device="cpu",
+            fp32=True,
+            cached_hidden_state_list=cached_hidden_state_list,
+        )
+        depths.append(depth)
+    return np.stack(depths), cached_hidden_state_list
+
+
+class TestInferVideoDepthBatch:
+    """Tests for VideoDepthAnything.infer_video_depth_batch."""
+
+    def test_matches_per_frame_output(self, model):
+        """Should match streaming one frame at a time with threaded hidden state."""
+        frames = _frames(4, seed=1)
+
+        expected, _ = _per_frame(model, frames)
+        depth, _ = model.infer_video_depth_batch(
+            frames, input_size=INPUT_SIZE, fp32=True
+        )
+
+        assert depth.shape == (4, 48, 64)
+        np.testing.assert_allclose(depth.numpy(), expected, rtol=1e-3, atol=1e-3)
+
+    def test_carries_hidden_state_across_chunks(self, model):
+        """Should match per-frame streaming when the cache is carried across chunks."""
+        first, second = _frames(4, seed=2), _frames(4, seed=3)
+
+        _, cache = _per_frame(model, first)
+        expected, expected_cache = _per_frame(model, second, cache)
+
+        _, batch_cache = model.infer_video_depth_batch(
+            first, input_size=INPUT_SIZE, fp32=True
+        )
+        depth, batch_cache = model.infer_video_depth_batch(
+            second,
+            input_size=INPUT_SIZE,
+            fp32=True,
+            cached_hidden_state_list=batch_cache,
+        )
+
+        np.testing.assert_allclose(depth.numpy(), expected, rtol=1e-3, atol=1e-3)
+        assert len(batch_cache) == len(expected_cache)
+        for actual, reference in zip(batch_cache, expected_cache, strict=True):
+            assert actual.shape == reference.shape
+
+    def test_single_frame_chunk(self, model):
+        """Should handle a chunk with a single frame."""
+        frames = _frames(1, seed=4)
+
+        expected, _ = _per_frame(model, frames)
+        depth, _ = model.infer_video_depth_batch(
+            frames, input_size=INPUT_SIZE, fp32=True
+        )
+
+        np.testing.assert_allclose(depth.numpy(), expected, rtol=1e-3, atol=1e-3)
+
+
+class TestVideoDepthAnythingPipeline:
+    """Tests for the streaming state of VideoDepthAnythingPipeline."""
+
+    def test_resolution_change_restarts_the_stream(self, pipeline):
+        """A chunk at a new size should be processed as if the stream just started."""
+        small, large = _frames(4, seed=5), _frames(4, seed=6, height=56, width=56)
+        pipeline(video=list(small.split(1)))
+
+        depth = pipeline(video=list(large.split(1)))["video"]
+        fresh = pipeline(video=list(large.split(1)), init_cache=True)["video"]
+
+        assert depth.shape == (4, 56, 56, 3)
+        torch.testing.assert_close(depth, fresh)
+        # The new size's hidden states are carried on to the next chunk
+        assert pipeline._cached_size == (56, 56)
+        assert pipeline._cached_hidden_state_list is not None